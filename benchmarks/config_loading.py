@@ -0,0 +1,119 @@
+"""Pipeline config loading benchmarks.
+
+Generates pipeline YAML files with a growing number of params and times
+:meth:`flowerpower.cfg.PipelineConfig.from_yaml`, split into the YAML decode
+step (C-accelerated ``CSafeLoader`` vs. the pure-Python ``SafeLoader``), the
+environment interpolation walk, and the full load.
+
+Usage::
+
+    python benchmarks/config_loading.py [--params 10 100 1000] [--number 20]
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import sys
+import tempfile
+import timeit
+from pathlib import Path
+
+import msgspec
+import yaml
+from fsspeckit import filesystem
+
+from flowerpower.cfg import PipelineConfig
+from flowerpower.utils.yaml_env import interpolate_env_in_data
+
+DEFAULT_PARAMS = (10, 100, 1000)
+
+
+def make_pipeline_config(num_params: int, env_ratio: int = 20) -> dict:
+    """Return a pipeline config dict with ``num_params`` nested params.
+
+    Every ``env_ratio``-th param contains an environment placeholder.
+    """
+    params = {}
+    for index in range(num_params):
+        value = "${BENCH_ROOT:-/data}/in" if index % env_ratio == 0 else f"value-{index}"
+        params[f"param_{index}"] = {
+            "path": value,
+            "size": index,
+            "options": {"enabled": index % 2 == 0, "tags": ["a", "b", "c"]},
+        }
+    return {
+        "run": {
+            "final_vars": ["result"],
+            "executor": {"type": "threadpool", "max_workers": 4},
+            "retry": {"max_retries": 2},
+        },
+        "params": params,
+    }
+
+
+def _per_call_ms(func, number: int, repeat: int = 3) -> float:
+    return min(timeit.repeat(func, number=number, repeat=repeat)) / number * 1e3
+
+
+def bench_config_loading(sizes: tuple[int, ...], number: int) -> list[dict]:
+    results = []
+    with tempfile.TemporaryDirectory() as tmpdir:
+        fs = filesystem(tmpdir, cached=False, dirfs=True)
+        for size in sizes:
+            path = Path(tmpdir) / f"bench_{size}.yml"
+            path.write_text(yaml.safe_dump(make_pipeline_config(size)))
+            raw = path.read_bytes()
+            decoded = msgspec.yaml.decode(raw)
+            results.append(
+                {
+                    "params": size,
+                    "bytes": len(raw),
+                    "pyyaml_safe_load_ms": round(
+                        _per_call_ms(
+                            lambda: yaml.load(raw, Loader=yaml.SafeLoader), number
+                        ),
+                        3,
+                    ),
+                    "msgspec_decode_ms": round(
+                        _per_call_ms(lambda: msgspec.yaml.decode(raw), number), 3
+                    ),
+                    "interpolate_ms": round(
+                        _per_call_ms(lambda: interpolate_env_in_data(decoded), number),
+                        3,
+                    ),
+                    "from_yaml_ms": round(
+                        _per_call_ms(
+                            lambda: PipelineConfig.from_yaml(
+                                name=f"bench_{size}", path=path.name, fs=fs
+                            ),
+                            number,
+                        ),
+                        3,
+                    ),
+                }
+            )
+    return results
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--params", type=int, nargs="+", default=list(DEFAULT_PARAMS))
+    parser.add_argument("--number", type=int, default=20)
+    args = parser.parse_args(argv)
+
+    json.dump(
+        {
+            "benchmark": "config_loading",
+            "libyaml": bool(getattr(yaml, "__with_libyaml__", False)),
+            "results": bench_config_loading(tuple(args.params), args.number),
+        },
+        sys.stdout,
+        indent=2,
+    )
+    sys.stdout.write("\n")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,314 @@
+"""Framework overhead benchmarks on synthetic projects.
+
+Generates throwaway projects with 1/100/1000 pipelines and pipeline modules
+with DAGs of 10/1k/10k nodes, then times the framework layers a run goes
+through:
+
+- ``cold_import``: ``python -c "import flowerpower"`` in a fresh interpreter,
+  next to ``interpreter_startup`` (``python -c pass``) as the baseline.
+- ``project_load``: :meth:`flowerpower.FlowerPowerProject.load`.
+- ``catalog_get_names``: :meth:`PipelineCatalog.get_names` on a freshly loaded
+  project.
+- ``build_run_plan``: ``PipelineExecutor._build_run_plan`` (config merge,
+  adapter resolution, loader cache).
+- ``driver_build``: Hamilton driver construction as done by the runner, per
+  DAG size.
+- ``run_tiny``: end-to-end latency of a three-node pipeline through
+  ``FlowerPowerProject.run`` versus raw Hamilton (``runner`` param).
+- ``peak_memory.*``: ``tracemalloc`` peak of loading a project and of a tiny
+  run.
+
+Every result keeps its raw samples so two result files can be compared
+statistically with ``flowerpower bench compare base.json head.json``.
+
+Run history and metrics are disabled so benchmark runs do not land in the
+user's history database.
+
+Usage::
+
+    python benchmarks/framework.py [--pipelines 1 100 1000] [--nodes 10 1000 10000]
+        [--repeat 7] [--output framework.json]
+"""
+
+from __future__ import annotations
+
+import argparse
+import importlib
+import json
+import os
+import platform
+import subprocess
+import sys
+import tempfile
+import time
+import tracemalloc
+from collections.abc import Callable
+from pathlib import Path
+from statistics import median
+from typing import Any
+
+os.environ.setdefault("FP_HISTORY_ENABLED", "false")
+os.environ.setdefault("FP_METRICS_ENABLED", "false")
+
+from hamilton import driver  # noqa: E402
+from hamilton.execution import executors  # noqa: E402
+
+from flowerpower import FlowerPowerProject  # noqa: E402
+
+DEFAULT_PIPELINES = (1, 100, 1000)
+DEFAULT_NODES = (10, 1_000, 10_000)
+
+TINY_MODULE = """
+def doubled(x: int) -> int:
+    return x * 2
+
+
+def shifted(doubled: int) -> int:
+    return doubled + 1
+
+
+def out(shifted: int, x: int) -> int:
+    return shifted + x
+"""
+
+
+def make_dag_module(num_nodes: int) -> str:
+    """Source of a module with ``num_nodes`` nodes in a layered DAG.
+
+    Node ``i`` depends on nodes ``i - 1`` and ``i // 2``, so the DAG is deep
+    and every node has at most two inputs.
+    """
+    lines = ["def n0(x: int) -> int:", "    return x", ""]
+    for index in range(1, num_nodes):
+        deps = sorted({index - 1, index // 2})
+        args = ", ".join(f"n{dep}: int" for dep in deps)
+        body = " + ".join(f"n{dep}" for dep in deps)
+        lines += [f"def n{index}({args}) -> int:", f"    return {body}", ""]
+    return "\n".join(lines)
+
+
+def make_project(root: Path, num_pipelines: int) -> Path:
+    """Create a project at ``root`` with ``num_pipelines`` tiny pipelines."""
+    (root / "pipelines").mkdir(parents=True)
+    (root / "conf" / "pipelines").mkdir(parents=True)
+    (root / "hooks").mkdir()
+    (root / "conf" / "project.yml").write_text(f"name: bench_{num_pipelines}\n")
+    for index in range(num_pipelines):
+        (root / "pipelines" / f"p{index}.py").write_text(TINY_MODULE)
+        (root / "conf" / "pipelines" / f"p{index}.yml").write_text(
+            "run:\n  final_vars: [out]\n  inputs: {x: 1}\n"
+            f"params:\n  index: {index}\n"
+        )
+    return root
+
+
+def _samples(func: Callable[[], Any], repeat: int, warmup: int = 1) -> list[float]:
+    for _ in range(warmup):
+        func()
+    samples = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func()
+        samples.append(time.perf_counter() - start)
+    return samples
+
+
+def _peak_memory(func: Callable[[], Any], repeat: int) -> list[float]:
+    func()
+    samples = []
+    for _ in range(repeat):
+        tracemalloc.start()
+        try:
+            func()
+            samples.append(float(tracemalloc.get_traced_memory()[1]))
+        finally:
+            tracemalloc.stop()
+    return samples
+
+
+def _result(
+    name: str, group: str, samples: list[float], unit: str = "s", **params: Any
+) -> dict[str, Any]:
+    label = ",".join(f"{key}={value}" for key, value in params.items())
+    return {
+        "id": f"{name}[{label}]" if label else name,
+        "name": name,
+        "group": group,
+        "unit": unit,
+        "params": params,
+        "samples": samples,
+        "min": min(samples),
+        "median": median(samples),
+    }
+
+
+def bench_cold_import(repeat: int) -> list[dict[str, Any]]:
+    def spawn(code: str) -> Callable[[], Any]:
+        return lambda: subprocess.run([sys.executable, "-c", code], check=True)
+
+    return [
+        _result("interpreter_startup", "cold_start", _samples(spawn("pass"), repeat)),
+        _result(
+            "cold_import",
+            "cold_start",
+            _samples(spawn("import flowerpower"), repeat),
+        ),
+    ]
+
+
+def bench_projects(
+    root: Path, sizes: tuple[int, ...], repeat: int
+) -> list[dict[str, Any]]:
+    results = []
+    for size in sizes:
+        base_dir = str(make_project(root / f"project_{size}", size))
+
+        def load() -> FlowerPowerProject:
+            return FlowerPowerProject.load(base_dir)
+
+        def names() -> list[str]:
+            return load().pipeline_manager.registry._catalog.get_names()
+
+        project = load()
+        executor = project.pipeline_manager.executor
+        results += [
+            _result("project_load", "cold_start", _samples(load, repeat), pipelines=size),
+            _result(
+                "catalog_get_names",
+                "overhead",
+                _samples(names, repeat),
+                pipelines=size,
+            ),
+            _result(
+                "build_run_plan",
+                "overhead",
+                _samples(
+                    lambda: executor._build_run_plan("p0", inputs={"x": 2}),
+                    repeat * 10,
+                ),
+                pipelines=size,
+            ),
+            _result(
+                "peak_memory.project_load",
+                "memory",
+                _peak_memory(load, repeat),
+                unit="bytes",
+                pipelines=size,
+            ),
+        ]
+    return results
+
+
+def _import_module(root: Path, name: str, source: str):
+    path = root / f"{name}.py"
+    path.write_text(source)
+    if str(root) not in sys.path:
+        sys.path.insert(0, str(root))
+    return importlib.import_module(name)
+
+
+def _runner_builder(module) -> driver.Builder:
+    """Driver builder configured the way :class:`PipelineRunner` builds it."""
+    return (
+        driver.Builder()
+        .with_modules(module)
+        .with_config({})
+        .enable_dynamic_execution(allow_experimental_mode=True)
+        .with_local_executor(executors.SynchronousLocalTaskExecutor())
+    )
+
+
+def bench_driver_build(
+    root: Path, sizes: tuple[int, ...], repeat: int
+) -> list[dict[str, Any]]:
+    results = []
+    for size in sizes:
+        module = _import_module(root, f"bench_dag_{size}", make_dag_module(size))
+        rounds = max(2, repeat if size < 10_000 else repeat // 2)
+        results.append(
+            _result(
+                "driver_build",
+                "overhead",
+                _samples(lambda: _runner_builder(module).build(), rounds),
+                nodes=size,
+            )
+        )
+    return results
+
+
+def bench_tiny_run(root: Path, repeat: int) -> list[dict[str, Any]]:
+    project = FlowerPowerProject.load(str(make_project(root / "tiny", 1)))
+    module = _import_module(root, "bench_tiny", TINY_MODULE)
+
+    def flowerpower_run() -> dict[str, Any]:
+        return project.run("p0", inputs={"x": 1}, final_vars=["out"])
+
+    def hamilton_run() -> dict[str, Any]:
+        dr = driver.Builder().with_modules(module).build()
+        return dr.execute(["out"], inputs={"x": 1})
+
+    rounds = repeat * 10
+    return [
+        _result(
+            "run_tiny", "overhead", _samples(flowerpower_run, rounds), runner="flowerpower"
+        ),
+        _result("run_tiny", "overhead", _samples(hamilton_run, rounds), runner="hamilton"),
+        _result(
+            "peak_memory.run_tiny",
+            "memory",
+            _peak_memory(flowerpower_run, repeat),
+            unit="bytes",
+            runner="flowerpower",
+        ),
+    ]
+
+
+def environment() -> dict[str, Any]:
+    from importlib.metadata import version
+
+    return {
+        "python": platform.python_version(),
+        "implementation": platform.python_implementation(),
+        "platform": platform.platform(),
+        "machine": platform.machine(),
+        "cpu_count": os.cpu_count(),
+        "flowerpower": version("FlowerPower"),
+        "hamilton": version("sf-hamilton"),
+    }
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument(
+        "--pipelines", type=int, nargs="+", default=list(DEFAULT_PIPELINES)
+    )
+    parser.add_argument("--nodes", type=int, nargs="+", default=list(DEFAULT_NODES))
+    parser.add_argument("--repeat", type=int, default=7)
+    parser.add_argument("--output", help="Write JSON here instead of stdout")
+    args = parser.parse_args(argv)
+
+    with tempfile.TemporaryDirectory() as tmpdir:
+        root = Path(tmpdir)
+        results = (
+            bench_cold_import(args.repeat)
+            + bench_projects(root, tuple(args.pipelines), args.repeat)
+            + bench_driver_build(root, tuple(args.nodes), args.repeat)
+            + bench_tiny_run(root, args.repeat)
+        )
+
+    report = {
+        "benchmark": "framework",
+        "created_at": time.time(),
+        "environment": environment(),
+        "results": results,
+    }
+    if args.output:
+        Path(args.output).write_text(json.dumps(report, indent=2) + "\n")
+    else:
+        json.dump(report, sys.stdout, indent=2)
+        sys.stdout.write("\n")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
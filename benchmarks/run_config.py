@@ -0,0 +1,112 @@
+"""RunConfig cloning and merge-planning microbenchmarks.
+
+``clone`` measures :func:`flowerpower.utils.config.clone_run_config` and
+:func:`flowerpower.utils.config.merge_run_configs` for growing input payloads.
+With copy-on-write cloning the per-call time stays flat regardless of how large
+the input values are. The payload is an opaque ``bytearray`` leaf, standing in
+for DataFrames or arrays passed as pipeline inputs.
+
+``merge`` compares per-run planning work: diffing against a freshly built
+``RunConfig()`` (the former approach) versus a cached merge-plan lookup.
+
+Usage::
+
+    python benchmarks/run_config.py [--sizes 1000 1000000 100000000] [--number 200]
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import sys
+import timeit
+
+from flowerpower.cfg.pipeline.run import RunConfig
+from flowerpower.utils.config import (
+    RunConfigBuilder,
+    build_sparse_struct_patch,
+    clone_run_config,
+    compile_merge_plan,
+    merge_run_configs,
+)
+
+DEFAULT_SIZES = (1_000, 1_000_000, 100_000_000)
+
+
+def _per_call_us(func, number: int, repeat: int = 5) -> float:
+    return min(timeit.repeat(func, number=number, repeat=repeat)) / number * 1e6
+
+
+def bench_clone(sizes: tuple[int, ...], number: int) -> list[dict]:
+    """Time cloning and merging a RunConfig whose input is ``size`` bytes."""
+    results = []
+    for size in sizes:
+        payload = bytearray(size)
+        base = RunConfig(inputs={"payload": payload}, config={"mode": "bench"})
+        override = RunConfig(inputs={"other": payload})
+        results.append(
+            {
+                "input_bytes": size,
+                "clone_us": round(_per_call_us(lambda: clone_run_config(base), number), 2),
+                "merge_us": round(
+                    _per_call_us(lambda: merge_run_configs(base, override), number), 2
+                ),
+            }
+        )
+    return results
+
+
+def bench_merge(number: int) -> dict:
+    """Time per-run merge planning for a typical CLI-built override."""
+    base = RunConfig.from_dict(
+        {
+            "inputs": {"a": 1},
+            "final_vars": ["x"],
+            "executor": {"type": "threadpool", "max_workers": 4},
+            "retry": {"max_retries": 2},
+        }
+    )
+    override = (
+        RunConfigBuilder()
+        .with_inputs({"b": 2})
+        .with_final_vars(["y"])
+        .with_executor("synchronous")
+        .build()
+    )
+    return {
+        "fresh_default_diff_us": round(
+            _per_call_us(
+                lambda: build_sparse_struct_patch(override, RunConfig()), number
+            ),
+            2,
+        ),
+        "cached_plan_lookup_us": round(
+            _per_call_us(lambda: compile_merge_plan(override), number), 2
+        ),
+        "merge_us": round(
+            _per_call_us(lambda: merge_run_configs(base, override), number), 2
+        ),
+    }
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--sizes", type=int, nargs="+", default=list(DEFAULT_SIZES))
+    parser.add_argument("--number", type=int, default=200)
+    args = parser.parse_args(argv)
+
+    json.dump(
+        {
+            "benchmark": "run_config",
+            "clone": bench_clone(tuple(args.sizes), args.number),
+            "merge": bench_merge(args.number * 10),
+        },
+        sys.stdout,
+        indent=2,
+    )
+    sys.stdout.write("\n")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
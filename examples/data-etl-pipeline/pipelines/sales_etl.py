@@ -9,12 +9,16 @@ import pandas as pd
 from hamilton.function_modifiers import config, parameterize
 from loguru import logger
 
+from flowerpower import params
 from flowerpower.cfg import Config
 
 # Load pipeline configuration
-PARAMS = Config.load(
-    Path(__file__).parents[1], pipeline_name="sales_etl"
-).pipeline.h_params
+PARAMS = params(
+    "sales_etl",
+    fallback=lambda: Config.load(
+        Path(__file__).parents[1], pipeline_name="sales_etl"
+    ).pipeline.h_params,
+)
 
 
 # === DATA LOADING ===
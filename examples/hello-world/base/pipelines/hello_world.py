@@ -10,11 +10,15 @@ import pandas as pd
 from hamilton.function_modifiers import config, parameterize
 from loguru import logger
 
+from flowerpower import params
 from flowerpower.cfg import Config
 
-PARAMS = Config.load(
-    Path(__file__).parents[1], pipeline_name="hello_world"
-).pipeline.h_params
+PARAMS = params(
+    "hello_world",
+    fallback=lambda: Config.load(
+        Path(__file__).parents[1], pipeline_name="hello_world"
+    ).pipeline.h_params,
+)
 
 
 @config.when(range=10_000)
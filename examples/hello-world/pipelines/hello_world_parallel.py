@@ -10,15 +10,19 @@ from hamilton.htypes import Parallelizable, Collect
 
 from pathlib import Path
 
+from flowerpower import params
 from flowerpower.cfg import Config
 import requests
 
 ####################################################################################################
 # Load pipeline parameters. Do not modify this section.
 
-PARAMS = Config.load(
-    Path(__file__).parents[1], pipeline_name="hello_world_parallel"
-).pipeline.h_params
+PARAMS = params(
+    "hello_world_parallel",
+    fallback=lambda: Config.load(
+        Path(__file__).parents[1], pipeline_name="hello_world_parallel"
+    ).pipeline.h_params,
+)
 
 
 ####################################################################################################
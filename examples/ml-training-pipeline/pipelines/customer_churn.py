@@ -20,12 +20,16 @@ from sklearn.model_selection import (GridSearchCV, cross_val_score,
                                      train_test_split)
 from sklearn.preprocessing import LabelEncoder, StandardScaler
 
+from flowerpower import params
 from flowerpower.cfg import Config
 
 # Load pipeline configuration
-PARAMS = Config.load(
-    Path(__file__).parents[1], pipeline_name="customer_churn"
-).pipeline.h_params
+PARAMS = params(
+    "customer_churn",
+    fallback=lambda: Config.load(
+        Path(__file__).parents[1], pipeline_name="customer_churn"
+    ).pipeline.h_params,
+)
 
 
 # === DATA LOADING ===
@@ -1,10 +1,25 @@
-import importlib.metadata
+import importlib
+from typing import TYPE_CHECKING
 
-from .cfg import Config, PipelineConfig, ProjectConfig
-from .flowerpower import FlowerPower, FlowerPowerProject, create_project
-from .pipeline import PipelineManager
+if TYPE_CHECKING:
+    from .cfg import Config, PipelineConfig, ProjectConfig
+    from .flowerpower import FlowerPower, FlowerPowerProject, create_project
+    from .pipeline import PipelineManager
+    from .pipeline.params import params
 
-__version__ = importlib.metadata.version("FlowerPower")
+# Public names are imported on first access (PEP 562) so that ``import
+# flowerpower`` and CLI start-up do not pay for Hamilton, fsspeckit and the
+# dataframe libraries they pull in.
+_LAZY_IMPORTS = {
+    "Config": ".cfg",
+    "PipelineConfig": ".cfg",
+    "ProjectConfig": ".cfg",
+    "FlowerPower": ".flowerpower",
+    "FlowerPowerProject": ".flowerpower",
+    "create_project": ".flowerpower",
+    "PipelineManager": ".pipeline",
+    "params": ".pipeline.params",
+}
 
 __all__ = [
     "__version__",
@@ -15,4 +30,23 @@ __all__ = [
     "Config",
     "ProjectConfig",
     "PipelineConfig",
+    "params",
 ]
+
+
+def __getattr__(name: str):
+    if name == "__version__":
+        from importlib.metadata import version
+
+        value = version("FlowerPower")
+    elif name in _LAZY_IMPORTS:
+        module = importlib.import_module(_LAZY_IMPORTS[name], __name__)
+        value = getattr(module, name)
+    else:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list[str]:
+    return sorted({*globals(), *__all__})
@@ -163,6 +163,8 @@ class Config(BaseConfig):
             pipelines_dir=pipelines_dir,
         )
 
+        # One concurrent read wave for all candidates on remote filesystems.
+        config_manager.prefetch([pipeline_name])
         project = config_manager.load_project_config(name=name)
         pipeline = config_manager.load_pipeline_config(pipeline_name)
 
@@ -18,7 +18,7 @@ from ...utils.security import (
     validate_file_path,
     validate_pipeline_name,
 )
-from ...utils.yaml_env import interpolate_env_in_data
+from ...utils.yaml_env import load_yaml_with_env
 from ..base import BaseConfig
 from ..exceptions import ConfigLoadError, ConfigSaveError
 from .adapter import AdapterConfig
@@ -168,8 +168,40 @@ class PipelineConfig(BaseConfig):
 
         try:
             with fs.open(str(validated_path)) as f:
-                raw = yaml.safe_load(f) or {}
-                data = interpolate_env_in_data(raw)
+                raw = f.read()
+        except Exception as e:
+            raise ConfigLoadError(
+                f"Failed to load configuration from {validated_path}",
+                path=str(validated_path),
+                original_error=e,
+            ) from e
+        return cls.from_raw(name=name, raw=raw, path=validated_path, fs=fs)
+
+    @classmethod
+    def from_raw(
+        cls,
+        name: str,
+        raw: bytes | str,
+        path: str,
+        fs: AbstractFileSystem | None = None,
+    ):
+        """Build a pipeline configuration from already-read YAML content.
+
+        Args:
+            name: Pipeline name, used when the YAML has no ``name`` key.
+            raw: YAML content of the pipeline config file.
+            path: Path the content was read from.
+            fs: Filesystem used to rewrite configs with legacy retry fields.
+                Migration is not persisted when omitted.
+
+        Returns:
+            Loaded pipeline configuration.
+
+        Raises:
+            ConfigLoadError: If parsing or validation fails.
+        """
+        try:
+            data = load_yaml_with_env(raw)
 
             migrated = False
             if isinstance(data, dict) and isinstance(data.get("run"), dict):
@@ -180,14 +212,14 @@ class PipelineConfig(BaseConfig):
 
             pipeline = cls.from_dict(name=pipeline_name, data=data)
 
-            if migrated:
-                pipeline.to_yaml(path=validated_path, fs=fs)
+            if migrated and fs is not None:
+                pipeline.to_yaml(path=path, fs=fs)
 
             return pipeline
         except Exception as e:
             raise ConfigLoadError(
-                f"Failed to load configuration from {validated_path}",
-                path=str(validated_path),
+                f"Failed to load configuration from {path}",
+                path=str(path),
                 original_error=e,
             ) from e
 
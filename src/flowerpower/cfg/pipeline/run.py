@@ -88,6 +88,8 @@ class WithAdapterConfig(BaseConfig):
     # opentelemetry: bool = msgspec.field(default=False)  # Removed - see flo-apob
     progressbar: bool = msgspec.field(default=False)
     future: bool = msgspec.field(default=False)
+    profiler: bool = msgspec.field(default=False)
+    memory_profiler: bool = msgspec.field(default=False)
 
 
 class ExecutorConfig(BaseConfig):
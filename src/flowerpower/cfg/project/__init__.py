@@ -10,7 +10,7 @@ from ...utils.security import (
     validate_directory_fragment,
     validate_file_path,
 )
-from ...utils.yaml_env import interpolate_env_in_data
+from ...utils.yaml_env import load_yaml_with_env
 from ..base import BaseConfig
 from ..exceptions import ConfigLoadError
 from .adapter import AdapterConfig
@@ -144,11 +144,24 @@ class ProjectConfig(BaseConfig):
                 path=str(validated_path),
                 original_error=e,
             ) from e
-        try:
-            import yaml as _yaml
+        return cls.from_raw(raw, path=str(validated_path))
+
+    @classmethod
+    def from_raw(cls, raw: bytes | str, path: str):
+        """Build a project configuration from already-read YAML content.
 
-            data = _yaml.safe_load(raw) or {}
-            data = interpolate_env_in_data(data)
+        Args:
+            raw: YAML content of the project config file.
+            path: Path the content was read from, used in error messages.
+
+        Returns:
+            ProjectConfig: Parsed project configuration.
+
+        Raises:
+            ConfigLoadError: If parsing or validation fails.
+        """
+        try:
+            data = load_yaml_with_env(raw)
         except Exception as e:
             raise ConfigLoadError(
                 f"Failed to parse YAML for {path}", path=path, original_error=e
@@ -157,8 +170,8 @@ class ProjectConfig(BaseConfig):
             return msgspec.convert(data, cls)
         except Exception as e:
             raise ConfigLoadError(
-                f"Failed to validate configuration from {validated_path}",
-                path=str(validated_path),
+                f"Failed to validate configuration from {path}",
+                path=path,
                 original_error=e,
             ) from e
 
@@ -4,8 +4,11 @@ import os
 import typer
 from loguru import logger
 
-from ..flowerpower import FlowerPowerProject
+from ..settings import BUNDLE_PATH, SERVE_ADDR, SERVE_PORT, SERVE_SOCKET
+from ..utils.logging import ensure_logging_initialized
+from .bench import app as bench_app
 from .pipeline import app as pipeline_app
+from .pipeline import parse_common_options
 from .utils import parse_dict_or_list_param
 
 app = typer.Typer(
@@ -17,6 +20,16 @@ app = typer.Typer(
 app.add_typer(
     pipeline_app, name="pipeline", help="Manage and execute FlowerPower pipelines"
 )
+app.add_typer(
+    bench_app, name="bench", help="Compare FlowerPower benchmark results"
+)
+
+
+@app.callback()
+def main():
+    # Configure logging once per invocation instead of at import time, so
+    # ``--help`` and shell completion stay cheap.
+    ensure_logging_initialized()
 
 
 @app.command()
@@ -58,6 +71,8 @@ def init(
         # Create a project in a specific location
         $ flowerpower init --name my-project --base-dir /path/to/projects
     """
+    from ..flowerpower import FlowerPowerProject
+
     parsed_storage_options = {}
     if storage_options:
         try:
@@ -85,6 +100,173 @@ def init(
         raise typer.Exit(code=1)
 
 
+@app.command("compile")
+def compile_project(
+    base_dir: str | None = typer.Option(
+        None, "--base-dir", "-d", help="Base directory of the project"
+    ),
+    storage_options: str | None = typer.Option(
+        None,
+        "--storage-options",
+        "-s",
+        help="Storage options as JSON, dict string, or key=value pairs",
+    ),
+    log_level: str | None = typer.Option(
+        None,
+        "--log-level",
+        help="Logging level (debug, info, warning, error, critical)",
+    ),
+    output: str = typer.Option(
+        BUNDLE_PATH, "--output", "-o", help="Bundle path relative to the project"
+    ),
+    dag: bool = typer.Option(True, help="Import modules and include DAG summaries"),
+    check: bool = typer.Option(
+        False, "--check", help="Only verify that the existing bundle is up to date"
+    ),
+):
+    """
+    Compile the project into a bundle for fast worker cold starts.
+
+    The bundle contains the project config, all pipeline configs, discovered
+    pipeline names and paths, module source hashes and DAG summaries. Pipeline
+    managers load it instead of scanning the project while it is present, was
+    compiled by the same FlowerPower version and no pipeline or config file
+    changed since. Recompile after editing pipelines or configs so workers
+    keep using it, or set FP_USE_BUNDLE=false to ignore it.
+
+    Args:
+        base_dir: Base directory of the project
+        storage_options: Options for storage backends
+        log_level: Set the logging level
+        output: Bundle path relative to the project root
+        dag: Whether to include DAG summaries (imports every pipeline module)
+        check: Verify the existing bundle instead of writing a new one; exits
+               with code 1 when it is missing or stale
+
+    Examples:
+        # Compile the project in the current directory
+        $ flowerpower compile
+
+        # Skip importing modules
+        $ flowerpower compile --no-dag
+
+        # Fail a CI job when the committed bundle is stale
+        $ flowerpower compile --check
+    """
+    from ..pipeline.manager import PipelineManager
+
+    base_dir, parsed_storage_options, log_level = parse_common_options(
+        base_dir, storage_options, log_level
+    )
+    with PipelineManager(
+        base_dir=base_dir,
+        storage_options=parsed_storage_options,
+        log_level=log_level,
+    ) as manager:
+        if check:
+            stale = manager.check_bundle(path=output)
+            if stale is None:
+                logger.error(f"No usable bundle at {output}")
+                raise typer.Exit(code=1)
+            if stale:
+                logger.error(f"Bundle {output} is stale: {', '.join(stale)}")
+                raise typer.Exit(code=1)
+            logger.info(f"Bundle {output} is up to date")
+            return
+
+        bundle = manager.compile(path=output, include_dag=dag)
+        logger.info(f"Compiled {len(bundle.pipelines)} pipeline(s) into {output}")
+
+
+@app.command()
+def serve(
+    base_dir: str | None = typer.Option(
+        None, "--base-dir", "-d", help="Base directory of the project"
+    ),
+    storage_options: str | None = typer.Option(
+        None,
+        "--storage-options",
+        "-s",
+        help="Storage options as JSON, dict string, or key=value pairs",
+    ),
+    log_level: str | None = typer.Option(
+        "info",
+        "--log-level",
+        help="Logging level of the daemon (debug, info, warning, error, critical)",
+    ),
+    host: str = typer.Option(SERVE_ADDR, "--host", help="Address to bind"),
+    port: int = typer.Option(SERVE_PORT, "--port", "-p", help="Port to bind"),
+    socket_path: str | None = typer.Option(
+        SERVE_SOCKET, "--socket", help="Serve on this Unix socket instead of TCP"
+    ),
+    max_concurrent: int = typer.Option(
+        1, "--max-concurrent", help="Number of runs executed at the same time"
+    ),
+):
+    """
+    Serve pipeline runs from a long-running daemon with a warm project.
+
+    The daemon loads the project once and keeps pipeline modules, configs and
+    executor pools warm, so `pipeline run --remote` skips interpreter start-up,
+    imports and project loading. Log records and the result of each run are
+    streamed back to the client. Restart the daemon after editing pipeline
+    code or configs.
+
+    Args:
+        base_dir: Base directory of the project
+        storage_options: Options for storage backends
+        log_level: Set the logging level of the daemon
+        host: Address to bind when serving TCP
+        port: Port to bind
+        socket_path: Unix socket to serve on instead of TCP
+        max_concurrent: Number of runs executed at the same time
+
+    Examples:
+        # Serve the project in the current directory on 127.0.0.1:8250
+        $ flowerpower serve
+
+        # Serve on a Unix socket
+        $ flowerpower serve --socket /tmp/flowerpower.sock
+
+        # Run against the daemon
+        $ flowerpower pipeline run my_pipeline --remote http://127.0.0.1:8250
+    """
+    from ..flowerpower import FlowerPowerProject
+    from ..server import RunServer
+
+    base_dir, parsed_storage_options, log_level = parse_common_options(
+        base_dir, storage_options, log_level
+    )
+    project = FlowerPowerProject.load(
+        base_dir=base_dir,
+        storage_options=parsed_storage_options,
+        log_level=log_level,
+    )
+    if project is None:
+        logger.error(f"Failed to load FlowerPower project from {base_dir or '.'}")
+        raise typer.Exit(code=1)
+
+    try:
+        server = RunServer(
+            project,
+            host=host,
+            port=port,
+            socket_path=socket_path,
+            max_concurrent=max_concurrent,
+        )
+    except (OSError, ValueError) as e:
+        logger.error(f"Cannot start server: {e}")
+        raise typer.Exit(code=1)
+
+    typer.echo(f"Serving FlowerPower project on {server.address} (Ctrl+C to stop)")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.close()
+
+
 @app.command()
 def ui(
     port: int = typer.Option(8241, "--port", "-p", help="Port to run the UI server on"),
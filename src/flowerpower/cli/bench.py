@@ -0,0 +1,108 @@
+import typer
+from loguru import logger
+
+app = typer.Typer(help="Benchmark tooling commands")
+
+
+@app.command()
+def compare(
+    base: str = typer.Argument(..., help="Benchmark report of the base revision"),
+    head: str = typer.Argument(..., help="Benchmark report of the revision under test"),
+    threshold: float = typer.Option(
+        0.05,
+        "--threshold",
+        "-t",
+        help="Minimum relative change of the median to flag (0.05 = 5%)",
+    ),
+    alpha: float = typer.Option(
+        0.05, "--alpha", help="Significance level of the Mann-Whitney U test"
+    ),
+    group: list[str] | None = typer.Option(
+        None,
+        "--group",
+        "-g",
+        help="Only compare this group (cold_start, overhead, memory); repeatable",
+    ),
+    fail_on_regression: bool = typer.Option(
+        True,
+        "--fail-on-regression/--no-fail-on-regression",
+        help="Exit with code 1 when a regression is found",
+    ),
+):
+    """
+    Compare two benchmark reports and flag significant regressions.
+
+    Each benchmark present in both reports is tested with a two-sided
+    Mann-Whitney U test on its raw samples. It is reported as a regression
+    (or improvement) when the median moved by more than the threshold and the
+    difference is significant at alpha. Use at least five samples per side
+    (benchmarks/framework.py --repeat) for the test to reach significance.
+
+    Args:
+        base: Report of the base revision
+        head: Report of the revision under test
+        threshold: Minimum relative change of the median to flag
+        alpha: Significance level of the test
+        group: Benchmark groups to compare
+        fail_on_regression: Exit with code 1 on regressions
+
+    Examples:
+        # Compare two runs of benchmarks/framework.py
+        $ flowerpower bench compare base.json head.json
+
+        # Only cold-start and memory, flag changes above 10%
+        $ flowerpower bench compare base.json head.json -g cold_start -g memory -t 0.1
+    """
+    from rich.console import Console
+    from rich.table import Table
+
+    from ..utils.benchmark import compare_reports, load_report
+
+    try:
+        comparisons = compare_reports(
+            load_report(base),
+            load_report(head),
+            threshold=threshold,
+            alpha=alpha,
+            groups=group,
+        )
+    except (OSError, ValueError) as e:
+        logger.error(f"Cannot compare benchmark reports: {e}")
+        raise typer.Exit(code=1)
+
+    def fmt(value: float | None, unit: str) -> str:
+        if value is None:
+            return "-"
+        if unit == "s":
+            return f"{value * 1e3:.3f} ms"
+        if unit == "bytes":
+            return f"{value / 1024:.1f} KiB"
+        return f"{value:.4g} {unit}"
+
+    styles = {"regression": "bold red", "improvement": "green", "unchanged": "dim"}
+    table = Table(title="Benchmark Comparison (base → head)")
+    table.add_column("Benchmark", style="cyan", overflow="fold")
+    table.add_column("Group")
+    table.add_column("Base", justify="right")
+    table.add_column("Head", justify="right")
+    table.add_column("Change", justify="right")
+    table.add_column("p", justify="right")
+    table.add_column("Verdict")
+    for comparison in comparisons:
+        style = styles.get(comparison.verdict, "yellow")
+        table.add_row(
+            comparison.id,
+            comparison.group,
+            fmt(comparison.base_median, comparison.unit),
+            fmt(comparison.head_median, comparison.unit),
+            "-" if comparison.change is None else f"{comparison.change:+.1%}",
+            "-" if comparison.p_value is None else f"{comparison.p_value:.3f}",
+            f"[{style}]{comparison.verdict}[/{style}]",
+        )
+    Console().print(table)
+
+    regressions = [c.id for c in comparisons if c.verdict == "regression"]
+    if regressions:
+        logger.warning(f"{len(regressions)} regression(s): {', '.join(regressions)}")
+        if fail_on_regression:
+            raise typer.Exit(code=1)
@@ -1,20 +1,14 @@
 # Import necessary libraries
+import os
 from typing import Annotated, Any
 
 import typer
 from loguru import logger
 
-from ..cfg.pipeline.run import RunConfig
-from ..flowerpower import FlowerPowerProject
-from ..pipeline.manager import PipelineManager
-from ..pipeline.registry import HookType
-from ..utils.config import RunConfigBuilder
-from ..utils.logging import setup_logging
+from ..pipeline.hook_types import HookType
 from ..utils.security import validate_executor_type
 from .utils import parse_dict_or_list_param
 
-setup_logging()
-
 app = typer.Typer(help="Pipeline management commands")
 
 
@@ -92,6 +86,16 @@ def run(
     jitter_factor: float | None = typer.Option(
         None, help="Random factor applied to delay for jitter (0-1)"
     ),
+    remote: str | None = typer.Option(
+        None,
+        "--remote",
+        help="Run on a `flowerpower serve` daemon (http://host:port or unix:///path.sock)",
+    ),
+    watch: bool = typer.Option(
+        False,
+        "--watch",
+        help="Re-run on changes to the pipeline code or config, recomputing only affected nodes",
+    ),
 ):
     """
     Run a pipeline immediately.
@@ -113,6 +117,10 @@ def run(
         max_retries: Maximum number of retry attempts on failure
         retry_delay: Base delay between retries in seconds
         jitter_factor: Random factor applied to delay for jitter (0-1)
+        remote: Address of a `flowerpower serve` daemon to run on; base_dir and
+                storage_options are then taken from the daemon's project
+        watch: Keep watching the pipeline module, additional modules and YAML
+               and re-run after every change
 
     Examples:
         # Run a pipeline with default settings
@@ -138,18 +146,47 @@ def run(
 
         # Configure automatic retries on failure
         $ pipeline run my_pipeline --max-retries 3 --retry-delay 2.0 --jitter-factor 0.2
+
+        # Run on a warm `flowerpower serve` daemon
+        $ pipeline run my_pipeline --remote http://127.0.0.1:8250
+
+        # Re-run after every edit, reusing results of unchanged nodes
+        $ pipeline run my_pipeline --watch
     """
     # Parse parameters at the CLI edge. ``None`` means the flag was not supplied,
     # so the value is not folded into the partial RunConfig and pipeline defaults
     # remain untouched.
-    parsed_inputs = parse_dict_or_list_param(inputs, "dict")
-    parsed_config = parse_dict_or_list_param(config, "dict")
-    parsed_cache = parse_dict_or_list_param(cache, "dict")
-    parsed_final_vars = parse_dict_or_list_param(final_vars, "list")
-    parsed_storage_options = parse_dict_or_list_param(storage_options, "dict")
-    parsed_with_adapter = parse_dict_or_list_param(with_adapter, "dict")
-    parsed_executor_cfg = parse_dict_or_list_param(executor_cfg, "dict")
+    executor_cfg_dict = parse_dict_or_list_param(executor_cfg, "dict") or {}
+    if executor is not None:
+        executor_cfg_dict["type"] = executor
+    if executor_max_workers is not None:
+        executor_cfg_dict["max_workers"] = executor_max_workers
+    if executor_num_cpus is not None:
+        executor_cfg_dict["num_cpus"] = executor_num_cpus
+    options = {
+        "inputs": parse_dict_or_list_param(inputs, "dict"),
+        "final_vars": parse_dict_or_list_param(final_vars, "list"),
+        "config": parse_dict_or_list_param(config, "dict"),
+        "cache": parse_dict_or_list_param(cache, "dict"),
+        "with_adapter": parse_dict_or_list_param(with_adapter, "dict"),
+        "log_level": log_level,
+        "executor_cfg": executor_cfg_dict or None,
+        "max_retries": max_retries,
+        "retry_delay": retry_delay,
+        "jitter_factor": jitter_factor,
+    }
+
+    if remote is not None:
+        if watch:
+            logger.error("--watch cannot be combined with --remote")
+            raise typer.Exit(1)
+        _run_remote(remote, name, options)
+        return
 
+    from ..flowerpower import FlowerPowerProject
+    from ..utils.config import run_config_from_options
+
+    parsed_storage_options = parse_dict_or_list_param(storage_options, "dict")
     # Ensure storage_options is a dict for FlowerPowerProject.load
     if parsed_storage_options is not None and not isinstance(
         parsed_storage_options, dict
@@ -168,75 +205,10 @@ def run(
         raise typer.Exit(1)
 
     try:
-        # Build a partial RunConfig so only explicitly supplied CLI values are
-        # treated as overrides.  This preserves the raw intent of nested config
-        # blocks (executor, retry, adapter) via the builder.
-        builder = RunConfigBuilder()
-
-        if parsed_inputs is not None:
-            if not isinstance(parsed_inputs, dict):
-                logger.warning(f"Expected dict for inputs, got {type(parsed_inputs)}")
-            else:
-                builder.with_inputs(parsed_inputs)
-
-        if parsed_final_vars is not None:
-            if not isinstance(parsed_final_vars, list):
-                logger.warning(
-                    f"Expected list for final_vars, got {type(parsed_final_vars)}"
-                )
-            else:
-                builder.with_final_vars(parsed_final_vars)
-
-        if parsed_config is not None:
-            if not isinstance(parsed_config, dict):
-                logger.warning(f"Expected dict for config, got {type(parsed_config)}")
-            else:
-                builder.with_config(parsed_config)
-
-        if parsed_cache is not None:
-            builder.with_cache(parsed_cache)
-
-        if parsed_with_adapter is not None:
-            if not isinstance(parsed_with_adapter, dict):
-                logger.warning(
-                    f"Expected dict for with_adapter, got {type(parsed_with_adapter)}"
-                )
-            else:
-                builder.with_with_adapter_cfg(parsed_with_adapter)
-
-        if log_level is not None:
-            builder.with_logging(log_level)
-
-        # Handle executor configuration (type + config + convenience flags)
-        try:
-            executor_cfg_dict = parsed_executor_cfg if parsed_executor_cfg is not None else {}
-            if executor is not None:
-                validate_executor_type(executor)
-                executor_cfg_dict["type"] = executor
-            if executor_max_workers is not None:
-                executor_cfg_dict["max_workers"] = executor_max_workers
-            if executor_num_cpus is not None:
-                executor_cfg_dict["num_cpus"] = executor_num_cpus
-
-            if executor_cfg_dict:
-                builder.with_executor(executor_cfg_dict)
-        except (ValueError, TypeError) as e:
-            logger.error(f"Invalid executor configuration: {e}")
-            raise typer.Exit(1)
-
-        # Handle retry configuration only when at least one retry flag is given
-        retry_kwargs: dict[str, Any] = {}
-        if max_retries is not None:
-            retry_kwargs["max_retries"] = max_retries
-        if retry_delay is not None:
-            retry_kwargs["retry_delay"] = retry_delay
-        if jitter_factor is not None:
-            retry_kwargs["jitter_factor"] = jitter_factor
-        if retry_kwargs:
-            builder.with_retry_config(**retry_kwargs)
-
-        run_config = builder.build()
-
+        run_config = run_config_from_options(**options)
+        if watch:
+            _run_watch(project, name, run_config)
+            return
         result = project.run(name=name, run_config=run_config)
         output_names = ", ".join(result.keys()) if result else "<none>"
         typer.echo(f"Pipeline '{name}' finished. Outputs: {output_names}")
@@ -252,6 +224,401 @@ def run(
         raise typer.Exit(1)
 
 
+def _run_watch(project, name: str, run_config) -> None:
+    """Run ``name`` and re-run it after every change until interrupted."""
+
+    def report(result) -> None:
+        trigger = ""
+        if result.changed:
+            files = ", ".join(os.path.basename(path) for path in result.changed)
+            trigger = f" ({files} changed)"
+        if result.error is not None:
+            logger.error(
+                f"[{result.iteration}] Pipeline '{name}' failed after "
+                f"{result.duration:.3f}s{trigger}: {result.error}"
+            )
+            return
+        outputs = ", ".join(result.outputs) if result.outputs else "<none>"
+        typer.echo(
+            f"[{result.iteration}] Pipeline '{name}' finished in "
+            f"{result.duration:.3f}s{trigger}: {len(result.computed)} node(s) "
+            f"computed, {len(result.reused)} reused. Outputs: {outputs}"
+        )
+
+    typer.echo(f"Watching pipeline '{name}' for changes, press Ctrl+C to stop.")
+    try:
+        project.pipeline_manager.run_watch(name, run_config, on_iteration=report)
+    except KeyboardInterrupt:
+        typer.echo("Stopped watching.")
+
+
+def _run_remote(address: str, name: str, options: dict[str, Any]) -> None:
+    """Run ``name`` on a `flowerpower serve` daemon and stream its output."""
+    from ..server import RunClient, ServerError
+
+    options = {key: value for key, value in options.items() if value is not None}
+    try:
+        for event in RunClient(address).run(
+            name, options, log_level=options.get("log_level")
+        ):
+            kind = event.get("event")
+            if kind == "log":
+                typer.echo(
+                    f"{event['time']} | {event['level']: <8} | {event['message']}",
+                    err=True,
+                )
+            elif kind == "result":
+                outputs = event.get("outputs") or {}
+                output_names = ", ".join(outputs) if outputs else "<none>"
+                typer.echo(
+                    f"Pipeline '{name}' finished in {event['duration']:.3f}s. "
+                    f"Outputs: {output_names}"
+                )
+                return
+            elif kind == "error":
+                logger.error(
+                    f"Pipeline execution failed: {event['type']}: {event['error']}"
+                )
+                raise typer.Exit(1)
+    except ServerError as e:
+        logger.error(f"FlowerPower server rejected the run: {e}")
+        raise typer.Exit(1)
+    except OSError as e:
+        logger.error(f"Cannot reach FlowerPower server at {address}: {e}")
+        raise typer.Exit(1)
+    logger.error(f"FlowerPower server at {address} closed the connection mid-run")
+    raise typer.Exit(1)
+
+
+@app.command()
+def run_batch(
+    name: str = typer.Argument(..., help="Name of the pipeline to run"),
+    inputs_file: str = typer.Option(
+        ...,
+        "--inputs-file",
+        "-i",
+        help="JSON Lines (.jsonl) or Parquet (.parquet) file with one inputs object per row",
+    ),
+    output: str = typer.Option(
+        ...,
+        "--output",
+        "-o",
+        help="Result file (.jsonl or .parquet), written as rows finish",
+    ),
+    parallel: int = typer.Option(
+        1, "--parallel", "-p", help="Number of rows to run at the same time"
+    ),
+    resume: bool = typer.Option(
+        True,
+        "--resume/--no-resume",
+        help="Skip rows that already succeeded in the output file instead of overwriting it; failed rows run again",
+    ),
+    inputs: str | None = typer.Option(
+        None, help="Inputs shared by all rows as JSON, dict string, or key=value pairs"
+    ),
+    final_vars: str | None = typer.Option(
+        None, "--final-vars", help="Final variables as JSON or list"
+    ),
+    config: str | None = typer.Option(
+        None, help="Config for the hamilton pipeline executor"
+    ),
+    base_dir: str | None = typer.Option(
+        None, "--base-dir", "-d", help="Base directory for the pipeline"
+    ),
+    storage_options: str | None = typer.Option(
+        None,
+        "--storage-options",
+        "-s",
+        help="Storage options as JSON, dict string, or key=value pairs",
+    ),
+    log_level: str | None = typer.Option(
+        None,
+        "--log-level",
+        help="Logging level (debug, info, warning, error, critical)",
+    ),
+):
+    """
+    Run a pipeline once per row of an input file.
+
+    Rows are streamed from the inputs file and each row's fields are merged
+    over the pipeline inputs. The pipeline is prepared once and shared by all
+    rows, which run on up to --parallel threads. Every finished row is
+    appended to the output file with its status, duration, inputs and outputs
+    (or error), so an interrupted batch resumes where it stopped when the
+    command is run again; rows that failed are run again. Exits with code 1 if any row failed.
+
+    Args:
+        name: Name of the pipeline to run
+        inputs_file: File with one inputs object per row
+        output: File the results are written to
+        parallel: Number of rows to run at the same time
+        resume: Skip rows that already succeeded in the output file
+        inputs: Inputs shared by all rows
+        final_vars: Final variables to request from the pipeline
+        config: Configuration for the Hamilton executor
+        base_dir: Base directory containing pipelines and configurations
+        storage_options: Options for storage backends
+        log_level: Set the logging level
+
+    Examples:
+        # Score every row of inputs.jsonl with 8 rows in flight
+        $ pipeline run-batch scoring --inputs-file inputs.jsonl --parallel 8 --output results.jsonl
+
+        # Parameter sweep from Parquet, starting over
+        $ pipeline run-batch sweep -i grid.parquet -o results.parquet --no-resume
+    """
+    from ..pipeline.manager import PipelineManager
+    from ..utils.config import run_config_from_options
+
+    base_dir, parsed_storage_options, log_level = parse_common_options(
+        base_dir, storage_options, log_level
+    )
+    run_config = run_config_from_options(
+        inputs=parse_dict_or_list_param(inputs, "dict"),
+        final_vars=parse_dict_or_list_param(final_vars, "list"),
+        config=parse_dict_or_list_param(config, "dict"),
+        log_level=log_level,
+    )
+
+    with PipelineManager(
+        base_dir=base_dir,
+        storage_options=parsed_storage_options,
+        log_level=log_level,
+    ) as manager:
+        try:
+            summary = manager.run_batch(
+                name,
+                inputs_file,
+                output,
+                run_config=run_config,
+                parallel=parallel,
+                resume=resume,
+            )
+        except (OSError, ValueError, ImportError, RuntimeError, TypeError) as e:
+            logger.error(f"Batch run failed: {e}")
+            raise typer.Exit(code=1)
+
+    typer.echo(
+        f"Pipeline '{name}' batch finished in {summary.duration:.3f}s: "
+        f"{summary.succeeded} succeeded, {summary.failed} failed, "
+        f"{summary.skipped} skipped of {summary.total} rows. Results: {output}"
+    )
+    if summary.failed:
+        raise typer.Exit(code=1)
+
+
+@app.command()
+def profile(
+    name: str = typer.Argument(..., help="Name of the pipeline to profile"),
+    inputs: str | None = typer.Option(
+        None, help="Input parameters as JSON, dict string, or key=value pairs"
+    ),
+    final_vars: str | None = typer.Option(
+        None,
+        "--final-vars",
+        "--outputs",
+        "-o",
+        help="Final variables as JSON or list",
+    ),
+    config: str | None = typer.Option(
+        None, help="Config for the hamilton pipeline executor"
+    ),
+    executor: str | None = typer.Option(
+        None, help="Executor to use for running the pipeline"
+    ),
+    trace_file: str | None = typer.Option(
+        None,
+        "--trace-file",
+        help="Where to write the trace JSON (default: <name>.trace.json)",
+    ),
+    trace_format: str = typer.Option(
+        "chrome", "--trace-format", help="Trace format: chrome or speedscope"
+    ),
+    top: int | None = typer.Option(
+        None, "--top", help="Show only the N slowest nodes in the table"
+    ),
+    memory: bool = typer.Option(
+        False,
+        "--memory",
+        help="Also record RSS deltas, tracemalloc peaks and output sizes per node",
+    ),
+    base_dir: str | None = typer.Option(
+        None, "--base-dir", "-d", help="Base directory for the pipeline"
+    ),
+    storage_options: str | None = typer.Option(
+        None,
+        "--storage-options",
+        "-s",
+        help="Storage options as JSON, dict string, or key=value pairs",
+    ),
+    log_level: str | None = typer.Option(
+        None,
+        "--log-level",
+        help="Logging level (debug, info, warning, error, critical)",
+    ),
+):
+    """
+    Run a pipeline and report where it spends its time.
+
+    The pipeline runs once with the per-node profiler attached. Nodes are
+    listed by total wall time together with CPU time and their share of the
+    run, and a trace file is written for chrome://tracing, Perfetto or
+    speedscope.
+
+    Args:
+        name: Name of the pipeline to profile
+        inputs: Input parameters for the pipeline
+        final_vars: Final variables to request from the pipeline
+        config: Configuration for the Hamilton executor
+        executor: Type of executor to use
+        trace_file: Path of the trace JSON file
+        trace_format: chrome (trace event format) or speedscope
+        top: Number of nodes to show in the table
+        memory: Record per-node memory usage (slows allocation-heavy nodes)
+        base_dir: Base directory containing pipelines and configurations
+        storage_options: Options for storage backends
+        log_level: Set the logging level
+
+    Examples:
+        # Profile a pipeline and write my_pipeline.trace.json
+        $ pipeline profile my_pipeline
+
+        # Show the 10 slowest nodes and write a speedscope profile
+        $ pipeline profile my_pipeline --top 10 --trace-format speedscope --trace-file run.speedscope.json
+
+        # Find the node that allocates the most memory
+        $ pipeline profile my_pipeline --memory
+    """
+    from pathlib import Path
+
+    import msgspec
+
+    from ..pipeline.manager import PipelineManager
+    from ..pipeline.presenter import PipelinePresenter
+    from ..pipeline.profiling import NodeProfiler
+
+    if trace_format not in ("chrome", "speedscope"):
+        logger.error(
+            f"Invalid trace format '{trace_format}', expected chrome or speedscope"
+        )
+        raise typer.Exit(code=1)
+
+    base_dir, parsed_storage_options, log_level = parse_common_options(
+        base_dir, storage_options, log_level
+    )
+    run_kwargs: dict[str, Any] = {}
+    parsed_inputs = parse_dict_or_list_param(inputs, "dict")
+    if parsed_inputs is not None:
+        run_kwargs["inputs"] = parsed_inputs
+    parsed_final_vars = parse_dict_or_list_param(final_vars, "list")
+    if parsed_final_vars is not None:
+        run_kwargs["final_vars"] = parsed_final_vars
+    parsed_config = parse_dict_or_list_param(config, "dict")
+    if parsed_config is not None:
+        run_kwargs["config"] = parsed_config
+    if executor is not None:
+        try:
+            validate_executor_type(executor)
+        except ValueError as e:
+            logger.error(f"Invalid executor configuration: {e}")
+            raise typer.Exit(code=1)
+        run_kwargs["executor_cfg"] = executor
+
+    profiler = NodeProfiler(log_top=0, memory=memory)
+    with PipelineManager(
+        base_dir=base_dir,
+        storage_options=parsed_storage_options,
+        log_level=log_level,
+    ) as manager:
+        try:
+            manager.run(name, adapter={"profiler": profiler}, **run_kwargs)
+        except (ValueError, ImportError, RuntimeError, TypeError) as e:
+            logger.error(f"Pipeline execution failed: {e}")
+            raise typer.Exit(code=1)
+
+    run_profile = profiler.profile
+    PipelinePresenter().show_profile(run_profile, top=top)
+
+    trace = (
+        run_profile.to_speedscope(name=name)
+        if trace_format == "speedscope"
+        else run_profile.to_chrome_trace()
+    )
+    trace_path = Path(trace_file or f"{name}.trace.json")
+    trace_path.write_bytes(msgspec.json.encode(trace))
+    typer.echo(f"Wrote {trace_format} trace to {trace_path}")
+
+
+@app.command()
+def history(
+    name: str = typer.Argument(..., help="Name of the pipeline"),
+    last: int = typer.Option(
+        100, "--last", help="Number of most recent runs to aggregate"
+    ),
+    runs: int = typer.Option(10, "--runs", help="Number of recent runs to list"),
+    status: str | None = typer.Option(
+        None, "--status", help="List only runs with this status (success, failure)"
+    ),
+    base_dir: str | None = typer.Option(
+        None, "--base-dir", "-d", help="Base directory for the pipeline"
+    ),
+    storage_options: str | None = typer.Option(
+        None,
+        "--storage-options",
+        "-s",
+        help="Storage options as JSON, dict string, or key=value pairs",
+    ),
+    log_level: str | None = typer.Option(
+        None,
+        "--log-level",
+        help="Logging level (debug, info, warning, error, critical)",
+    ),
+):
+    """
+    Show the recorded run history of a pipeline.
+
+    Prints run-time percentiles and the trend over the last runs, per-node
+    durations and output sizes, and the most recent runs with their status,
+    attempts and configuration hash. Runs are recorded in FP_HISTORY_PATH
+    unless FP_HISTORY_ENABLED is false.
+
+    Args:
+        name: Name of the pipeline
+        last: Number of most recent runs to aggregate
+        runs: Number of recent runs to list
+        status: Only list runs with this status
+        base_dir: Base directory containing pipelines and configurations
+        storage_options: Options for storage backends
+        log_level: Set the logging level
+
+    Examples:
+        # Percentiles over the last 100 runs
+        $ pipeline history my_pipeline
+
+        # Aggregate the last 20 runs and list recent failures
+        $ pipeline history my_pipeline --last 20 --status failure
+    """
+    from ..pipeline.manager import PipelineManager
+    from ..pipeline.presenter import PipelinePresenter
+
+    if status not in (None, "success", "failure"):
+        logger.error(f"Invalid status '{status}', expected success or failure")
+        raise typer.Exit(code=1)
+
+    base_dir, parsed_storage_options, log_level = parse_common_options(
+        base_dir, storage_options, log_level
+    )
+    with PipelineManager(
+        base_dir=base_dir,
+        storage_options=parsed_storage_options,
+        log_level=log_level,
+    ) as manager:
+        stats = manager.history_stats(name, last=last)
+        recent = manager.history(name, status=status, limit=runs)
+
+    PipelinePresenter().show_history(stats, recent)
+
+
 @app.command()
 def new(
     name: str = typer.Argument(..., help="Name of the pipeline to create"),
@@ -297,6 +664,8 @@ def new(
         # Create a pipeline in a specific directory
         $ pipeline new my_new_pipeline --base-dir /path/to/project
     """
+    from ..pipeline.manager import PipelineManager
+
     base_dir, parsed_storage_options, log_level = parse_common_options(
         base_dir, storage_options, log_level
     )
@@ -357,6 +726,8 @@ def delete(
         # Delete only the module file
         $ pipeline delete my_pipeline --module
     """
+    from ..pipeline.manager import PipelineManager
+
     base_dir, parsed_storage_options, log_level = parse_common_options(
         base_dir, storage_options, log_level
     )
@@ -428,6 +799,8 @@ def show_dag(
         # Get raw graphviz object
         $ pipeline show-dag my_pipeline --format raw
     """
+    from ..pipeline.manager import PipelineManager
+
     base_dir, parsed_storage_options, log_level = parse_common_options(
         base_dir, storage_options, log_level
     )
@@ -508,6 +881,8 @@ def save_dag(
         # Save to a custom location
         $ pipeline save-dag my_pipeline --output-path ./visualizations/my_graph.png
     """
+    from ..pipeline.manager import PipelineManager
+
     base_dir, parsed_storage_options, log_level = parse_common_options(
         base_dir, storage_options, log_level
     )
@@ -573,6 +948,8 @@ def show_pipelines(
         # List pipelines from a specific directory
         $ pipeline show-pipelines --base-dir /path/to/project
     """
+    from ..pipeline.manager import PipelineManager
+
     base_dir, parsed_storage_options, log_level = parse_common_options(
         base_dir, storage_options, log_level
     )
@@ -597,6 +974,138 @@ def show_pipelines(
                 manager.registry.show_pipelines()
 
 
+@app.command()
+def rebuild_index(
+    base_dir: str | None = typer.Option(
+        None, "--base-dir", "-d", help="Base directory for the pipeline"
+    ),
+    storage_options: str | None = typer.Option(
+        None,
+        "--storage-options",
+        "-s",
+        help="Storage options as JSON, dict string, or key=value pairs",
+    ),
+    log_level: str | None = typer.Option(
+        None,
+        "--log-level",
+        help="Logging level (debug, info, warning, error, critical)",
+    ),
+):
+    """
+    Rebuild the persistent pipeline catalog index from scratch.
+
+    Pipeline listings are served from an on-disk index that is refreshed
+    incrementally from directory listings. This command re-reads every
+    pipeline module and configuration file and rewrites the index.
+
+    Args:
+        base_dir: Base directory containing pipelines
+        storage_options: Options for storage backends
+        log_level: Set the logging level
+
+    Examples:
+        # Rebuild the index of the current project
+        $ pipeline rebuild-index
+
+        # Rebuild the index of a remote project
+        $ pipeline rebuild-index --base-dir s3://bucket/project
+    """
+    from ..pipeline.manager import PipelineManager
+
+    base_dir, parsed_storage_options, log_level = parse_common_options(
+        base_dir, storage_options, log_level
+    )
+    with PipelineManager(
+        base_dir=base_dir,
+        storage_options=parsed_storage_options,
+        log_level=log_level,
+    ) as manager:
+        try:
+            index = manager.rebuild_catalog_index()
+        except RuntimeError as e:
+            logger.error(f"Cannot rebuild catalog index: {e}")
+            raise typer.Exit(code=1)
+    logger.info(f"Catalog index rebuilt with {len(index.pipelines)} pipelines.")
+
+
+@app.command()
+def search(
+    node: str | None = typer.Option(
+        None, "--node", "-n", help="Node name to find producers and consumers of"
+    ),
+    tag: list[str] | None = typer.Option(
+        None, "--tag", "-t", help="Tag filter as key=value (repeatable)"
+    ),
+    base_dir: str | None = typer.Option(
+        None, "--base-dir", "-d", help="Base directory for the pipeline"
+    ),
+    storage_options: str | None = typer.Option(
+        None,
+        "--storage-options",
+        "-s",
+        help="Storage options as JSON, dict string, or key=value pairs",
+    ),
+    log_level: str | None = typer.Option(
+        None,
+        "--log-level",
+        help="Logging level (debug, info, warning, error, critical)",
+    ),
+    format: str = typer.Option("table", help="Output format (table, json)"),
+):
+    """
+    Find which pipelines produce or consume a node, or carry a tag.
+
+    Queries are answered from the node index stored with the pipeline
+    catalog, which is built by parsing pipeline modules without importing
+    them.
+
+    Args:
+        node: Node name to look up
+        tag: Tag filters as key=value; all must match
+        base_dir: Base directory containing pipelines
+        storage_options: Options for storage backends
+        log_level: Set the logging level
+        format: Output format (table, json)
+
+    Examples:
+        # Which pipelines produce or consume `raw_orders`?
+        $ pipeline search --node raw_orders
+
+        # Nodes owned by the data team
+        $ pipeline search --tag owner=data
+
+        # Combine both and emit JSON
+        $ pipeline search --node report --tag stage=prod --format json
+    """
+    from ..pipeline.manager import PipelineManager
+    from ..pipeline.node_index import parse_tag_filters
+
+    if node is None and not tag:
+        logger.error("Provide --node and/or --tag to search for.")
+        raise typer.Exit(code=1)
+    try:
+        tags = parse_tag_filters(tag or [])
+    except ValueError as e:
+        logger.error(str(e))
+        raise typer.Exit(code=1)
+
+    base_dir, parsed_storage_options, log_level = parse_common_options(
+        base_dir, storage_options, log_level
+    )
+    with PipelineManager(
+        base_dir=base_dir,
+        storage_options=parsed_storage_options,
+        log_level=log_level,
+    ) as manager:
+        matches = manager.registry.search_nodes(node=node, tags=tags)
+        if (format or "table").lower() == "json":
+            import msgspec
+
+            print(msgspec.json.encode(matches).decode())
+        else:
+            manager.registry.show_node_matches(matches)
+
+
 @app.command()
 def show_summary(
     name: str | None = typer.Option(
@@ -624,6 +1133,12 @@ def show_summary(
     output_file: str | None = typer.Option(
         None, help="Save output to specified file instead of printing"
     ),
+    limit: int | None = typer.Option(
+        None, "--limit", min=0, help="Maximum number of pipelines to show"
+    ),
+    offset: int = typer.Option(
+        0, "--offset", min=0, help="Number of pipelines to skip"
+    ),
 ):
     """
     Show summary information for one or all pipelines.
@@ -643,6 +1158,8 @@ def show_summary(
         to_html: Generate HTML output instead of text
         to_svg: Generate SVG output (where applicable)
         output_file: File path to save the output instead of printing to console
+        limit: Maximum number of pipelines to show
+        offset: Number of pipelines to skip before showing any
 
     Examples:
         # Show summary for all pipelines
@@ -656,7 +1173,12 @@ def show_summary(
 
         # Generate HTML report
         $ pipeline show-summary --to-html --output-file pipeline_report.html
+
+        # Page through a large project, 20 pipelines at a time
+        $ pipeline show-summary --limit 20 --offset 40
     """
+    from ..pipeline.manager import PipelineManager
+
     base_dir, parsed_storage_options, log_level = parse_common_options(
         base_dir, storage_options, log_level
     )
@@ -673,6 +1195,8 @@ def show_summary(
             project=project,
             to_html=to_html,
             to_svg=to_svg,
+            limit=limit,
+            offset=offset,
         )
 
         if summary_output:
@@ -744,6 +1268,8 @@ def add_hook(
         # Add a hook for all nodes with a specific tag
         $ pipeline add-hook my_pipeline --function log_metrics --type NODE_POST_EXECUTE --to @metrics
     """
+    from ..pipeline.manager import PipelineManager
+
     base_dir, parsed_storage_options, log_level = parse_common_options(
         base_dir, storage_options, log_level
     )
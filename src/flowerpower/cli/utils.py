@@ -11,13 +11,8 @@ from typing import Any
 
 from loguru import logger
 
-from flowerpower.pipeline import PipelineManager
-
-from ..utils.logging import setup_logging
 from ..utils.security import validate_pipeline_name
 
-setup_logging()
-
 
 def convert_string_booleans(obj):
     """Convert string 'true'/'false' to boolean values recursively."""
@@ -180,6 +175,8 @@ def load_hook(
     Returns:
         Callable: The loaded hook function
     """
+    from ..pipeline.manager import PipelineManager
+
     pipeline_name = validate_pipeline_name(pipeline_name)
     if not re.fullmatch(r"[A-Za-z_]\w*(\.[A-Za-z_]\w*)+", function_path):
         raise ValueError(
@@ -15,11 +15,8 @@ from .cfg.pipeline import RunConfig
 from .pipeline import PipelineManager
 from .utils.config import merge_run_config_with_kwargs
 from .utils.filesystem import FilesystemHelper
-from .utils.logging import setup_logging
 from .utils.security import validate_file_path, validate_pipeline_name
 
-setup_logging()
-
 
 def handle_errors(func):
     """Decorator to handle exceptions, log them, and re-raise as RuntimeError."""
@@ -1,7 +1,30 @@
-from .manager import PipelineManager
-from .pipeline import Pipeline
+import importlib
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from .manager import PipelineManager
+    from .pipeline import Pipeline
+
+_LAZY_IMPORTS = {
+    "PipelineManager": ".manager",
+    "Pipeline": ".pipeline",
+}
 
 __all__ = [
     "PipelineManager",
     "Pipeline",
 ]
+
+
+def __getattr__(name: str):
+    # Submodules such as ``pipeline.hook_types`` stay importable without
+    # loading the manager and everything it depends on.
+    if name not in _LAZY_IMPORTS:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(_LAZY_IMPORTS[name], __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list[str]:
+    return sorted({*globals(), *__all__})
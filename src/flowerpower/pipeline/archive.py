@@ -0,0 +1,263 @@
+"""Single-file pipeline archives with an embedded manifest.
+
+Exporting a project file by file costs one object-store request per file.
+An archive bundles the selected pipelines into one compressed tarball that is
+written to and read from the destination as a stream; nothing is staged on
+local disk.
+
+The first member of every archive is :data:`MANIFEST_NAME`, a JSON document
+listing the archived pipelines, their files and a SHA-256 per file.  Readers
+therefore know the layout before any payload arrives, can skip the members of
+pipelines they were not asked for, and verify every extracted file.
+
+``tar.gz`` uses the standard library.  ``tar.zst`` requires the optional
+``zstandard`` package (``pip install flowerpower[archive]``).
+"""
+
+from __future__ import annotations
+
+import contextlib
+import hashlib
+import io
+import posixpath
+import tarfile
+import time
+from collections.abc import Iterable, Iterator
+from typing import IO, Literal
+
+import msgspec
+from fsspeckit import AbstractFileSystem
+
+from .bundle import _flowerpower_version
+
+try:
+    import zstandard
+except ImportError:  # pragma: no cover - depends on optional extra
+    zstandard = None
+
+__all__ = [
+    "ARCHIVE_FORMATS",
+    "ARCHIVE_FORMAT_VERSION",
+    "MANIFEST_NAME",
+    "ArchiveFormat",
+    "ArchiveManifest",
+    "ArchivedFile",
+    "ArchivedPipeline",
+    "build_manifest",
+    "detect_archive_format",
+    "read_archive",
+    "write_archive",
+]
+
+ArchiveFormat = Literal["tar.zst", "tar.gz"]
+ArchiveMember = tuple[str, tarfile.TarFile, tarfile.TarInfo]
+
+ARCHIVE_FORMATS: tuple[str, ...] = ("tar.zst", "tar.gz")
+ARCHIVE_FORMAT_VERSION = 1
+MANIFEST_NAME = "flowerpower-manifest.json"
+
+_SUFFIXES = {
+    ".tar.zst": "tar.zst",
+    ".tzst": "tar.zst",
+    ".tar.gz": "tar.gz",
+    ".tgz": "tar.gz",
+}
+
+
+class ArchivedFile(msgspec.Struct, frozen=True):
+    """One file stored in an archive."""
+
+    path: str
+    size: int
+    sha256: str
+
+
+class ArchivedPipeline(msgspec.Struct, frozen=True):
+    """A pipeline and the project-relative paths of its files."""
+
+    name: str
+    files: list[str] = msgspec.field(default_factory=list)
+
+
+class ArchiveManifest(msgspec.Struct, frozen=True):
+    """Table of contents written as the first archive member.
+
+    Attributes:
+        format_version: Manifest layout version.
+        flowerpower_version: Version of the exporting FlowerPower.
+        created_at: Creation time (POSIX seconds).
+        project: Name of the exporting project, if configured.
+        project_files: Project-level files (``conf/project.yml``).
+        pipelines: Archived pipelines in archive order.
+        files: Every archived file with its size and SHA-256.
+    """
+
+    format_version: int
+    flowerpower_version: str
+    created_at: float
+    project: str | None = None
+    project_files: list[str] = msgspec.field(default_factory=list)
+    pipelines: list[ArchivedPipeline] = msgspec.field(default_factory=list)
+    files: list[ArchivedFile] = msgspec.field(default_factory=list)
+
+
+def detect_archive_format(path: str, format: str | None = None) -> ArchiveFormat:
+    """Resolve the archive format from ``format`` or the ``path`` suffix.
+
+    Raises:
+        ValueError: If the format is unknown or cannot be inferred.
+    """
+    if format is None:
+        format = next(
+            (fmt for suffix, fmt in _SUFFIXES.items() if path.endswith(suffix)),
+            None,
+        )
+        if format is None:
+            raise ValueError(
+                f"Cannot infer archive format of {path}; "
+                f"pass format= one of {', '.join(ARCHIVE_FORMATS)}"
+            )
+    if format not in ARCHIVE_FORMATS:
+        raise ValueError(
+            f"Unsupported archive format '{format}', "
+            f"expected one of {', '.join(ARCHIVE_FORMATS)}"
+        )
+    return format  # type: ignore[return-value]
+
+
+def _require_zstandard():
+    if zstandard is None:
+        raise ImportError(
+            "tar.zst archives require the 'zstandard' package. "
+            "Install it with `pip install flowerpower[archive]` "
+            "or use format='tar.gz'."
+        )
+    return zstandard
+
+
+def _safe_member(path: str) -> str:
+    normalized = posixpath.normpath(path)
+    if (
+        not path
+        or posixpath.isabs(path)
+        or normalized == ".."
+        or normalized.startswith("../")
+    ):
+        raise ValueError(f"Unsafe path in archive: {path}")
+    return normalized
+
+
+def _add_member(tar: tarfile.TarFile, path: str, content: bytes, mtime: float) -> None:
+    info = tarfile.TarInfo(name=path)
+    info.size = len(content)
+    info.mtime = int(mtime)
+    info.mode = 0o644
+    tar.addfile(info, io.BytesIO(content))
+
+
+def write_archive(
+    fs: AbstractFileSystem,
+    path: str,
+    manifest: ArchiveManifest,
+    contents: Iterable[tuple[str, bytes]],
+    format: ArchiveFormat = "tar.zst",
+) -> None:
+    """Stream ``manifest`` and ``contents`` into one archive at ``path``.
+
+    Args:
+        fs: Destination filesystem.
+        path: Archive path on ``fs``.
+        manifest: Manifest written as the first member.
+        contents: ``(path, bytes)`` pairs in archive order.
+        format: ``"tar.zst"`` or ``"tar.gz"``.
+    """
+    codec = _require_zstandard() if format == "tar.zst" else None
+    with contextlib.ExitStack() as stack:
+        raw: IO[bytes] = stack.enter_context(fs.open(path, "wb"))
+        if codec is not None:
+            stream = stack.enter_context(
+                codec.ZstdCompressor().stream_writer(raw, closefd=False)
+            )
+            tar = stack.enter_context(tarfile.open(fileobj=stream, mode="w|"))
+        else:
+            tar = stack.enter_context(tarfile.open(fileobj=raw, mode="w|gz"))
+
+        _add_member(
+            tar, MANIFEST_NAME, msgspec.json.encode(manifest), manifest.created_at
+        )
+        for member, content in contents:
+            _add_member(tar, member, content, manifest.created_at)
+
+
+@contextlib.contextmanager
+def read_archive(
+    fs: AbstractFileSystem,
+    path: str,
+    format: ArchiveFormat = "tar.zst",
+) -> Iterator[tuple[ArchiveManifest, Iterator[ArchiveMember]]]:
+    """Open an archive for one streaming pass.
+
+    Yields the manifest and an iterator over the remaining regular-file
+    members as ``(path, tar, member)``.  Members must be consumed in order
+    with ``tar.extractfile(member)``; skipping one costs no extra request.
+
+    Raises:
+        ValueError: If the archive does not start with a valid manifest.
+    """
+    codec = _require_zstandard() if format == "tar.zst" else None
+    with contextlib.ExitStack() as stack:
+        raw: IO[bytes] = stack.enter_context(fs.open(path, "rb"))
+        if codec is not None:
+            stream = stack.enter_context(
+                codec.ZstdDecompressor().stream_reader(raw, closefd=False)
+            )
+            tar = stack.enter_context(tarfile.open(fileobj=stream, mode="r|"))
+        else:
+            tar = stack.enter_context(tarfile.open(fileobj=raw, mode="r|gz"))
+
+        first = tar.next()
+        if first is None or first.name != MANIFEST_NAME:
+            raise ValueError(f"{path} is not a FlowerPower archive (no manifest)")
+        try:
+            manifest = msgspec.json.decode(
+                tar.extractfile(first).read(), type=ArchiveManifest
+            )
+        except msgspec.DecodeError as error:
+            raise ValueError(f"Invalid manifest in {path}: {error}") from error
+        if manifest.format_version > ARCHIVE_FORMAT_VERSION:
+            raise ValueError(
+                f"{path} uses archive format {manifest.format_version}; "
+                f"this FlowerPower reads up to {ARCHIVE_FORMAT_VERSION}"
+            )
+
+        def members():
+            while (member := tar.next()) is not None:
+                if member.isfile():
+                    yield _safe_member(member.name), tar, member
+
+        yield manifest, members()
+
+
+def build_manifest(
+    project: str | None,
+    project_files: list[str],
+    pipelines: list[ArchivedPipeline],
+    contents: dict[str, bytes],
+) -> ArchiveManifest:
+    """Create a manifest with size and SHA-256 of every file in ``contents``."""
+    return ArchiveManifest(
+        format_version=ARCHIVE_FORMAT_VERSION,
+        flowerpower_version=_flowerpower_version(),
+        created_at=time.time(),
+        project=project,
+        project_files=project_files,
+        pipelines=pipelines,
+        files=[
+            ArchivedFile(
+                path=path,
+                size=len(content),
+                sha256=hashlib.sha256(content).hexdigest(),
+            )
+            for path, content in contents.items()
+        ],
+    )
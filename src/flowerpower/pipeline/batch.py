@@ -0,0 +1,317 @@
+"""Bulk pipeline runs over input files.
+
+:func:`run_batch` streams input rows from a JSON Lines or Parquet file and runs
+one pipeline per row, merging the row over the pipeline's inputs. The run
+config, adapters and pipeline object are resolved once and shared by all rows
+(:meth:`PipelineExecutor.prepare_run`). Rows run on a thread pool with at most
+``parallel`` runs in flight, and only about ``2 * parallel`` rows are held in
+memory.
+
+Every finished row is appended to the output right away as one record:
+``{"row", "status", "duration", "inputs", "outputs", "error"}``. ``row`` is the
+0-based position of the row in the input file. On restart, rows that already
+succeeded are skipped and failed rows are dropped from the output and run
+again, so an interrupted sweep resumes where it stopped. This assumes the
+input file has not changed.
+
+JSON Lines output is appended and flushed per row. Parquet output goes to a
+``<output>.partial.jsonl`` checkpoint and is converted to Parquet when the
+batch completes. Parquet needs ``pyarrow``.
+"""
+
+from __future__ import annotations
+
+import os
+import time
+from collections.abc import Callable, Iterable, Iterator
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from dataclasses import dataclass
+from pathlib import Path
+from typing import TYPE_CHECKING, Any
+
+import msgspec
+from loguru import logger
+
+if TYPE_CHECKING:
+    from ..cfg.pipeline.run import RunConfig
+    from .executor import PipelineExecutor, PipelineRunPlan
+
+__all__ = [
+    "BatchSummary",
+    "JsonlResultWriter",
+    "ParquetResultWriter",
+    "open_result_writer",
+    "read_input_rows",
+    "run_batch",
+]
+
+JSONL_SUFFIXES = (".jsonl", ".ndjson")
+PARQUET_SUFFIXES = (".parquet", ".pq")
+
+
+@dataclass(frozen=True)
+class BatchSummary:
+    """Outcome of :func:`run_batch`.
+
+    Attributes:
+        total: Rows read from the input file.
+        succeeded: Rows that ran successfully in this invocation.
+        failed: Rows whose run raised in this invocation.
+        skipped: Rows that already succeeded in the output (resumed).
+        duration: Wall-clock seconds of this invocation.
+    """
+
+    total: int
+    succeeded: int
+    failed: int
+    skipped: int
+    duration: float
+
+
+def _pyarrow_parquet():
+    try:
+        import pyarrow.parquet as pq
+    except ImportError as e:  # pragma: no cover - depends on optional extra
+        raise ImportError(
+            "Parquet input/output requires pyarrow. Install it with `pip install pyarrow`."
+        ) from e
+    return pq
+
+
+def _file_format(path: str | Path) -> str:
+    suffix = Path(path).suffix.lower()
+    if suffix in JSONL_SUFFIXES:
+        return "jsonl"
+    if suffix in PARQUET_SUFFIXES:
+        return "parquet"
+    raise ValueError(
+        f"Unsupported file type '{suffix}' for {path}; use .jsonl or .parquet"
+    )
+
+
+def read_input_rows(path: str | Path, batch_size: int = 1024) -> Iterator[dict[str, Any]]:
+    """Stream input rows (dicts) from a JSON Lines or Parquet file.
+
+    Blank JSON Lines are skipped and do not count as rows.
+
+    Raises:
+        ValueError: If the file type is unsupported or a line is not a JSON object.
+    """
+    if _file_format(path) == "parquet":
+        parquet_file = _pyarrow_parquet().ParquetFile(str(path))
+        for record_batch in parquet_file.iter_batches(batch_size=batch_size):
+            yield from record_batch.to_pylist()
+        return
+
+    decoder = msgspec.json.Decoder()
+    with open(path, "rb") as f:
+        for line_number, line in enumerate(f, start=1):
+            if not line.strip():
+                continue
+            row = decoder.decode(line)
+            if not isinstance(row, dict):
+                raise ValueError(
+                    f"{path}:{line_number}: expected a JSON object, got {type(row).__name__}"
+                )
+            yield row
+
+
+def _to_builtins(value: Any) -> Any:
+    # Outputs msgspec cannot encode (dataframes, models, ...) are stored as str().
+    return msgspec.to_builtins(value, enc_hook=str, str_keys=True)
+
+
+def _read_records(path: Path) -> tuple[list[dict[str, Any]], int]:
+    """Records of a JSON Lines result file and the byte length of its valid prefix.
+
+    A truncated last line (process killed mid-write) is not part of the prefix.
+    """
+    records = []
+    valid = 0
+    decoder = msgspec.json.Decoder()
+    with open(path, "rb") as f:
+        for line in f:
+            if not line.endswith(b"\n"):
+                break
+            try:
+                records.append(decoder.decode(line))
+            except msgspec.DecodeError:
+                break
+            valid += len(line)
+    return records, valid
+
+
+class JsonlResultWriter:
+    """Append result records to a JSON Lines file, one flushed line per row.
+
+    Args:
+        path: Output file.
+        resume: Keep existing successful records and report their rows as
+            completed; failed records are dropped so those rows run again.
+            Otherwise the file is truncated.
+    """
+
+    def __init__(self, path: str | Path, resume: bool = True) -> None:
+        self.path = Path(path)
+        self.completed: set[int] = set()
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        if resume and self.path.exists():
+            records, valid = _read_records(self.path)
+            succeeded = [record for record in records if record["status"] == "success"]
+            self.completed = {record["row"] for record in succeeded}
+            self._encoder = msgspec.json.Encoder()
+            if len(succeeded) == len(records):
+                with open(self.path, "r+b") as f:
+                    f.truncate(valid)
+            else:
+                tmp = self.path.with_name(self.path.name + ".tmp")
+                tmp.write_bytes(
+                    b"".join(self._encoder.encode(record) + b"\n" for record in succeeded)
+                )
+                os.replace(tmp, self.path)
+            self._file = open(self.path, "ab")
+        else:
+            self._encoder = msgspec.json.Encoder()
+            self._file = open(self.path, "wb")
+
+    def write(self, record: dict[str, Any]) -> None:
+        self._file.write(self._encoder.encode(record) + b"\n")
+        self._file.flush()
+        if record["status"] == "success":
+            self.completed.add(record["row"])
+
+    def close(self) -> None:
+        self._file.close()
+
+
+class ParquetResultWriter(JsonlResultWriter):
+    """Checkpoint results to ``<path>.partial.jsonl`` and write Parquet on close.
+
+    When resuming a completed Parquet output, its records are copied into
+    the checkpoint first so that new rows can be appended.
+    """
+
+    def __init__(self, path: str | Path, resume: bool = True) -> None:
+        self.output = Path(path)
+        checkpoint = self.output.with_name(self.output.name + ".partial.jsonl")
+        if resume and self.output.exists() and not checkpoint.exists():
+            records = _pyarrow_parquet().read_table(str(self.output)).to_pylist()
+            encoder = msgspec.json.Encoder()
+            checkpoint.write_bytes(
+                b"".join(encoder.encode(record) + b"\n" for record in records)
+            )
+        super().__init__(checkpoint, resume=resume)
+
+    def close(self) -> None:
+        super().close()
+        import pyarrow as pa
+
+        records, _ = _read_records(self.path)
+        records.sort(key=lambda record: record["row"])
+        tmp = self.output.with_name(self.output.name + ".tmp")
+        _pyarrow_parquet().write_table(pa.Table.from_pylist(records), str(tmp))
+        os.replace(tmp, self.output)
+        self.path.unlink()
+
+
+def open_result_writer(path: str | Path, resume: bool = True) -> JsonlResultWriter:
+    """Result writer for ``path`` chosen by its suffix (.jsonl or .parquet)."""
+    if _file_format(path) == "parquet":
+        _pyarrow_parquet()
+        return ParquetResultWriter(path, resume=resume)
+    return JsonlResultWriter(path, resume=resume)
+
+
+def _run_row(
+    executor: PipelineExecutor,
+    plan: PipelineRunPlan,
+    row: int,
+    inputs: dict[str, Any],
+) -> dict[str, Any]:
+    start = time.perf_counter()
+    try:
+        outputs = executor.run_prepared(plan, inputs)
+    except Exception as e:  # recorded per row; the batch keeps going
+        logger.warning(f"Row {row} of '{plan.name}' failed: {e}")
+        return {
+            "row": row,
+            "status": "failure",
+            "duration": time.perf_counter() - start,
+            "inputs": _to_builtins(inputs),
+            "outputs": None,
+            "error": f"{type(e).__name__}: {e}",
+        }
+    return {
+        "row": row,
+        "status": "success",
+        "duration": time.perf_counter() - start,
+        "inputs": _to_builtins(inputs),
+        "outputs": _to_builtins(outputs or {}),
+        "error": None,
+    }
+
+
+def run_batch(
+    executor: PipelineExecutor,
+    name: str,
+    rows: Iterable[dict[str, Any]],
+    writer: JsonlResultWriter,
+    run_config: RunConfig | None = None,
+    parallel: int = 1,
+    on_result: Callable[[dict[str, Any]], None] | None = None,
+) -> BatchSummary:
+    """Run pipeline ``name`` once per input row and write each result.
+
+    Args:
+        executor: Executor of the project.
+        name: Pipeline name.
+        rows: Input rows; each is merged over the resolved run inputs.
+        writer: Destination from :func:`open_result_writer`; rows in
+            ``writer.completed`` are skipped.
+        run_config: Overrides shared by all rows.
+        parallel: Maximum number of rows running at the same time.
+        on_result: Called with every written record, e.g. for progress output.
+
+    Returns:
+        BatchSummary: Counts of this invocation.
+    """
+    if parallel < 1:
+        raise ValueError("parallel must be at least 1")
+    start = time.perf_counter()
+    plan = executor.prepare_run(name, run_config)
+    total = skipped = succeeded = failed = 0
+
+    def collect(done: Iterable[Future]) -> None:
+        nonlocal succeeded, failed
+        for future in done:
+            record = future.result()
+            writer.write(record)
+            if record["status"] == "success":
+                succeeded += 1
+            else:
+                failed += 1
+            if on_result is not None:
+                on_result(record)
+
+    with ThreadPoolExecutor(max_workers=parallel, thread_name_prefix="fp-batch") as pool:
+        pending: set[Future] = set()
+        for index, inputs in enumerate(rows):
+            total += 1
+            if index in writer.completed:
+                skipped += 1
+                continue
+            pending.add(pool.submit(_run_row, executor, plan, index, inputs))
+            if len(pending) >= 2 * parallel:
+                done, pending = wait(pending, return_when=FIRST_COMPLETED)
+                collect(done)
+        while pending:
+            done, pending = wait(pending, return_when=FIRST_COMPLETED)
+            collect(done)
+
+    return BatchSummary(
+        total=total,
+        succeeded=succeeded,
+        failed=failed,
+        skipped=skipped,
+        duration=time.perf_counter() - start,
+    )
@@ -0,0 +1,426 @@
+"""Compiled project bundles for fast cold starts.
+
+``flowerpower compile`` snapshots everything a worker needs to resolve
+pipelines — the project config, every pipeline config, discovered names and
+module paths, module source hashes and an optional DAG summary — into a single
+msgpack file.  When a valid bundle is present, :class:`PipelineConfigManager`
+and :class:`PipelineCatalog` answer from it instead of globbing ``pipelines/``
+and probing candidate config paths, so cold start costs one read plus one
+listing of the config and pipelines directories.
+
+The bundle also records a stamp (mtime, size, ETag) of every config and
+pipeline file.  A bundle whose stamps no longer match the listing is ignored,
+so edits made after ``flowerpower compile`` are never silently shadowed.
+
+Configs are stored as decoded YAML *before* ``${VAR}`` interpolation and
+``FP_*`` overlays, so environment-specific values are still resolved at
+runtime.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import posixpath
+import time
+from typing import Any
+
+import msgspec
+from fsspeckit import AbstractFileSystem
+from loguru import logger
+
+from ..cfg import PipelineConfig, ProjectConfig
+from ..cfg.pipeline.run import migrate_legacy_retry_fields
+from ..settings import BUNDLE_PATH, CONFIG_DIR, PIPELINES_DIR
+from ..utils.filesystem import (
+    format_pipeline_file_path,
+    get_pipeline_config_paths,
+    get_project_config_paths,
+)
+from ..utils.security import SecurityError, validate_pipeline_name
+from ..utils.yaml_env import interpolate_env_in_data
+from .catalog_index import FileStamp, list_file_stamps
+
+__all__ = [
+    "BUNDLE_FORMAT_VERSION",
+    "BundledPipeline",
+    "ProjectBundle",
+    "compile_bundle",
+    "read_bundle",
+    "write_bundle",
+]
+
+BUNDLE_FORMAT_VERSION = 2
+_CONFIG_SUFFIXES = (".yml", ".yaml")
+
+
+def _flowerpower_version() -> str:
+    import importlib.metadata
+
+    try:
+        return importlib.metadata.version("FlowerPower")
+    except importlib.metadata.PackageNotFoundError:  # pragma: no cover
+        return "unknown"
+
+
+def _pack(value: Any) -> msgspec.Raw:
+    return msgspec.Raw(msgspec.msgpack.encode(value))
+
+
+def _unpack(raw: msgspec.Raw) -> Any:
+    return msgspec.msgpack.decode(raw)
+
+
+def _digest(data: bytes) -> str:
+    return hashlib.sha256(data).hexdigest()
+
+
+def _list_stamps(
+    fs: AbstractFileSystem, cfg_dir: str, pipelines_dir: str
+) -> dict[str, FileStamp]:
+    stamps = list_file_stamps(fs, pipelines_dir, (".py",))
+    stamps.update(list_file_stamps(fs, cfg_dir, _CONFIG_SUFFIXES))
+    return stamps
+
+
+class BundledPipeline(msgspec.Struct, frozen=True):
+    """One pipeline entry of a :class:`ProjectBundle`.
+
+    Attributes:
+        name: Canonical pipeline name (stored ``name:`` or derived from path).
+        module_file: Module path relative to the project root.
+        config_file: Resolved config path, or ``None`` when the pipeline has
+            no config file.
+        module_hash: SHA-256 of the module source.
+        config_hash: SHA-256 of the config file, empty without a config.
+        config: msgpack-encoded YAML data, decoded on demand.
+        dag: msgpack-encoded DAG summary (``None`` when not compiled).
+    """
+
+    name: str
+    module_file: str
+    config_file: str | None
+    module_hash: str
+    config_hash: str
+    config: msgspec.Raw
+    dag: msgspec.Raw
+
+    def config_data(self) -> dict[str, Any]:
+        """Return a fresh copy of the stored (uninterpolated) config data."""
+        return _unpack(self.config) or {}
+
+    def dag_summary(self) -> dict[str, Any] | None:
+        """Return the compiled DAG summary, if one was recorded."""
+        return _unpack(self.dag)
+
+
+class ProjectBundle(msgspec.Struct, dict=True):
+    """Snapshot of a project's configuration and pipeline discovery state.
+
+    ``stamps`` maps every config and pipeline file to its listing stamp at
+    compile time.
+    """
+
+    format_version: int
+    flowerpower_version: str
+    created_at: float
+    cfg_dir: str
+    pipelines_dir: str
+    project_file: str | None
+    project_hash: str
+    project: msgspec.Raw
+    pipelines: list[BundledPipeline] = msgspec.field(default_factory=list)
+    stamps: dict[str, FileStamp] = msgspec.field(default_factory=dict)
+
+    def __post_init__(self) -> None:
+        self._by_name = {entry.name: entry for entry in self.pipelines}
+        self._by_file = {entry.module_file: entry for entry in self.pipelines}
+
+    @property
+    def names(self) -> list[str]:
+        """Pipeline names in module path order."""
+        return [entry.name for entry in self.pipelines]
+
+    @property
+    def files(self) -> list[str]:
+        """Pipeline module files, sorted like :meth:`PipelineCatalog.get_files`."""
+        return [entry.module_file for entry in self.pipelines]
+
+    def get(self, name: str) -> BundledPipeline | None:
+        """Return the entry for a pipeline name or formatted module path."""
+        entry = self._by_name.get(name)
+        if entry is None:
+            module_file = posixpath.join(
+                self.pipelines_dir, f"{format_pipeline_file_path(name)}.py"
+            )
+            entry = self._by_file.get(module_file)
+        return entry
+
+    def get_by_file(self, module_file: str) -> BundledPipeline | None:
+        """Return the entry for a pipeline module file."""
+        return self._by_file.get(module_file)
+
+    def project_config(self) -> ProjectConfig | None:
+        """Build the project config, or ``None`` if none was compiled."""
+        data = _unpack(self.project)
+        if data is None:
+            return None
+        return msgspec.convert(interpolate_env_in_data(data), ProjectConfig)
+
+    def pipeline_config(self, name: str) -> PipelineConfig | None:
+        """Build the config for ``name``, or ``None`` if it is not bundled."""
+        entry = self.get(name)
+        if entry is None:
+            return None
+        if entry.config_file is None:
+            return PipelineConfig(name=name)
+        data = interpolate_env_in_data(entry.config_data())
+        stored_name = data.get("name") if isinstance(data, dict) else None
+        return PipelineConfig.from_dict(
+            name=stored_name if isinstance(stored_name, str) else name,
+            data=data,
+        )
+
+    def changed_files(self, fs: AbstractFileSystem) -> list[str]:
+        """Return files whose listing stamp differs from the compiled one.
+
+        Costs one listing of the config and pipelines directories.  Files
+        without a usable stamp (no mtime or ETag) always count as changed.
+        """
+        current = _list_stamps(fs, self.cfg_dir, self.pipelines_dir)
+        return sorted(
+            path
+            for path in current.keys() | self.stamps.keys()
+            if path not in current
+            or not current[path].reliable
+            or current[path] != self.stamps.get(path)
+        )
+
+    def stale_paths(self, fs: AbstractFileSystem) -> list[str]:
+        """Return project paths whose content no longer matches the bundle.
+
+        Re-hashes every bundled file and re-discovers pipeline modules, so this
+        costs a full scan; it backs ``flowerpower compile --check``.  Unlike
+        :meth:`changed_files`, files that were touched but not modified are
+        not reported.
+        """
+        current = compile_bundle(
+            fs,
+            cfg_dir=self.cfg_dir,
+            pipelines_dir=self.pipelines_dir,
+            include_dag=False,
+        )
+        stale: set[str] = set()
+        if (current.project_file, current.project_hash) != (
+            self.project_file,
+            self.project_hash,
+        ):
+            stale.update(p for p in (self.project_file, current.project_file) if p)
+
+        previous = {entry.module_file: entry for entry in self.pipelines}
+        for entry in current.pipelines:
+            old = previous.pop(entry.module_file, None)
+            if old is None or old.module_hash != entry.module_hash:
+                stale.add(entry.module_file)
+            if old is None or (old.config_file, old.config_hash) != (
+                entry.config_file,
+                entry.config_hash,
+            ):
+                stale.update(
+                    p for p in (entry.config_file, old and old.config_file) if p
+                )
+        stale.update(previous)
+        return sorted(stale)
+
+
+def _read_first(
+    fs: AbstractFileSystem, paths: list[str]
+) -> tuple[str | None, bytes | None]:
+    for path in paths:
+        try:
+            return path, fs.cat(path)
+        except FileNotFoundError:
+            continue
+    return None, None
+
+
+def _discover_modules(
+    fs: AbstractFileSystem, cfg_dir: str, pipelines_dir: str
+) -> list[str]:
+    from .catalog import PipelineCatalog
+
+    return PipelineCatalog(fs=fs, cfg_dir=cfg_dir, pipelines_dir=pipelines_dir).get_files()
+
+
+def _summarize_dag(module: Any, config: dict[str, Any]) -> dict[str, Any]:
+    from hamilton import driver
+
+    dr = driver.Builder().with_modules(module).with_config(config).build()
+    nodes = []
+    for variable in dr.list_available_variables():
+        dependencies = set(variable.required_dependencies) | set(
+            variable.optional_dependencies
+        )
+        nodes.append(
+            {
+                "name": variable.name,
+                "type": getattr(variable.type, "__name__", str(variable.type)),
+                "tags": dict(variable.tags),
+                "external": variable.is_external_input,
+                "dependencies": sorted(dependencies),
+            }
+        )
+    nodes.sort(key=lambda node: node["name"])
+    return {"nodes": nodes}
+
+
+def compile_bundle(
+    fs: AbstractFileSystem,
+    cfg_dir: str = CONFIG_DIR,
+    pipelines_dir: str = PIPELINES_DIR,
+    *,
+    include_dag: bool = True,
+) -> ProjectBundle:
+    """Scan the project on ``fs`` and build a :class:`ProjectBundle`.
+
+    Args:
+        fs: Project filesystem, rooted at the project base directory.
+        cfg_dir: Configuration directory fragment.
+        pipelines_dir: Pipelines directory fragment.
+        include_dag: Import every pipeline module and record its DAG summary.
+            Modules that fail to build are logged and bundled without a DAG.
+
+    Returns:
+        The compiled bundle.
+    """
+    stamps = _list_stamps(fs, cfg_dir, pipelines_dir)
+    project_file, project_raw = _read_first(fs, get_project_config_paths(cfg_dir))
+    project_data = msgspec.yaml.decode(project_raw) if project_raw else None
+
+    resolver = None
+    if include_dag:
+        from .module_resolver import PipelineModuleResolver
+
+        resolver = PipelineModuleResolver(pipelines_dir)
+
+    entries: list[BundledPipeline] = []
+    for module_file in _discover_modules(fs, cfg_dir, pipelines_dir):
+        module_path = posixpath.splitext(
+            posixpath.relpath(module_file, pipelines_dir)
+        )[0]
+        config_file, config_raw = _read_first(
+            fs, get_pipeline_config_paths(module_path, cfg_dir, pipelines_dir)
+        )
+        config_data = (msgspec.yaml.decode(config_raw) if config_raw else None) or {}
+        if isinstance(config_data.get("run"), dict):
+            migrate_legacy_retry_fields(config_data["run"])
+
+        derived_name = name = module_path.replace("/", ".")
+        stored_name = config_data.get("name")
+        if isinstance(stored_name, str) and stored_name:
+            try:
+                name = validate_pipeline_name(stored_name)
+            except (SecurityError, ValueError):
+                pass
+
+        dag = None
+        if resolver is not None:
+            try:
+                run_config = interpolate_env_in_data(config_data).get("run") or {}
+                dag = _summarize_dag(
+                    resolver.load(derived_name), run_config.get("config") or {}
+                )
+            except Exception as error:
+                logger.warning(f"Could not compile DAG for pipeline '{name}': {error}")
+
+        entries.append(
+            BundledPipeline(
+                name=name,
+                module_file=module_file,
+                config_file=config_file,
+                module_hash=_digest(fs.cat(module_file)),
+                config_hash=_digest(config_raw) if config_raw is not None else "",
+                config=_pack(config_data),
+                dag=_pack(dag),
+            )
+        )
+
+    return ProjectBundle(
+        format_version=BUNDLE_FORMAT_VERSION,
+        flowerpower_version=_flowerpower_version(),
+        created_at=time.time(),
+        cfg_dir=cfg_dir,
+        pipelines_dir=pipelines_dir,
+        project_file=project_file,
+        project_hash=_digest(project_raw) if project_raw is not None else "",
+        project=_pack(project_data),
+        pipelines=entries,
+        stamps=stamps,
+    )
+
+
+def write_bundle(
+    fs: AbstractFileSystem, bundle: ProjectBundle, path: str = BUNDLE_PATH
+) -> str:
+    """Write ``bundle`` to ``path`` on ``fs`` and return the path."""
+    fs.makedirs(posixpath.dirname(path) or ".", exist_ok=True)
+    with fs.open(path, "wb") as f:
+        f.write(msgspec.msgpack.encode(bundle))
+    return path
+
+
+def read_bundle(
+    fs: AbstractFileSystem,
+    cfg_dir: str = CONFIG_DIR,
+    pipelines_dir: str = PIPELINES_DIR,
+    path: str = BUNDLE_PATH,
+    *,
+    validate: bool = True,
+) -> ProjectBundle | None:
+    """Read the bundle at ``path`` if it exists and matches this runtime.
+
+    A bundle is rejected (``None``) when it cannot be decoded, was written by
+    another bundle format or FlowerPower version, or was compiled for other
+    config/pipelines directories.  With ``validate`` it is also rejected when
+    any config or pipeline file changed since it was compiled
+    (:meth:`ProjectBundle.changed_files`).
+    """
+    try:
+        raw = fs.cat(path)
+    except FileNotFoundError:
+        return None
+    except Exception as error:
+        logger.debug(f"Cannot read project bundle {path}: {error}")
+        return None
+
+    try:
+        bundle = msgspec.msgpack.decode(raw, type=ProjectBundle)
+    except (msgspec.DecodeError, TypeError) as error:
+        logger.warning(f"Ignoring unreadable project bundle {path}: {error}")
+        return None
+
+    expected = (BUNDLE_FORMAT_VERSION, _flowerpower_version(), cfg_dir, pipelines_dir)
+    actual = (
+        bundle.format_version,
+        bundle.flowerpower_version,
+        bundle.cfg_dir,
+        bundle.pipelines_dir,
+    )
+    if actual != expected:
+        logger.warning(
+            f"Ignoring project bundle {path} compiled for {actual}; "
+            "run `flowerpower compile` to refresh it."
+        )
+        return None
+
+    if validate:
+        changed = bundle.changed_files(fs)
+        if changed:
+            logger.warning(
+                f"Ignoring stale project bundle {path}: {len(changed)} file(s) "
+                f"changed since it was compiled ({', '.join(changed[:3])}); "
+                "run `flowerpower compile` to refresh it."
+            )
+            return None
+
+    logger.debug(f"Loaded project bundle {path} with {len(bundle.pipelines)} pipelines")
+    return bundle
@@ -2,17 +2,33 @@
 
 from __future__ import annotations
 
+import datetime as dt
 import posixpath
-from typing import Any, Callable
+from collections.abc import Iterable, Iterator, Mapping
+from concurrent.futures import ThreadPoolExecutor
+from typing import TYPE_CHECKING, Any, Callable
 
 import yaml
 from fsspeckit import AbstractFileSystem
 from loguru import logger
 
 from ..cfg import PipelineConfig, ProjectConfig
-from ..utils.filesystem import format_pipeline_file_path, get_pipeline_config_paths
+from ..settings import SUMMARY_MAX_WORKERS, SUMMARY_PAGE_SIZE
+from ..utils.filesystem import (
+    format_pipeline_file_path,
+    get_pipeline_config_paths,
+    read_candidate_paths,
+)
 from ..utils.security import SecurityError, validate_pipeline_name
 
+if TYPE_CHECKING:
+    from .bundle import ProjectBundle
+    from .catalog_index import CatalogIndex, FileStamp
+    from .node_index import NodeMatch
+
+SUMMARY_FIELDS = ("cfg", "code")
+_SUMMARY_KEYS = {"cfg": "cfg", "code": "module"}
+
 
 class PipelineCatalog:
     """Discovers, lists, and summarizes pipeline modules.
@@ -29,6 +45,10 @@ class PipelineCatalog:
         _project_cfg: Static project configuration fallback.
         _config_provider: Callable that returns a ``PipelineConfig`` for a name.
         _project_cfg_provider: Callable that returns the current ``ProjectConfig``.
+        _bundle_provider: Callable that returns the active compiled bundle, used
+            instead of scanning the filesystem when set.
+        _index_path: Path of the persistent catalog index, or ``None`` to scan
+            the pipelines directory on every call.
     """
 
     def __init__(
@@ -40,6 +60,8 @@ class PipelineCatalog:
         *,
         config_provider: Callable[[str], PipelineConfig] | None = None,
         project_cfg_provider: Callable[[], ProjectConfig | None] | None = None,
+        bundle_provider: Callable[[], "ProjectBundle | None"] | None = None,
+        index_path: str | None = None,
     ) -> None:
         """Initialize the PipelineCatalog.
 
@@ -52,6 +74,11 @@ class PipelineCatalog:
                 a summary requests configuration data.
             project_cfg_provider: Optional callable returning the current project
                 configuration.  When set, it takes precedence over ``project_cfg``.
+            bundle_provider: Optional callable returning the active compiled
+                :class:`~flowerpower.pipeline.bundle.ProjectBundle`, if any.
+            index_path: Optional path of the persistent catalog index.  When set,
+                discovery refreshes the index from two directory listings and
+                only re-reads pipelines whose files changed.
         """
         self._fs = fs
         self._cfg_dir = cfg_dir
@@ -59,6 +86,100 @@ class PipelineCatalog:
         self._project_cfg = project_cfg
         self._config_provider = config_provider
         self._project_cfg_provider = project_cfg_provider
+        self._bundle_provider = bundle_provider
+        self._index_path = index_path
+        self._index: CatalogIndex | None = None
+        self._index_loaded = False
+
+    def _bundle(self) -> "ProjectBundle | None":
+        return self._bundle_provider() if self._bundle_provider is not None else None
+
+    # --- Catalog index ---
+
+    def _indexed(self, *, ignore_bundle: bool = False) -> "CatalogIndex | None":
+        """Return the refreshed catalog index, or ``None`` to scan directly."""
+        if self._index_path is None or (
+            not ignore_bundle and self._bundle() is not None
+        ):
+            return None
+        from .catalog_index import read_catalog_index, refresh_catalog_index
+
+        try:
+            if not self._index_loaded:
+                self._index = read_catalog_index(
+                    self._fs, self._cfg_dir, self._pipelines_dir, self._index_path
+                )
+                self._index_loaded = True
+            index, changed = refresh_catalog_index(
+                self._fs, self._cfg_dir, self._pipelines_dir, self._index
+            )
+        except Exception as e:
+            logger.debug(f"Catalog index unavailable, scanning pipelines: {e}")
+            return None
+
+        self._index = index
+        if changed:
+            self._write_index(index)
+        return index
+
+    def _write_index(self, index: "CatalogIndex") -> None:
+        from .catalog_index import write_catalog_index
+
+        try:
+            write_catalog_index(self._fs, index, self._index_path)
+        except Exception as e:
+            # Read-only projects still benefit from the in-memory index.
+            logger.debug(f"Could not persist catalog index {self._index_path}: {e}")
+
+    def rebuild_index(self) -> "CatalogIndex":
+        """Rebuild the catalog index from scratch and persist it.
+
+        Every pipeline module and config is read again, regardless of the
+        stored stamps.
+
+        Returns:
+            CatalogIndex: The rebuilt index.
+
+        Raises:
+            RuntimeError: If the catalog was created without an index path.
+        """
+        if self._index_path is None:
+            raise RuntimeError("PipelineCatalog was created without an index path")
+        from .catalog_index import refresh_catalog_index
+
+        index, _ = refresh_catalog_index(self._fs, self._cfg_dir, self._pipelines_dir)
+        self._index = index
+        self._index_loaded = True
+        self._write_index(index)
+        return index
+
+    def search_nodes(
+        self,
+        node: str | None = None,
+        tags: Mapping[str, Any] | None = None,
+    ) -> list["NodeMatch"]:
+        """Find pipelines that produce or consume ``node`` and/or carry ``tags``.
+
+        Answered from the statically parsed nodes of the catalog index; no
+        pipeline module is imported.  Without a persistent index, every module
+        is read and parsed for this call.
+
+        Args:
+            node: Node name to look up.
+            tags: Tag filter, e.g. ``{"owner": "data"}``.
+
+        Returns:
+            list[NodeMatch]: Matching nodes ordered by pipeline.
+        """
+        from .catalog_index import refresh_catalog_index
+        from .node_index import search_nodes
+
+        index = self._indexed(ignore_bundle=True)
+        if index is None:
+            index, _ = refresh_catalog_index(
+                self._fs, self._cfg_dir, self._pipelines_dir
+            )
+        return search_nodes(index, node=node, tags=tags)
 
     # --- Pipeline Discovery & Listing ---
 
@@ -69,6 +190,12 @@ class PipelineCatalog:
         Returns:
             list[str]: The list of pipeline files.
         """
+        bundle = self._bundle()
+        if bundle is not None:
+            return bundle.files
+        index = self._indexed()
+        if index is not None:
+            return index.files
         try:
             files: list[str] = []
             seen: set[str] = set()
@@ -117,25 +244,81 @@ class PipelineCatalog:
         Returns:
             list[str]: The list of pipeline names.
         """
-        return [self.path_to_pipeline_name(path) for path in self.get_files()]
+        index = self._indexed()
+        if index is not None:
+            return index.names
+        return self._paths_to_pipeline_names(self.get_files())
+
+    def _paths_to_pipeline_names(self, paths: list[str]) -> list[str]:
+        """Resolve names for many files, reading configs in one wave if async."""
+        if self._bundle() is None and len(paths) > 1:
+            module_paths = [self._module_path(path) for path in paths]
+            candidates = {
+                module_path: self._config_candidates(module_path)
+                for module_path in module_paths
+            }
+            contents = read_candidate_paths(
+                self._fs,
+                [path for group in candidates.values() for path in group],
+                purpose="pipeline config",
+            )
+            if contents is not None:
+                names = []
+                for module_path in module_paths:
+                    stored_name = None
+                    for cfg_path in candidates[module_path]:
+                        if cfg_path in contents:
+                            stored_name = self._stored_name(contents[cfg_path], cfg_path)
+                            if stored_name:
+                                break
+                    names.append(stored_name or module_path.replace("/", "."))
+                return names
+        return [self.path_to_pipeline_name(path) for path in paths]
+
+    def _module_path(self, path: str) -> str:
+        relative_path = posixpath.relpath(path, self._pipelines_dir)
+        return posixpath.splitext(relative_path)[0]
+
+    def _config_candidates(self, module_path: str) -> list[str]:
+        return get_pipeline_config_paths(
+            module_path,
+            self._cfg_dir,
+            self._pipelines_dir,
+        )
+
+    @staticmethod
+    def _stored_name(raw: Any, cfg_path: str) -> str | None:
+        """Return the validated ``name`` from config YAML content, if any."""
+        try:
+            data = yaml.safe_load(raw) or {}
+        except Exception as e:
+            logger.debug(
+                f"Skipping unreadable pipeline config candidate {cfg_path}: {e}"
+            )
+            return None
+
+        stored_name = data.get("name") if isinstance(data, dict) else None
+        if isinstance(stored_name, str) and stored_name:
+            try:
+                return validate_pipeline_name(stored_name)
+            except (SecurityError, ValueError):
+                return None
+        return None
 
     def path_to_pipeline_name(self, path: str) -> str:
         """Convert a pipeline file path into a discovered pipeline name."""
-        relative_path = posixpath.relpath(path, self._pipelines_dir)
-        module_path = posixpath.splitext(relative_path)[0]
+        bundle = self._bundle()
+        entry = bundle.get_by_file(path) if bundle is not None else None
+        if entry is not None:
+            return entry.name
+        module_path = self._module_path(path)
         derived_name = module_path.replace("/", ".")
         stored_name = self.read_stored_pipeline_name(module_path)
         return stored_name or derived_name
 
     def read_stored_pipeline_name(self, module_path: str) -> str | None:
         """Return the canonical pipeline name from YAML when available."""
-        candidate_paths = get_pipeline_config_paths(
-            module_path,
-            self._cfg_dir,
-            self._pipelines_dir,
-        )
-
-        for cfg_path in candidate_paths:
+        for cfg_path in self._config_candidates(module_path):
             try:
                 exists = self._fs.exists(cfg_path)
             except Exception as error:
@@ -148,24 +331,28 @@ class PipelineCatalog:
                 continue
             try:
                 with self._fs.open(cfg_path) as f:
-                    data = yaml.safe_load(f) or {}
+                    stored_name = self._stored_name(f, cfg_path)
             except Exception as e:
                 logger.debug(
                     f"Skipping unreadable pipeline config candidate {cfg_path}: {e}"
                 )
                 continue
-
-            stored_name = data.get("name") if isinstance(data, dict) else None
-            if isinstance(stored_name, str) and stored_name:
-                try:
-                    return validate_pipeline_name(stored_name)
-                except (SecurityError, ValueError):
-                    continue
+            if stored_name:
+                return stored_name
 
         return None
 
     # --- Data Gathering (presentation-free) ---
 
+    def project_summary(self) -> dict[str, Any] | None:
+        """Return the current project configuration as a dict, if any."""
+        project_cfg = (
+            self._project_cfg_provider()
+            if self._project_cfg_provider is not None
+            else self._project_cfg
+        )
+        return project_cfg.to_dict() if project_cfg is not None else None
+
     def get_summary(
         self,
         name: str | None = None,
@@ -176,6 +363,9 @@ class PipelineCatalog:
         """
         Get a summary of the pipelines.
 
+        Materializes :meth:`iter_summary`; prefer the iterator for large
+        projects.
+
         Args:
             name (str | None, optional): The name of the pipeline. Defaults to None.
             cfg (bool, optional): Whether to show the configuration. Defaults to True.
@@ -190,94 +380,204 @@ class PipelineCatalog:
             summary=pm.get_summary()
             ```
         """
-        if name is not None:
-            name = validate_pipeline_name(name)
-            pipeline_names = [name]
-        else:
-            pipeline_names = self.get_names()
-
         summary: dict[str, Any] = {}
         summary["pipelines"] = {}
 
         if project:
-            project_cfg = (
-                self._project_cfg_provider()
-                if self._project_cfg_provider is not None
-                else self._project_cfg
-            )
-            if project_cfg is not None:
-                summary["project"] = project_cfg.to_dict()
+            project_summary = self.project_summary()
+            if project_summary is not None:
+                summary["project"] = project_summary
 
-        for name in pipeline_names:
-            # Load pipeline config directly
+        fields = [field for field, wanted in (("cfg", cfg), ("code", code)) if wanted]
+        summary["pipelines"].update(self.iter_summary(name, fields=fields))
+        return summary
 
-            pipeline_summary = {}
-            if cfg:
-                if self._config_provider is None:
-                    raise RuntimeError(
-                        "PipelineCatalog requires config_provider to load configuration summaries"
-                    )
-                pipeline_cfg = self._config_provider(name)
-                pipeline_summary["cfg"] = pipeline_cfg.to_dict()
-            if code:
-                try:
-                    module_path = posixpath.join(
-                        self._pipelines_dir,
-                        f"{format_pipeline_file_path(name)}.py",
-                    )
-                    module_content = self._fs.cat(module_path).decode()
-                    pipeline_summary["module"] = module_content
-                except FileNotFoundError:
-                    logger.warning(f"Module file not found for pipeline '{name}'")
-                    pipeline_summary["module"] = "# Module file not found"
-                except (OSError, PermissionError, UnicodeDecodeError) as e:
-                    logger.error(
-                        f"Error reading module file for pipeline '{name}': {e}"
-                    )
-                    pipeline_summary["module"] = f"# Error reading module file: {e}"
-                except Exception as e:
-                    logger.error(
-                        f"Unexpected error reading module file for pipeline '{name}': {e}"
-                    )
-                    pipeline_summary["module"] = (
-                        f"# Unexpected error reading module file: {e}"
+    def iter_summary(
+        self,
+        name: str | None = None,
+        *,
+        fields: Iterable[str] = SUMMARY_FIELDS,
+        page_size: int = SUMMARY_PAGE_SIZE,
+        offset: int = 0,
+        limit: int | None = None,
+        max_workers: int = SUMMARY_MAX_WORKERS,
+    ) -> Iterator[tuple[str, dict[str, Any]]]:
+        """Yield ``(name, summary)`` pairs for pipelines, one page at a time.
+
+        Configs and module sources of a page are fetched concurrently on a
+        bounded thread pool; the next page is only fetched once the previous
+        one has been consumed, so memory stays proportional to ``page_size``.
+
+        Args:
+            name: Summarize only this pipeline.  Defaults to all pipelines.
+            fields: Parts to include: ``"cfg"`` (key ``cfg``) and/or ``"code"``
+                (key ``module``).
+            page_size: Number of pipelines fetched per batch
+                (``FP_SUMMARY_PAGE_SIZE``).
+            offset: Number of pipelines to skip.
+            limit: Maximum number of pipelines to yield.
+            max_workers: Upper bound on concurrent fetches
+                (``FP_SUMMARY_MAX_WORKERS``).
+
+        Yields:
+            tuple[str, dict[str, Any]]: Pipeline name and its summary payload.
+
+        Raises:
+            ValueError: If ``fields`` contains an unknown field or ``page_size``,
+                ``offset`` or ``limit`` is out of range.
+        """
+        fields = tuple(dict.fromkeys(fields))
+        unknown = set(fields) - set(SUMMARY_FIELDS)
+        if unknown:
+            raise ValueError(
+                f"Unknown summary fields {sorted(unknown)}; "
+                f"expected any of {list(SUMMARY_FIELDS)}"
+            )
+        if page_size < 1 or offset < 0 or (limit is not None and limit < 0):
+            raise ValueError("page_size must be positive; offset and limit >= 0")
+
+        if name is not None:
+            pipeline_names = [validate_pipeline_name(name)]
+        else:
+            pipeline_names = self.get_names()
+        stop = offset + limit if limit is not None else None
+        pipeline_names = pipeline_names[offset:stop]
+        if not fields or not pipeline_names:
+            return
+
+        fetchers = {"cfg": self._summary_cfg, "code": self._summary_module}
+        workers = max(1, min(max_workers, page_size * len(fields)))
+        with ThreadPoolExecutor(
+            max_workers=workers, thread_name_prefix="fp-summary"
+        ) as pool:
+            for start in range(0, len(pipeline_names), page_size):
+                page = [
+                    (
+                        pipeline_name,
+                        [
+                            (field, pool.submit(fetchers[field], pipeline_name))
+                            for field in fields
+                        ],
                     )
+                    for pipeline_name in pipeline_names[start : start + page_size]
+                ]
+                for pipeline_name, futures in page:
+                    yield pipeline_name, {
+                        _SUMMARY_KEYS[field]: future.result()
+                        for field, future in futures
+                    }
+
+    def _summary_cfg(self, name: str) -> dict[str, Any]:
+        if self._config_provider is None:
+            raise RuntimeError(
+                "PipelineCatalog requires config_provider to load configuration summaries"
+            )
+        return self._config_provider(name).to_dict()
 
-            if pipeline_summary:  # Only add if cfg or code was requested and found
-                summary["pipelines"][name] = pipeline_summary
-        return summary
+    def _summary_module(self, name: str) -> str:
+        try:
+            module_path = posixpath.join(
+                self._pipelines_dir,
+                f"{format_pipeline_file_path(name)}.py",
+            )
+            return self._fs.cat(module_path).decode()
+        except FileNotFoundError:
+            logger.warning(f"Module file not found for pipeline '{name}'")
+            return "# Module file not found"
+        except (OSError, PermissionError, UnicodeDecodeError) as e:
+            logger.error(f"Error reading module file for pipeline '{name}': {e}")
+            return f"# Error reading module file: {e}"
+        except Exception as e:
+            logger.error(
+                f"Unexpected error reading module file for pipeline '{name}': {e}"
+            )
+            return f"# Unexpected error reading module file: {e}"
+
+    @staticmethod
+    def _format_mod_time(mtime: float | None) -> str:
+        if mtime is None:
+            return "N/A"
+        return dt.datetime.fromtimestamp(mtime, tz=dt.timezone.utc).strftime(
+            "%Y-%m-%d %H:%M:%S"
+        )
+
+    @staticmethod
+    def _format_size(size_bytes: int | None) -> str:
+        if size_bytes is None:
+            return "N/A"
+        return f"{size_bytes / 1024:.1f} KB" if size_bytes else "0.0 KB"
+
+    def _list_module_stamps(self) -> "dict[str, FileStamp]":
+        """Fetch metadata for every module with one recursive listing."""
+        from .catalog_index import list_file_stamps
+
+        try:
+            return list_file_stamps(self._fs, self._pipelines_dir, (".py",))
+        except Exception as e:
+            logger.debug(
+                f"Could not list {self._pipelines_dir} with details, "
+                f"falling back to per-file metadata: {e}"
+            )
+            return {}
+
+    def _probe_metadata(self, path: str) -> tuple[str, str]:
+        """Fetch ``(mod_time, size)`` for one file with two round trips."""
+        try:
+            mod_time = self._fs.modified(path).strftime("%Y-%m-%d %H:%M:%S")
+        except NotImplementedError:
+            mod_time = "N/A"
+        try:
+            size = self._format_size(self._fs.size(path))
+        except NotImplementedError:
+            size = "N/A"
+        except (OSError, PermissionError) as e:
+            logger.warning(f"Could not get size for {path}: {e}")
+            size = "Error"
+        except Exception as e:
+            logger.warning(f"Unexpected error getting size for {path}: {e}")
+            size = "Error"
+        return mod_time, size
 
     def collect_pipeline_info(self) -> list[dict[str, Any]]:
         """Collect metadata (name, path, mod_time, size) for all pipelines.
 
+        Modification times and sizes come from the catalog index or from a
+        single detailed listing of the pipelines directory, so the cost does
+        not grow with one round trip per file.  Files the listing does not
+        describe are probed individually.
+
         Returns:
             A list of dicts, each with keys ``name``, ``path``, ``mod_time``,
             and ``size``.  Returns an empty list when no pipelines exist.
         """
+        index = self._indexed()
+        if index is not None:
+            return [
+                {
+                    "name": entry.name,
+                    "path": entry.module_file,
+                    "mod_time": self._format_mod_time(entry.mtime),
+                    "size": self._format_size(entry.size),
+                }
+                for entry in index.pipelines
+            ]
+
         pipeline_files = self.get_files()
-        pipeline_names = [self.path_to_pipeline_name(path) for path in pipeline_files]
+        pipeline_names = self._paths_to_pipeline_names(pipeline_files)
 
         if not pipeline_files:
             return []
 
+        stamps = self._list_module_stamps()
         pipeline_info: list[dict[str, Any]] = []
 
         for path, name in zip(pipeline_files, pipeline_names, strict=True):
-            try:
-                mod_time = self._fs.modified(path).strftime("%Y-%m-%d %H:%M:%S")
-            except NotImplementedError:
-                mod_time = "N/A"
-            try:
-                size_bytes = self._fs.size(path)
-                size = f"{size_bytes / 1024:.1f} KB" if size_bytes else "0.0 KB"
-            except NotImplementedError:
-                size = "N/A"
-            except (OSError, PermissionError) as e:
-                logger.warning(f"Could not get size for {path}: {e}")
-                size = "Error"
-            except Exception as e:
-                logger.warning(f"Unexpected error getting size for {path}: {e}")
-                size = "Error"
+            stamp = stamps.get(path)
+            if stamp is not None and stamp.mtime is not None and stamp.size is not None:
+                mod_time = self._format_mod_time(stamp.mtime)
+                size = self._format_size(stamp.size)
+            else:
+                mod_time, size = self._probe_metadata(path)
 
             pipeline_info.append(
                 {
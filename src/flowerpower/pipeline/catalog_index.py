@@ -0,0 +1,356 @@
+"""Persistent, incrementally refreshed index of discovered pipelines.
+
+Listing a project's pipelines used to glob ``pipelines/`` twice and then probe
+and parse every config candidate just to read the stored ``name:``.  On object
+stores that is several round trips per pipeline.  The catalog index keeps the
+result of that work on disk (``FP_CATALOG_INDEX_PATH``) together with a stamp
+(mtime, size, ETag) of every file it was derived from.
+
+A refresh costs one recursive listing of the pipelines directory and one of
+the config directory.  Only pipelines whose module or config stamps changed
+are read again; everything else is served from the stored entries.  Files
+without any usable stamp are always re-read.
+
+Re-read modules are also parsed into a static node index
+(:mod:`flowerpower.pipeline.node_index`), so node searches never import
+pipeline code.
+"""
+
+from __future__ import annotations
+
+import datetime as dt
+import hashlib
+import posixpath
+import time
+from typing import Any
+
+import msgspec
+from fsspeckit import AbstractFileSystem
+from loguru import logger
+
+from ..settings import CATALOG_INDEX_PATH, CONFIG_DIR, PIPELINES_DIR
+from ..utils.filesystem import get_pipeline_config_paths, read_candidate_paths
+from .node_index import IndexedNode, parse_module_nodes
+
+__all__ = [
+    "CATALOG_INDEX_FORMAT_VERSION",
+    "CatalogIndex",
+    "FileStamp",
+    "IndexedPipeline",
+    "list_file_stamps",
+    "read_catalog_index",
+    "refresh_catalog_index",
+    "write_catalog_index",
+]
+
+CATALOG_INDEX_FORMAT_VERSION = 2
+
+_MTIME_KEYS = ("mtime", "LastModified", "last_modified", "updated", "modified")
+_ETAG_KEYS = ("ETag", "etag", "md5Hash", "content_md5")
+_CONFIG_SUFFIXES = (".yml", ".yaml")
+
+
+class FileStamp(msgspec.Struct, frozen=True, array_like=True):
+    """Change marker for one file taken from a directory listing."""
+
+    mtime: float | None = None
+    size: int | None = None
+    etag: str | None = None
+
+    @property
+    def reliable(self) -> bool:
+        """Whether an unchanged stamp implies unchanged content."""
+        return self.mtime is not None or self.etag is not None
+
+
+class IndexedPipeline(msgspec.Struct, frozen=True):
+    """One pipeline entry of a :class:`CatalogIndex`.
+
+    Attributes:
+        name: Canonical pipeline name (stored ``name:`` or derived from path).
+        module_path: Module path relative to the pipelines directory, without
+            the ``.py`` suffix (``"group/my_pipeline"``).
+        module_file: Module path relative to the project root.
+        config_file: First existing config candidate, or ``None``.
+        mtime: Module modification time (POSIX seconds), if listed.
+        size: Module size in bytes, if listed.
+        stored_name: Validated ``name:`` read from the config, if any.
+        content_hash: SHA-256 over the module and its config candidates.
+        module_stamp: Listing stamp of the module file.
+        config_stamps: Listing stamps of every existing config candidate.
+        module_hash: SHA-256 of the module source alone.
+        nodes: Nodes defined by the module, parsed without importing it.
+    """
+
+    name: str
+    module_path: str
+    module_file: str
+    config_file: str | None
+    mtime: float | None
+    size: int | None
+    stored_name: str | None
+    content_hash: str
+    module_stamp: FileStamp
+    config_stamps: dict[str, FileStamp] = msgspec.field(default_factory=dict)
+    module_hash: str = ""
+    nodes: list[IndexedNode] = msgspec.field(default_factory=list)
+
+
+class CatalogIndex(msgspec.Struct, dict=True):
+    """On-disk catalog of the pipelines of one project."""
+
+    format_version: int
+    cfg_dir: str
+    pipelines_dir: str
+    updated_at: float
+    pipelines: list[IndexedPipeline] = msgspec.field(default_factory=list)
+
+    def __post_init__(self) -> None:
+        self._by_file = {entry.module_file: entry for entry in self.pipelines}
+
+    @property
+    def names(self) -> list[str]:
+        """Pipeline names in module path order."""
+        return [entry.name for entry in self.pipelines]
+
+    @property
+    def files(self) -> list[str]:
+        """Pipeline module files, sorted like :meth:`PipelineCatalog.get_files`."""
+        return [entry.module_file for entry in self.pipelines]
+
+    def get_by_file(self, module_file: str) -> IndexedPipeline | None:
+        """Return the entry for a pipeline module file."""
+        return self._by_file.get(module_file)
+
+
+def _timestamp(value: Any) -> float | None:
+    if isinstance(value, (int, float)):
+        return float(value)
+    if isinstance(value, str):
+        try:
+            value = dt.datetime.fromisoformat(value.replace("Z", "+00:00"))
+        except ValueError:
+            return None
+    if isinstance(value, dt.datetime):
+        if value.tzinfo is None:
+            value = value.replace(tzinfo=dt.timezone.utc)
+        return value.timestamp()
+    return None
+
+
+def _stamp(info: dict[str, Any]) -> FileStamp:
+    mtime = next(
+        (
+            stamp
+            for stamp in (_timestamp(info.get(key)) for key in _MTIME_KEYS)
+            if stamp is not None
+        ),
+        None,
+    )
+    etag = next((str(info[key]) for key in _ETAG_KEYS if info.get(key)), None)
+    if mtime is None and etag is None:
+        mtime = _timestamp(info.get("created"))
+    size = info.get("size")
+    return FileStamp(
+        mtime=mtime,
+        size=int(size) if isinstance(size, (int, float)) else None,
+        etag=etag,
+    )
+
+
+def list_file_stamps(
+    fs: AbstractFileSystem, root: str, suffixes: tuple[str, ...]
+) -> dict[str, FileStamp]:
+    """List files below ``root`` ending in ``suffixes`` with one recursive call.
+
+    Args:
+        fs: Project filesystem.
+        root: Directory to list.
+        suffixes: File suffixes to keep.
+
+    Returns:
+        Mapping of file path (as returned by ``fs.find``) to its stamp.  A
+        missing directory yields an empty mapping.
+    """
+    try:
+        listing = fs.find(root, detail=True)
+    except FileNotFoundError:
+        return {}
+    return {
+        path: _stamp(info)
+        for path, info in listing.items()
+        if path.endswith(suffixes) and info.get("type", "file") == "file"
+    }
+
+
+def _read_many(fs: AbstractFileSystem, paths: list[str]) -> dict[str, bytes]:
+    if not paths:
+        return {}
+    contents = read_candidate_paths(fs, paths, purpose="catalog index")
+    if contents is not None:
+        return contents
+    contents = {}
+    for path in paths:
+        try:
+            contents[path] = fs.cat(path)
+        except FileNotFoundError:
+            continue
+    return contents
+
+
+def refresh_catalog_index(
+    fs: AbstractFileSystem,
+    cfg_dir: str = CONFIG_DIR,
+    pipelines_dir: str = PIPELINES_DIR,
+    previous: CatalogIndex | None = None,
+) -> tuple[CatalogIndex, bool]:
+    """Bring ``previous`` up to date with the files on ``fs``.
+
+    Args:
+        fs: Project filesystem, rooted at the project base directory.
+        cfg_dir: Configuration directory fragment.
+        pipelines_dir: Pipelines directory fragment.
+        previous: Index to update incrementally.  ``None`` re-reads every
+            pipeline (a full rebuild).
+
+    Returns:
+        The refreshed index and whether it differs from ``previous``.
+    """
+    from .catalog import PipelineCatalog
+
+    modules = {
+        path: stamp
+        for path, stamp in list_file_stamps(fs, pipelines_dir, (".py",)).items()
+        if posixpath.basename(path) != "__init__.py"
+    }
+    configs = list_file_stamps(fs, cfg_dir, _CONFIG_SUFFIXES)
+
+    planned: list[tuple[str, str, FileStamp, dict[str, FileStamp]]] = []
+    for module_file in sorted(modules):
+        module_path = posixpath.splitext(
+            posixpath.relpath(module_file, pipelines_dir)
+        )[0]
+        config_stamps = {
+            path: configs[path]
+            for path in get_pipeline_config_paths(module_path, cfg_dir, pipelines_dir)
+            if path in configs
+        }
+        planned.append((module_file, module_path, modules[module_file], config_stamps))
+
+    def reusable(module_file, stamp, config_stamps) -> IndexedPipeline | None:
+        old = previous.get_by_file(module_file) if previous is not None else None
+        if (
+            old is not None
+            and stamp.reliable
+            and all(s.reliable for s in config_stamps.values())
+            and (old.module_stamp, old.config_stamps) == (stamp, config_stamps)
+        ):
+            return old
+        return None
+
+    stale = [
+        (module_file, config_stamps)
+        for module_file, _, stamp, config_stamps in planned
+        if reusable(module_file, stamp, config_stamps) is None
+    ]
+    contents = _read_many(
+        fs,
+        [
+            path
+            for module_file, config_stamps in stale
+            for path in (module_file, *config_stamps)
+        ],
+    )
+
+    entries: list[IndexedPipeline] = []
+    for module_file, module_path, stamp, config_stamps in planned:
+        entry = reusable(module_file, stamp, config_stamps)
+        if entry is None:
+            source = contents.get(module_file, b"")
+            digest = hashlib.sha256(source)
+            module_hash = digest.hexdigest()
+            stored_name = None
+            for cfg_path in config_stamps:
+                raw = contents.get(cfg_path)
+                if raw is None:
+                    continue
+                digest.update(b"\0" + cfg_path.encode() + b"\0" + raw)
+                stored_name = stored_name or PipelineCatalog._stored_name(
+                    raw, cfg_path
+                )
+            entry = IndexedPipeline(
+                name=stored_name or module_path.replace("/", "."),
+                module_path=module_path,
+                module_file=module_file,
+                config_file=next(iter(config_stamps), None),
+                mtime=stamp.mtime,
+                size=stamp.size,
+                stored_name=stored_name,
+                content_hash=digest.hexdigest(),
+                module_stamp=stamp,
+                config_stamps=config_stamps,
+                module_hash=module_hash,
+                nodes=parse_module_nodes(source, module_file),
+            )
+        entries.append(entry)
+
+    changed = previous is None or previous.pipelines != entries
+    if not changed:
+        return previous, False
+    if stale:
+        logger.debug(f"Catalog index re-read {len(stale)} of {len(entries)} pipelines")
+    return (
+        CatalogIndex(
+            format_version=CATALOG_INDEX_FORMAT_VERSION,
+            cfg_dir=cfg_dir,
+            pipelines_dir=pipelines_dir,
+            updated_at=time.time(),
+            pipelines=entries,
+        ),
+        True,
+    )
+
+
+def write_catalog_index(
+    fs: AbstractFileSystem, index: CatalogIndex, path: str = CATALOG_INDEX_PATH
+) -> str:
+    """Write ``index`` to ``path`` on ``fs`` and return the path."""
+    fs.makedirs(posixpath.dirname(path) or ".", exist_ok=True)
+    with fs.open(path, "wb") as f:
+        f.write(msgspec.msgpack.encode(index))
+    return path
+
+
+def read_catalog_index(
+    fs: AbstractFileSystem,
+    cfg_dir: str = CONFIG_DIR,
+    pipelines_dir: str = PIPELINES_DIR,
+    path: str = CATALOG_INDEX_PATH,
+) -> CatalogIndex | None:
+    """Read the catalog index at ``path`` if it exists and matches the project.
+
+    An index written by another format version or for other config/pipelines
+    directories is ignored (``None``); the next refresh rebuilds it.
+    """
+    try:
+        raw = fs.cat(path)
+    except FileNotFoundError:
+        return None
+    except Exception as error:
+        logger.debug(f"Cannot read catalog index {path}: {error}")
+        return None
+
+    try:
+        index = msgspec.msgpack.decode(raw, type=CatalogIndex)
+    except (msgspec.DecodeError, TypeError) as error:
+        logger.debug(f"Ignoring unreadable catalog index {path}: {error}")
+        return None
+
+    if (index.format_version, index.cfg_dir, index.pipelines_dir) != (
+        CATALOG_INDEX_FORMAT_VERSION,
+        cfg_dir,
+        pipelines_dir,
+    ):
+        logger.debug(f"Ignoring catalog index {path} built for another layout")
+        return None
+    return index
@@ -1,21 +1,36 @@
 """Configuration management for pipelines."""
 
-from typing import Any
+from collections.abc import Iterable
+from typing import TYPE_CHECKING, Any
 
 from fsspeckit import AbstractFileSystem
+from loguru import logger
 
 from ..cfg import PipelineConfig, ProjectConfig
 from ..settings import CONFIG_DIR, PIPELINES_DIR
 from ..utils.env import apply_env_overlays
-from ..utils.filesystem import find_first_existing_path, get_project_config_paths
+from ..utils.filesystem import (
+    find_first_existing_path,
+    format_pipeline_file_path,
+    get_pipeline_config_paths,
+    get_project_config_paths,
+    read_candidate_paths,
+)
 from ..utils.security import validate_directory_fragment, validate_pipeline_name
 
+if TYPE_CHECKING:
+    from .bundle import ProjectBundle
+
 
 class PipelineConfigManager:
     """Loads project and pipeline configurations from disk.
 
     Stateless loader: every call reads fresh and applies environment overlays.
-    Caching is owned by PipelineLoader, not this module.
+    Caching is owned by PipelineLoader, not this module.  When a compiled
+    :class:`~flowerpower.pipeline.bundle.ProjectBundle` is attached, configs
+    are built from it instead of probing the filesystem until the bundle is
+    discarded.  On async (remote) filesystems all config path candidates are
+    read in one concurrent wave instead of serial ``exists``/``open`` probes.
     """
 
     def __init__(
@@ -44,10 +59,75 @@ class PipelineConfigManager:
         self._pipelines_dir = validate_directory_fragment(
             pipelines_dir if pipelines_dir is not None else PIPELINES_DIR
         )
+        self.bundle: "ProjectBundle | None" = None
+        # Contents from the last ``prefetch`` wave (``None`` marks a miss),
+        # consumed by the next load of each path.
+        self._prefetched: dict[str, bytes | None] = {}
+
+    def use_bundle(self, bundle: "ProjectBundle | None") -> None:
+        """Serve configs from ``bundle`` (``None`` detaches it)."""
+        self.bundle = bundle
+
+    def discard_bundle(self, reason: str = "") -> None:
+        """Stop serving configs from the attached bundle, if any."""
+        if self.bundle is not None:
+            logger.debug(f"Discarding project bundle{f' ({reason})' if reason else ''}")
+            self.bundle = None
 
     def _project_config_paths(self) -> list[str]:
         return get_project_config_paths(self._cfg_dir)
 
+    def _pipeline_config_paths(self, name: str) -> list[str]:
+        return get_pipeline_config_paths(
+            format_pipeline_file_path(name), self._cfg_dir, self._pipelines_dir
+        )
+
+    def prefetch(
+        self, pipeline_names: Iterable[str | None] = (), *, project: bool = True
+    ) -> bool:
+        """Read config candidates for the project and pipelines in one wave.
+
+        Only effective on async filesystems; the next ``load_project_config``
+        and ``load_pipeline_config`` calls consume the prefetched contents.
+
+        Args:
+            pipeline_names: Pipelines whose config candidates to read.
+            project: Whether to include the project config candidates.
+
+        Returns:
+            bool: Whether a concurrent read wave was issued.
+        """
+        paths = self._project_config_paths() if project else []
+        for name in pipeline_names:
+            if name is not None:
+                paths.extend(self._pipeline_config_paths(validate_pipeline_name(name)))
+        contents = read_candidate_paths(self._fs, paths, purpose="config")
+        if contents is None:
+            return False
+        self._prefetched.update({path: contents.get(path) for path in paths})
+        return True
+
+    def _read_first_candidate(
+        self, paths: list[str], purpose: str
+    ) -> tuple[str | None, bytes | None] | None:
+        """Return the first readable candidate and its content.
+
+        Uses prefetched contents when every candidate is available, otherwise
+        a concurrent read wave.  Returns ``None`` on synchronous filesystems so
+        callers fall back to the serial probe.
+        """
+        if paths and all(path in self._prefetched for path in paths):
+            contents = {path: self._prefetched.pop(path) for path in paths}
+        else:
+            contents = read_candidate_paths(self._fs, paths, purpose=purpose)
+            if contents is None:
+                return None
+        for path in paths:
+            raw = contents.get(path)
+            if raw is not None:
+                return path, raw
+        return None, None
+
     def load_project_config(self, name: str | None = None) -> ProjectConfig:
         """Load project configuration.
 
@@ -57,6 +137,25 @@ class PipelineConfigManager:
         Returns:
             ProjectConfig: The loaded project configuration
         """
+        if self.bundle is not None:
+            bundled = self.bundle.project_config()
+            if bundled is not None:
+                apply_env_overlays(project_cfg=bundled)
+                return bundled
+
+        fetched = self._read_first_candidate(
+            self._project_config_paths(), "project config"
+        )
+        if fetched is not None:
+            path, raw = fetched
+            project_cfg = (
+                ProjectConfig.from_raw(raw, path=path)
+                if path is not None
+                else ProjectConfig(name=name)
+            )
+            apply_env_overlays(project_cfg=project_cfg)
+            return project_cfg
+
         project_config_exists = (
             find_first_existing_path(
                 self._fs,
@@ -92,6 +191,32 @@ class PipelineConfigManager:
         if name is not None:
             name = validate_pipeline_name(name)
 
+        pipeline_cfg = (
+            self.bundle.pipeline_config(name)
+            if self.bundle is not None and name is not None
+            else None
+        )
+        if pipeline_cfg is not None:
+            apply_env_overlays(pipeline_cfg=pipeline_cfg)
+            return pipeline_cfg
+
+        fetched = (
+            self._read_first_candidate(
+                self._pipeline_config_paths(name), "pipeline config"
+            )
+            if name is not None
+            else None
+        )
+        if fetched is not None:
+            path, raw = fetched
+            pipeline_cfg = (
+                PipelineConfig.from_raw(name=name, raw=raw, path=path, fs=self._fs)
+                if path is not None
+                else PipelineConfig(name=name)
+            )
+            apply_env_overlays(pipeline_cfg=pipeline_cfg)
+            return pipeline_cfg
+
         # Load configuration through the canonical loader
         pipeline_cfg = PipelineConfig.load(
             base_dir=self._base_dir,
@@ -35,7 +35,11 @@ class ExecutionContextBuilder:
         run_config: RunConfig,
         adapter_set: ResolvedAdapterSet,
     ) -> tuple[h_executors.BaseExecutor, Callable | None, list]:
-        """Create executor, shutdown function, and adapters for a pipeline run."""
+        """Create executor, shutdown function, and adapters for a pipeline run.
+
+        The executor is borrowed from the executor factory; the shutdown
+        function hands it back and must be called once the run has finished.
+        """
         executor_cfg = run_config.executor or ExecutorConfig()
         executor, cleanup_fn = self._create_executor(
             executor_cfg,
@@ -54,8 +58,8 @@ class ExecutionContextBuilder:
         executor_cfg: ExecutorConfig,
         project_adapter_cfg: Any = None,
     ) -> tuple[h_executors.BaseExecutor, Callable | None]:
-        executor = self._executor_factory.create_executor(executor_cfg)
-        cleanup_fn = None
+        executor = self._executor_factory.acquire(executor_cfg)
+        shutdown_fn = None
 
         # Only ray currently needs special shutdown handling. Use the resolved
         # project adapter config instead of peeking into project context shape.
@@ -63,7 +67,15 @@ class ExecutionContextBuilder:
         ray_cfg = getattr(project_adapter_cfg, "ray", None)
         if executor_cfg.type == "ray" and ray_module is not None and ray_cfg is not None:
             should_shutdown = getattr(ray_cfg, "shutdown_ray_on_completion", False)
-            cleanup_fn = ray_module.shutdown if should_shutdown else None
+            shutdown_fn = ray_module.shutdown if should_shutdown else None
+
+        def cleanup_fn() -> None:
+            try:
+                if shutdown_fn is not None:
+                    shutdown_fn()
+            finally:
+                self._executor_factory.release(executor_cfg, executor)
+
         return executor, cleanup_fn
 
 
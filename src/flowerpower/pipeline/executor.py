@@ -5,6 +5,7 @@ from typing import TYPE_CHECKING, Any
 
 from ..cfg.pipeline.run import RunConfig
 from ..utils.config import (
+    clone_run_config,
     merge_run_config_with_kwargs,
     merge_run_configs,
     validate_resolved_run_config,
@@ -119,6 +120,34 @@ class PipelineExecutor:
             adapter_set=plan.adapter_set,
         )
 
+    def prepare_run(
+        self, name: str, run_config: RunConfig | None = None, **kwargs: Any
+    ) -> PipelineRunPlan:
+        """Resolve config, adapters and the pipeline object once for many runs.
+
+        Run-specific logging is applied here, so :meth:`run_prepared` does not
+        reconfigure logging per run.
+        """
+        plan = self._build_run_plan(name, run_config, **kwargs)
+        self._apply_run_logging(plan)
+        return plan
+
+    def run_prepared(
+        self, plan: PipelineRunPlan, inputs: dict[str, Any] | None = None
+    ) -> dict[str, Any]:
+        """Execute a plan from :meth:`prepare_run` with ``inputs`` merged over its inputs.
+
+        Safe to call from several threads with the same plan.
+        """
+        run_config = clone_run_config(plan.run_config)
+        run_config.inputs = {**(plan.run_config.inputs or {}), **(inputs or {})}
+        run_config.log_level = None
+        run_config.reload = False
+        return plan.pipeline._run_resolved(
+            run_config=run_config,
+            adapter_set=plan.adapter_set,
+        )
+
     def _build_run_plan(
         self,
         name: str,
@@ -0,0 +1,548 @@
+"""Persistent run history.
+
+Every pipeline run is recorded in a SQLite database (``FP_HISTORY_PATH``,
+default ``~/.flowerpower/cache/history.sqlite``): run ID, project, pipeline,
+a hash of the run configuration, start/end time, status, attempts, and the
+duration and output size of each executed node of the final attempt.
+
+Rows are handed to a background writer thread, so a run only pays for
+building the record and one queue put.  The writer batches pending records
+into a single transaction and the database runs in WAL mode, letting readers
+query it while runs are being recorded.  Disable recording with
+``FP_HISTORY_ENABLED=false``.
+
+Read the history with :class:`RunHistory` (``get_history().runs(...)``,
+``get_history().stats(...)``), :meth:`PipelineManager.history` or
+``flowerpower pipeline history <name>``.
+"""
+
+from __future__ import annotations
+
+import atexit
+import contextlib
+import hashlib
+import math
+import os
+import queue
+import sqlite3
+import sys
+import threading
+import time
+import uuid
+from collections.abc import Iterator, Sequence
+from dataclasses import dataclass, field
+from typing import Any
+
+import msgspec
+from hamilton.lifecycle import api
+from loguru import logger
+
+from ..settings import HISTORY_ENABLED, HISTORY_PATH
+
+__all__ = [
+    "HistoryRecorder",
+    "NodeRecord",
+    "NodeSummary",
+    "RunHistory",
+    "RunRecord",
+    "RunStats",
+    "config_hash",
+    "estimate_size",
+    "get_history",
+    "history_enabled",
+    "percentile",
+]
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS runs (
+    run_id TEXT PRIMARY KEY,
+    project TEXT NOT NULL,
+    pipeline TEXT NOT NULL,
+    config_hash TEXT NOT NULL,
+    started_at REAL NOT NULL,
+    finished_at REAL NOT NULL,
+    status TEXT NOT NULL,
+    attempts INTEGER NOT NULL,
+    error TEXT
+);
+CREATE INDEX IF NOT EXISTS runs_by_pipeline ON runs (project, pipeline, started_at);
+CREATE TABLE IF NOT EXISTS nodes (
+    run_id TEXT NOT NULL REFERENCES runs (run_id) ON DELETE CASCADE,
+    node TEXT NOT NULL,
+    duration REAL NOT NULL,
+    output_size INTEGER
+);
+CREATE INDEX IF NOT EXISTS nodes_by_run ON nodes (run_id);
+"""
+
+_INSERT_RUN = (
+    "INSERT OR REPLACE INTO runs (run_id, project, pipeline, config_hash, "
+    "started_at, finished_at, status, attempts, error) "
+    "VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)"
+)
+# Empty filters are passed as NULL; a negative LIMIT means no limit.
+_SELECT_RUNS = (
+    "SELECT run_id, project, pipeline, config_hash, started_at, finished_at, "
+    "status, attempts, error FROM runs "
+    "WHERE (?1 IS NULL OR pipeline = ?1) AND (?2 IS NULL OR project = ?2) "
+    "AND (?3 IS NULL OR status = ?3) "
+    "ORDER BY started_at DESC LIMIT ?4"
+)
+
+
+@dataclass(frozen=True)
+class NodeRecord:
+    """One node execution of a recorded run."""
+
+    node: str
+    duration: float
+    output_size: int | None = None
+
+
+@dataclass(frozen=True)
+class RunRecord:
+    """One recorded pipeline run.
+
+    Attributes:
+        run_id: Hamilton run ID of the final attempt (a UUID if the run
+            failed before the graph started).
+        project: Project name.
+        pipeline: Pipeline name.
+        config_hash: Hash of the pipeline params and run configuration.
+        started_at: Start of the first attempt (Unix time).
+        finished_at: End of the final attempt (Unix time).
+        status: ``"success"`` or ``"failure"``.
+        attempts: Number of attempts made.
+        error: ``repr`` of the final error for failed runs.
+        nodes: Node executions of the final attempt.
+    """
+
+    run_id: str
+    project: str
+    pipeline: str
+    config_hash: str
+    started_at: float
+    finished_at: float
+    status: str
+    attempts: int = 1
+    error: str | None = None
+    nodes: tuple[NodeRecord, ...] = ()
+
+    @property
+    def duration(self) -> float:
+        return self.finished_at - self.started_at
+
+
+@dataclass(frozen=True)
+class NodeSummary:
+    """Durations and output sizes of one node across recorded runs."""
+
+    node: str
+    calls: int
+    p50: float
+    p95: float
+    mean_output_size: float | None
+
+
+@dataclass(frozen=True)
+class RunStats:
+    """Aggregated history of one pipeline.
+
+    Attributes:
+        pipeline: Pipeline name.
+        runs: Number of runs considered.
+        failures: How many of them failed.
+        durations: Percentiles (``p50``, ``p90``, ``p95``, ``p99``) plus
+            ``min``, ``mean`` and ``max`` of successful run durations.
+        trend: Relative change of the mean successful duration of the newer
+            half of the runs over the older half (``0.1`` is 10% slower), or
+            ``None`` with fewer than four successful runs.
+        nodes: Per-node summaries, slowest (by ``p50``) first.
+    """
+
+    pipeline: str
+    runs: int
+    failures: int
+    durations: dict[str, float] = field(default_factory=dict)
+    trend: float | None = None
+    nodes: list[NodeSummary] = field(default_factory=list)
+
+    @property
+    def success_rate(self) -> float:
+        return (self.runs - self.failures) / self.runs if self.runs else 0.0
+
+
+def percentile(values: Sequence[float], q: float) -> float:
+    """Linearly interpolated ``q``-th percentile (0-100) of sorted ``values``."""
+    if not values:
+        return math.nan
+    position = (len(values) - 1) * q / 100
+    lower = math.floor(position)
+    upper = min(lower + 1, len(values) - 1)
+    return values[lower] + (values[upper] - values[lower]) * (position - lower)
+
+
+def estimate_size(value: Any, deep: bool = False) -> int | None:
+    """Estimate the in-memory size of a node output in bytes.
+
+    Uses the buffer sizes reported by Arrow, NumPy, pandas and Polars objects
+    and falls back to the shallow :func:`sys.getsizeof`.  Nothing is traversed
+    or serialised unless ``deep`` is set, which makes pandas count the
+    contents of object columns (``memory_usage(deep=True)``).
+    """
+    try:
+        estimated_size = getattr(value, "estimated_size", None)  # polars
+        if callable(estimated_size):
+            return int(estimated_size())
+        memory_usage = getattr(value, "memory_usage", None)  # pandas
+        if callable(memory_usage):
+            usage = memory_usage(index=True, deep=deep)
+            return int(usage.sum() if hasattr(usage, "sum") else usage)
+        nbytes = getattr(value, "nbytes", None)  # numpy, pyarrow
+        if isinstance(nbytes, int):
+            return nbytes
+        return sys.getsizeof(value)
+    except Exception:  # pragma: no cover - exotic objects
+        return None
+
+
+def config_hash(*parts: Any) -> str:
+    """Short stable hash of configuration values (unencodable values use ``repr``)."""
+    encoded = msgspec.json.encode(parts, enc_hook=repr, order="sorted")
+    return hashlib.sha256(encoded).hexdigest()[:16]
+
+
+class RunHistory:
+    """SQLite-backed store of recorded runs.
+
+    Writes go through :meth:`record`, which only enqueues the run; a daemon
+    thread owns the write connection.  Queries open their own connection and
+    first wait for pending writes, so they see every run recorded before.
+
+    Args:
+        path: Database file; parent directories are created.
+    """
+
+    def __init__(self, path: str) -> None:
+        self.path = os.path.expanduser(path)
+        parent = os.path.dirname(self.path)
+        if parent:
+            os.makedirs(parent, exist_ok=True)
+        self._queue: queue.Queue[RunRecord | None] = queue.Queue()
+        self._writer: threading.Thread | None = None
+        self._lock = threading.Lock()
+        with contextlib.closing(self._connect()) as conn:
+            conn.executescript(_SCHEMA)
+
+    def _connect(self) -> sqlite3.Connection:
+        conn = sqlite3.connect(self.path, timeout=30)
+        conn.execute("PRAGMA journal_mode=WAL")
+        conn.execute("PRAGMA foreign_keys=ON")
+        return conn
+
+    # --- Writing ---
+
+    def record(self, run: RunRecord) -> None:
+        """Queue ``run`` for writing and return immediately."""
+        with self._lock:
+            if self._writer is None or not self._writer.is_alive():
+                self._writer = threading.Thread(
+                    target=self._write_loop, name="fp-history", daemon=True
+                )
+                self._writer.start()
+        self._queue.put(run)
+
+    def flush(self) -> None:
+        """Block until every queued run has been written."""
+        if self._writer is not None:
+            self._queue.join()
+
+    def close(self) -> None:
+        """Write pending runs and stop the writer thread."""
+        with self._lock:
+            writer, self._writer = self._writer, None
+        if writer is not None and writer.is_alive():
+            self._queue.put(None)
+            writer.join()
+
+    def _write_loop(self) -> None:
+        conn = self._connect()
+        try:
+            while True:
+                batch = [self._queue.get()]
+                with contextlib.suppress(queue.Empty):
+                    while len(batch) < 500:
+                        batch.append(self._queue.get_nowait())
+                runs = [run for run in batch if run is not None]
+                try:
+                    if runs:
+                        self._write(conn, runs)
+                except sqlite3.Error as error:
+                    logger.warning(f"Cannot record run history: {error}")
+                finally:
+                    for _ in batch:
+                        self._queue.task_done()
+                if len(runs) < len(batch):
+                    return
+        finally:
+            conn.close()
+
+    @staticmethod
+    def _write(conn: sqlite3.Connection, runs: list[RunRecord]) -> None:
+        with conn:
+            conn.executemany(
+                _INSERT_RUN,
+                [
+                    (
+                        run.run_id,
+                        run.project,
+                        run.pipeline,
+                        run.config_hash,
+                        run.started_at,
+                        run.finished_at,
+                        run.status,
+                        run.attempts,
+                        run.error,
+                    )
+                    for run in runs
+                ],
+            )
+            conn.executemany(
+                "INSERT INTO nodes (run_id, node, duration, output_size) "
+                "VALUES (?, ?, ?, ?)",
+                [
+                    (run.run_id, node.node, node.duration, node.output_size)
+                    for run in runs
+                    for node in run.nodes
+                ],
+            )
+
+    # --- Reading ---
+
+    def runs(
+        self,
+        pipeline: str | None = None,
+        *,
+        project: str | None = None,
+        status: str | None = None,
+        limit: int | None = 20,
+        with_nodes: bool = False,
+    ) -> list[RunRecord]:
+        """Recorded runs, newest first.
+
+        Args:
+            pipeline: Only runs of this pipeline.
+            project: Only runs of this project.
+            status: Only runs with this status (``"success"``/``"failure"``).
+            limit: Maximum number of runs; ``None`` for all.
+            with_nodes: Also load the node records of each run.
+        """
+        self.flush()
+        params = (
+            pipeline or None,
+            project or None,
+            status or None,
+            -1 if limit is None else limit,
+        )
+        with contextlib.closing(self._connect()) as conn:
+            rows = conn.execute(_SELECT_RUNS, params).fetchall()
+            nodes: dict[str, list[NodeRecord]] = {}
+            if with_nodes and rows:
+                ids = [row[0] for row in rows]
+                marks = ", ".join("?" * len(ids))
+                # Only "?" placeholders are interpolated; the ids are bound.
+                for run_id, node, duration, size in conn.execute(
+                    "SELECT run_id, node, duration, output_size FROM nodes "  # noqa: S608
+                    f"WHERE run_id IN ({marks}) ORDER BY rowid",
+                    ids,
+                ):
+                    nodes.setdefault(run_id, []).append(
+                        NodeRecord(node=node, duration=duration, output_size=size)
+                    )
+        return [
+            RunRecord(*row, nodes=tuple(nodes.get(row[0], ()))) for row in rows
+        ]
+
+    def stats(
+        self,
+        pipeline: str,
+        *,
+        project: str | None = None,
+        last: int | None = 100,
+    ) -> RunStats:
+        """Percentiles and trend over the ``last`` recorded runs of ``pipeline``."""
+        runs = self.runs(pipeline, project=project, limit=last, with_nodes=True)
+        successful = [run for run in reversed(runs) if run.status == "success"]
+        durations = sorted(run.duration for run in successful)
+        summary: dict[str, float] = {}
+        if durations:
+            summary = {
+                f"p{q}": percentile(durations, q) for q in (50, 90, 95, 99)
+            }
+            summary.update(
+                min=durations[0],
+                mean=sum(durations) / len(durations),
+                max=durations[-1],
+            )
+
+        trend = None
+        if len(successful) >= 4:
+            half = len(successful) // 2
+            older = sum(run.duration for run in successful[:half]) / half
+            newer = sum(run.duration for run in successful[-half:]) / half
+            trend = newer / older - 1 if older > 0 else None
+
+        grouped: dict[str, list[NodeRecord]] = {}
+        for run in successful:
+            for node in run.nodes:
+                grouped.setdefault(node.node, []).append(node)
+        nodes = []
+        for name, records in grouped.items():
+            node_durations = sorted(record.duration for record in records)
+            sizes = [r.output_size for r in records if r.output_size is not None]
+            nodes.append(
+                NodeSummary(
+                    node=name,
+                    calls=len(records),
+                    p50=percentile(node_durations, 50),
+                    p95=percentile(node_durations, 95),
+                    mean_output_size=sum(sizes) / len(sizes) if sizes else None,
+                )
+            )
+        nodes.sort(key=lambda summary: summary.p50, reverse=True)
+
+        return RunStats(
+            pipeline=pipeline,
+            runs=len(runs),
+            failures=sum(run.status != "success" for run in runs),
+            durations=summary,
+            trend=trend,
+            nodes=nodes,
+        )
+
+    def prune(self, *, older_than: float) -> int:
+        """Delete runs that started before ``older_than`` (Unix time)."""
+        self.flush()
+        with contextlib.closing(self._connect()) as conn, conn:
+            cursor = conn.execute(
+                "DELETE FROM runs WHERE started_at < ?", (older_than,)
+            )
+        return cursor.rowcount
+
+
+_HISTORIES: dict[str, RunHistory] = {}
+_HISTORIES_LOCK = threading.Lock()
+
+
+def history_enabled() -> bool:
+    """Whether runs are recorded (``FP_HISTORY_ENABLED``)."""
+    return HISTORY_ENABLED
+
+
+def get_history(path: str | None = None) -> RunHistory:
+    """Return the shared store for ``path`` (default ``FP_HISTORY_PATH``)."""
+    path = os.path.expanduser(path or HISTORY_PATH)
+    with _HISTORIES_LOCK:
+        history = _HISTORIES.get(path)
+        if history is None:
+            history = _HISTORIES[path] = RunHistory(path)
+        return history
+
+
+@atexit.register
+def _close_histories() -> None:
+    for history in list(_HISTORIES.values()):
+        history.close()
+
+
+class HistoryRecorder(api.GraphExecutionHook, api.NodeExecutionHook):
+    """Hamilton adapter collecting the history record of one run.
+
+    The same recorder is attached to every attempt of a run; node records are
+    reset when an attempt starts so the record describes the final attempt.
+    Use :meth:`track` around the whole run (including retries) and pass
+    :meth:`on_retry` to the :class:`~flowerpower.pipeline.retry.RetryManager`.
+    """
+
+    def __init__(
+        self,
+        project: str,
+        pipeline: str,
+        config_hash: str,
+        history: RunHistory | None = None,
+    ) -> None:
+        self.project = project
+        self.pipeline = pipeline
+        self.config_hash = config_hash
+        self.history = history
+        self.run_id: str | None = None
+        self.attempts = 1
+        self.nodes: list[NodeRecord] = []
+        self._started: dict[tuple[str | None, str, int], float] = {}
+
+    def on_retry(self, attempt: int, error: BaseException) -> None:
+        self.attempts = attempt + 1
+
+    @contextlib.contextmanager
+    def track(self) -> Iterator[None]:
+        """Record the enclosed run when it finishes, successfully or not."""
+        started_at = time.time()
+        status, error = "failure", None
+        try:
+            yield
+            status = "success"
+        except BaseException as exc:
+            error = repr(exc)
+            raise
+        finally:
+            record = RunRecord(
+                run_id=self.run_id or uuid.uuid4().hex,
+                project=self.project,
+                pipeline=self.pipeline,
+                config_hash=self.config_hash,
+                started_at=started_at,
+                finished_at=time.time(),
+                status=status,
+                attempts=self.attempts,
+                error=error,
+                nodes=tuple(self.nodes),
+            )
+            try:
+                (self.history or get_history()).record(record)
+            except (OSError, sqlite3.Error) as exc:
+                logger.warning(f"Cannot record run history: {exc}")
+
+    def run_before_graph_execution(self, *, run_id: str, **future_kwargs: Any) -> None:
+        self.run_id = run_id
+        self.nodes = []
+        self._started.clear()
+
+    def run_after_graph_execution(self, **future_kwargs: Any) -> None:
+        pass
+
+    def run_before_node_execution(
+        self, *, node_name: str, task_id: str | None, **future_kwargs: Any
+    ) -> None:
+        self._started[(task_id, node_name, threading.get_ident())] = (
+            time.perf_counter()
+        )
+
+    def run_after_node_execution(
+        self,
+        *,
+        node_name: str,
+        task_id: str | None,
+        success: bool,
+        result: Any = None,
+        **future_kwargs: Any,
+    ) -> None:
+        started = self._started.pop((task_id, node_name, threading.get_ident()), None)
+        if started is None:
+            return
+        self.nodes.append(
+            NodeRecord(
+                node=node_name,
+                duration=time.perf_counter() - started,
+                output_size=estimate_size(result) if success else None,
+            )
+        )
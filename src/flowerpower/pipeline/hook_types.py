@@ -0,0 +1,13 @@
+from enum import Enum
+
+__all__ = ["HookType"]
+
+
+class HookType(str, Enum):
+    MQTT_BUILD_CONFIG = "mqtt-build-config"
+
+    def default_function_name(self) -> str:
+        return self.value.replace("-", "_")
+
+    def __str__(self) -> str:
+        return self.value
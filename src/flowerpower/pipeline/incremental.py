@@ -0,0 +1,512 @@
+"""Incremental re-execution for ``pipeline run --watch``.
+
+:class:`IncrementalCache` is a Hamilton lifecycle adapter that keeps every node
+result of the previous run in memory together with a fingerprint of the node.
+A fingerprint covers the node's function code, the same-module helper
+functions and constants it references, and the fingerprints of its
+dependencies; external inputs are fingerprinted by value. When a node's
+fingerprint is unchanged in the next run its previous result is returned
+without calling the function, so only edited nodes and their downstream nodes
+are recomputed.
+
+:class:`WatchSession` drives the edit loop. It runs the pipeline, polls the
+pipeline module, its ``additional_modules`` and the pipeline YAML, reloads only
+the modules whose files changed through :class:`PipelineModuleResolver` and
+runs again with the same cache.
+
+Limitations:
+
+- Results are reused as objects; nodes that mutate their inputs in place
+  corrupt the cache.
+- Nodes downstream of a ``Parallelizable`` node are always recomputed.
+- A change of the pipeline ``params`` reloads the pipeline module and drops
+  the cache, because parameters are bound into decorators at import time.
+- Helper functions are followed within the pipeline and additional modules
+  only; edits to other imported code are not detected.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import importlib.util
+import os
+import threading
+import time
+import types
+from collections import deque
+from collections.abc import Callable, Iterable
+from dataclasses import dataclass, field
+from typing import TYPE_CHECKING, Any
+
+import msgspec
+from hamilton import htypes
+from hamilton.lifecycle import api
+from loguru import logger
+
+from ..settings import WATCH_INTERVAL
+from ..utils.config import merge_run_configs
+from ..utils.filesystem import format_pipeline_file_path, get_pipeline_config_paths
+from ..utils.misc import DictNamespace
+from .module_resolver import PipelineModuleResolver
+from .params import provide_params
+from .watcher import _info_signature
+
+if TYPE_CHECKING:
+    from ..cfg.pipeline.run import RunConfig
+    from .manager import PipelineManager
+
+__all__ = ["IncrementalCache", "IterationResult", "WatchSession"]
+
+_MISSING = b"<missing>"
+_DATA_TYPES = (
+    int,
+    float,
+    complex,
+    str,
+    bytes,
+    bool,
+    type(None),
+    tuple,
+    list,
+    dict,
+    set,
+    frozenset,
+    DictNamespace,
+)
+
+
+def _value_token(value: Any) -> bytes:
+    try:
+        return msgspec.json.encode(value, enc_hook=repr, order="deterministic")
+    except (TypeError, ValueError, msgspec.EncodeError):
+        return repr(value).encode()
+
+
+class _CodeHasher:
+    """Hash functions by bytecode, following helpers in the watched modules.
+
+    Bytecode is used instead of source so that edits elsewhere in the file,
+    which only shift line numbers, do not change the hash.
+    """
+
+    def __init__(self, modules: set[str]) -> None:
+        self._modules = modules
+        self._memo: dict[int, bytes] = {}
+
+    def function(self, func: Callable) -> bytes:
+        key = id(func)
+        if key in self._memo:
+            return self._memo[key]
+        self._memo[key] = b"<recursive>"
+        code = getattr(func, "__code__", None)
+        if code is None:
+            digest = repr(func).encode()
+        else:
+            hasher = hashlib.sha256()
+            self._code(code, getattr(func, "__globals__", {}), hasher)
+            hasher.update(_value_token(getattr(func, "__defaults__", None)))
+            digest = hasher.digest()
+        self._memo[key] = digest
+        return digest
+
+    def _code(self, code: types.CodeType, scope: dict[str, Any], hasher) -> None:
+        hasher.update(code.co_code)
+        hasher.update(repr(code.co_names).encode())
+        hasher.update(repr(code.co_varnames).encode())
+        for const in code.co_consts:
+            if isinstance(const, types.CodeType):
+                self._code(const, scope, hasher)
+            else:
+                hasher.update(repr(const).encode())
+        # ``helpers.fn`` style references: look names up in watched modules too.
+        scopes = [scope] + [
+            vars(value)
+            for name in code.co_names
+            if isinstance(value := scope.get(name), types.ModuleType)
+            and value.__name__ in self._modules
+        ]
+        for name in code.co_names:
+            for namespace in scopes:
+                if name not in namespace:
+                    continue
+                value = namespace[name]
+                if isinstance(value, types.FunctionType):
+                    if value.__module__ in self._modules:
+                        hasher.update(self.function(value))
+                elif isinstance(value, _DATA_TYPES):
+                    hasher.update(_value_token(value))
+                break
+
+
+class IncrementalCache(api.NodeExecutionMethod, api.GraphExecutionHook):
+    """Reuse node results across runs whose code and inputs did not change.
+
+    Pass the same instance to consecutive runs, e.g.
+    ``adapter={"incremental": cache}``.
+
+    Args:
+        modules: Names of the modules whose helper functions are part of a
+            node's fingerprint (the pipeline and its additional modules).
+
+    Attributes:
+        config: Hamilton config of the current run; config values consumed
+            as node inputs are fingerprinted like inputs.
+        computed: Nodes executed in the last run.
+        reused: Nodes served from the cache in the last run.
+    """
+
+    def __init__(self, modules: Iterable[str] = ()) -> None:
+        self.modules = set(modules)
+        self.config: dict[str, Any] = {}
+        self.computed: list[str] = []
+        self.reused: list[str] = []
+        self._results: dict[str, tuple[bytes, Any]] = {}
+        self._fingerprints: dict[str, bytes] = {}
+        self._lock = threading.Lock()
+
+    def clear(self) -> None:
+        """Drop all cached results."""
+        with self._lock:
+            self._results.clear()
+
+    def __len__(self) -> int:
+        return len(self._results)
+
+    def run_before_graph_execution(
+        self, *, graph: Any, inputs: dict[str, Any] | None = None, **future_kwargs: Any
+    ) -> None:
+        self.computed = []
+        self.reused = []
+        self._fingerprints = self._fingerprint_graph(graph, inputs or {})
+
+    def run_after_graph_execution(self, **future_kwargs: Any) -> None:
+        with self._lock:
+            for name in set(self._results) - set(self._fingerprints):
+                del self._results[name]
+
+    def run_to_execute_node(
+        self,
+        *,
+        node_name: str,
+        node_callable: Any,
+        node_kwargs: dict[str, Any],
+        **future_kwargs: Any,
+    ) -> Any:
+        fingerprint = self._fingerprints.get(node_name)
+        if fingerprint is not None:
+            cached = self._results.get(node_name)
+            if cached is not None and cached[0] == fingerprint:
+                self.reused.append(node_name)
+                return cached[1]
+        result = node_callable(**node_kwargs)
+        self.computed.append(node_name)
+        if fingerprint is not None:
+            with self._lock:
+                self._results[node_name] = (fingerprint, result)
+        return result
+
+    def _fingerprint_graph(
+        self, graph: Any, inputs: dict[str, Any]
+    ) -> dict[str, bytes]:
+        """Fingerprints of all cacheable nodes of ``graph``."""
+        nodes = {node.name: node for node in graph.nodes}
+        hasher = _CodeHasher(self.modules)
+        uncacheable = self._parallel_nodes(nodes)
+
+        def external(name: str) -> bytes:
+            if name in inputs:
+                return _value_token(inputs[name])
+            if name in self.config:
+                return _value_token(self.config[name])
+            return _MISSING
+
+        fingerprints: dict[str, bytes] = {}
+        for name in nodes:
+            stack = [name]
+            while stack:
+                current = stack[-1]
+                if current in fingerprints:
+                    stack.pop()
+                    continue
+                node = nodes[current]
+                deps = sorted(node.required_dependencies | node.optional_dependencies)
+                pending = [dep for dep in deps if dep in nodes and dep not in fingerprints]
+                if pending:
+                    stack.extend(pending)
+                    continue
+                stack.pop()
+                digest = hashlib.sha256(current.encode())
+                if node.is_external_input:
+                    digest.update(external(current))
+                else:
+                    for func in node.originating_functions or ():
+                        digest.update(hasher.function(func))
+                    digest.update(_value_token(node.tags))
+                    digest.update(
+                        _value_token(node.optional_dependencies_default_values)
+                    )
+                for dep in deps:
+                    digest.update(dep.encode())
+                    digest.update(fingerprints[dep] if dep in nodes else external(dep))
+                fingerprints[current] = digest.digest()
+
+        for name in uncacheable:
+            fingerprints.pop(name, None)
+        return fingerprints
+
+    @staticmethod
+    def _parallel_nodes(nodes: dict[str, Any]) -> set[str]:
+        """Nodes at or downstream of a ``Parallelizable`` node."""
+        dependents: dict[str, list[str]] = {}
+        for node in nodes.values():
+            for dep in node.required_dependencies | node.optional_dependencies:
+                dependents.setdefault(dep, []).append(node.name)
+        queue = deque(
+            name
+            for name, node in nodes.items()
+            if htypes.is_parallelizable_type(node.type)
+        )
+        seen = set(queue)
+        while queue:
+            for dependent in dependents.get(queue.popleft(), ()):
+                if dependent not in seen:
+                    seen.add(dependent)
+                    queue.append(dependent)
+        return seen
+
+
+@dataclass
+class IterationResult:
+    """Outcome of one run of a :class:`WatchSession`.
+
+    Attributes:
+        iteration: 1-based run counter.
+        duration: Wall-clock seconds of the run, including module reloads.
+        computed: Nodes executed.
+        reused: Nodes served from the previous run.
+        changed: Files whose change triggered the run (empty for the first).
+        outputs: Pipeline outputs, ``None`` when the run failed.
+        error: The exception of a failed run or reload.
+    """
+
+    iteration: int
+    duration: float
+    computed: list[str] = field(default_factory=list)
+    reused: list[str] = field(default_factory=list)
+    changed: list[str] = field(default_factory=list)
+    outputs: dict[str, Any] | None = None
+    error: BaseException | None = None
+
+
+def _drop_bytecode(path: str) -> None:
+    # The bytecode cache is validated by whole-second mtime and size, so a
+    # quick same-size edit would otherwise reload stale code.
+    try:
+        os.unlink(importlib.util.cache_from_source(path))
+    except (OSError, NotImplementedError, ValueError):
+        pass
+
+
+class WatchSession:
+    """Re-run a pipeline on edits, recomputing only what changed.
+
+    Args:
+        manager: Manager of the project.
+        name: Pipeline name.
+        run_config: Run overrides applied to every run.
+        fs: Project filesystem holding the pipeline YAML.
+        cfg_dir: Configuration directory fragment.
+        pipelines_dir: Pipelines directory fragment.
+
+    Example:
+        >>> with PipelineManager() as manager:
+        ...     manager.run_watch("my_pipeline", on_iteration=print)
+    """
+
+    def __init__(
+        self,
+        manager: PipelineManager,
+        name: str,
+        run_config: RunConfig | None = None,
+        *,
+        fs: Any,
+        cfg_dir: str | None,
+        pipelines_dir: str | None,
+    ) -> None:
+        self._manager = manager
+        self._name = name
+        self._run_config = run_config
+        self._fs = fs
+        self._config_paths = get_pipeline_config_paths(
+            format_pipeline_file_path(name), cfg_dir, pipelines_dir
+        )
+        self._resolver = PipelineModuleResolver(pipelines_dir)
+        self.cache = IncrementalCache()
+        self.iteration = 0
+        # path -> additional_modules entry, or None for the pipeline module
+        self._module_files: dict[str, str | types.ModuleType | None] = {}
+        self._signatures: dict[str, Any] = {}
+        self._params: Any = None
+        self._primary: types.ModuleType | None = None
+
+    # --- Running ---
+
+    def run(self, changed: Iterable[str] = ()) -> IterationResult:
+        """Run the pipeline once with the incremental cache attached."""
+        self.iteration += 1
+        result = IterationResult(iteration=self.iteration, duration=0.0)
+        result.changed = sorted(changed)
+        start = time.perf_counter()
+        try:
+            pipeline_cfg = self._manager.load_pipeline(self._name)
+            self._params = pipeline_cfg.params
+            effective = merge_run_configs(pipeline_cfg.run, self._run_config)
+            self._track_files(effective.additional_modules or [])
+            self.cache.config = dict(effective.config or {})
+            adapters = dict(self._run_config.adapter or {}) if self._run_config else {}
+            adapters["incremental"] = self.cache
+            result.outputs = self._manager.run(
+                self._name, run_config=self._run_config, adapter=adapters
+            )
+        except Exception as error:  # reported per iteration; watching goes on
+            result.error = error
+        result.duration = time.perf_counter() - start
+        result.computed = list(self.cache.computed)
+        result.reused = list(self.cache.reused)
+        self._snapshot()
+        return result
+
+    def _track_files(self, additional: list[str | types.ModuleType]) -> None:
+        with provide_params(self._name, self._manager.load_pipeline(self._name).h_params):
+            primary = self._resolver.load(self._name)
+        self._primary = primary
+        module_files: dict[str, str | types.ModuleType | None] = {}
+        modules = {primary.__name__}
+        for entry in additional:
+            module = self._resolver.coerce(entry)
+            modules.add(module.__name__)
+            if getattr(module, "__file__", None):
+                module_files[module.__file__] = entry
+        if getattr(primary, "__file__", None):
+            module_files[primary.__file__] = None
+        self._module_files = module_files
+        self.cache.modules = modules
+
+    # --- Change detection ---
+
+    def _signature(self, path: str) -> Any:
+        if path in self._module_files:
+            try:
+                stat = os.stat(path)
+            except OSError:
+                return None
+            return (stat.st_mtime_ns, stat.st_size)
+        try:
+            return _info_signature(self._fs.info(path))
+        except OSError:
+            return None
+
+    def _watched(self) -> list[str]:
+        return [*self._module_files, *self._config_paths]
+
+    def _snapshot(self) -> None:
+        self._signatures = {path: self._signature(path) for path in self._watched()}
+
+    def poll(self) -> list[str]:
+        """Watched files that changed since the last run."""
+        return [
+            path
+            for path in self._watched()
+            if self._signature(path) != self._signatures.get(path)
+        ]
+
+    def apply(self, changed: Iterable[str]) -> None:
+        """Reload what ``changed`` touched: the YAML config and changed modules only.
+
+        Raises:
+            Exception: Whatever a module raises while being re-imported.
+        """
+        changed = set(changed)
+        reload_primary = False
+        if changed & set(self._config_paths):
+            self._manager.registry.clear_cache(self._name)
+            pipeline_cfg = self._manager.load_pipeline(self._name)
+            if pipeline_cfg.params != self._params:
+                logger.info("Pipeline params changed; reloading the pipeline module")
+                reload_primary = True
+                self.cache.clear()
+
+        reloaded: set[str] = set()
+        for path, entry in self._module_files.items():
+            if entry is None:
+                reload_primary = reload_primary or path in changed
+            elif path in changed:
+                logger.debug(f"Reloading {path}")
+                _drop_bytecode(path)
+                reloaded.add(self._resolver.coerce(entry, reload=True).__name__)
+
+        # ``from helpers import fn`` keeps the old object until the importing
+        # pipeline module is re-executed as well.
+        if reloaded and self._primary is not None:
+            reload_primary = reload_primary or any(
+                getattr(value, "__module__", None) in reloaded
+                for value in vars(self._primary).values()
+                if not isinstance(value, types.ModuleType)
+            )
+
+        if reload_primary:
+            h_params = self._manager.load_pipeline(self._name).h_params
+            for path, entry in self._module_files.items():
+                if entry is None:
+                    logger.debug(f"Reloading {path}")
+                    _drop_bytecode(path)
+            with provide_params(self._name, h_params):
+                self._resolver.load(self._name, reload=True)
+        if reload_primary or changed & set(self._module_files):
+            self._manager.registry.clear_cache(self._name)
+
+    def loop(
+        self,
+        on_iteration: Callable[[IterationResult], None] | None = None,
+        *,
+        interval: float = WATCH_INTERVAL,
+        stop: threading.Event | None = None,
+        max_iterations: int | None = None,
+    ) -> None:
+        """Run, then re-run after every change until ``stop`` is set.
+
+        Args:
+            on_iteration: Called with every :class:`IterationResult`.
+            interval: Seconds between file checks.
+            stop: Event that ends the loop; ``KeyboardInterrupt`` ends it too.
+            max_iterations: End after this many runs.
+        """
+        stop = stop or threading.Event()
+        emit = on_iteration or (lambda result: None)
+        emit(self.run())
+        while not stop.is_set():
+            if max_iterations is not None and self.iteration >= max_iterations:
+                return
+            if stop.wait(interval):
+                return
+            changed = self.poll()
+            if not changed:
+                continue
+            start = time.perf_counter()
+            try:
+                self.apply(changed)
+            except Exception as error:  # e.g. a syntax error in the edited file
+                self.iteration += 1
+                self._snapshot()
+                emit(
+                    IterationResult(
+                        iteration=self.iteration,
+                        duration=time.perf_counter() - start,
+                        changed=sorted(changed),
+                        error=error,
+                    )
+                )
+                continue
+            result = self.run(changed)
+            result.duration += time.perf_counter() - start
+            emit(result)
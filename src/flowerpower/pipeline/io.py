@@ -4,7 +4,10 @@
 Manages the import and export of pipelines.
 """
 
+import hashlib
 import posixpath
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
 
 from fsspeckit import (
     AbstractFileSystem,
@@ -15,15 +18,24 @@ from fsspeckit import (
 from loguru import logger
 from rich.console import Console
 
-from ..settings import LOG_LEVEL
+from ..settings import IO_MAX_WORKERS
 from ..utils.filesystem import (
     find_first_existing_path,
     format_pipeline_file_path,
     get_pipeline_config_paths,
     get_project_config_paths,
 )
-from ..utils.logging import setup_logging
 from ..utils.security import validate_pipeline_name
+from .archive import (
+    ArchivedPipeline,
+    ArchiveFormat,
+    ArchiveManifest,
+    _safe_member,
+    build_manifest,
+    detect_archive_format,
+    read_archive,
+    write_archive,
+)
 from .registry import PipelineRegistry
 
 # Import necessary config types and utility functions
@@ -31,7 +43,31 @@ from .registry import PipelineRegistry
 
 console = Console()
 
-setup_logging(level=LOG_LEVEL)
+
+@dataclass
+class SyncReport:
+    """Outcome of copying pipeline files between filesystems.
+
+    Attributes:
+        copied: Files written to the destination.
+        skipped: Files not written, because they exist and ``overwrite`` is
+            off, or because their content is already identical.
+        unchanged: Subset of ``skipped`` whose content was identical.
+        bytes_copied: Bytes written to the destination.
+    """
+
+    copied: int = 0
+    skipped: int = 0
+    unchanged: int = 0
+    bytes_copied: int = 0
+
+    def record(self, outcome: str, size: int) -> None:
+        if outcome == "copied":
+            self.copied += 1
+            self.bytes_copied += size
+        else:
+            self.skipped += 1
+            self.unchanged += outcome == "unchanged"
 
 
 class PipelineIOManager:
@@ -40,14 +76,18 @@ class PipelineIOManager:
     def __init__(
         self,
         registry: PipelineRegistry,
+        max_workers: int = IO_MAX_WORKERS,
     ):
         """
         Initializes the PipelineIOManager.
 
         Args:
             registry: The pipeline registry instance.
+            max_workers: Number of concurrent file copies
+                (``FP_IO_MAX_WORKERS``).
         """
         self.registry = registry
+        self.max_workers = max_workers
         self._fs = registry._fs
         self._cfg_dir = registry._cfg_dir
         self._pipelines_dir = registry._pipelines_dir
@@ -152,23 +192,20 @@ class PipelineIOManager:
         }
         return target in available
 
-    def _discover_all_pipeline_files(self, fs: AbstractFileSystem) -> list[str]:
-        """Discover all project/pipeline files for import/export.
+    def _discover_pipeline_file_groups(
+        self, fs: AbstractFileSystem
+    ) -> tuple[str | None, dict[str, list[str]]]:
+        """Discover the project config and the files of every pipeline.
 
-        Restricts discovery to configured project, pipeline-config, and pipeline-module
-        locations instead of copying every ``*.py``/``*.yml`` file in the tree.
+        Returns:
+            The existing project config (or ``None``) and a mapping of pipeline
+            name (module path in dotted form) to its module and config file.
         """
-        files: list[str] = []
-        seen: set[str] = set()
-
         project_config = find_first_existing_path(
             fs,
             self._project_config_files(),
             purpose="project config",
         )
-        if project_config is not None:
-            seen.add(project_config)
-            files.append(project_config)
 
         module_patterns = [
             posixpath.join(self._pipelines_dir, "*.py"),
@@ -176,6 +213,7 @@ class PipelineIOManager:
         ]
 
         module_files: list[str] = []
+        seen: set[str] = {project_config} if project_config is not None else set()
         for pattern in module_patterns:
             try:
                 paths = fs.glob(pattern)
@@ -189,13 +227,15 @@ class PipelineIOManager:
                 if posixpath.basename(path) == "__init__.py" or path in seen:
                     continue
                 seen.add(path)
-                files.append(path)
                 module_files.append(path)
 
+        groups: dict[str, list[str]] = {}
         for module_file in module_files:
             module_path = posixpath.splitext(
                 posixpath.relpath(module_file, self._pipelines_dir)
             )[0]
+            group = groups.setdefault(module_path.replace("/", "."), [])
+            group.append(module_file)
             cfg_path = find_first_existing_path(
                 fs,
                 get_pipeline_config_paths(
@@ -207,8 +247,20 @@ class PipelineIOManager:
             )
             if cfg_path is not None and cfg_path not in seen:
                 seen.add(cfg_path)
-                files.append(cfg_path)
+                group.append(cfg_path)
+
+        return project_config, groups
+
+    def _discover_all_pipeline_files(self, fs: AbstractFileSystem) -> list[str]:
+        """Discover all project/pipeline files for import/export.
 
+        Restricts discovery to configured project, pipeline-config, and pipeline-module
+        locations instead of copying every ``*.py``/``*.yml`` file in the tree.
+        """
+        project_config, groups = self._discover_pipeline_file_groups(fs)
+        files = [file for group in groups.values() for file in group]
+        if project_config is not None:
+            files.append(project_config)
         return sorted(files)
 
     def _print_import_success(
@@ -240,6 +292,42 @@ class PipelineIOManager:
                 f"✅ Exported all pipelines from [bold blue]{project_label}[/bold blue] to [green]{dest_base_dir}[/green]"
             )
 
+    @staticmethod
+    def _leaf_directories(files: list[str]) -> list[str]:
+        """Parent directories of ``files`` that are not a prefix of another."""
+        parents = sorted({posixpath.dirname(file) for file in files} - {""})
+        return [
+            parent
+            for index, parent in enumerate(parents)
+            if not any(
+                other.startswith(parent + "/") for other in parents[index + 1 :]
+            )
+        ]
+
+    @staticmethod
+    def _is_unchanged(content: bytes, dest_fs: AbstractFileSystem, file: str) -> bool:
+        """Whether ``file`` on ``dest_fs`` already holds ``content``.
+
+        Compares the size first, then the ETag when it is a plain MD5 (single
+        part uploads), and finally the destination bytes themselves.
+        """
+        try:
+            info = dest_fs.info(file)
+        except FileNotFoundError:
+            return False
+        try:
+            size = info.get("size")
+            if isinstance(size, int) and size != len(content):
+                return False
+            etag = info.get("ETag") or info.get("etag")
+            if isinstance(etag, str) and etag.strip('"') and "-" not in etag:
+                digest = hashlib.md5(content, usedforsecurity=False).hexdigest()
+                return etag.strip('"') == digest
+            return dest_fs.cat_file(file) == content
+        except Exception as e:
+            logger.debug(f"Cannot compare {file} with destination, copying: {e}")
+            return False
+
     def _sync_filesystem(
         self,
         src_base_dir: str,
@@ -250,10 +338,16 @@ class PipelineIOManager:
         dest_storage_options: dict | BaseStorageOptions | None = None,
         files: list[str] | None = None,
         overwrite: bool = False,
-    ):
+        max_workers: int | None = None,
+    ) -> SyncReport:
         """
         Synchronizes the source and destination filesystems.
 
+        Parent directories are created once per distinct leaf directory, then
+        files are copied concurrently.  With ``overwrite=True`` a destination
+        file whose content already matches (size, ETag or bytes) is skipped
+        instead of being uploaded again.
+
         Args:
             src_base_dir (str): The source base directory.
             dest_base_dir (str): The destination base directory.
@@ -263,6 +357,11 @@ class PipelineIOManager:
             dest_storage_options (dict | BaseStorageOptions | None, optional): Storage options for the destination filesystem. Defaults to None.
             files (list[str] | None, optional): Specific files to sync. If None, all pipeline files are discovered automatically.
             overwrite (bool, optional): Whether to overwrite existing files. Defaults to False.
+            max_workers (int | None, optional): Concurrent copies. Defaults to
+                the manager's ``max_workers`` (``FP_IO_MAX_WORKERS``).
+
+        Returns:
+            SyncReport: Files copied and skipped, and bytes written.
         """
 
         src_fs = self._get_dir_filesystem(
@@ -280,23 +379,41 @@ class PipelineIOManager:
 
         if files is None:
             files = self._discover_all_pipeline_files(src_fs)
+        files = list(dict.fromkeys(files))
 
-        for file in files:
-            logger.debug(f"Copying {file} from {src_fs} to {dest_fs}")
-            parent_dir = posixpath.dirname(file)
-            if parent_dir and not dest_fs.exists(parent_dir):
+        for parent_dir in self._leaf_directories(files):
+            if not dest_fs.exists(parent_dir):
                 logger.debug(
                     f"Creating directory {parent_dir} in destination filesystem."
                 )
                 dest_fs.makedirs(parent_dir, exist_ok=True)
+
+        def _copy_one(file: str) -> tuple[str, int]:
             if not overwrite and dest_fs.exists(file):
                 logger.warning(
                     f"File {file} already exists in the destination. Skipping write. Use overwrite=True to overwrite."
                 )
-                continue
+                return "skipped", 0
 
             content = src_fs.read_bytes(file)
+            if overwrite and self._is_unchanged(content, dest_fs, file):
+                logger.debug(f"Skipping unchanged file {file}")
+                return "unchanged", 0
+            logger.debug(f"Copying {file} from {src_fs} to {dest_fs}")
             dest_fs.write_bytes(file, content)
+            return "copied", len(content)
+
+        workers = max(1, min(max_workers or self.max_workers, len(files) or 1))
+        report = SyncReport()
+        with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="fp-io") as pool:
+            for outcome, size in pool.map(_copy_one, files):
+                report.record(outcome, size)
+
+        logger.info(
+            f"Synced {len(files)} files: {report.copied} copied, "
+            f"{report.skipped} skipped, {report.bytes_copied} bytes written"
+        )
+        return report
 
     def import_pipeline(
         self,
@@ -305,7 +422,7 @@ class PipelineIOManager:
         src_fs: AbstractFileSystem | None = None,
         src_storage_options: dict | BaseStorageOptions | None = None,
         overwrite: bool = False,
-    ):
+    ) -> SyncReport:
         """
         Import a pipeline from a given path.
 
@@ -317,7 +434,7 @@ class PipelineIOManager:
             overwrite (bool, optional): Whether to overwrite an existing pipeline. Defaults to False.
 
         Returns:
-            None
+            SyncReport: Files copied and skipped, and bytes written.
 
         Raises:
             ValueError: If the pipeline already exists and overwrite is False.
@@ -336,7 +453,7 @@ class PipelineIOManager:
             src_storage_options or {},
         )
         files = self._get_pipeline_files(name, fs=resolved_src_fs)
-        self._sync_filesystem(
+        report = self._sync_filesystem(
             src_base_dir=src_base_dir,
             src_fs=src_fs,
             src_storage_options=src_storage_options,
@@ -348,6 +465,7 @@ class PipelineIOManager:
         )
 
         self._print_import_success([name], src_base_dir)
+        return report
 
     def import_many(
         self,
@@ -356,7 +474,7 @@ class PipelineIOManager:
         src_fs: AbstractFileSystem | None = None,
         src_storage_options: dict | BaseStorageOptions | None = None,
         overwrite: bool = False,
-    ):
+    ) -> SyncReport:
         """
         Import multiple pipelines from given paths.
 
@@ -368,7 +486,7 @@ class PipelineIOManager:
             overwrite (bool, optional): Whether to overwrite existing pipelines. Defaults to False.
 
         Returns:
-            None
+            SyncReport: Files copied and skipped, and bytes written.
 
         Examples:
             ```python
@@ -390,7 +508,7 @@ class PipelineIOManager:
         )
         files = self._get_many_pipeline_files(names, fs=resolved_src_fs)
 
-        self._sync_filesystem(
+        report = self._sync_filesystem(
             src_base_dir=src_base_dir,
             src_fs=src_fs,
             src_storage_options=src_storage_options,
@@ -401,6 +519,7 @@ class PipelineIOManager:
             overwrite=overwrite,
         )
         self._print_import_success(names, src_base_dir)
+        return report
 
     def import_all(
         self,
@@ -408,7 +527,7 @@ class PipelineIOManager:
         src_fs: AbstractFileSystem | None = None,
         src_storage_options: dict | BaseStorageOptions | None = None,
         overwrite: bool = False,
-    ):
+    ) -> SyncReport:
         """Import all pipelines from a given path.
 
         Args:
@@ -418,7 +537,7 @@ class PipelineIOManager:
             overwrite (bool, optional): Whether to overwrite existing pipelines. Defaults to False.
 
         Returns:
-            None
+            SyncReport: Files copied and skipped, and bytes written.
 
         Examples:
             ```python
@@ -429,7 +548,7 @@ class PipelineIOManager:
             # pm.import_all("s3://my-bucket/pipelines_backup", storage_options={"key": "...", "secret": "..."}, overwrite=False)
             ```
         """
-        self._sync_filesystem(
+        report = self._sync_filesystem(
             src_base_dir=src_base_dir,
             src_fs=src_fs,
             src_storage_options=src_storage_options,
@@ -440,6 +559,7 @@ class PipelineIOManager:
             overwrite=overwrite,
         )
         self._print_import_success(None, src_base_dir)
+        return report
 
     def export_pipeline(
         self,
@@ -448,7 +568,7 @@ class PipelineIOManager:
         dest_fs: AbstractFileSystem | None = None,
         dest_storage_options: dict | BaseStorageOptions | None = None,
         overwrite: bool = False,
-    ):
+    ) -> SyncReport:
         """
         Export a pipeline to a given path.
 
@@ -460,7 +580,7 @@ class PipelineIOManager:
             overwrite (bool, optional): Whether to overwrite existing files at the destination. Defaults to False.
 
         Returns:
-            None
+            SyncReport: Files copied and skipped, and bytes written.
 
         Raises:
             ValueError: If the pipeline does not exist or if the destination exists and overwrite is False.
@@ -482,7 +602,7 @@ class PipelineIOManager:
 
         files = self._get_pipeline_files(name, fs=self._fs)
 
-        self._sync_filesystem(
+        report = self._sync_filesystem(
             src_base_dir=".",
             src_fs=self._fs,
             src_storage_options=None,
@@ -494,6 +614,7 @@ class PipelineIOManager:
         )
 
         self._print_export_success([name], dest_base_dir)
+        return report
 
     def export_many(
         self,
@@ -502,7 +623,7 @@ class PipelineIOManager:
         dest_fs: AbstractFileSystem | None = None,
         dest_storage_options: dict | BaseStorageOptions | None = None,
         overwrite: bool = False,
-    ):
+    ) -> SyncReport:
         """
         Export multiple pipelines to a directory.
 
@@ -514,7 +635,7 @@ class PipelineIOManager:
             overwrite (bool, optional): Whether to overwrite existing files at the destination. Defaults to False.
 
         Returns:
-            None
+            SyncReport: Files copied and skipped, and bytes written.
 
         Examples:
             ```python
@@ -534,7 +655,7 @@ class PipelineIOManager:
 
         files = self._get_many_pipeline_files(names, fs=self._fs)
 
-        self._sync_filesystem(
+        report = self._sync_filesystem(
             src_base_dir=".",
             src_fs=self._fs,
             src_storage_options=None,
@@ -545,6 +666,7 @@ class PipelineIOManager:
             overwrite=overwrite,
         )
         self._print_export_success(names, dest_base_dir)
+        return report
 
     def export_all(
         self,
@@ -552,7 +674,7 @@ class PipelineIOManager:
         dest_fs: AbstractFileSystem | None = None,
         dest_storage_options: dict | BaseStorageOptions | None = None,
         overwrite: bool = False,
-    ):
+    ) -> SyncReport:
         """Export all pipelines to a given path.
 
         Args:
@@ -562,7 +684,7 @@ class PipelineIOManager:
             overwrite (bool, optional): Whether to overwrite existing files at the destination. Defaults to False.
 
         Returns:
-            None
+            SyncReport: Files copied and skipped, and bytes written.
 
         Examples:
             ```python
@@ -573,7 +695,7 @@ class PipelineIOManager:
             # pm.export_all("s3://my-bucket/pipelines_backup", storage_options={"key": "...", "secret": "..."}, overwrite=False)
             ```
         """
-        self._sync_filesystem(
+        report = self._sync_filesystem(
             src_base_dir=".",
             src_fs=self._fs,
             src_storage_options=None,
@@ -586,3 +708,280 @@ class PipelineIOManager:
         console.print(
             f"✅ Exported all pipelines from [bold blue]{self._project_label()}[/bold blue] to [green]{dest_base_dir}[/green]"
         )
+        return report
+
+    def _archive_location(
+        self,
+        path: str,
+        fs: AbstractFileSystem | None,
+        storage_options: dict | BaseStorageOptions | None,
+    ) -> tuple[AbstractFileSystem, str]:
+        parent, file = posixpath.split(path)
+        return (
+            self._get_dir_filesystem(parent or ".", fs, storage_options or {}),
+            file,
+        )
+
+    def export_archive(
+        self,
+        dest_path: str,
+        names: list[str] | None = None,
+        dest_fs: AbstractFileSystem | None = None,
+        dest_storage_options: dict | BaseStorageOptions | None = None,
+        format: ArchiveFormat | None = None,
+        overwrite: bool = False,
+    ) -> ArchiveManifest:
+        """Export pipelines into a single compressed archive.
+
+        The archive is streamed to ``dest_path`` in one upload instead of one
+        request per file.  Its first member is a manifest listing every
+        pipeline with the SHA-256 of each file (see
+        :mod:`flowerpower.pipeline.archive`).
+
+        Args:
+            dest_path (str): Archive path, e.g. ``"s3://bucket/project.tar.zst"``.
+            names (list[str] | None, optional): Pipelines to export. Defaults to
+                all pipelines of the project.
+            dest_fs (AbstractFileSystem | None, optional): The destination filesystem. Defaults to None.
+            dest_storage_options (BaseStorageOptions | None, optional): Storage options for the destination path. Defaults to None.
+            format (str | None, optional): ``"tar.zst"`` (requires
+                ``flowerpower[archive]``) or ``"tar.gz"``. Defaults to the
+                format implied by the ``dest_path`` suffix.
+            overwrite (bool, optional): Whether to replace an existing archive. Defaults to False.
+
+        Returns:
+            ArchiveManifest: The manifest written into the archive.
+
+        Raises:
+            ValueError: If a pipeline does not exist or the format is unknown.
+            FileExistsError: If the archive exists and overwrite is False.
+
+        Examples:
+            ```python
+            pm = PipelineManager()
+            pm.io.export_archive("s3://my-bucket/backup/project.tar.zst")
+            pm.io.export_archive("pipelines.tar.gz", names=["etl", "report"])
+            ```
+        """
+        archive_format = detect_archive_format(dest_path, format)
+
+        if names is None:
+            project_config, groups = self._discover_pipeline_file_groups(self._fs)
+        else:
+            names = [validate_pipeline_name(name) for name in names]
+            for name in names:
+                if not self._pipeline_exists(name):
+                    raise ValueError(
+                        f"Pipeline {name} does not exist in the registry. Please check the name."
+                    )
+            project_config = self._resolve_project_config_file(fs=self._fs)
+            groups = {}
+            for name in names:
+                _, config_file, module_file = self._get_pipeline_files(
+                    name, fs=self._fs
+                )
+                groups[name] = [module_file, config_file]
+
+        fs, file = self._archive_location(dest_path, dest_fs, dest_storage_options)
+        if not overwrite and fs.exists(file):
+            raise FileExistsError(
+                f"Archive {dest_path} already exists. Use overwrite=True to replace it."
+            )
+
+        paths = list(
+            dict.fromkeys(
+                [
+                    *([project_config] if project_config else []),
+                    *(path for files in groups.values() for path in files),
+                ]
+            )
+        )
+
+        def read(path: str) -> bytes | None:
+            try:
+                return self._fs.read_bytes(path)
+            except FileNotFoundError:
+                return None
+
+        workers = max(1, min(self.max_workers, len(paths) or 1))
+        with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="fp-io") as pool:
+            contents = {
+                path: content
+                for path, content in zip(paths, pool.map(read, paths), strict=True)
+                if content is not None
+            }
+
+        manifest = build_manifest(
+            project=getattr(self.project_cfg, "name", None),
+            project_files=[path for path in [project_config] if path in contents],
+            pipelines=[
+                ArchivedPipeline(
+                    name=name, files=[path for path in files if path in contents]
+                )
+                for name, files in groups.items()
+            ],
+            contents=contents,
+        )
+        write_archive(fs, file, manifest, contents.items(), format=archive_format)
+
+        logger.info(
+            f"Archived {len(manifest.pipelines)} pipelines "
+            f"({len(contents)} files, {sum(map(len, contents.values()))} bytes) "
+            f"to {dest_path}"
+        )
+        self._print_export_success(names, dest_path)
+        return manifest
+
+    def _archive_destinations(
+        self, manifest: ArchiveManifest, selected: list[ArchivedPipeline]
+    ) -> set[str]:
+        """Validate the manifest paths to extract and return them normalized.
+
+        Project files may only target the project config, and pipeline files
+        only the module and config locations of their own pipeline.
+
+        Raises:
+            ValueError: If a path is unsafe or points anywhere else.
+        """
+
+        def check(path: str, allowed: set[str]) -> str:
+            normalized = _safe_member(path)
+            if normalized not in allowed:
+                raise ValueError(f"Unexpected path in archive manifest: {path}")
+            return normalized
+
+        project_files = set(self._project_config_files())
+        wanted = {check(path, project_files) for path in manifest.project_files}
+        for pipeline in selected:
+            module_path = format_pipeline_file_path(pipeline.name)
+            allowed = {
+                posixpath.join(self._pipelines_dir, f"{module_path}.py"),
+                *get_pipeline_config_paths(
+                    module_path, self._cfg_dir, self._pipelines_dir
+                ),
+            }
+            wanted.update(check(path, allowed) for path in pipeline.files)
+        return wanted
+
+    def import_from_archive(
+        self,
+        src_path: str,
+        names: list[str] | None = None,
+        src_fs: AbstractFileSystem | None = None,
+        src_storage_options: dict | BaseStorageOptions | None = None,
+        format: ArchiveFormat | None = None,
+        overwrite: bool = False,
+    ) -> SyncReport:
+        """Import pipelines from an archive created by :meth:`export_archive`.
+
+        The archive is read in a single streaming pass.  Members of pipelines
+        not listed in ``names`` are skipped without being written.  Manifest
+        paths are validated first: they may only target the project config
+        and the module and config files of their pipeline.  Every extracted
+        file is then read into memory and checked against the SHA-256 in the
+        manifest, and files are only written once all of them are present and
+        verified, so a corrupt or truncated archive leaves the project
+        untouched.
+
+        Args:
+            src_path (str): Archive path.
+            names (list[str] | None, optional): Pipelines to extract. Defaults to
+                every pipeline in the archive.
+            src_fs (AbstractFileSystem | None, optional): The source filesystem. Defaults to None.
+            src_storage_options (BaseStorageOptions | None, optional): Storage options for the source path. Defaults to None.
+            format (str | None, optional): Archive format. Defaults to the
+                format implied by the ``src_path`` suffix.
+            overwrite (bool, optional): Whether to overwrite existing files. Defaults to False.
+
+        Returns:
+            SyncReport: Files copied and skipped, and bytes written.
+
+        Raises:
+            ValueError: If a requested pipeline is not in the archive, a
+                manifest path is unsafe or outside its pipeline's locations,
+                or a file does not match its manifest hash.
+
+        Examples:
+            ```python
+            pm = PipelineManager()
+            pm.io.import_from_archive("s3://my-bucket/backup/project.tar.zst")
+            pm.io.import_from_archive("pipelines.tar.gz", names=["report"])
+            ```
+        """
+        archive_format = detect_archive_format(src_path, format)
+        if names is not None:
+            names = [validate_pipeline_name(name) for name in names]
+        fs, file = self._archive_location(src_path, src_fs, src_storage_options)
+        report = SyncReport()
+
+        with read_archive(fs, file, format=archive_format) as (manifest, members):
+            archived = {
+                format_pipeline_file_path(pipeline.name): pipeline
+                for pipeline in manifest.pipelines
+            }
+            if names is None:
+                selected = list(archived.values())
+            else:
+                missing = [
+                    name
+                    for name in names
+                    if format_pipeline_file_path(name) not in archived
+                ]
+                if missing:
+                    raise ValueError(
+                        f"Pipelines {', '.join(missing)} are not in archive {src_path}. "
+                        f"Available: {', '.join(p.name for p in manifest.pipelines)}"
+                    )
+                selected = [archived[format_pipeline_file_path(name)] for name in names]
+            hashes = {
+                posixpath.normpath(entry.path): entry.sha256 for entry in manifest.files
+            }
+            wanted = self._archive_destinations(manifest, selected)
+
+            contents: dict[str, bytes] = {}
+            for path, tar, member in members:
+                if path not in wanted or path in contents:
+                    continue
+                content = tar.extractfile(member).read()
+                if hashlib.sha256(content).hexdigest() != hashes.get(path):
+                    raise ValueError(
+                        f"File {path} in archive {src_path} does not match its manifest hash"
+                    )
+                contents[path] = content
+
+        missing = wanted.difference(contents)
+        if missing:
+            raise ValueError(
+                f"Archive {src_path} is truncated; missing {', '.join(sorted(missing))}"
+            )
+
+        for parent_dir in self._leaf_directories(sorted(contents)):
+            self._fs.makedirs(parent_dir, exist_ok=True)
+
+        def extract(path: str, content: bytes) -> tuple[str, int]:
+            if not overwrite and self._fs.exists(path):
+                logger.warning(
+                    f"File {path} already exists. Skipping write. Use overwrite=True to overwrite."
+                )
+                return "skipped", 0
+            if overwrite and self._is_unchanged(content, self._fs, path):
+                logger.debug(f"Skipping unchanged file {path}")
+                return "unchanged", 0
+            self._fs.write_bytes(path, content)
+            return "copied", len(content)
+
+        with ThreadPoolExecutor(
+            max_workers=self.max_workers, thread_name_prefix="fp-io"
+        ) as pool:
+            for result in pool.map(extract, contents, contents.values()):
+                report.record(*result)
+
+        logger.info(
+            f"Extracted {report.copied + report.skipped} files from {src_path}: "
+            f"{report.copied} copied, {report.skipped} skipped, "
+            f"{report.bytes_copied} bytes written"
+        )
+        self._print_import_success(
+            [pipeline.name for pipeline in selected] if names else None, src_path
+        )
+        return report
@@ -2,21 +2,28 @@
 
 from __future__ import annotations
 
-from typing import TYPE_CHECKING, Any
+import os
+import time
+from typing import TYPE_CHECKING, Any, Iterable
 
 import msgspec
 from fsspeckit import AbstractFileSystem
 from loguru import logger
 
 from ..cfg import PipelineConfig, ProjectConfig
-from ..settings import HOOKS_DIR
+from ..settings import CONFIG_DIR, HOOKS_DIR, PROJECT_CONFIG_TTL
+from ..utils.env import _env_snapshot
+from ..utils.filesystem import format_pipeline_file_path, get_project_config_paths
 from ..utils.security import validate_pipeline_name
 from .config_manager import PipelineConfigManager
+from .metrics import get_metrics, metrics_enabled
 from .module_resolver import PipelineModuleResolver
+from .params import provide_params
 
 if TYPE_CHECKING:
     from ..flowerpower import FlowerPowerProject
     from .pipeline import Pipeline
+    from .watcher import WatchChanges
 
 __all__ = ["CachedPipelineData", "PipelineLoader"]
 
@@ -38,6 +45,7 @@ class PipelineLoader:
         module_resolver: PipelineModuleResolver,
         fs: AbstractFileSystem,
         project_cfg: ProjectConfig,
+        project_cfg_ttl: float = PROJECT_CONFIG_TTL,
     ) -> None:
         self._config_manager = config_manager
         self._module_resolver = module_resolver
@@ -45,12 +53,84 @@ class PipelineLoader:
         self.project_cfg = project_cfg
         self._hooks_dir = getattr(project_cfg, "hooks_dir", HOOKS_DIR) or HOOKS_DIR
         self._pipeline_data_cache: dict[str, CachedPipelineData] = {}
+        # Formatted paths of pipeline modules that changed on disk; the next
+        # load must re-execute the module instead of reusing sys.modules.
+        self._stale_modules: set[str] = set()
+        # Project config revalidation state: the file stat and FP_* env
+        # signature the cached ``project_cfg`` was loaded from and when it was
+        # last checked.
+        self.project_cfg_ttl = project_cfg_ttl
+        self._project_cfg_signature: tuple[Any, ...] | None = None
+        self._project_cfg_checked_at: float | None = None
+
+    def _project_config_signature(self) -> tuple[Any, ...] | None:
+        """Return a cheap signature of the active project config.
+
+        The signature combines the stat of the project config file with the
+        ``FP_*`` environment, since env overlays are applied on load. Returns
+        ``None`` when the file cannot be stat'ed reliably, which forces a full
+        reload.
+        """
+        file_signature = self._project_config_file_signature()
+        if file_signature is None:
+            return None
+        return (file_signature, _env_snapshot(os.environ, "FP_"))
+
+    def _project_config_file_signature(self) -> tuple[Any, ...] | None:
+        cfg_dir = getattr(self._config_manager, "_cfg_dir", CONFIG_DIR)
+        for path in get_project_config_paths(cfg_dir):
+            try:
+                info = self._fs.info(path)
+            except FileNotFoundError:
+                continue
+            except Exception as error:
+                logger.debug(f"Cannot stat project config {path}: {error}")
+                return None
+            if not isinstance(info, dict):
+                return None
+            modified = info.get(
+                "mtime", info.get("modified", info.get("LastModified"))
+            )
+            return (path, modified, info.get("size"), info.get("ETag"))
+        return ()
+
+    def sync_project_state(self, force: bool = False) -> None:
+        """Revalidate the cached project configuration.
+
+        The project config is only re-read when its file stat signature or an
+        ``FP_*`` environment variable changed. Each check stats the config
+        file, so by default every cache hit costs one ``fs.info`` call. Within
+        ``project_cfg_ttl`` seconds of the last check (``FP_PROJECT_CONFIG_TTL``,
+        default 0, infinite while a :class:`PipelineWatcher` is running) no
+        check is made at all, so neither file nor environment changes are
+        seen until the TTL expires.
+
+        Args:
+            force: Skip the TTL and signature checks and reload unconditionally.
+        """
+        now = time.monotonic()
+        checked_at = self._project_cfg_checked_at
+        if (
+            not force
+            and checked_at is not None
+            and now - checked_at < self.project_cfg_ttl
+        ):
+            return
+
+        signature = self._project_config_signature()
+        self._project_cfg_checked_at = now
+        if (
+            not force
+            and signature is not None
+            and signature == self._project_cfg_signature
+        ):
+            return
 
-    def sync_project_state(self) -> None:
         try:
             self.project_cfg = self._config_manager.load_project_config()
         except ValueError:
             return
+        self._project_cfg_signature = signature
         self._hooks_dir = getattr(self.project_cfg, "hooks_dir", HOOKS_DIR) or HOOKS_DIR
 
     def get_pipeline(
@@ -73,7 +153,10 @@ class PipelineLoader:
 
         # Use cache if available and not reloading
         cached_data = self._pipeline_data_cache.get(name)
-        if not reload and cached_data is not None and cached_data.pipeline is not None:
+        hit = not reload and cached_data is not None and cached_data.pipeline is not None
+        if metrics_enabled():
+            get_metrics().record_cache("pipeline", hit)
+        if hit:
             self.sync_project_state()
             logger.debug(f"Returning cached pipeline '{name}'")
             return cached_data.pipeline
@@ -83,8 +166,8 @@ class PipelineLoader:
         # Load pipeline configuration
         config = self.load_config(name, reload=reload)
 
-        # Load pipeline module
-        module = self.load_module(name, reload=reload)
+        # Load pipeline module with the resolved params injected
+        module = self._load_module(name, config, reload=reload)
 
         # Import Pipeline class here to avoid circular import
         from .pipeline import Pipeline
@@ -96,6 +179,8 @@ class PipelineLoader:
             module=module,
             project_context=project_context,
         )
+        # Labels metrics; the runtime context deliberately carries no config.
+        pipeline.project_name = getattr(self.project_cfg, "name", None)
 
         # Cache the pipeline data
         self._pipeline_data_cache[name] = CachedPipelineData(
@@ -121,15 +206,20 @@ class PipelineLoader:
 
         # Use cache if available and not reloading
         cached_data = self._pipeline_data_cache.get(name)
-        if not reload and cached_data is not None and cached_data.config is not None:
+        hit = not reload and cached_data is not None and cached_data.config is not None
+        if metrics_enabled():
+            get_metrics().record_cache("config", hit)
+        if hit:
             self.sync_project_state()
             logger.debug(f"Returning cached config for pipeline '{name}'")
             return cached_data.config
 
         logger.debug(f"Loading configuration for pipeline '{name}'")
 
+        if reload:
+            self._config_manager.discard_bundle("reload requested")
         config = self._config_manager.load_pipeline_config(name)
-        self.sync_project_state()
+        self.sync_project_state(force=reload)
 
         if cached_data is None:
             self._pipeline_data_cache[name] = CachedPipelineData(config=config)
@@ -144,6 +234,10 @@ class PipelineLoader:
     def load_module(self, name: str, reload: bool = False) -> Any:
         """Load pipeline module from disk.
 
+        The pipeline's (cached) resolved ``h_params`` are bound while the
+        module is imported, so ``flowerpower.params()`` at module level does
+        not read the configuration again.
+
         Args:
             name: Name of the pipeline
             reload: Whether to reload from disk even if cached
@@ -153,6 +247,26 @@ class PipelineLoader:
         """
         name = validate_pipeline_name(name)
 
+        cached_data = self._pipeline_data_cache.get(name)
+        hit = not reload and cached_data is not None and cached_data.module is not None
+        if metrics_enabled():
+            get_metrics().record_cache("module", hit)
+        if hit:
+            logger.debug(f"Returning cached module for pipeline '{name}'")
+            return cached_data.module
+
+        try:
+            # Module reloads reuse the cached config; reload it explicitly
+            # with ``load_config(reload=True)`` when the YAML changed.
+            config = self.load_config(name)
+        except Exception as error:
+            logger.debug(f"Importing '{name}' without injected params: {error}")
+            config = None
+        return self._load_module(name, config, reload=reload)
+
+    def _load_module(
+        self, name: str, config: PipelineConfig | None, reload: bool = False
+    ) -> Any:
         # Use cache if available and not reloading
         cached_data = self._pipeline_data_cache.get(name)
         if not reload and cached_data is not None and cached_data.module is not None:
@@ -163,7 +277,15 @@ class PipelineLoader:
 
         # Load the module through the shared resolver (handles package-root
         # normalization, hyphens, and fallback candidates)
-        module = self._module_resolver.load(name, reload=reload)
+        module_path = format_pipeline_file_path(name)
+        stale = module_path in self._stale_modules
+        if config is not None:
+            with provide_params(name, config.h_params):
+                module = self._module_resolver.load(name, reload=reload or stale)
+        else:
+            module = self._module_resolver.load(name, reload=reload or stale)
+        self._stale_modules.discard(module_path)
+        cached_data = self._pipeline_data_cache.get(name)
 
         if cached_data is None:
             self._pipeline_data_cache[name] = CachedPipelineData(module=module)
@@ -187,3 +309,53 @@ class PipelineLoader:
         else:
             logger.debug("Clearing entire pipeline cache")
             self._pipeline_data_cache.clear()
+
+    def invalidate(self, paths: Iterable[str], *, modules: bool = True) -> list[str]:
+        """Drop cache entries for pipelines stored at the given file paths.
+
+        Args:
+            paths: Formatted pipeline paths as produced by
+                :func:`format_pipeline_file_path` (e.g. ``"group/my_pipeline"``).
+            modules: Whether the pipeline modules may have changed as well,
+                forcing a re-import on the next load.
+
+        Returns:
+            Names of the cache entries that were dropped.
+        """
+        targets = set(paths)
+        if not targets:
+            return []
+        self._config_manager.discard_bundle("pipeline files changed")
+
+        dropped = [
+            name
+            for name in list(self._pipeline_data_cache)
+            if format_pipeline_file_path(name) in targets
+        ]
+        for name in dropped:
+            self._pipeline_data_cache.pop(name, None)
+        if modules:
+            self._stale_modules.update(targets)
+        if dropped:
+            logger.debug(f"Invalidated cached pipelines: {', '.join(sorted(dropped))}")
+        return dropped
+
+    def apply_changes(self, changes: "WatchChanges") -> list[str]:
+        """Apply a watcher change set to the loader caches.
+
+        Only the pipelines touched by the change set are evicted.  A project
+        configuration change re-syncs the project state without discarding
+        unrelated pipelines.
+
+        Args:
+            changes: Classified changes reported by :class:`PipelineWatcher`.
+
+        Returns:
+            Names of the cache entries that were dropped.
+        """
+        if changes.project:
+            self._config_manager.discard_bundle("project config changed")
+            self.sync_project_state(force=True)
+        dropped = self.invalidate(changes.pipelines - changes.modules, modules=False)
+        dropped.extend(self.invalidate(changes.modules))
+        return dropped
@@ -1,9 +1,10 @@
 import datetime as dt
 import os
 import posixpath
+import threading
 from pathlib import Path
 from types import TracebackType
-from typing import Any
+from typing import Any, Callable
 
 import rich
 from fsspec.implementations.dirfs import DirFileSystem
@@ -11,19 +12,32 @@ from fsspeckit import AbstractFileSystem, BaseStorageOptions, filesystem
 from .. import settings
 from ..cfg import PipelineConfig, ProjectConfig
 from ..cfg.pipeline.run import RunConfig
-from ..settings import CACHE_DIR, CONFIG_DIR, PIPELINES_DIR
+from ..settings import (
+    BUNDLE_PATH,
+    CACHE_DIR,
+    CATALOG_INDEX_PATH,
+    CONFIG_DIR,
+    PIPELINES_DIR,
+    USE_BUNDLE,
+    USE_CATALOG_INDEX,
+    WATCH_INTERVAL,
+)
 from ..utils.filesystem import FilesystemHelper
-from ..utils.logging import setup_logging
+from ..utils.logging import ensure_logging_initialized, setup_logging
 from ..utils.security import validate_directory_fragment, validate_file_path
+from .batch import BatchSummary, open_result_writer, read_input_rows, run_batch
+from .bundle import ProjectBundle, compile_bundle, read_bundle, write_bundle
+from .catalog_index import CatalogIndex
 from .config_manager import PipelineConfigManager
 from .creator import PipelineCreator
 from .executor import PipelineExecutor
+from .history import RunRecord, RunStats, get_history
+from .incremental import IterationResult, WatchSession
 from .io import PipelineIOManager
 from .registry import PipelineRegistry
 from .project_context import ProjectRuntimeContext
 from .visualizer import PipelineVisualizer
-
-setup_logging()
+from .watcher import PipelineWatcher
 
 
 class PipelineManager:
@@ -121,6 +135,8 @@ class PipelineManager:
         """
         if log_level:
             setup_logging(level=log_level)
+        else:
+            ensure_logging_initialized()
         self._context = _context or self._build_runtime_context(
             base_dir=base_dir,
             storage_options=storage_options,
@@ -235,6 +251,8 @@ class PipelineManager:
         """Load an existing FlowerPower project as a PipelineManager facade."""
         if log_level is not None:
             setup_logging(level=log_level)
+        else:
+            ensure_logging_initialized()
 
         context = cls._build_runtime_context(
             base_dir=base_dir,
@@ -383,6 +401,8 @@ class PipelineManager:
         """Create a FlowerPower project and return its PipelineManager facade."""
         if log_level:
             setup_logging(level=log_level)
+        else:
+            ensure_logging_initialized()
 
         name, base_dir = cls._resolve_project_params(name, base_dir)
         validate_file_path(hooks_dir, allow_absolute=False, allow_relative=True)
@@ -415,6 +435,14 @@ class PipelineManager:
             cfg_dir=self._context.cfg_dir,
             pipelines_dir=self._context.pipelines_dir,
         )
+        if USE_BUNDLE:
+            self._config_manager.use_bundle(
+                read_bundle(
+                    self._context.fs,
+                    cfg_dir=self._context.cfg_dir,
+                    pipelines_dir=self._context.pipelines_dir,
+                )
+            )
 
         project_cfg = self._config_manager.load_project_config()
 
@@ -422,6 +450,7 @@ class PipelineManager:
             self._context,
             project_cfg=project_cfg,
             config_manager=self._config_manager,
+            catalog_index_path=CATALOG_INDEX_PATH if USE_CATALOG_INDEX else None,
         )
         self._creator = PipelineCreator.from_context(
             self._context,
@@ -483,6 +512,9 @@ class PipelineManager:
             exc_val: Exception instance that occurred, if any
             exc_tb: Traceback of exception that occurred, if any
         """
+        registry = getattr(self, "registry", None)
+        if registry is not None:
+            registry.unwatch()
         if not self._context.owns_filesystem:
             return
         try:
@@ -503,6 +535,131 @@ class PipelineManager:
         """
         return self.registry.load_config(name, reload=reload)
 
+    def watch(self, **kwargs: Any) -> PipelineWatcher:
+        """Watch project files and invalidate only the affected cached pipelines.
+
+        The watcher is stopped automatically when the manager context exits.
+
+        Args:
+            **kwargs: Forwarded to :meth:`PipelineRegistry.watch`
+                (``on_change``, ``interval``, ``backend``).
+
+        Returns:
+            PipelineWatcher: The running watcher.
+
+        Example:
+            >>> with PipelineManager() as manager:
+            ...     manager.watch(interval=0.5)
+            ...     manager.run("my_pipeline")  # reloads only after edits
+        """
+        return self.registry.watch(**kwargs)
+
+    def compile(
+        self, path: str = BUNDLE_PATH, include_dag: bool = True
+    ) -> ProjectBundle:
+        """Compile the project into a bundle for fast cold starts.
+
+        The bundle is always built from the files on disk, never from a bundle
+        that is currently in use.  Later ``PipelineManager`` instances load
+        configs and pipeline names from it while it matches this FlowerPower
+        version and no config or pipeline file changed since (disable with
+        ``FP_USE_BUNDLE=false``).
+
+        Args:
+            path: Bundle path relative to the project root
+                (``FP_BUNDLE_PATH``).
+            include_dag: Import each pipeline module and store a DAG summary.
+
+        Returns:
+            ProjectBundle: The bundle that was written.
+        """
+        bundle = compile_bundle(
+            self._fs,
+            cfg_dir=self._cfg_dir,
+            pipelines_dir=self._pipelines_dir,
+            include_dag=include_dag,
+        )
+        write_bundle(self._fs, bundle, path)
+        return bundle
+
+    def check_bundle(self, path: str = BUNDLE_PATH) -> list[str] | None:
+        """Compare the bundle at ``path`` against the project files.
+
+        Returns:
+            Paths that changed since the bundle was compiled (empty when it is
+            up to date), or ``None`` when no usable bundle exists.
+        """
+        bundle = read_bundle(
+            self._fs,
+            cfg_dir=self._cfg_dir,
+            pipelines_dir=self._pipelines_dir,
+            path=path,
+            validate=False,
+        )
+        if bundle is None:
+            return None
+        return bundle.stale_paths(self._fs)
+
+    def rebuild_catalog_index(self) -> CatalogIndex:
+        """Rebuild the persistent pipeline catalog index from scratch.
+
+        The index is normally refreshed incrementally from directory listings;
+        a rebuild re-reads every pipeline module and config, e.g. after files
+        were replaced without changing their size or modification time.
+
+        Returns:
+            CatalogIndex: The rebuilt index.
+
+        Raises:
+            RuntimeError: If the catalog index is disabled
+                (``FP_USE_CATALOG_INDEX=false``).
+        """
+        return self.registry.rebuild_catalog_index()
+
+    def history(
+        self,
+        name: str | None = None,
+        *,
+        status: str | None = None,
+        limit: int | None = 20,
+        with_nodes: bool = False,
+    ) -> list[RunRecord]:
+        """Recorded runs of this project, newest first.
+
+        Args:
+            name: Only runs of this pipeline.
+            status: Only runs with this status (``"success"``/``"failure"``).
+            limit: Maximum number of runs; ``None`` for all.
+            with_nodes: Also load per-node durations and output sizes.
+
+        Returns:
+            list[RunRecord]: Runs from the history store (``FP_HISTORY_PATH``).
+
+        Example:
+            >>> with PipelineManager() as manager:
+            ...     last = manager.history("my_pipeline", limit=1)[0]
+            ...     print(last.status, last.duration)
+        """
+        return get_history().runs(
+            name,
+            project=self.project_cfg.name,
+            status=status,
+            limit=limit,
+            with_nodes=with_nodes,
+        )
+
+    def history_stats(self, name: str, *, last: int | None = 100) -> RunStats:
+        """Duration percentiles, failure rate and trend of a pipeline.
+
+        Args:
+            name: Pipeline name.
+            last: Number of most recent runs to aggregate; ``None`` for all.
+
+        Returns:
+            RunStats: Aggregated run history.
+        """
+        return get_history().stats(name, project=self.project_cfg.name, last=last)
+
     # --- Properties ---
 
     @property
@@ -692,3 +849,102 @@ class PipelineManager:
         return await self._executor.run_async(
             name=name, run_config=run_config, **kwargs
         )
+
+    def run_batch(
+        self,
+        name: str,
+        inputs_file: str,
+        output: str,
+        run_config: RunConfig | None = None,
+        parallel: int = 1,
+        resume: bool = True,
+        on_result: Callable[[dict[str, Any]], None] | None = None,
+    ) -> BatchSummary:
+        """Run a pipeline once per row of an input file and stream results to a file.
+
+        The run config, adapters and pipeline are prepared once and shared by
+        all rows; each row's fields are merged over the run inputs. See
+        :mod:`flowerpower.pipeline.batch` for the file formats.
+
+        Args:
+            name: Name of the pipeline to run.
+            inputs_file: JSON Lines (``.jsonl``) or Parquet (``.parquet``) file
+                with one inputs object per row.
+            output: Result file (``.jsonl`` or ``.parquet``), written as rows finish.
+            run_config: Run configuration shared by all rows.
+            parallel: Maximum number of rows running at the same time.
+            resume: Skip rows already present in ``output``; ``False`` overwrites it.
+            on_result: Called with each result record as it is written.
+
+        Returns:
+            BatchSummary: Row counts and duration of this invocation.
+
+        Example:
+            >>> with PipelineManager() as manager:
+            ...     summary = manager.run_batch(
+            ...         "scoring", "inputs.jsonl", "results.jsonl", parallel=4
+            ...     )
+            ...     print(summary.failed)
+        """
+        writer = open_result_writer(output, resume=resume)
+        try:
+            return run_batch(
+                self._executor,
+                name,
+                read_input_rows(inputs_file),
+                writer,
+                run_config=run_config,
+                parallel=parallel,
+                on_result=on_result,
+            )
+        finally:
+            writer.close()
+
+    def run_watch(
+        self,
+        name: str,
+        run_config: RunConfig | None = None,
+        *,
+        on_iteration: Callable[[IterationResult], None] | None = None,
+        interval: float = WATCH_INTERVAL,
+        stop: threading.Event | None = None,
+        max_iterations: int | None = None,
+    ) -> None:
+        """Run a pipeline and re-run it whenever its code or config changes.
+
+        The pipeline module, its ``additional_modules`` and the pipeline YAML
+        are checked every ``interval`` seconds. Only the modules whose files
+        changed are reloaded, and only nodes whose code, config or upstream
+        results changed are recomputed; all other node results are reused
+        from the previous run. See :mod:`flowerpower.pipeline.incremental`.
+
+        Args:
+            name: Name of the pipeline to run.
+            run_config: Run configuration applied to every run.
+            on_iteration: Called with the :class:`IterationResult` of every run,
+                including failed runs and failed reloads.
+            interval: Seconds between file checks.
+            stop: Event that ends watching; ``KeyboardInterrupt`` ends it too.
+            max_iterations: Stop after this many runs.
+
+        Example:
+            >>> with PipelineManager() as manager:
+            ...     manager.run_watch(
+            ...         "my_pipeline",
+            ...         on_iteration=lambda r: print(r.iteration, r.duration),
+            ...     )
+        """
+        session = WatchSession(
+            self,
+            name,
+            run_config,
+            fs=self._fs,
+            cfg_dir=self._cfg_dir,
+            pipelines_dir=self._pipelines_dir,
+        )
+        session.loop(
+            on_iteration,
+            interval=interval,
+            stop=stop,
+            max_iterations=max_iterations,
+        )
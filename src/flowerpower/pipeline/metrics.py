@@ -0,0 +1,384 @@
+"""Prometheus metrics for pipeline runs.
+
+Metrics are collected in-process and rendered in the Prometheus text
+exposition format, either served on ``http://<FP_METRICS_ADDR>:<FP_METRICS_PORT>/metrics``
+or written to ``FP_METRICS_TEXTFILE`` for the node-exporter textfile
+collector after every run.  Collection is off unless ``FP_METRICS_ENABLED`` is
+set, so a disabled subsystem costs one attribute check per run.
+
+Labels are deliberately limited to ``project``, ``pipeline``, ``status`` and,
+for node durations, the node name.  None of them carry run IDs, inputs or
+timestamps, so the number of series stays bounded by the code base.
+
+Exported series:
+
+- ``flowerpower_pipeline_runs_total`` (counter; project, pipeline, status)
+- ``flowerpower_pipeline_run_duration_seconds`` (histogram; project, pipeline, status)
+- ``flowerpower_pipeline_retries_total`` (counter; project, pipeline)
+- ``flowerpower_node_duration_seconds`` (histogram; project, pipeline, node)
+- ``flowerpower_cache_requests_total`` (counter; cache, result)
+- ``flowerpower_executor_queue_depth`` (gauge; project, pipeline)
+"""
+
+from __future__ import annotations
+
+import contextlib
+import math
+import os
+import tempfile
+import threading
+import time
+from collections.abc import Iterator, Sequence
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Any
+
+from hamilton.lifecycle import api
+from loguru import logger
+
+from ..settings import (
+    METRICS_ADDR,
+    METRICS_ENABLED,
+    METRICS_PORT,
+    METRICS_TEXTFILE,
+)
+
+__all__ = [
+    "Counter",
+    "Gauge",
+    "Histogram",
+    "MetricsAdapter",
+    "PipelineMetrics",
+    "export_metrics",
+    "get_metrics",
+    "observe_run",
+    "metrics_enabled",
+    "start_metrics_server",
+    "stop_metrics_server",
+]
+
+CONTENT_TYPE = "text/plain; version=0.0.4; charset=utf-8"
+
+DURATION_BUCKETS = (0.1, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0, 60.0, 300.0, 900.0, 3600.0)
+NODE_BUCKETS = (0.001, 0.005, 0.025, 0.1, 0.5, 1.0, 5.0, 30.0, 120.0, 600.0)
+
+
+def _escape(value: str) -> str:
+    return value.replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+
+
+def _format_labels(names: Sequence[str], values: Sequence[str]) -> str:
+    if not names:
+        return ""
+    pairs = ",".join(f'{name}="{_escape(value)}"' for name, value in zip(names, values, strict=True))
+    return "{" + pairs + "}"
+
+
+def _format_value(value: float) -> str:
+    if math.isinf(value):
+        return "+Inf" if value > 0 else "-Inf"
+    return repr(float(value)) if not float(value).is_integer() else str(int(value))
+
+
+class _Metric:
+    kind = ""
+
+    def __init__(self, name: str, documentation: str, labelnames: Sequence[str] = ()):
+        self.name = name
+        self.documentation = documentation
+        self.labelnames = tuple(labelnames)
+        self._lock = threading.Lock()
+
+    def _key(self, labels: dict[str, str]) -> tuple[str, ...]:
+        return tuple(str(labels.get(name, "")) for name in self.labelnames)
+
+    def _samples(self) -> list[str]:  # pragma: no cover - abstract
+        raise NotImplementedError
+
+    def render(self) -> str:
+        header = f"# HELP {self.name} {self.documentation}\n# TYPE {self.name} {self.kind}\n"
+        return header + "".join(line + "\n" for line in self._samples())
+
+
+class Counter(_Metric):
+    """Monotonic counter."""
+
+    kind = "counter"
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self._values: dict[tuple[str, ...], float] = {}
+
+    def inc(self, amount: float = 1.0, **labels: str) -> None:
+        key = self._key(labels)
+        with self._lock:
+            self._values[key] = self._values.get(key, 0.0) + amount
+
+    def value(self, **labels: str) -> float:
+        return self._values.get(self._key(labels), 0.0)
+
+    def _samples(self) -> list[str]:
+        with self._lock:
+            items = sorted(self._values.items())
+        return [
+            f"{self.name}{_format_labels(self.labelnames, key)} {_format_value(value)}"
+            for key, value in items
+        ]
+
+
+class Gauge(Counter):
+    """Value that can go up and down."""
+
+    kind = "gauge"
+
+    def dec(self, amount: float = 1.0, **labels: str) -> None:
+        self.inc(-amount, **labels)
+
+    def set(self, value: float, **labels: str) -> None:
+        with self._lock:
+            self._values[self._key(labels)] = value
+
+
+class Histogram(_Metric):
+    """Cumulative histogram with fixed buckets."""
+
+    kind = "histogram"
+
+    def __init__(self, *args, buckets: Sequence[float] = DURATION_BUCKETS, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.buckets = tuple(sorted(buckets)) + (math.inf,)
+        self._values: dict[tuple[str, ...], tuple[list[int], float]] = {}
+
+    def observe(self, value: float, **labels: str) -> None:
+        key = self._key(labels)
+        with self._lock:
+            counts, total = self._values.get(key) or ([0] * len(self.buckets), 0.0)
+            for index, bound in enumerate(self.buckets):
+                if value <= bound:
+                    counts[index] += 1
+                    break
+            self._values[key] = (counts, total + value)
+
+    def count(self, **labels: str) -> int:
+        counts, _ = self._values.get(self._key(labels)) or ([0], 0.0)
+        return sum(counts)
+
+    def _samples(self) -> list[str]:
+        with self._lock:
+            items = sorted((key, (list(c), s)) for key, (c, s) in self._values.items())
+        lines = []
+        for key, (counts, total) in items:
+            cumulative = 0
+            for bound, count in zip(self.buckets, counts, strict=True):
+                cumulative += count
+                labels = _format_labels(
+                    (*self.labelnames, "le"), (*key, _format_value(bound))
+                )
+                lines.append(f"{self.name}_bucket{labels} {cumulative}")
+            labels = _format_labels(self.labelnames, key)
+            lines.append(f"{self.name}_sum{labels} {_format_value(total)}")
+            lines.append(f"{self.name}_count{labels} {cumulative}")
+        return lines
+
+
+class PipelineMetrics:
+    """The metric families exported by FlowerPower."""
+
+    def __init__(self) -> None:
+        self.runs = Counter(
+            "flowerpower_pipeline_runs_total",
+            "Finished pipeline runs.",
+            ("project", "pipeline", "status"),
+        )
+        self.run_duration = Histogram(
+            "flowerpower_pipeline_run_duration_seconds",
+            "Wall time of pipeline runs, including retries.",
+            ("project", "pipeline", "status"),
+        )
+        self.retries = Counter(
+            "flowerpower_pipeline_retries_total",
+            "Retry attempts scheduled by the retry manager.",
+            ("project", "pipeline"),
+        )
+        self.node_duration = Histogram(
+            "flowerpower_node_duration_seconds",
+            "Wall time of node executions.",
+            ("project", "pipeline", "node"),
+            buckets=NODE_BUCKETS,
+        )
+        self.cache = Counter(
+            "flowerpower_cache_requests_total",
+            "Pipeline loader cache lookups.",
+            ("cache", "result"),
+        )
+        self.queue_depth = Gauge(
+            "flowerpower_executor_queue_depth",
+            "Tasks submitted to the executor and not yet returned.",
+            ("project", "pipeline"),
+        )
+        self._families = (
+            self.runs,
+            self.run_duration,
+            self.retries,
+            self.node_duration,
+            self.cache,
+            self.queue_depth,
+        )
+
+    def render(self) -> str:
+        """Return all metrics in the Prometheus text exposition format."""
+        return "".join(family.render() for family in self._families)
+
+    def record_run(
+        self, project: str, pipeline: str, status: str, duration: float
+    ) -> None:
+        self.runs.inc(project=project, pipeline=pipeline, status=status)
+        self.run_duration.observe(
+            duration, project=project, pipeline=pipeline, status=status
+        )
+
+    def record_cache(self, cache: str, hit: bool) -> None:
+        self.cache.inc(cache=cache, result="hit" if hit else "miss")
+
+    def write_textfile(self, path: str) -> None:
+        """Atomically write the metrics to ``path`` (textfile collector)."""
+        directory = os.path.dirname(os.path.abspath(path))
+        os.makedirs(directory, exist_ok=True)
+        fd, tmp = tempfile.mkstemp(dir=directory, prefix=".flowerpower-", suffix=".prom")
+        try:
+            with os.fdopen(fd, "w", encoding="utf-8") as f:
+                f.write(self.render())
+            os.replace(tmp, path)
+        except BaseException:
+            with contextlib.suppress(OSError):
+                os.unlink(tmp)
+            raise
+
+
+_METRICS = PipelineMetrics()
+_SERVER: ThreadingHTTPServer | None = None
+_SERVER_LOCK = threading.Lock()
+
+
+def get_metrics() -> PipelineMetrics:
+    """Return the process-wide metrics."""
+    return _METRICS
+
+
+def metrics_enabled() -> bool:
+    """Whether metrics collection is enabled (``FP_METRICS_ENABLED``)."""
+    return METRICS_ENABLED
+
+
+class _MetricsHandler(BaseHTTPRequestHandler):
+    def do_GET(self) -> None:  # noqa: N802 - http.server API
+        if self.path.split("?", 1)[0] not in ("/metrics", "/"):
+            self.send_error(404)
+            return
+        body = _METRICS.render().encode()
+        self.send_response(200)
+        self.send_header("Content-Type", CONTENT_TYPE)
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format: str, *args: Any) -> None:
+        logger.trace(f"metrics: {format % args}")
+
+
+def start_metrics_server(
+    port: int | None = None, addr: str | None = None
+) -> ThreadingHTTPServer:
+    """Serve ``/metrics`` from a daemon thread; started at most once.
+
+    Args:
+        port: Port to bind; defaults to ``FP_METRICS_PORT``. ``0`` picks a
+            free port (see ``server.server_address``).
+        addr: Address to bind; defaults to ``FP_METRICS_ADDR``.
+    """
+    global _SERVER
+    with _SERVER_LOCK:
+        if _SERVER is None:
+            _SERVER = ThreadingHTTPServer(
+                (addr or METRICS_ADDR, METRICS_PORT if port is None else port),
+                _MetricsHandler,
+            )
+            threading.Thread(
+                target=_SERVER.serve_forever, name="fp-metrics", daemon=True
+            ).start()
+            host, bound = _SERVER.server_address[:2]
+            logger.info(f"Serving metrics on http://{host}:{bound}/metrics")
+        return _SERVER
+
+
+def stop_metrics_server() -> None:
+    """Stop the server started by :func:`start_metrics_server`."""
+    global _SERVER
+    with _SERVER_LOCK:
+        if _SERVER is not None:
+            _SERVER.shutdown()
+            _SERVER.server_close()
+            _SERVER = None
+
+
+def export_metrics() -> None:
+    """Publish metrics through the configured exporters.
+
+    Starts the HTTP endpoint on first use when ``FP_METRICS_PORT`` is set and
+    rewrites ``FP_METRICS_TEXTFILE`` if configured.  Exporter errors are
+    logged, never raised into the run.
+    """
+    try:
+        if METRICS_PORT is not None:
+            start_metrics_server()
+        if METRICS_TEXTFILE:
+            _METRICS.write_textfile(METRICS_TEXTFILE)
+    except OSError as error:
+        logger.warning(f"Cannot export metrics: {error}")
+
+
+@contextlib.contextmanager
+def observe_run(project: str, pipeline: str) -> Iterator[None]:
+    """Record the duration and outcome of the enclosed run, then export."""
+    started = time.perf_counter()
+    status = "failure"
+    try:
+        yield
+        status = "success"
+    finally:
+        _METRICS.record_run(project, pipeline, status, time.perf_counter() - started)
+        export_metrics()
+
+
+class MetricsAdapter(
+    api.NodeExecutionHook, api.TaskSubmissionHook, api.TaskReturnHook
+):
+    """Hamilton adapter feeding node durations and executor queue depth."""
+
+    def __init__(
+        self, project: str, pipeline: str, metrics: PipelineMetrics | None = None
+    ) -> None:
+        self.labels = {"project": project, "pipeline": pipeline}
+        self.metrics = metrics or _METRICS
+        self._started: dict[tuple[str | None, str, int], float] = {}
+
+    def run_before_node_execution(
+        self, *, node_name: str, task_id: str | None, **future_kwargs: Any
+    ) -> None:
+        self._started[(task_id, node_name, threading.get_ident())] = (
+            time.perf_counter()
+        )
+
+    def run_after_node_execution(
+        self, *, node_name: str, task_id: str | None, **future_kwargs: Any
+    ) -> None:
+        started = self._started.pop((task_id, node_name, threading.get_ident()), None)
+        if started is not None:
+            self.metrics.node_duration.observe(
+                time.perf_counter() - started, node=node_name, **self.labels
+            )
+
+    def run_before_task_submission(self, **future_kwargs: Any) -> None:
+        self.metrics.queue_depth.inc(**self.labels)
+
+    def run_after_task_return(self, **future_kwargs: Any) -> None:
+        self.metrics.queue_depth.dec(**self.labels)
@@ -0,0 +1,199 @@
+"""Static index of the Hamilton nodes defined by pipeline modules.
+
+Answering "which pipelines produce or consume node X" used to require
+importing every module and building a driver.  Instead, pipeline modules are
+parsed with :mod:`ast` when the catalog index re-reads them: every public
+top-level function becomes an :class:`IndexedNode` with its parameters,
+``@config.when*`` variant and ``@tag`` values.  Nothing is imported, so a
+search over the stored index takes milliseconds.
+
+The parser mirrors Hamilton's naming rules closely enough for lookups:
+functions starting with ``_`` are skipped, and ``__suffix`` variants of
+``@config.when`` functions resolve to the node name before the suffix.
+Nodes generated dynamically by other decorators are not expanded.
+"""
+
+from __future__ import annotations
+
+import ast
+from collections.abc import Iterable, Mapping
+from typing import TYPE_CHECKING, Any, Literal
+
+import msgspec
+from loguru import logger
+
+if TYPE_CHECKING:
+    from .catalog_index import CatalogIndex
+
+__all__ = [
+    "IndexedNode",
+    "NodeMatch",
+    "parse_module_nodes",
+    "parse_tag_filters",
+    "search_nodes",
+]
+
+_CONFIG_DECORATORS = {"when", "when_not", "when_in", "when_not_in"}
+
+
+class IndexedNode(msgspec.Struct, frozen=True):
+    """A node defined by a pipeline module.
+
+    Attributes:
+        name: Hamilton node name (``__suffix`` of ``@config.when`` variants
+            removed).
+        function: Name of the defining function.
+        parameters: Names of the function parameters, i.e. consumed nodes.
+        when: Source of the ``@config.when*`` decorator, if any.
+        tags: ``@tag`` key/value pairs.
+        lineno: Line of the ``def`` statement.
+    """
+
+    name: str
+    function: str
+    parameters: list[str] = msgspec.field(default_factory=list)
+    when: str | None = None
+    tags: dict[str, str] = msgspec.field(default_factory=dict)
+    lineno: int = 0
+
+
+class NodeMatch(msgspec.Struct, frozen=True):
+    """One search hit: a node of ``pipeline`` that produces or consumes."""
+
+    pipeline: str
+    module_file: str
+    role: Literal["produces", "consumes"]
+    node: IndexedNode
+
+
+def _dotted_name(expr: ast.expr) -> str:
+    if isinstance(expr, ast.Call):
+        expr = expr.func
+    try:
+        return ast.unparse(expr)
+    except Exception:  # pragma: no cover - defensive
+        return ""
+
+
+def _literal(expr: ast.expr) -> str:
+    try:
+        value = ast.literal_eval(expr)
+    except (ValueError, SyntaxError, TypeError):
+        return ast.unparse(expr)
+    return value if isinstance(value, str) else str(value)
+
+
+def _parse_function(func: ast.FunctionDef | ast.AsyncFunctionDef) -> IndexedNode:
+    when = None
+    tags: dict[str, str] = {}
+    for decorator in func.decorator_list:
+        parts = _dotted_name(decorator).split(".")
+        if parts[-1] in _CONFIG_DECORATORS and parts[-2:-1] == ["config"]:
+            when = ast.unparse(decorator)
+        elif parts[-1] == "tag" and isinstance(decorator, ast.Call):
+            tags.update(
+                {
+                    keyword.arg: _literal(keyword.value)
+                    for keyword in decorator.keywords
+                    if keyword.arg is not None
+                }
+            )
+
+    args = func.args
+    parameters = [arg.arg for arg in (*args.posonlyargs, *args.args, *args.kwonlyargs)]
+    name = func.name
+    if when is not None and "__" in name:
+        name = name.rsplit("__", 1)[0]
+    return IndexedNode(
+        name=name,
+        function=func.name,
+        parameters=parameters,
+        when=when,
+        tags=tags,
+        lineno=func.lineno,
+    )
+
+
+def parse_module_nodes(
+    source: bytes | str, filename: str = "<pipeline>"
+) -> list[IndexedNode]:
+    """Return the nodes defined at the top level of a pipeline module.
+
+    Args:
+        source: Module source code.
+        filename: Used in log messages only.
+
+    Returns:
+        Nodes in definition order; empty when the module cannot be parsed.
+    """
+    try:
+        tree = ast.parse(source, filename=filename)
+    except (SyntaxError, ValueError) as error:
+        logger.debug(f"Cannot index nodes of {filename}: {error}")
+        return []
+    return [
+        _parse_function(stmt)
+        for stmt in tree.body
+        if isinstance(stmt, (ast.FunctionDef, ast.AsyncFunctionDef))
+        and not stmt.name.startswith("_")
+    ]
+
+
+def search_nodes(
+    index: "CatalogIndex",
+    node: str | None = None,
+    tags: Mapping[str, Any] | None = None,
+) -> list[NodeMatch]:
+    """Find pipelines that produce or consume a node and/or carry tags.
+
+    Args:
+        index: Catalog index holding the parsed nodes.
+        node: Node name.  Matches functions defining it (``produces``) and
+            functions taking it as a parameter (``consumes``).
+        tags: Tag filter; every key must be present with the given value.
+            Without ``node``, all nodes carrying the tags are returned as
+            ``produces`` hits.
+
+    Returns:
+        Matches ordered by pipeline, then definition order.
+    """
+    wanted = {key: str(value) for key, value in (tags or {}).items()}
+
+    def tagged(candidate: IndexedNode) -> bool:
+        return all(candidate.tags.get(key) == value for key, value in wanted.items())
+
+    matches: list[NodeMatch] = []
+    for entry in index.pipelines:
+        for candidate in entry.nodes:
+            if not tagged(candidate):
+                continue
+            role = None
+            if node is None or candidate.name == node:
+                role = "produces"
+            elif node in candidate.parameters:
+                role = "consumes"
+            if role is not None:
+                matches.append(
+                    NodeMatch(
+                        pipeline=entry.name,
+                        module_file=entry.module_file,
+                        role=role,
+                        node=candidate,
+                    )
+                )
+    return matches
+
+
+def parse_tag_filters(values: Iterable[str]) -> dict[str, str]:
+    """Parse ``key=value`` strings into a tag filter.
+
+    Raises:
+        ValueError: If a value has no ``=``.
+    """
+    filters = {}
+    for value in values:
+        key, sep, tag_value = value.partition("=")
+        if not sep or not key:
+            raise ValueError(f"Invalid tag filter '{value}', expected key=value")
+        filters[key.strip()] = tag_value.strip()
+    return filters
@@ -0,0 +1,83 @@
+"""Context-bound injection of pipeline parameters into pipeline modules.
+
+Pipeline modules read their parameters at import time.  Instead of every
+module calling ``Config.load`` (walking up to the project root and parsing the
+project and pipeline YAML again), the :class:`PipelineLoader` binds the
+already-resolved ``h_params`` of the pipeline it is importing and the module
+picks them up with :func:`flowerpower.params`::
+
+    from flowerpower import params
+
+    PARAMS = params("my_pipeline")
+
+Only a module imported outside of FlowerPower (a plain ``import`` in a
+notebook or a spawned worker process) falls back to reading the config from
+disk.
+"""
+
+from __future__ import annotations
+
+from collections.abc import Callable, Iterator
+from contextlib import contextmanager
+from contextvars import ContextVar
+
+from loguru import logger
+
+from ..utils.filesystem import format_pipeline_file_path
+from ..utils.misc import DictNamespace
+
+__all__ = ["params", "provide_params"]
+
+_ACTIVE_PARAMS: ContextVar[tuple[str, DictNamespace] | None] = ContextVar(
+    "flowerpower_pipeline_params", default=None
+)
+
+
+@contextmanager
+def provide_params(name: str, h_params: DictNamespace) -> Iterator[None]:
+    """Bind ``h_params`` for pipeline ``name`` while its module is imported.
+
+    Args:
+        name: Pipeline name.
+        h_params: Resolved Hamilton parameters of the pipeline config.
+    """
+    token = _ACTIVE_PARAMS.set((format_pipeline_file_path(name), h_params))
+    try:
+        yield
+    finally:
+        _ACTIVE_PARAMS.reset(token)
+
+
+def _load_from_disk(name: str | None) -> DictNamespace:
+    from ..cfg import Config
+
+    return Config.load(pipeline_name=name).pipeline.h_params
+
+
+def params(
+    name: str | None = None,
+    *,
+    fallback: Callable[[], DictNamespace] | None = None,
+) -> DictNamespace:
+    """Return the parameters of the pipeline module being imported.
+
+    Args:
+        name: Pipeline name. When omitted, the parameters bound by the loader
+            are returned regardless of which pipeline they belong to.
+        fallback: Called when no parameters are bound, e.g. because the
+            module is imported standalone. Defaults to ``Config.load`` from
+            the current working directory.
+
+    Returns:
+        DictNamespace: Hamilton-formatted pipeline parameters.
+    """
+    active = _ACTIVE_PARAMS.get()
+    if active is not None and (
+        name is None or format_pipeline_file_path(name) == active[0]
+    ):
+        return active[1]
+
+    logger.debug(f"No injected params for pipeline '{name}', loading config from disk")
+    if fallback is not None:
+        return fallback()
+    return _load_from_disk(name)
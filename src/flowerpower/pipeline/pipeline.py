@@ -26,6 +26,7 @@ class Pipeline(msgspec.Struct):
     config: PipelineConfig
     module: Any
     project_context: FlowerPowerProject
+    project_name: str | None = None
     _adapter_manager: Any = None
     _executor_factory: Any = None
     _runner: PipelineRunner | None = None
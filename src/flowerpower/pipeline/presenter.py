@@ -1,7 +1,10 @@
 """Pipeline Presenter for Rich rendering of pipeline information."""
 
+import datetime as dt
+from collections.abc import Iterable
 from typing import Any
 
+import humanize
 import rich
 from rich.console import Console
 from rich.panel import Panel
@@ -99,8 +102,43 @@ class PipelinePresenter:
         Returns:
             str | None: HTML or SVG string if export is requested, otherwise None.
         """
-        project_summary = summary.get("project", {})
-        pipeline_summary = summary.get("pipelines", {})
+        return self.show_summary_stream(
+            summary.get("pipelines", {}).items(),
+            project_summary=summary.get("project", {}),
+            cfg=cfg,
+            code=code,
+            project=project,
+            to_html=to_html,
+            to_svg=to_svg,
+        )
+
+    def show_summary_stream(
+        self,
+        pipelines: Iterable[tuple[str, dict[str, Any]]],
+        project_summary: dict[str, Any] | None = None,
+        cfg: bool = True,
+        code: bool = True,
+        project: bool = True,
+        to_html: bool = False,
+        to_svg: bool = False,
+    ) -> str | None:
+        """Render pipeline summaries as they are produced.
+
+        Each pipeline is printed as soon as the iterable yields it, e.g. from
+        :meth:`PipelineCatalog.iter_summary`.
+
+        Args:
+            pipelines: ``(name, summary)`` pairs.
+            project_summary: Project configuration dictionary, if any.
+            cfg: Whether configuration was included in the summary.
+            code: Whether code/module was included in the summary.
+            project: Whether project info was included in the summary.
+            to_html: Whether to export to HTML. Defaults to False.
+            to_svg: Whether to export to SVG. Defaults to False.
+
+        Returns:
+            str | None: HTML or SVG string if export is requested, otherwise None.
+        """
 
         def add_dict_to_tree(tree: Tree, dict_data: dict) -> None:
             """Recursively add dictionary items to a tree."""
@@ -131,7 +169,7 @@ class PipelinePresenter:
             )
             target_console.print("\n")
 
-        for pipeline, info in pipeline_summary.items():
+        for pipeline, info in pipelines:
             if cfg and "cfg" in info:
                 # Create tree for config
                 config_tree = Tree("📋 Pipeline Configuration", style="bold magenta")
@@ -179,6 +217,158 @@ class PipelinePresenter:
             # Normal rendering already done to self._console
             return None
 
+    def show_node_matches(self, matches: list[Any]) -> None:
+        """Render node search results as a table.
+
+        Args:
+            matches: :class:`~flowerpower.pipeline.node_index.NodeMatch` hits.
+        """
+        if not matches:
+            rich.print("[yellow]No matching nodes found[/yellow]")
+            return
+
+        table = Table(title="Matching Nodes")
+        table.add_column("Pipeline", style="blue")
+        table.add_column("Role", style="magenta")
+        table.add_column("Node", style="green")
+        table.add_column("Variant", style="cyan")
+        table.add_column("Tags", style="cyan")
+        table.add_column("Location", style="dim")
+
+        for match in matches:
+            node = match.node
+            label = node.name
+            if node.function != node.name:
+                label = f"{node.name} ({node.function})"
+            table.add_row(
+                match.pipeline,
+                match.role,
+                label,
+                node.when or "",
+                ", ".join(f"{key}={value}" for key, value in node.tags.items()),
+                f"{match.module_file}:{node.lineno}",
+            )
+
+        self._console.print(table)
+
+    def show_profile(self, profile: Any, top: int | None = None) -> None:
+        """Render per-node timings, slowest first.
+
+        Args:
+            profile: :class:`~flowerpower.pipeline.profiling.RunProfile`.
+            top: Show only the ``top`` slowest nodes.
+        """
+        stats = profile.stats()
+        if not stats:
+            rich.print("[yellow]No node timings recorded[/yellow]")
+            return
+
+        table = Table(title=f"Node Profile ({profile.wall_ns / 1e6:.1f} ms total)")
+        table.add_column("Node", style="green")
+        table.add_column("Calls", justify="right")
+        table.add_column("Wall (ms)", justify="right", style="magenta")
+        table.add_column("CPU (ms)", justify="right", style="cyan")
+        table.add_column("Max (ms)", justify="right")
+        table.add_column("Share", justify="right", style="bold")
+        memory = profile.has_memory
+        if memory:
+            table.add_column("Peak alloc", justify="right", style="red")
+            table.add_column("RSS Δ", justify="right", style="red")
+            table.add_column("Output", justify="right", style="cyan")
+
+        def size(value: int | None) -> str:
+            if value is None:
+                return "-"
+            sign = "-" if value < 0 else ""
+            return sign + humanize.naturalsize(abs(value))
+
+        for stat in stats[:top] if top else stats:
+            row = [
+                stat.name,
+                str(stat.calls),
+                f"{stat.wall_ns / 1e6:.2f}",
+                f"{stat.cpu_ns / 1e6:.2f}",
+                f"{stat.max_wall_ns / 1e6:.2f}",
+                f"{stat.share:.1%}",
+            ]
+            if memory:
+                row += [
+                    size(stat.max_peak_bytes),
+                    size(stat.max_rss_delta),
+                    size(stat.max_output_bytes),
+                ]
+            table.add_row(*row)
+
+        self._console.print(table)
+
+    def show_history(self, stats: Any, runs: list[Any]) -> None:
+        """Render run-time percentiles, node summaries and recent runs.
+
+        Args:
+            stats: :class:`~flowerpower.pipeline.history.RunStats`.
+            runs: Recent :class:`~flowerpower.pipeline.history.RunRecord` s.
+        """
+        if not stats.runs:
+            rich.print(f"[yellow]No recorded runs of '{stats.pipeline}'[/yellow]")
+            return
+
+        summary = Table(
+            title=f"Run History: {stats.pipeline} "
+            f"({stats.runs} runs, {stats.success_rate:.0%} successful)"
+        )
+        for column in ("p50", "p90", "p95", "p99", "min", "mean", "max"):
+            summary.add_column(f"{column} (s)", justify="right", style="magenta")
+        summary.add_column("Trend", justify="right", style="bold")
+        durations = stats.durations
+        trend = "n/a" if stats.trend is None else f"{stats.trend:+.1%}"
+        summary.add_row(
+            *(
+                f"{durations[key]:.3f}" if key in durations else "-"
+                for key in ("p50", "p90", "p95", "p99", "min", "mean", "max")
+            ),
+            trend,
+        )
+        self._console.print(summary)
+
+        if stats.nodes:
+            nodes = Table(title="Nodes (successful runs)")
+            nodes.add_column("Node", style="green")
+            nodes.add_column("Calls", justify="right")
+            nodes.add_column("p50 (ms)", justify="right", style="magenta")
+            nodes.add_column("p95 (ms)", justify="right", style="magenta")
+            nodes.add_column("Mean output", justify="right", style="cyan")
+            for node in stats.nodes:
+                nodes.add_row(
+                    node.node,
+                    str(node.calls),
+                    f"{node.p50 * 1000:.2f}",
+                    f"{node.p95 * 1000:.2f}",
+                    "-"
+                    if node.mean_output_size is None
+                    else humanize.naturalsize(node.mean_output_size),
+                )
+            self._console.print(nodes)
+
+        recent = Table(title="Recent Runs")
+        recent.add_column("Started", style="green")
+        recent.add_column("Run ID")
+        recent.add_column("Status")
+        recent.add_column("Attempts", justify="right")
+        recent.add_column("Duration (s)", justify="right", style="magenta")
+        recent.add_column("Config", style="dim")
+        for run in runs:
+            recent.add_row(
+                dt.datetime.fromtimestamp(run.started_at).strftime("%Y-%m-%d %H:%M:%S"),
+                run.run_id,
+                "[green]success[/green]"
+                if run.status == "success"
+                else f"[red]{run.status}[/red]",
+                str(run.attempts),
+                f"{run.duration:.3f}",
+                run.config_hash,
+            )
+        self._console.print(recent)
+
     def print_no_pipelines_found(self) -> None:
         """Print a message when no pipelines are found."""
         rich.print("[yellow]No pipelines found[/yellow]")
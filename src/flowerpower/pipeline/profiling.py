@@ -0,0 +1,383 @@
+"""Per-node timing of pipeline runs.
+
+:class:`NodeProfiler` is a Hamilton lifecycle adapter that records, for every
+executed node, its wall and CPU time, start/end offsets from the beginning of
+the run, and the executing thread and process.  Each hook does two clock reads
+and one dict operation, so the adapter can stay enabled on real workloads.
+
+Enable it for a run with ``with_adapter: {profiler: true}`` (a summary of the
+slowest nodes is logged when the run finishes), or pass an instance through
+``adapter={"profiler": NodeProfiler()}`` to inspect :attr:`NodeProfiler.profile`
+afterwards, which is what ``flowerpower pipeline profile`` does.
+
+With ``memory=True`` (``with_adapter: {memory_profiler: true}`` or
+``flowerpower pipeline profile --memory``) each node additionally records the
+change in process RSS, the peak of Python allocations traced by
+:mod:`tracemalloc` above the level at node start, and the estimated size of
+its output.  Tracing allocations slows allocation-heavy code down noticeably,
+so this mode is opt-in.  RSS and the allocation peak are process-wide: when
+nodes overlap on a thread pool, each overlapping node is charged with the
+peak reached while it ran, an upper bound of its own usage.
+
+Nodes executed by process-based executors (``processpool``, ``ray``, ...) run
+in other interpreters; their hooks do not report back and they are missing
+from the profile.
+"""
+
+from __future__ import annotations
+
+import os
+import threading
+import time
+import tracemalloc
+from dataclasses import dataclass, field
+from typing import Any
+
+import humanize
+from hamilton.lifecycle import api
+from loguru import logger
+
+from .history import estimate_size
+
+try:
+    import psutil
+except ImportError:  # pragma: no cover - depends on optional extra
+    psutil = None
+
+__all__ = ["NodeProfiler", "NodeStats", "NodeTiming", "RunProfile", "current_rss"]
+
+SPEEDSCOPE_SCHEMA = "https://www.speedscope.app/file-format-schema.json"
+
+
+@dataclass(frozen=True)
+class NodeTiming:
+    """One execution of a node.
+
+    Attributes:
+        name: Node name.
+        task_id: Hamilton task ID with dynamic execution, else ``None``.
+        start_ns: Start offset from the beginning of the run.
+        end_ns: End offset from the beginning of the run.
+        cpu_ns: CPU time of the executing thread.
+        thread_id: Executing thread.
+        process_id: Executing process.
+        success: Whether the node returned without raising.
+        rss_delta: Change in process RSS in bytes (memory mode only).
+        peak_bytes: Peak traced allocations above the level at node start
+            in bytes (memory mode only).
+        output_bytes: Estimated size of the node output in bytes (memory
+            mode only).
+    """
+
+    name: str
+    task_id: str | None
+    start_ns: int
+    end_ns: int
+    cpu_ns: int
+    thread_id: int
+    process_id: int
+    success: bool = True
+    rss_delta: int | None = None
+    peak_bytes: int | None = None
+    output_bytes: int | None = None
+
+    @property
+    def wall_ns(self) -> int:
+        return self.end_ns - self.start_ns
+
+
+@dataclass(frozen=True)
+class NodeStats:
+    """Timings of one node aggregated over a run.
+
+    The memory figures are maxima over the node's calls and ``None`` when
+    the run was profiled without memory mode.
+    """
+
+    name: str
+    calls: int
+    wall_ns: int
+    cpu_ns: int
+    max_wall_ns: int
+    share: float
+    max_rss_delta: int | None = None
+    max_peak_bytes: int | None = None
+    max_output_bytes: int | None = None
+
+    @property
+    def mean_wall_ns(self) -> float:
+        return self.wall_ns / self.calls if self.calls else 0.0
+
+
+@dataclass
+class RunProfile:
+    """Node timings of one pipeline run.
+
+    Attributes:
+        run_id: Hamilton run ID.
+        wall_ns: Duration of the whole run (graph start to end).
+        timings: Node executions in completion order.
+        success: Whether the run succeeded; ``None`` while it is running.
+    """
+
+    run_id: str | None = None
+    wall_ns: int = 0
+    timings: list[NodeTiming] = field(default_factory=list)
+    success: bool | None = None
+
+    def stats(self) -> list[NodeStats]:
+        """Per-node totals, slowest (by total wall time) first."""
+        grouped: dict[str, list[NodeTiming]] = {}
+        for timing in self.timings:
+            grouped.setdefault(timing.name, []).append(timing)
+        total = self.wall_ns or sum(t.wall_ns for t in self.timings) or 1
+        stats = [
+            NodeStats(
+                name=name,
+                calls=len(runs),
+                wall_ns=sum(t.wall_ns for t in runs),
+                cpu_ns=sum(t.cpu_ns for t in runs),
+                max_wall_ns=max(t.wall_ns for t in runs),
+                share=sum(t.wall_ns for t in runs) / total,
+                max_rss_delta=_max_of(t.rss_delta for t in runs),
+                max_peak_bytes=_max_of(t.peak_bytes for t in runs),
+                max_output_bytes=_max_of(t.output_bytes for t in runs),
+            )
+            for name, runs in grouped.items()
+        ]
+        return sorted(stats, key=lambda s: s.wall_ns, reverse=True)
+
+    @property
+    def has_memory(self) -> bool:
+        """Whether the timings carry memory measurements."""
+        return any(t.peak_bytes is not None for t in self.timings)
+
+    def to_chrome_trace(self) -> dict[str, Any]:
+        """Return the profile in Chrome trace event format.
+
+        Load the JSON in ``chrome://tracing`` or https://ui.perfetto.dev.
+        """
+        return {
+            "displayTimeUnit": "ms",
+            "traceEvents": [
+                {
+                    "name": t.name,
+                    "cat": "node",
+                    "ph": "X",
+                    "ts": t.start_ns / 1000,
+                    "dur": t.wall_ns / 1000,
+                    "pid": t.process_id,
+                    "tid": t.thread_id,
+                    "args": {
+                        "cpu_ms": t.cpu_ns / 1e6,
+                        "task_id": t.task_id,
+                        "success": t.success,
+                        **(
+                            {
+                                "rss_delta": t.rss_delta,
+                                "peak_bytes": t.peak_bytes,
+                                "output_bytes": t.output_bytes,
+                            }
+                            if t.peak_bytes is not None
+                            else {}
+                        ),
+                    },
+                }
+                for t in sorted(self.timings, key=lambda t: t.start_ns)
+            ],
+        }
+
+    def to_speedscope(self, name: str = "flowerpower") -> dict[str, Any]:
+        """Return the profile in speedscope's evented format, one lane per thread."""
+        frames: dict[str, int] = {}
+        lanes: dict[tuple[int, int], list[NodeTiming]] = {}
+        for timing in self.timings:
+            frames.setdefault(timing.name, len(frames))
+            lanes.setdefault((timing.process_id, timing.thread_id), []).append(timing)
+
+        end = max((t.end_ns for t in self.timings), default=0)
+        profiles = []
+        for (pid, tid), timings in sorted(lanes.items()):
+            events = [
+                event
+                for t in timings
+                for event in (
+                    (t.start_ns, 1, {"type": "O", "frame": frames[t.name]}),
+                    (t.end_ns, 0, {"type": "C", "frame": frames[t.name]}),
+                )
+            ]
+            profiles.append(
+                {
+                    "type": "evented",
+                    "name": f"pid {pid} thread {tid}",
+                    "unit": "nanoseconds",
+                    "startValue": 0,
+                    "endValue": max(self.wall_ns, end),
+                    "events": [
+                        {**event, "at": at}
+                        for at, _, event in sorted(events, key=lambda e: e[:2])
+                    ],
+                }
+            )
+        return {
+            "$schema": SPEEDSCOPE_SCHEMA,
+            "name": name,
+            "exporter": "flowerpower",
+            "shared": {"frames": [{"name": frame} for frame in frames]},
+            "profiles": profiles,
+        }
+
+
+def _max_of(values: Any) -> int | None:
+    measured = [value for value in values if value is not None]
+    return max(measured) if measured else None
+
+
+def current_rss() -> int | None:
+    """Resident set size of this process in bytes, if it can be read."""
+    if psutil is not None:
+        return psutil.Process().memory_info().rss
+    try:
+        with open("/proc/self/statm", "rb") as statm:
+            return int(statm.read().split()[1]) * os.sysconf("SC_PAGE_SIZE")
+    except (OSError, ValueError, IndexError):
+        return None
+
+
+class NodeProfiler(api.NodeExecutionHook, api.GraphExecutionHook):
+    """Hamilton adapter recording per-node wall/CPU time.
+
+    Args:
+        log_top: Number of slowest nodes to log when a run finishes; ``0``
+            disables the summary.
+        memory: Also record RSS deltas, :mod:`tracemalloc` peaks and output
+            sizes per node.  Starts ``tracemalloc`` for the run unless it is
+            already tracing.
+    """
+
+    def __init__(self, log_top: int = 10, memory: bool = False) -> None:
+        self.log_top = log_top
+        self.memory = memory
+        self.profile = RunProfile()
+        self._origin: int | None = None
+        self._open: dict[tuple[str | None, str, int], tuple[int, int]] = {}
+        # Memory mode: open node -> [rss at start, traced at start, peak seen].
+        self._memory_lock = threading.Lock()
+        self._memory_open: dict[tuple[str | None, str, int], list[Any]] = {}
+        self._started_tracing = False
+
+    def run_before_graph_execution(self, *, run_id: str, **future_kwargs: Any) -> None:
+        self.profile = RunProfile(run_id=run_id)
+        self._open.clear()
+        self._memory_open.clear()
+        if self.memory and not tracemalloc.is_tracing():
+            tracemalloc.start()
+            self._started_tracing = True
+        self._origin = time.perf_counter_ns()
+
+    def run_after_graph_execution(
+        self, *, success: bool, run_id: str, **future_kwargs: Any
+    ) -> None:
+        if self._origin is not None:
+            self.profile.wall_ns = time.perf_counter_ns() - self._origin
+        self.profile.success = success
+        if self._started_tracing:
+            tracemalloc.stop()
+            self._started_tracing = False
+        if self.log_top:
+            self._log_summary()
+
+    def run_before_node_execution(
+        self, *, node_name: str, task_id: str | None, **future_kwargs: Any
+    ) -> None:
+        key = (task_id, node_name, threading.get_ident())
+        if self.memory:
+            self._memory_start(key)
+        now = time.perf_counter_ns()
+        if self._origin is None:
+            self._origin = now
+        self._open[key] = (now, time.thread_time_ns())
+
+    def run_after_node_execution(
+        self,
+        *,
+        node_name: str,
+        success: bool,
+        task_id: str | None,
+        result: Any = None,
+        **future_kwargs: Any,
+    ) -> None:
+        end, cpu_end = time.perf_counter_ns(), time.thread_time_ns()
+        thread_id = threading.get_ident()
+        key = (task_id, node_name, thread_id)
+        started = self._open.pop(key, None)
+        if started is None:
+            return
+        memory: dict[str, int | None] = {}
+        if self.memory:
+            memory = self._memory_end(key)
+            if success:
+                memory["output_bytes"] = estimate_size(result, deep=True)
+        start, cpu_start = started
+        self.profile.timings.append(
+            NodeTiming(
+                name=node_name,
+                task_id=task_id,
+                start_ns=start - self._origin,
+                end_ns=end - self._origin,
+                cpu_ns=cpu_end - cpu_start,
+                thread_id=thread_id,
+                process_id=os.getpid(),
+                success=success,
+                **memory,
+            )
+        )
+
+    def _fold_peak(self) -> None:
+        """Charge the traced peak since the last reset to every open node."""
+        peak = tracemalloc.get_traced_memory()[1]
+        for state in self._memory_open.values():
+            state[2] = max(state[2], peak)
+        tracemalloc.reset_peak()
+
+    def _memory_start(self, key: tuple[str | None, str, int]) -> None:
+        rss = current_rss()
+        with self._memory_lock:
+            tracing = tracemalloc.is_tracing()
+            if tracing:
+                self._fold_peak()
+            traced = tracemalloc.get_traced_memory()[0] if tracing else 0
+            self._memory_open[key] = [rss, traced, traced]
+
+    def _memory_end(self, key: tuple[str | None, str, int]) -> dict[str, int | None]:
+        with self._memory_lock:
+            tracing = tracemalloc.is_tracing()
+            if tracing:
+                self._fold_peak()
+            state = self._memory_open.pop(key, None)
+        rss = current_rss()
+        if state is None:
+            return {}
+        rss_start, traced_start, peak = state
+        return {
+            "rss_delta": rss - rss_start
+            if rss is not None and rss_start is not None
+            else None,
+            "peak_bytes": max(peak - traced_start, 0) if tracing else None,
+        }
+
+    def _log_summary(self) -> None:
+        stats = self.profile.stats()[: self.log_top]
+        lines = ", ".join(
+            f"{s.name} {s.wall_ns / 1e6:.1f} ms ({s.share:.0%})"
+            + (
+                f", peak {humanize.naturalsize(s.max_peak_bytes)}"
+                if s.max_peak_bytes is not None
+                else ""
+            )
+            for s in stats
+        )
+        logger.info(
+            f"Run {self.profile.run_id} took {self.profile.wall_ns / 1e6:.1f} ms; "
+            f"slowest nodes: {lines or '<none>'}"
+        )
@@ -8,18 +8,17 @@ normalization is handled by the shared :class:`PipelineModuleResolver`.
 """
 
 import posixpath
-from enum import Enum
-from typing import TYPE_CHECKING, Any
+from collections.abc import Iterator
+from typing import TYPE_CHECKING, Any, Callable
 import rich
 
 from fsspeckit import AbstractFileSystem, filesystem
 
 from ..cfg import ProjectConfig
-from ..settings import CONFIG_DIR, LOG_LEVEL, PIPELINES_DIR
+from ..settings import CONFIG_DIR, PIPELINES_DIR, WATCH_INTERVAL
 from ..utils.filesystem import (
     add_modules_path,
 )
-from ..utils.logging import setup_logging
 from ..utils.security import (
     validate_directory_fragment,
     validate_file_path,
@@ -28,11 +27,16 @@ from ..utils.security import (
 from ..utils.templates import HOOK_TEMPLATE__MQTT_BUILD_CONFIG
 
 # Import base utilities
+from .bundle import ProjectBundle
 from .catalog import PipelineCatalog
+from .catalog_index import CatalogIndex
 from .config_manager import PipelineConfigManager
+from .hook_types import HookType
 from .loader import CachedPipelineData, PipelineLoader
+from .node_index import NodeMatch
 from .module_resolver import PipelineModuleResolver
 from .presenter import PipelinePresenter
+from .watcher import PipelineWatcher, WatchChanges
 
 if TYPE_CHECKING:
     from ..flowerpower import FlowerPowerProject
@@ -41,19 +45,6 @@ if TYPE_CHECKING:
 __all__ = ["CachedPipelineData", "HookType", "PipelineRegistry"]
 
 
-setup_logging(level=LOG_LEVEL)
-
-
-class HookType(str, Enum):
-    MQTT_BUILD_CONFIG = "mqtt-build-config"
-
-    def default_function_name(self) -> str:
-        return self.value.replace("-", "_")
-
-    def __str__(self) -> str:
-        return self.value
-
-
 class PipelineRegistry:
     """Compatibility facade over catalog, loader, and resolver responsibilities.
 
@@ -77,6 +68,7 @@ class PipelineRegistry:
         config_manager: "PipelineConfigManager | None" = None,
         cfg_dir: str = CONFIG_DIR,
         pipelines_dir: str = PIPELINES_DIR,
+        catalog_index_path: str | None = None,
     ):
         """
         Initializes the PipelineRegistry.
@@ -90,6 +82,8 @@ class PipelineRegistry:
                 If not provided, one is automatically instantiated.
             cfg_dir: Configuration directory name.
             pipelines_dir: Pipelines directory name.
+            catalog_index_path: Optional path of the persistent catalog index
+                used for pipeline discovery.
         """
         self._fs = fs
         if config_manager is not None:
@@ -135,11 +129,16 @@ class PipelineRegistry:
             project_cfg=project_cfg,
             config_provider=self._loader.load_config,
             project_cfg_provider=lambda: self._loader.project_cfg,
+            bundle_provider=self._active_bundle,
+            index_path=catalog_index_path,
         )
 
         # Presenter for all Rich rendering
         self._presenter = PipelinePresenter()
 
+        # Optional file watcher driving targeted cache invalidation
+        self._watcher: PipelineWatcher | None = None
+
         # Sync project state through the loader
         self._sync_project_state()
 
@@ -153,6 +152,7 @@ class PipelineRegistry:
         *,
         project_cfg: ProjectConfig,
         config_manager: "PipelineConfigManager | None" = None,
+        catalog_index_path: str | None = None,
     ) -> "PipelineRegistry":
         """Create a registry from project runtime context facts."""
         return cls(
@@ -163,6 +163,7 @@ class PipelineRegistry:
             config_manager=config_manager,
             cfg_dir=context.cfg_dir,
             pipelines_dir=context.pipelines_dir,
+            catalog_index_path=catalog_index_path,
         )
 
     # --- Delegating properties (compatibility with historical internals) ---
@@ -262,6 +263,11 @@ class PipelineRegistry:
             pipelines_dir=pipelines_dir,
         )
 
+    def _active_bundle(self) -> ProjectBundle | None:
+        """Return the compiled bundle the config manager is serving, if any."""
+        bundle = getattr(self._config_manager, "bundle", None)
+        return bundle if isinstance(bundle, ProjectBundle) else None
+
     # --- Loader delegation (config/module/pipeline cache) ---
 
     def _sync_project_state(self) -> None:
@@ -329,6 +335,56 @@ class PipelineRegistry:
         """
         self._loader.clear_cache(name)
 
+    def watch(
+        self,
+        on_change: Callable[[WatchChanges], None] | None = None,
+        interval: float = WATCH_INTERVAL,
+        backend: str = "auto",
+    ) -> PipelineWatcher:
+        """Watch pipeline, config, and hook files and invalidate stale caches.
+
+        Changes are applied to the loader cache before ``on_change`` runs, so
+        only the pipelines touched on disk are reloaded on their next use.
+
+        Args:
+            on_change: Optional callback receiving each :class:`WatchChanges`.
+            interval: Polling interval in seconds.
+            backend: ``"auto"``, ``"inotify"``, or ``"poll"``.
+
+        Returns:
+            The running :class:`PipelineWatcher`.
+        """
+        self.unwatch()
+        self._config_manager.discard_bundle("watching project files")
+
+        def handle(changes: WatchChanges) -> None:
+            self._loader.apply_changes(changes)
+            if on_change is not None:
+                on_change(changes)
+
+        watcher = PipelineWatcher(
+            self._fs,
+            cfg_dir=self._cfg_dir,
+            pipelines_dir=self._pipelines_dir,
+            hooks_dir=self._hooks_dir,
+            on_change=handle,
+            interval=interval,
+            backend=backend,
+        )
+        self._watcher = watcher.start()
+        # Project config edits now arrive as watch events; no stat is needed
+        # on cache hits while the watcher runs.
+        self._project_cfg_ttl = self._loader.project_cfg_ttl
+        self._loader.project_cfg_ttl = float("inf")
+        return self._watcher
+
+    def unwatch(self) -> None:
+        """Stop the file watcher started by :meth:`watch`, if any."""
+        if self._watcher is not None:
+            self._watcher.stop()
+            self._watcher = None
+            self._loader.project_cfg_ttl = self._project_cfg_ttl
+
     # --- Catalog delegation (discovery, listing, summaries) ---
 
     def _get_files(self) -> list[str]:
@@ -351,6 +407,32 @@ class PipelineRegistry:
         """Collect metadata for all pipelines. Delegates to :class:`PipelineCatalog`."""
         return self._catalog.collect_pipeline_info()
 
+    def search_nodes(
+        self, node: str | None = None, tags: dict[str, str] | None = None
+    ) -> list[NodeMatch]:
+        """Find nodes across pipelines. Delegates to :class:`PipelineCatalog`.
+
+        Args:
+            node: Node name to look up.
+            tags: Tag filter, e.g. ``{"owner": "data"}``.
+
+        Returns:
+            list[NodeMatch]: Matching nodes ordered by pipeline.
+        """
+        return self._catalog.search_nodes(node=node, tags=tags)
+
+    def show_node_matches(self, matches: list[NodeMatch]) -> None:
+        """Print node search results. Delegates to :class:`PipelinePresenter`."""
+        self._presenter.show_node_matches(matches)
+
+    def rebuild_catalog_index(self) -> CatalogIndex:
+        """Rebuild the persistent catalog index. Delegates to :class:`PipelineCatalog`.
+
+        Returns:
+            CatalogIndex: The rebuilt index.
+        """
+        return self._catalog.rebuild_index()
+
     def get_summary(
         self,
         name: str | None = None,
@@ -382,6 +464,19 @@ class PipelineRegistry:
             name=name, cfg=cfg, code=code, project=project
         )
 
+    def iter_summary(
+        self, name: str | None = None, **kwargs: Any
+    ) -> Iterator[tuple[str, dict[str, Any]]]:
+        """Yield pipeline summaries lazily. Delegates to :class:`PipelineCatalog`.
+
+        Args:
+            name: Summarize only this pipeline.  Defaults to all pipelines.
+            **kwargs: Forwarded to :meth:`PipelineCatalog.iter_summary`
+                (``fields``, ``page_size``, ``offset``, ``limit``,
+                ``max_workers``).
+        """
+        return self._catalog.iter_summary(name, **kwargs)
+
     def list_pipeline_info(self) -> list[dict[str, Any]]:
         """Get metadata for all available pipelines.
 
@@ -418,18 +513,31 @@ class PipelineRegistry:
         project: bool = True,
         to_html: bool = False,
         to_svg: bool = False,
+        limit: int | None = None,
+        offset: int = 0,
     ) -> None | str:
         """Show a Rich-rendered summary of pipelines.
 
-        Delegates to :class:`PipelinePresenter` for all rendering.
+        Pipelines are fetched page by page via :meth:`iter_summary` and printed
+        as they arrive. Delegates to :class:`PipelinePresenter` for all
+        rendering.
+
+        Args:
+            limit: Maximum number of pipelines to show.
+            offset: Number of pipelines to skip.
 
         Returns:
             None | str: HTML/SVG string when export is requested, otherwise None.
         """
-        summary = self.get_summary(name=name, cfg=cfg, code=code, project=project)
-        return self._presenter.show_summary(
-            summary, cfg=cfg, code=code, project=project,
-            to_html=to_html, to_svg=to_svg,
+        fields = [field for field, wanted in (("cfg", cfg), ("code", code)) if wanted]
+        return self._presenter.show_summary_stream(
+            self.iter_summary(name, fields=fields, limit=limit, offset=offset),
+            project_summary=self._catalog.project_summary() if project else None,
+            cfg=cfg,
+            code=code,
+            project=project,
+            to_html=to_html,
+            to_svg=to_svg,
         )
 
     def show_pipelines(self) -> None:
@@ -465,6 +573,7 @@ class PipelineRegistry:
         as the lifecycle entry point.
         """
         self._creator().new(name=name, overwrite=overwrite)
+        self._config_manager.discard_bundle(f"pipeline '{name}' created")
 
     def delete(self, name: str, cfg: bool = True, module: bool = False) -> None:
         """Delete a pipeline.
@@ -473,6 +582,7 @@ class PipelineRegistry:
         as the lifecycle entry point.
         """
         self._creator().delete(name=name, cfg=cfg, module=module)
+        self._config_manager.discard_bundle(f"pipeline '{name}' deleted")
 
     def create_pipeline(self, name: str, overwrite: bool = False) -> None:
         """Backward-compatible alias for :meth:`new`."""
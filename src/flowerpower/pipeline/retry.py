@@ -27,6 +27,7 @@ class RetryManager:
         retry_exceptions: Tuple[Type[BaseException], ...],
         sleep: Callable[[float], None] = time.sleep,
         rng: Callable[[], float] = random.random,
+        on_retry: Callable[[int, BaseException], None] | None = None,
     ) -> None:
         self._max_retries = max(0, max_retries)
         self._retry_delay = max(0.0, retry_delay)
@@ -34,6 +35,7 @@ class RetryManager:
         self._retry_exceptions = retry_exceptions or (Exception,)
         self._sleep = sleep
         self._rng = rng
+        self._on_retry = on_retry
 
     def execute(
         self,
@@ -75,6 +77,8 @@ class RetryManager:
                         "🔄 Retrying in {delay:.2f} seconds...",
                         delay=total_delay,
                     )
+                    if self._on_retry is not None:
+                        self._on_retry(attempt + 1, error)
                     self._sleep(total_delay)
                     continue
 
@@ -129,6 +133,8 @@ class RetryManager:
                         "🔄 Retrying in {delay:.2f} seconds...",
                         delay=total_delay,
                     )
+                    if self._on_retry is not None:
+                        self._on_retry(attempt + 1, error)
                     await self._sleep_async(total_delay)
                     continue
 
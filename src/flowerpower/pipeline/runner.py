@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+from contextlib import ExitStack, nullcontext
 from types import ModuleType
 from typing import TYPE_CHECKING, Any
 
@@ -18,9 +19,13 @@ from ..utils.config import (
     validate_resolved_run_config,
 )
 from ..utils.logging import ensure_logging_initialized, setup_logging
+from ..utils.misc import DictNamespace
 from .adapter_provider import AdapterProvider, ResolvedAdapterSet
 from .execution_context import ExecutionContextBuilder
+from .history import HistoryRecorder, config_hash, history_enabled
+from .metrics import MetricsAdapter, get_metrics, metrics_enabled, observe_run
 from .module_resolver import PipelineModuleResolver
+from .params import provide_params
 from .retry import RetryManager
 
 if TYPE_CHECKING:
@@ -55,17 +60,21 @@ class PipelineRunner:
         if configured_run.log_level:
             setup_logging(level=configured_run.log_level)
 
-        retry_manager = self._create_retry_manager(configured_run)
+        recorder = self._history_recorder(configured_run)
+        retry_manager = self._create_retry_manager(configured_run, recorder)
 
         def operation() -> dict[str, Any]:
-            return self._execute_sync(context_builder, configured_run, adapter_set, modules)
+            return self._execute_sync(
+                context_builder, configured_run, adapter_set, modules, recorder
+            )
 
-        return retry_manager.execute(
-            operation=operation,
-            on_success=configured_run.on_success,
-            on_failure=configured_run.on_failure,
-            context_name=self._pipeline.name,
-        )
+        with self._observe_run(recorder):
+            return retry_manager.execute(
+                operation=operation,
+                on_success=configured_run.on_success,
+                on_failure=configured_run.on_failure,
+                context_name=self._pipeline.name,
+            )
 
     async def run_async(
         self,
@@ -82,7 +91,8 @@ class PipelineRunner:
 
         if configured_run.log_level:
             setup_logging(level=configured_run.log_level)
-        retry_manager = self._create_retry_manager(configured_run)
+        recorder = self._history_recorder(configured_run)
+        retry_manager = self._create_retry_manager(configured_run, recorder)
 
         use_async_driver = configured_run.async_driver
         if use_async_driver is None:
@@ -102,14 +112,16 @@ class PipelineRunner:
                 adapter_set,
                 modules,
                 async_driver_module,
+                recorder,
             )
 
-        return await retry_manager.execute_async(
-            operation=operation_async,
-            on_success=configured_run.on_success,
-            on_failure=configured_run.on_failure,
-            context_name=self._pipeline.name,
-        )
+        with self._observe_run(recorder):
+            return await retry_manager.execute_async(
+                operation=operation_async,
+                on_success=configured_run.on_success,
+                on_failure=configured_run.on_failure,
+                context_name=self._pipeline.name,
+            )
 
     def _prepare_run_config(
         self, run_config: RunConfig | None, overrides: dict[str, Any]
@@ -136,27 +148,83 @@ class PipelineRunner:
             construct_runtime=False,
         )
 
-    def _create_retry_manager(self, run_config: RunConfig) -> RetryManager:
+    def _create_retry_manager(
+        self, run_config: RunConfig, recorder: HistoryRecorder | None = None
+    ) -> RetryManager:
         retry_cfg = run_config.retry or self._pipeline.config.run.retry
         retry_config = retry_cfg
+        labels = self._metrics_labels()
+
+        def on_retry(attempt: int, error: BaseException) -> None:
+            if labels is not None:
+                get_metrics().retries.inc(**labels)
+            if recorder is not None:
+                recorder.on_retry(attempt, error)
+
         return RetryManager(
             max_retries=retry_config.max_retries,
             retry_delay=retry_config.retry_delay,
             jitter_factor=retry_config.jitter_factor,
             retry_exceptions=tuple(retry_config.retry_exceptions),
+            on_retry=on_retry if labels is not None or recorder else None,
+        )
+
+    def _history_recorder(self, run_config: RunConfig) -> HistoryRecorder | None:
+        """Recorder adding this run to the run history, or ``None`` when off."""
+        if not history_enabled():
+            return None
+        return HistoryRecorder(
+            project=getattr(self._pipeline, "project_name", None) or "",
+            pipeline=self._pipeline.name,
+            config_hash=config_hash(
+                getattr(self._pipeline.config, "params", None),
+                run_config.config,
+                run_config.final_vars,
+                run_config.executor.type,
+            ),
         )
 
+    def _metrics_labels(self) -> dict[str, str] | None:
+        """Metric labels of this pipeline, or ``None`` when metrics are off."""
+        if not metrics_enabled():
+            return None
+        return {
+            "project": getattr(self._pipeline, "project_name", None) or "",
+            "pipeline": self._pipeline.name,
+        }
+
+    def _observe_run(self, recorder: HistoryRecorder | None = None) -> ExitStack:
+        stack = ExitStack()
+        labels = self._metrics_labels()
+        if labels is not None:
+            stack.enter_context(observe_run(**labels))
+        if recorder is not None:
+            stack.enter_context(recorder.track())
+        return stack
+
+    def _with_observers(
+        self, adapters: list, recorder: HistoryRecorder | None = None
+    ) -> list:
+        labels = self._metrics_labels()
+        if labels is not None:
+            adapters = [*adapters, MetricsAdapter(**labels)]
+        if recorder is not None:
+            adapters = [*adapters, recorder]
+        return adapters
+
     def _execute_sync(
         self,
         context_builder: ExecutionContextBuilder,
         run_config: RunConfig,
         adapter_set: ResolvedAdapterSet,
         modules: list[ModuleType],
+        recorder: HistoryRecorder | None = None,
     ) -> dict[str, Any]:
         adapter_set = AdapterProvider(
             self._pipeline.adapter_manager
         ).construct_runtime_adapters(run_config, adapter_set)
         executor, shutdown, adapters = context_builder.build(run_config, adapter_set)
+        adapters = self._with_observers(adapters, recorder)
         synchronous_executor = run_config.executor.type in (
             "synchronous",
             "local",
@@ -201,11 +269,13 @@ class PipelineRunner:
         adapter_set: ResolvedAdapterSet,
         modules: list[ModuleType],
         async_driver_module,
+        recorder: HistoryRecorder | None = None,
     ) -> dict[str, Any]:
         adapter_set = AdapterProvider(
             self._pipeline.adapter_manager
         ).construct_runtime_adapters(run_config, adapter_set)
         executor, shutdown, adapters = context_builder.build(run_config, adapter_set)
+        adapters = self._with_observers(adapters, recorder)
         synchronous_executor = run_config.executor.type in (
             "synchronous",
             "local",
@@ -248,11 +318,20 @@ class PipelineRunner:
         additional = run_config.additional_modules or []
         if isinstance(additional, (str, bytes)):
             additional = [additional]
-        return resolver.resolve(
-            self._pipeline.module,
-            additional=additional,
-            reload=run_config.reload,
+        # Reloaded modules pick up the pipeline's params instead of reading YAML.
+        h_params = getattr(getattr(self._pipeline, "config", None), "h_params", None)
+        name = getattr(self._pipeline, "name", None)
+        injected = (
+            provide_params(name, h_params)
+            if isinstance(h_params, DictNamespace) and isinstance(name, str)
+            else nullcontext()
         )
+        with injected:
+            return resolver.resolve(
+                self._pipeline.module,
+                additional=additional,
+                reload=run_config.reload,
+            )
 
     def _resolve_pipelines_dir(self) -> str | None:
         """Determine the configured pipelines directory for module resolution.
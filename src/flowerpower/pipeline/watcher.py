@@ -0,0 +1,339 @@
+"""Filesystem watcher driving targeted pipeline cache invalidation.
+
+The :class:`PipelineWatcher` observes the project ``pipelines/``, ``conf/`` and
+``hooks/`` directories and classifies every change into the pipelines it
+affects.  On Linux with a local filesystem the optional ``inotify_simple``
+package is used to wake up on kernel events; every other filesystem (remote
+fsspec backends, macOS, missing extra) falls back to periodic polling.  In both
+modes the authoritative change set is computed by diffing ``(mtime, size)``
+snapshots, so the two backends report identical results.
+"""
+
+from __future__ import annotations
+
+import posixpath
+import sys
+import threading
+from collections.abc import Callable
+from dataclasses import dataclass, field
+from typing import Any, Literal
+
+from fsspeckit import AbstractFileSystem
+from loguru import logger
+
+from ..settings import CONFIG_DIR, HOOKS_DIR, PIPELINES_DIR, WATCH_INTERVAL
+from ..utils.filesystem import get_project_config_paths
+
+try:
+    import inotify_simple
+except ImportError:  # pragma: no cover - depends on optional extra
+    inotify_simple = None
+
+__all__ = ["PipelineWatcher", "WatchChanges"]
+
+WatchBackend = Literal["auto", "inotify", "poll"]
+
+_WATCHED_SUFFIXES = (".py", ".yml", ".yaml")
+
+FileSnapshot = dict[str, tuple[Any, Any]]
+
+
+@dataclass(frozen=True)
+class WatchChanges:
+    """Classified set of project file changes.
+
+    Attributes:
+        pipelines: Formatted pipeline paths (e.g. ``"group/my_pipeline"``)
+            whose module or configuration changed.
+        modules: Subset of ``pipelines`` whose Python module changed.
+        project: Whether the project configuration changed.
+        hooks: Pipeline hook directories that changed.
+        paths: All raw paths that changed, in sorted order.
+    """
+
+    pipelines: frozenset[str] = field(default_factory=frozenset)
+    modules: frozenset[str] = field(default_factory=frozenset)
+    project: bool = False
+    hooks: frozenset[str] = field(default_factory=frozenset)
+    paths: tuple[str, ...] = ()
+
+    def __bool__(self) -> bool:
+        return bool(self.paths)
+
+
+def _normalize_dir(path: str | None, default: str) -> str:
+    return (path if path is not None else default).strip("/")
+
+
+def _info_signature(info: dict[str, Any]) -> tuple[Any, Any]:
+    modified = info.get("mtime", info.get("modified", info.get("LastModified")))
+    return (modified, info.get("size"))
+
+
+class PipelineWatcher:
+    """Watch project directories and report pipeline-level changes.
+
+    Args:
+        fs: Project filesystem, rooted at the project base directory.
+        cfg_dir: Configuration directory fragment.
+        pipelines_dir: Pipelines directory fragment.
+        hooks_dir: Hooks directory fragment.
+        on_change: Callback invoked from the watcher thread with each
+            non-empty :class:`WatchChanges`.
+        interval: Polling interval in seconds. With the inotify backend this
+            is the upper bound between snapshot checks.
+        backend: ``"auto"`` picks inotify when available, ``"inotify"``
+            requires it, and ``"poll"`` forces polling.
+    """
+
+    def __init__(
+        self,
+        fs: AbstractFileSystem,
+        *,
+        cfg_dir: str | None = CONFIG_DIR,
+        pipelines_dir: str | None = PIPELINES_DIR,
+        hooks_dir: str | None = HOOKS_DIR,
+        on_change: Callable[[WatchChanges], None] | None = None,
+        interval: float = WATCH_INTERVAL,
+        backend: WatchBackend = "auto",
+    ) -> None:
+        self._fs = fs
+        self._cfg_dir = _normalize_dir(cfg_dir, CONFIG_DIR)
+        self._pipelines_dir = _normalize_dir(pipelines_dir, PIPELINES_DIR)
+        self._hooks_dir = _normalize_dir(hooks_dir, HOOKS_DIR)
+        self._on_change = on_change
+        self._interval = interval
+        self._backend = self._resolve_backend(backend)
+        self._project_cfg_paths = set(get_project_config_paths(self._cfg_dir))
+        self._snapshot: FileSnapshot | None = None
+        self._stop_event = threading.Event()
+        self._thread: threading.Thread | None = None
+        self._unwatched: set[str] = set()
+
+    @property
+    def backend(self) -> Literal["inotify", "poll"]:
+        """The backend actually in use."""
+        return self._backend
+
+    @property
+    def running(self) -> bool:
+        """Whether the background watch thread is alive."""
+        return self._thread is not None and self._thread.is_alive()
+
+    @property
+    def roots(self) -> tuple[str, ...]:
+        """Watched directory fragments, relative to the filesystem root."""
+        roots: list[str] = []
+        for root in (self._pipelines_dir, self._cfg_dir, self._hooks_dir):
+            if root and root not in roots:
+                roots.append(root)
+        return tuple(roots)
+
+    def _local_root(self) -> str | None:
+        """Return the OS path backing ``fs`` when it is a local filesystem."""
+        fs = self._fs
+        root = ""
+        if hasattr(fs, "path") and hasattr(fs, "fs"):
+            root = fs.path
+            fs = fs.fs
+        protocol = fs.protocol if isinstance(fs.protocol, tuple) else (fs.protocol,)
+        if "file" not in protocol and "local" not in protocol:
+            return None
+        return root or "."
+
+    def _resolve_backend(self, backend: WatchBackend) -> Literal["inotify", "poll"]:
+        if backend == "poll":
+            return "poll"
+        available = (
+            inotify_simple is not None
+            and sys.platform.startswith("linux")
+            and self._local_root() is not None
+        )
+        if available:
+            return "inotify"
+        if backend == "inotify":
+            raise ValueError(
+                "The inotify watch backend requires Linux, a local filesystem and "
+                "the 'inotify_simple' package (pip install flowerpower[watch])."
+            )
+        return "poll"
+
+    # --- Snapshot and classification ---
+
+    def snapshot(self) -> FileSnapshot:
+        """Return ``{path: (mtime, size)}`` for every watched file."""
+        snapshot: FileSnapshot = {}
+        for root in self.roots:
+            try:
+                if not self._fs.exists(root):
+                    continue
+                entries = self._fs.find(root, detail=True)
+            except Exception as error:
+                logger.debug(f"Skipping unreadable watch root {root}: {error}")
+                continue
+            for path, info in entries.items():
+                path = path.lstrip("/")
+                if "__pycache__" in path or not path.endswith(_WATCHED_SUFFIXES):
+                    continue
+                snapshot[path] = _info_signature(info)
+        return snapshot
+
+    def classify(self, paths: set[str] | list[str] | tuple[str, ...]) -> WatchChanges:
+        """Map changed paths to the pipelines, project and hooks they affect."""
+        pipelines: set[str] = set()
+        modules: set[str] = set()
+        hooks: set[str] = set()
+        project = False
+        pipeline_cfg_dir = posixpath.join(self._cfg_dir, self._pipelines_dir)
+
+        for path in paths:
+            stem, suffix = posixpath.splitext(path)
+            if path in self._project_cfg_paths:
+                project = True
+            elif self._hooks_dir and path.startswith(f"{self._hooks_dir}/"):
+                relative = path[len(self._hooks_dir) + 1 :]
+                hooks.add(posixpath.dirname(relative) or relative)
+            elif suffix == ".py" and path.startswith(f"{self._pipelines_dir}/"):
+                relative = stem[len(self._pipelines_dir) + 1 :]
+                if posixpath.basename(relative) != "__init__":
+                    pipelines.add(relative)
+                    modules.add(relative)
+            elif suffix in (".yml", ".yaml"):
+                for prefix in (pipeline_cfg_dir, self._cfg_dir):
+                    if prefix and path.startswith(f"{prefix}/"):
+                        pipelines.add(stem[len(prefix) + 1 :])
+                        break
+
+        return WatchChanges(
+            pipelines=frozenset(pipelines),
+            modules=frozenset(modules),
+            project=project,
+            hooks=frozenset(hooks),
+            paths=tuple(sorted(paths)),
+        )
+
+    def poll(self) -> WatchChanges:
+        """Diff the current snapshot against the previous one.
+
+        The first call only records the baseline and reports no changes.
+        """
+        current = self.snapshot()
+        previous = self._snapshot
+        self._snapshot = current
+        if previous is None:
+            return WatchChanges()
+
+        changed = {
+            path
+            for path in previous.keys() | current.keys()
+            if previous.get(path) != current.get(path)
+        }
+        return self.classify(changed)
+
+    def check(self) -> WatchChanges:
+        """Poll once and dispatch non-empty changes to ``on_change``."""
+        changes = self.poll()
+        if changes and self._on_change is not None:
+            try:
+                self._on_change(changes)
+            except Exception as error:
+                logger.warning(f"Pipeline watch callback failed: {error}")
+        return changes
+
+    # --- Background thread ---
+
+    def start(self) -> "PipelineWatcher":
+        """Start watching in a daemon thread. Idempotent."""
+        if self.running:
+            return self
+        if self._snapshot is None:
+            self.poll()
+        self._stop_event.clear()
+        target = self._run_inotify if self._backend == "inotify" else self._run_poll
+        self._thread = threading.Thread(
+            target=target, name="flowerpower-watcher", daemon=True
+        )
+        self._thread.start()
+        logger.debug(f"Started pipeline watcher ({self._backend}) on {self.roots}")
+        return self
+
+    def stop(self, timeout: float | None = None) -> None:
+        """Stop the watch thread and wait for it to exit."""
+        self._stop_event.set()
+        if self._thread is not None:
+            self._thread.join(timeout if timeout is not None else self._interval * 2)
+            self._thread = None
+
+    def _run_poll(self) -> None:
+        while not self._stop_event.wait(self._interval):
+            self.check()
+
+    def _run_inotify(self) -> None:
+        root = self._local_root() or "."
+        flags = inotify_simple.flags
+        mask = (
+            flags.MODIFY
+            | flags.CLOSE_WRITE
+            | flags.CREATE
+            | flags.DELETE
+            | flags.MOVED_FROM
+            | flags.MOVED_TO
+        )
+        timeout_ms = max(int(self._interval * 1000), 1)
+        self._unwatched.clear()
+        with inotify_simple.INotify() as inotify:
+            watched: set[str] = set()
+
+            def add_watches() -> bool:
+                directories, complete = self._local_directories(root)
+                for directory in directories:
+                    if directory not in watched:
+                        try:
+                            inotify.add_watch(directory, mask)
+                        except OSError as error:
+                            self._warn_unwatched(directory, error)
+                            complete = False
+                            continue
+                        watched.add(directory)
+                return complete
+
+            # Directories that cannot be watched are polled every interval.
+            complete = add_watches()
+            while not self._stop_event.is_set():
+                events = inotify.read(timeout=timeout_ms, read_delay=50)
+                if self._stop_event.is_set():
+                    break
+                if events or not complete:
+                    complete = add_watches()
+                    self.check()
+
+    def _local_directories(self, root: str) -> tuple[list[str], bool]:
+        """Directories to watch below ``root`` and whether all roots were listed."""
+        directories: list[str] = []
+        complete = True
+        for fragment in self.roots:
+            base = posixpath.join(root, fragment)
+            try:
+                if not self._fs.isdir(fragment):
+                    continue
+                subdirs = self._fs.find(fragment, withdirs=True, detail=True)
+            except Exception as error:
+                self._warn_unwatched(fragment, error)
+                complete = False
+                continue
+            directories.append(base)
+            for path, info in subdirs.items():
+                if info.get("type") == "directory" and "__pycache__" not in path:
+                    directories.append(posixpath.join(root, path.lstrip("/")))
+        return directories, complete
+
+    def _warn_unwatched(self, path: str, error: Exception) -> None:
+        if path not in self._unwatched:
+            self._unwatched.add(path)
+            logger.warning(f"Cannot watch {path}, polling it instead: {error}")
+
+    def __enter__(self) -> "PipelineWatcher":
+        return self.start()
+
+    def __exit__(self, exc_type, exc_val, exc_tb) -> None:
+        self.stop()
@@ -0,0 +1,397 @@
+"""Long-running run server that keeps a project warm.
+
+``flowerpower serve`` loads a :class:`~flowerpower.flowerpower.FlowerPowerProject`
+once and executes run requests against it, so a local run no longer pays for
+interpreter start-up, imports, project load and config parsing. Pipeline
+modules stay imported, the loader keeps its pipeline config cache, and each run
+borrows an executor from the executor factory and returns it afterwards, so
+later requests reuse it while concurrent requests get their own. Hamilton
+still starts and shuts down the worker pool of an executor for every run, and
+the driver is built per run because adapters (history, metrics, trackers) are
+created per run.
+
+The server speaks plain HTTP on ``FP_SERVE_ADDR:FP_SERVE_PORT`` or on a Unix
+socket (``FP_SERVE_SOCKET``):
+
+- ``GET /health`` returns ``{"status": "ok", "project": ..., "runs": ...}``.
+- ``POST /run`` takes ``{"name": ..., "options": {...}, "log_level": ...}``
+  where ``options`` are the keyword arguments of
+  :func:`flowerpower.utils.config.run_config_from_options`. The response is a
+  stream of newline-delimited JSON events: ``log`` records emitted by the run,
+  then a single ``result`` (``outputs``, ``duration``) or ``error``
+  (``type``, ``error``, ``duration``) event. ``log_level`` (or
+  ``options["log_level"]``) only selects the records streamed to this client;
+  it never changes the daemon's own logging.
+
+This module only imports the standard library, msgspec and loguru at module
+level so the thin client used by ``pipeline run --remote`` starts quickly.
+"""
+
+from __future__ import annotations
+
+import http.client
+import os
+import socket
+import socketserver
+import stat
+import threading
+import time
+from collections.abc import Iterator
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import TYPE_CHECKING, Any
+from urllib.parse import urlsplit
+
+import msgspec
+from loguru import logger
+
+from .settings import SERVE_ADDR, SERVE_PORT
+
+if TYPE_CHECKING:
+    from .flowerpower import FlowerPowerProject
+
+__all__ = ["RunClient", "RunServer", "ServerError", "encode_outputs"]
+
+NDJSON = "application/x-ndjson"
+
+
+class ServerError(RuntimeError):
+    """The server rejected a request."""
+
+
+def _remove_stale_socket(path: str) -> None:
+    """Delete a leftover Unix socket at ``path``; refuse to delete anything else."""
+    try:
+        mode = os.lstat(path).st_mode
+    except FileNotFoundError:
+        return
+    if not stat.S_ISSOCK(mode):
+        raise FileExistsError(f"{path} exists and is not a Unix socket")
+    os.unlink(path)
+
+
+def encode_outputs(outputs: dict[str, Any]) -> dict[str, Any]:
+    """Convert run outputs to JSON-compatible values.
+
+    Values msgspec cannot encode (dataframes, models, ...) are replaced by
+    their ``str()``.
+    """
+    return msgspec.to_builtins(outputs, enc_hook=str, str_keys=True)
+
+
+class _UnixHTTPServer(socketserver.ThreadingMixIn, socketserver.UnixStreamServer):
+    daemon_threads = True
+
+
+class _RunHandler(BaseHTTPRequestHandler):
+    server: Any  # ThreadingHTTPServer or _UnixHTTPServer with ``run_server``
+
+    def do_GET(self) -> None:  # noqa: N802 - http.server API
+        if self.path.split("?", 1)[0] != "/health":
+            self._send_json(404, {"error": f"Unknown path {self.path}"})
+            return
+        self._send_json(200, self.server.run_server.health())
+
+    def do_POST(self) -> None:  # noqa: N802 - http.server API
+        if self.path.split("?", 1)[0] != "/run":
+            self._send_json(404, {"error": f"Unknown path {self.path}"})
+            return
+        try:
+            length = int(self.headers.get("Content-Length") or 0)
+            request = msgspec.json.decode(self.rfile.read(length))
+            if not isinstance(request, dict) or not isinstance(
+                request.get("name"), str
+            ):
+                raise ValueError("Request body must be an object with a 'name'")
+            options = request.get("options") or {}
+            if not isinstance(options, dict):
+                raise ValueError("'options' must be an object")
+        except (ValueError, msgspec.DecodeError) as e:
+            self._send_json(400, {"error": str(e)})
+            return
+
+        self.send_response(200)
+        self.send_header("Content-Type", NDJSON)
+        self.end_headers()
+        self.server.run_server.execute(
+            request["name"],
+            options,
+            log_level=request.get("log_level"),
+            emit=self._emit,
+        )
+
+    def _emit(self, event: dict[str, Any]) -> None:
+        self.wfile.write(msgspec.json.encode(event) + b"\n")
+        self.wfile.flush()
+
+    def _send_json(self, status: int, body: dict[str, Any]) -> None:
+        payload = msgspec.json.encode(body)
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(payload)))
+        self.end_headers()
+        self.wfile.write(payload)
+
+    def address_string(self) -> str:
+        # Unix socket peers have no (host, port) address.
+        return self.client_address[0] if self.client_address else "local"
+
+    def log_message(self, format: str, *args: Any) -> None:
+        logger.trace(f"serve: {format % args}")
+
+
+class RunServer:
+    """Serve run requests against a loaded project.
+
+    Args:
+        project: The project to keep warm.
+        host: Address to bind when serving TCP; defaults to ``FP_SERVE_ADDR``.
+        port: Port to bind; defaults to ``FP_SERVE_PORT``. ``0`` picks a free
+            port (see :attr:`address`).
+        socket_path: Serve on this Unix socket instead of TCP.
+        max_concurrent: Number of runs executed at the same time; further
+            requests wait for a free slot.
+
+    Example:
+        >>> server = RunServer(FlowerPowerProject.load("."), port=0)
+        >>> server.start()
+        >>> RunClient(server.address).health()["status"]
+        'ok'
+        >>> server.close()
+    """
+
+    def __init__(
+        self,
+        project: FlowerPowerProject,
+        host: str | None = None,
+        port: int | None = None,
+        socket_path: str | None = None,
+        max_concurrent: int = 1,
+    ) -> None:
+        if max_concurrent < 1:
+            raise ValueError("max_concurrent must be at least 1")
+        self.project = project
+        self.socket_path = socket_path
+        self._slots = threading.BoundedSemaphore(max_concurrent)
+        self._lock = threading.Lock()
+        self._runs = 0
+        self._started = time.time()
+        self._thread: threading.Thread | None = None
+
+        if socket_path:
+            _remove_stale_socket(socket_path)
+            self._httpd = _UnixHTTPServer(socket_path, _RunHandler)
+        else:
+            self._httpd = ThreadingHTTPServer(
+                (host or SERVE_ADDR, SERVE_PORT if port is None else port),
+                _RunHandler,
+            )
+        self._httpd.run_server = self
+        # Per-request sinks select their own level; the daemon's stderr handler
+        # keeps the level it was started with.
+        logger.enable("flowerpower")
+
+    @property
+    def address(self) -> str:
+        """Address for :class:`RunClient`, e.g. ``http://127.0.0.1:8250``."""
+        if self.socket_path:
+            return f"unix://{self.socket_path}"
+        host, port = self._httpd.server_address[:2]
+        return f"http://{host}:{port}"
+
+    def health(self) -> dict[str, Any]:
+        manager = self.project.pipeline_manager
+        return {
+            "status": "ok",
+            "project": getattr(manager.project_cfg, "name", None),
+            "runs": self._runs,
+            "uptime": time.time() - self._started,
+        }
+
+    def execute(
+        self,
+        name: str,
+        options: dict[str, Any],
+        log_level: str | None = None,
+        emit=None,
+    ) -> dict[str, Any]:
+        """Run a pipeline and report log records and the outcome to ``emit``.
+
+        Log records emitted on the calling thread at ``log_level`` (default:
+        ``options["log_level"]``, then ``INFO``) or above are forwarded while
+        the run executes. The level only applies to this request; it never
+        changes the daemon's logging configuration.
+
+        Returns:
+            The final ``result`` or ``error`` event.
+        """
+        from .utils.config import run_config_from_options
+
+        emit = emit or (lambda event: None)
+        options = dict(options)
+        requested_level = options.pop("log_level", None)
+        log_level = (log_level or requested_level or "INFO").upper()
+        thread_id = threading.get_ident()
+        connected = True
+
+        def forward(message) -> None:
+            nonlocal connected
+            if not connected:
+                return
+            record = message.record
+            try:
+                emit(
+                    {
+                        "event": "log",
+                        "time": record["time"].isoformat(),
+                        "level": record["level"].name,
+                        "message": record["message"],
+                    }
+                )
+            except OSError:
+                connected = False  # client went away; let the run finish
+
+        with self._slots:
+            sink = logger.add(
+                forward,
+                level=log_level,
+                filter=lambda record: record["thread"].id == thread_id,
+                format="{message}",
+            )
+            start = time.perf_counter()
+            try:
+                run_config = run_config_from_options(**options)
+                # ``log_level=None`` keeps the run from reconfiguring the
+                # process-wide logger (the config default is ``INFO``).
+                outputs = self.project.run(
+                    name=name, run_config=run_config, log_level=None
+                )
+                event = {
+                    "event": "result",
+                    "outputs": encode_outputs(outputs or {}),
+                    "duration": time.perf_counter() - start,
+                }
+            except Exception as e:  # reported to the client, the server keeps going
+                event = {
+                    "event": "error",
+                    "type": type(e).__name__,
+                    "error": str(e),
+                    "duration": time.perf_counter() - start,
+                }
+            finally:
+                logger.remove(sink)
+                with self._lock:
+                    self._runs += 1
+
+        if connected:
+            try:
+                emit(event)
+            except OSError:
+                pass
+        return event
+
+    def start(self) -> None:
+        """Serve from a daemon thread."""
+        self._thread = threading.Thread(
+            target=self._httpd.serve_forever, name="fp-serve", daemon=True
+        )
+        self._thread.start()
+
+    def serve_forever(self) -> None:
+        """Serve on the calling thread until :meth:`close` or ``KeyboardInterrupt``."""
+        self._httpd.serve_forever()
+
+    def close(self) -> None:
+        if self._thread is not None:
+            self._httpd.shutdown()
+            self._thread.join()
+            self._thread = None
+        self._httpd.server_close()
+        if self.socket_path:
+            try:
+                _remove_stale_socket(self.socket_path)
+            except FileExistsError as e:
+                logger.warning(f"Not removing {self.socket_path}: {e}")
+
+    def __enter__(self) -> RunServer:
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb) -> None:
+        self.close()
+
+
+class _UnixHTTPConnection(http.client.HTTPConnection):
+    def __init__(self, path: str, timeout: float | None = None) -> None:
+        super().__init__("localhost", timeout=timeout)
+        self._path = path
+
+    def connect(self) -> None:
+        self.sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        self.sock.settimeout(self.timeout)
+        self.sock.connect(self._path)
+
+
+class RunClient:
+    """Thin client for :class:`RunServer`.
+
+    Args:
+        address: ``http://host:port``, ``host:port``, ``unix:///path/to.sock``
+            or a socket path.
+        timeout: Socket timeout in seconds; ``None`` waits for long runs.
+    """
+
+    def __init__(self, address: str, timeout: float | None = None) -> None:
+        self.address = address
+        self.timeout = timeout
+
+    def _connection(self) -> http.client.HTTPConnection:
+        address = self.address
+        if address.startswith("unix://"):
+            return _UnixHTTPConnection(address[len("unix://") :], self.timeout)
+        if address.startswith("/") or address.endswith(".sock"):
+            return _UnixHTTPConnection(address, self.timeout)
+        parts = urlsplit(address if "://" in address else f"http://{address}")
+        return http.client.HTTPConnection(
+            parts.hostname or SERVE_ADDR, parts.port or SERVE_PORT, timeout=self.timeout
+        )
+
+    def _request(self, method: str, path: str, body: dict | None = None):
+        connection = self._connection()
+        payload = msgspec.json.encode(body) if body is not None else None
+        headers = {"Content-Type": "application/json"} if payload else {}
+        connection.request(method, path, body=payload, headers=headers)
+        response = connection.getresponse()
+        if response.status != 200:
+            data = response.read()
+            connection.close()
+            try:
+                message = msgspec.json.decode(data).get("error", data.decode())
+            except (msgspec.DecodeError, AttributeError):
+                message = data.decode(errors="replace")
+            raise ServerError(f"{response.status}: {message}")
+        return connection, response
+
+    def health(self) -> dict[str, Any]:
+        connection, response = self._request("GET", "/health")
+        try:
+            return msgspec.json.decode(response.read())
+        finally:
+            connection.close()
+
+    def run(
+        self,
+        name: str,
+        options: dict[str, Any] | None = None,
+        log_level: str | None = None,
+    ) -> Iterator[dict[str, Any]]:
+        """Run ``name`` on the server and yield its events as they arrive."""
+        connection, response = self._request(
+            "POST",
+            "/run",
+            {"name": name, "options": options or {}, "log_level": log_level},
+        )
+        try:
+            for line in response:
+                if line.strip():
+                    yield msgspec.json.decode(line)
+        finally:
+            connection.close()
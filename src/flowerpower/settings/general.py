@@ -1,6 +1,30 @@
 import os
 
+from .executor import _env_bool
+
 PIPELINES_DIR = os.getenv("FP_PIPELINES_DIR", "pipelines")
 CONFIG_DIR = os.getenv("FP_CONFIG_DIR", "conf")
 HOOKS_DIR = os.getenv("FP_HOOKS_DIR", "hooks")
 CACHE_DIR = os.getenv("FP_CACHE_DIR", "~/.flowerpower/cache")
+WATCH_INTERVAL = float(os.getenv("FP_WATCH_INTERVAL", 1.0))
+PROJECT_CONFIG_TTL = float(os.getenv("FP_PROJECT_CONFIG_TTL", 0.0))
+BUNDLE_PATH = os.getenv("FP_BUNDLE_PATH", ".flowerpower/bundle.msgpack")
+USE_BUNDLE = _env_bool(os.getenv("FP_USE_BUNDLE"), default=True)
+CATALOG_INDEX_PATH = os.getenv(
+    "FP_CATALOG_INDEX_PATH", ".flowerpower/catalog.msgpack"
+)
+USE_CATALOG_INDEX = _env_bool(os.getenv("FP_USE_CATALOG_INDEX"), default=True)
+SUMMARY_PAGE_SIZE = int(os.getenv("FP_SUMMARY_PAGE_SIZE", 20))
+SUMMARY_MAX_WORKERS = int(os.getenv("FP_SUMMARY_MAX_WORKERS", 8))
+IO_MAX_WORKERS = int(os.getenv("FP_IO_MAX_WORKERS", 8))
+METRICS_ENABLED = _env_bool(os.getenv("FP_METRICS_ENABLED"), default=False)
+METRICS_PORT = (
+    int(os.environ["FP_METRICS_PORT"]) if os.getenv("FP_METRICS_PORT") else None
+)
+METRICS_ADDR = os.getenv("FP_METRICS_ADDR", "127.0.0.1")
+METRICS_TEXTFILE = os.getenv("FP_METRICS_TEXTFILE") or None
+HISTORY_ENABLED = _env_bool(os.getenv("FP_HISTORY_ENABLED"), default=True)
+HISTORY_PATH = os.getenv("FP_HISTORY_PATH", os.path.join(CACHE_DIR, "history.sqlite"))
+SERVE_ADDR = os.getenv("FP_SERVE_ADDR", "127.0.0.1")
+SERVE_PORT = int(os.getenv("FP_SERVE_PORT", 8250))
+SERVE_SOCKET = os.getenv("FP_SERVE_SOCKET") or None
@@ -3,11 +3,27 @@ Utility modules for FlowerPower.
 
 This package contains utility classes and functions that help simplify
 the main codebase by centralizing common operations.
+
+The re-exported helpers are imported on first access so that lightweight
+modules such as ``utils.logging`` and ``utils.security`` can be used without
+importing Hamilton and fsspeckit.
 """
 
-from .adapter import AdapterManager, create_adapter_manager
-from .executor import ExecutorFactory, create_executor_factory
-from .filesystem import FilesystemHelper
+import importlib
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from .adapter import AdapterManager, create_adapter_manager
+    from .executor import ExecutorFactory, create_executor_factory
+    from .filesystem import FilesystemHelper
+
+_LAZY_IMPORTS = {
+    "AdapterManager": ".adapter",
+    "create_adapter_manager": ".adapter",
+    "ExecutorFactory": ".executor",
+    "create_executor_factory": ".executor",
+    "FilesystemHelper": ".filesystem",
+}
 
 __all__ = [
     "AdapterManager",
@@ -16,3 +32,15 @@ __all__ = [
     "create_executor_factory",
     "FilesystemHelper",
 ]
+
+
+def __getattr__(name: str):
+    if name not in _LAZY_IMPORTS:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(_LAZY_IMPORTS[name], __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list[str]:
+    return sorted({*globals(), *__all__})
@@ -150,6 +150,13 @@ class AdapterManager:
             if adapter:
                 adapters.append(adapter)
 
+        # Per-node profiler, optionally with memory measurements
+        memory_profiler = getattr(with_adapter_cfg, "memory_profiler", False)
+        if getattr(with_adapter_cfg, "profiler", False) or memory_profiler:
+            from ..pipeline.profiling import NodeProfiler
+
+            adapters.append(NodeProfiler(memory=memory_profiler))
+
         return adapters
 
     def _create_hamilton_tracker(
@@ -0,0 +1,202 @@
+"""Statistical comparison of benchmark result files.
+
+Compares two JSON reports written by ``benchmarks/framework.py`` (or any file
+with a ``results`` list of ``{"id", "group", "unit", "samples"}`` entries).
+Every benchmark present in both files is tested with a two-sided
+Mann-Whitney U test on the raw samples. It is flagged as a regression when
+the head median is worse than the base median by more than the threshold and
+the difference is significant at ``alpha``. All measured quantities (time,
+bytes) are lower-is-better.
+
+The U test makes no normality assumption and ranks are robust against the
+occasional outlier from a noisy machine, which makes it a good fit for a
+handful of timing samples per side.  p-values are exact for small samples
+without ties and use the tie-corrected normal approximation otherwise.
+"""
+
+from __future__ import annotations
+
+import math
+from collections.abc import Sequence
+from dataclasses import dataclass
+from functools import cache
+from pathlib import Path
+from statistics import median
+from typing import Any
+
+import msgspec
+
+__all__ = [
+    "BenchmarkComparison",
+    "compare_reports",
+    "load_report",
+    "mann_whitney_u",
+]
+
+EXACT_MAX_SAMPLES = 30
+
+
+@dataclass(frozen=True)
+class BenchmarkComparison:
+    """Outcome of comparing one benchmark between two reports.
+
+    Attributes:
+        id: Benchmark ID, e.g. ``project_load[pipelines=100]``.
+        group: ``cold_start``, ``overhead``, ``memory``, ...
+        unit: Unit of the samples (``s`` or ``bytes``).
+        base_median: Median of the base samples (``None`` if missing).
+        head_median: Median of the head samples (``None`` if missing).
+        change: Relative change of the median, ``head / base - 1``.
+        p_value: Two-sided Mann-Whitney p-value.
+        verdict: ``regression``, ``improvement``, ``unchanged``, ``added``
+            or ``removed``.
+    """
+
+    id: str
+    group: str
+    unit: str
+    base_median: float | None
+    head_median: float | None
+    change: float | None
+    p_value: float | None
+    verdict: str
+
+
+@cache
+def _u_counts(m: int, n: int) -> tuple[int, ...]:
+    """Number of orderings of ``m`` x- and ``n`` y-samples yielding each U."""
+    if m == 0 or n == 0:
+        return (1,)
+    counts = [0] * (m * n + 1)
+    # The largest sample is either an x (beating all n y's) or a y.
+    for u, count in enumerate(_u_counts(m - 1, n)):
+        counts[u + n] += count
+    for u, count in enumerate(_u_counts(m, n - 1)):
+        counts[u] += count
+    return tuple(counts)
+
+
+def mann_whitney_u(x: Sequence[float], y: Sequence[float]) -> tuple[float, float]:
+    """Two-sided Mann-Whitney U test.
+
+    Args:
+        x: First sample.
+        y: Second sample.
+
+    Returns:
+        ``(U, p)`` where ``U`` counts the pairs in which ``x`` exceeds ``y``
+        (ties count one half).
+
+    Raises:
+        ValueError: If either sample is empty.
+    """
+    m, n = len(x), len(y)
+    if not m or not n:
+        raise ValueError("Mann-Whitney U needs at least one sample on each side")
+
+    pooled = sorted([(value, 0) for value in x] + [(value, 1) for value in y])
+    ranks = [0.0] * len(pooled)
+    tie_term = 0
+    start = 0
+    while start < len(pooled):
+        end = start
+        while end + 1 < len(pooled) and pooled[end + 1][0] == pooled[start][0]:
+            end += 1
+        for index in range(start, end + 1):
+            ranks[index] = (start + end) / 2 + 1
+        size = end - start + 1
+        tie_term += size**3 - size
+        start = end + 1
+
+    rank_sum_x = sum(rank for rank, (_, side) in zip(ranks, pooled, strict=True) if side == 0)
+    u = rank_sum_x - m * (m + 1) / 2
+
+    if not tie_term and m <= EXACT_MAX_SAMPLES and n <= EXACT_MAX_SAMPLES:
+        counts = _u_counts(m, n)
+        total = sum(counts)
+        below = sum(counts[: int(u) + 1]) / total
+        above = sum(counts[int(u) :]) / total
+        return u, min(1.0, 2 * min(below, above))
+
+    total = m + n
+    mean = m * n / 2
+    variance = m * n / 12 * ((total + 1) - tie_term / (total * (total - 1)))
+    if variance <= 0:
+        return u, 1.0
+    z = max(abs(u - mean) - 0.5, 0.0) / math.sqrt(variance)
+    return u, math.erfc(z / math.sqrt(2))
+
+
+def load_report(path: str | Path) -> dict[str, dict[str, Any]]:
+    """Read a benchmark report and index its results by ID."""
+    report = msgspec.json.decode(Path(path).read_bytes())
+    results = report.get("results") if isinstance(report, dict) else None
+    if not isinstance(results, list):
+        raise ValueError(f"{path} is not a benchmark report (no 'results' list)")
+    indexed = {}
+    for result in results:
+        if not isinstance(result, dict) or "samples" not in result:
+            continue
+        key = result.get("id") or result.get("name")
+        if key:
+            indexed[key] = result
+    return indexed
+
+
+def compare_reports(
+    base: dict[str, dict[str, Any]],
+    head: dict[str, dict[str, Any]],
+    *,
+    threshold: float = 0.05,
+    alpha: float = 0.05,
+    groups: Sequence[str] | None = None,
+) -> list[BenchmarkComparison]:
+    """Compare indexed reports from :func:`load_report`.
+
+    Args:
+        base: Results of the baseline revision.
+        head: Results of the revision under test.
+        threshold: Minimum relative change of the median to report, e.g.
+            ``0.05`` for 5%.
+        alpha: Significance level of the Mann-Whitney test.
+        groups: Only compare benchmarks in these groups.
+
+    Returns:
+        One comparison per benchmark ID, in base order followed by benchmarks
+        only present in head.
+    """
+    comparisons = []
+    for key in [*base, *(key for key in head if key not in base)]:
+        base_result, head_result = base.get(key), head.get(key)
+        result = base_result or head_result
+        group = result.get("group", "")
+        if groups and group not in groups:
+            continue
+        base_samples = base_result["samples"] if base_result else []
+        head_samples = head_result["samples"] if head_result else []
+        base_median = median(base_samples) if base_samples else None
+        head_median = median(head_samples) if head_samples else None
+
+        change = p_value = None
+        if base_median is None or head_median is None:
+            verdict = "removed" if head_median is None else "added"
+        else:
+            change = head_median / base_median - 1 if base_median else 0.0
+            _, p_value = mann_whitney_u(base_samples, head_samples)
+            verdict = "unchanged"
+            if p_value < alpha and abs(change) > threshold:
+                verdict = "regression" if change > 0 else "improvement"
+
+        comparisons.append(
+            BenchmarkComparison(
+                id=key,
+                group=group,
+                unit=result.get("unit", "s"),
+                base_median=base_median,
+                head_median=head_median,
+                change=change,
+                p_value=p_value,
+                verdict=verdict,
+            )
+        )
+    return comparisons
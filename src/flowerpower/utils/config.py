@@ -6,8 +6,13 @@ This module provides shared configuration handling utilities to avoid code dupli
 
 import copy
 from collections.abc import Iterable
+from dataclasses import dataclass
+from functools import cache, lru_cache
 from typing import Any
 
+import msgspec
+from loguru import logger
+
 from ..cfg.pipeline.run import (
     CallbackSpec,
     RunConfig,
@@ -15,7 +20,12 @@ from ..cfg.pipeline.run import (
     WithAdapterConfig,
     RetryConfig,
 )
-from .security import validate_config_dict, validate_callback_function
+from .security import (
+    SecurityError,
+    validate_callback_function,
+    validate_config_dict,
+    validate_executor_type,
+)
 
 
 # Fields that accept ``None`` as an explicit reset to the unset state.
@@ -127,6 +137,37 @@ def _safe_copy(value: Any) -> Any:
             return value
 
 
+def _cow_copy(value: Any) -> Any:
+    """Copy-on-write clone of a run-time data value.
+
+    Only the outermost container layer is copied, because that is the only
+    layer the merge handlers mutate (``dict.update``, list reassignment).
+    Leaf values such as DataFrames, arrays, or modules are shared by reference
+    and treated as immutable, so cloning cost is independent of their size.
+    Config structs get a shallow copy; their nested values are only ever
+    replaced through the copy-on-write ``merge_dict``.
+    """
+    if isinstance(value, dict):
+        return dict(value)
+    if isinstance(value, list):
+        return list(value)
+    if isinstance(value, set):
+        return set(value)
+    if isinstance(value, msgspec.Struct):
+        return copy.copy(value)
+    return value
+
+
+@cache
+def _struct_defaults(struct_type: type) -> Any:
+    """Return a shared default instance of ``struct_type``.
+
+    The instance is only ever read (for diffing against defaults) and must not
+    be mutated.
+    """
+    return struct_type()
+
+
 def _clone_callback_spec(value: Any) -> Any:
     """Clone a ``CallbackSpec`` while preserving callable identity."""
     if value is None or not isinstance(value, CallbackSpec):
@@ -152,33 +193,29 @@ def clone_run_config(run_config: RunConfig) -> RunConfig:
     ``RunConfig`` can contain module objects, callbacks, or adapters that are not
     safely deep-copyable. This helper copies the mutable containers we merge into
     during execution, while leaving opaque runtime objects intact when necessary.
+    User data (``inputs``, ``config``, ``cache``) is cloned copy-on-write via
+    :func:`_cow_copy`, so large input values are never duplicated.
     """
     cloned = copy.copy(run_config)
-    cloned.inputs = _safe_copy(run_config.inputs)
-    cloned.final_vars = _safe_copy(run_config.final_vars)
-    cloned.config = _safe_copy(run_config.config)
-    cloned.cache = _safe_copy(run_config.cache)
-    cloned.with_adapter = _safe_copy(run_config.with_adapter)
-    cloned.with_adapter_override_raw = _safe_copy(
-        run_config.with_adapter_override_raw
-    )
-    cloned.executor = _safe_copy(run_config.executor)
-    cloned.executor_override_raw = _safe_copy(run_config.executor_override_raw)
-    cloned.retry = _normalize_retry_config(_safe_copy(run_config.retry))
-    cloned.retry_override_raw = _safe_copy(run_config.retry_override_raw)
-    cloned.pipeline_adapter_cfg = _safe_copy(run_config.pipeline_adapter_cfg)
-    cloned.pipeline_adapter_cfg_override_raw = _safe_copy(
-        run_config.pipeline_adapter_cfg_override_raw
-    )
-    cloned.project_adapter_cfg = _safe_copy(run_config.project_adapter_cfg)
-    cloned.project_adapter_cfg_override_raw = _safe_copy(
-        run_config.project_adapter_cfg_override_raw
-    )
+    cloned.inputs = _cow_copy(run_config.inputs)
+    cloned.final_vars = _cow_copy(run_config.final_vars)
+    cloned.config = _cow_copy(run_config.config)
+    cloned.cache = _cow_copy(run_config.cache)
+    cloned.with_adapter = _cow_copy(run_config.with_adapter)
+    cloned.with_adapter_override_raw = _cow_copy(run_config.with_adapter_override_raw)
+    cloned.executor = _cow_copy(run_config.executor)
+    cloned.executor_override_raw = _cow_copy(run_config.executor_override_raw)
+    cloned.retry = _normalize_retry_config(run_config.retry)
+    cloned.retry_override_raw = _cow_copy(run_config.retry_override_raw)
+    cloned.pipeline_adapter_cfg = _cow_copy(run_config.pipeline_adapter_cfg)
+    cloned.pipeline_adapter_cfg_override_raw = _cow_copy(run_config.pipeline_adapter_cfg_override_raw)
+    cloned.project_adapter_cfg = _cow_copy(run_config.project_adapter_cfg)
+    cloned.project_adapter_cfg_override_raw = _cow_copy(run_config.project_adapter_cfg_override_raw)
     cloned.adapter = dict(run_config.adapter) if run_config.adapter is not None else None
     cloned.on_success = _clone_callback_spec(run_config.on_success)
     cloned.on_failure = _clone_callback_spec(run_config.on_failure)
-    cloned.additional_modules = _safe_copy(run_config.additional_modules)
-    cloned.explicit_overrides = _safe_copy(run_config.explicit_overrides)
+    cloned.additional_modules = _cow_copy(run_config.additional_modules)
+    cloned.explicit_overrides = _cow_copy(run_config.explicit_overrides)
     _sync_retry_legacy_fields(cloned)
     return cloned
 
@@ -226,23 +263,44 @@ def build_sparse_struct_patch(
     """
     patch: dict[str, Any] = {}
 
-    for field in getattr(value, "__struct_fields__", ()):  # pragma: no branch
-        if not hasattr(default, field):
-            continue
-
-        current_value = getattr(value, field)
-        default_value = getattr(default, field)
-
+    for field, current_value, default_value in _iter_changed_fields(value, default):
         if hasattr(current_value, "merge_dict") and hasattr(default_value, "__struct_fields__"):
             nested_patch = build_sparse_struct_patch(current_value, default_value)
             if nested_patch:
                 patch[field] = nested_patch
-        elif current_value != default_value:
-            patch[field] = _safe_copy(current_value)
+        else:
+            patch[field] = _cow_copy(current_value)
 
     return patch
 
 
+def _iter_changed_fields(value: Any, default: Any):
+    """Yield ``(field, value, default)`` for fields differing from ``default``.
+
+    Structs of the same type are compared as ``msgspec.structs.astuple``
+    snapshots in a single pass; other pairs fall back to per-field lookups.
+    """
+    fields = getattr(value, "__struct_fields__", ())
+    if type(value) is type(default) and isinstance(value, msgspec.Struct):
+        for field, current_value, default_value in zip(
+            fields,
+            msgspec.structs.astuple(value),
+            msgspec.structs.astuple(default),
+            strict=True,
+        ):
+            if current_value is not default_value and current_value != default_value:
+                yield field, current_value, default_value
+        return
+
+    for field in fields:  # pragma: no branch
+        if not hasattr(default, field):
+            continue
+        current_value = getattr(value, field)
+        default_value = getattr(default, field)
+        if current_value != default_value:
+            yield field, current_value, default_value
+
+
 def _sync_retry_legacy_fields(run_config: RunConfig) -> None:
     """Keep deprecated flat retry fields aligned with nested retry config."""
     if run_config.retry is None:
@@ -284,7 +342,7 @@ def _merge_struct_or_mapping(existing: Any, value: Any) -> Any:
         if existing is None:
             return _safe_copy(value)
         if hasattr(existing, "merge_dict"):
-            patch = build_sparse_struct_patch(value, type(value)())
+            patch = build_sparse_struct_patch(value, _struct_defaults(type(value)))
             return existing.merge_dict(patch) if patch else existing
 
     return value
@@ -298,7 +356,7 @@ def _merge_inputs(run_config: RunConfig, value):
         return
     validate_config_dict(value)
     if run_config.inputs is None:
-        run_config.inputs = value
+        run_config.inputs = dict(value)
     else:
         run_config.inputs.update(value)
 
@@ -311,7 +369,7 @@ def _merge_config(run_config: RunConfig, value):
         return
     validate_config_dict(value)
     if run_config.config is None:
-        run_config.config = value
+        run_config.config = dict(value)
     else:
         run_config.config.update(value)
 
@@ -350,7 +408,7 @@ def _set_executor_cfg(run_config: RunConfig, value):
         run_config.executor = run_config.executor.merge_dict(value)
         run_config.executor_override_raw = dict(value)
     elif isinstance(value, ExecutorConfig):
-        patch = build_sparse_struct_patch(value, ExecutorConfig())
+        patch = build_sparse_struct_patch(value, _struct_defaults(ExecutorConfig))
         if patch:
             run_config.executor = run_config.executor.merge_dict(patch)
             run_config.executor_override_raw = patch
@@ -405,7 +463,7 @@ def _set_retry_cfg(run_config: RunConfig, value):
     if isinstance(value, dict):
         run_config.retry = run_config.retry.merge_dict(value)
     elif isinstance(value, RetryConfig):
-        patch = build_sparse_struct_patch(value, RetryConfig())
+        patch = build_sparse_struct_patch(value, _struct_defaults(RetryConfig))
         if patch:
             run_config.retry = run_config.retry.merge_dict(patch)
 
@@ -476,6 +534,21 @@ _attr_handlers = {
 }
 
 
+# Kwargs consumed by ``merge_run_config_with_kwargs``, in application order.
+_SIMPLE_KWARG_ATTRS = (
+    "final_vars",
+    "reload",
+    "log_level",
+    "max_retries",
+    "retry_delay",
+    "jitter_factor",
+    "retry_exceptions",
+    "on_success",
+    "on_failure",
+)
+_HANDLER_KWARG_ATTRS = tuple(_attr_handlers)
+
+
 def merge_run_config_with_kwargs(
     run_config: RunConfig, kwargs: dict[str, Any]
 ) -> RunConfig:
@@ -496,19 +569,7 @@ def merge_run_config_with_kwargs(
     # retry handler runs means that a nested ``retry`` value in the same kwargs
     # layer wins over flat retry fields, while flat fields still fill any keys
     # the nested block does not specify.
-    simple_attrs = [
-        "final_vars",
-        "reload",
-        "log_level",
-        "max_retries",
-        "retry_delay",
-        "jitter_factor",
-        "retry_exceptions",
-        "on_success",
-        "on_failure",
-    ]
-
-    for attr in simple_attrs:
+    for attr in _SIMPLE_KWARG_ATTRS:
         if attr not in kwargs:
             continue
         value = kwargs[attr]
@@ -546,19 +607,7 @@ def merge_run_config_with_kwargs(
             setattr(run_config, attr, value)
             _mark_explicit_override(run_config, attr)
 
-    for attr in (
-        "inputs",
-        "config",
-        "cache",
-        "adapter",
-        "executor_cfg",
-        "with_adapter_cfg",
-        "pipeline_adapter_cfg",
-        "project_adapter_cfg",
-        "retry",
-        "additional_modules",
-        "async_driver",
-    ):
+    for attr in _HANDLER_KWARG_ATTRS:
         if attr in kwargs:
             _attr_handlers[attr](run_config, kwargs[attr])
 
@@ -591,69 +640,204 @@ def validate_resolved_run_config(run_config: RunConfig) -> None:
         )
 
 
-def merge_run_configs(base: RunConfig, override: RunConfig | None) -> RunConfig:
-    """Merge a user-provided ``RunConfig`` onto pipeline defaults.
+# RunConfig fields whose differing value is renamed to a kwargs key.
+_PATCH_KEY_RENAMES = {"executor": "executor_cfg", "with_adapter": "with_adapter_cfg"}
 
-    The override config may be only partially populated. This function treats
-    values matching ``RunConfig()`` defaults as unspecified and merges only the
-    differing fields onto a defensive copy of ``base``.
+# Raw override fields that replace the diffed struct patch when present.
+_RAW_OVERRIDE_KEYS = (
+    ("executor_override_raw", "executor_cfg"),
+    ("with_adapter_override_raw", "with_adapter_cfg"),
+    ("retry_override_raw", "retry"),
+    ("pipeline_adapter_cfg_override_raw", "pipeline_adapter_cfg"),
+    ("project_adapter_cfg_override_raw", "project_adapter_cfg"),
+)
+
+# Fields copied verbatim from the override when explicitly set.
+_EXPLICIT_COPY_FIELDS = (
+    "inputs",
+    "final_vars",
+    "config",
+    "cache",
+    "log_level",
+    "reload",
+    "async_driver",
+    "additional_modules",
+    "adapter",
+    "pipeline_adapter_cfg",
+    "project_adapter_cfg",
+    "on_success",
+    "on_failure",
+)
+
+_CONSUMED_KWARGS = frozenset(_SIMPLE_KWARG_ATTRS) | frozenset(_HANDLER_KWARG_ATTRS)
+
+_CALLBACK_FIELDS = frozenset({"on_success", "on_failure"})
+
+
+@dataclass(frozen=True)
+class RunConfigMergePlan:
+    """Precompiled recipe for merging one override shape onto a base config.
+
+    A plan depends only on *which* override fields differ from ``RunConfig``
+    defaults (and which raw/explicit markers are present), never on their
+    values, so it is compiled once per shape and reused for every run.
+
+    Attributes:
+        patch_steps: ``(field, kwargs_key, nested)`` triples. ``nested`` fields
+            contribute a sparse struct patch; the others a copy-on-write value.
+        raw_steps: ``(raw_field, kwargs_key)`` pairs overriding diffed structs.
+        present_fields: Non-default ``adapter`` and callback fields copied
+            into the patch.
+        explicit_fields: Fields copied verbatim because they were set
+            explicitly (including explicit ``None``).
+        explicit_marks: Sorted explicit-override names recorded on the result.
     """
-    merged = clone_run_config(base)
-    if override is None:
+
+    patch_steps: tuple[tuple[str, str, bool], ...] = ()
+    raw_steps: tuple[tuple[str, str], ...] = ()
+    present_fields: tuple[str, ...] = ()
+    explicit_fields: tuple[str, ...] = ()
+    explicit_marks: tuple[str, ...] = ()
+
+    def build_patch(
+        self, override: RunConfig, changed: dict[str, tuple[Any, Any]]
+    ) -> dict[str, Any]:
+        """Build the kwargs patch for ``override`` from its changed fields."""
+        patch: dict[str, Any] = {}
+        for field, key, nested in self.patch_steps:
+            current_value, default_value = changed[field]
+            if nested:
+                nested_patch = build_sparse_struct_patch(current_value, default_value)
+                if nested_patch:
+                    patch[key] = nested_patch
+            else:
+                patch[key] = _cow_copy(current_value)
+        for raw_field, key in self.raw_steps:
+            patch[key] = _cow_copy(getattr(override, raw_field))
+        if "adapter" in self.present_fields:
+            patch["adapter"] = dict(override.adapter)
+        for field in self.present_fields:
+            if field in _CALLBACK_FIELDS:
+                patch[field] = _clone_callback_spec(getattr(override, field))
+        return patch
+
+    def apply(
+        self,
+        base: RunConfig,
+        override: RunConfig,
+        changed: dict[str, tuple[Any, Any]] | None = None,
+    ) -> RunConfig:
+        """Merge ``override`` onto a copy-on-write clone of ``base``."""
+        if changed is None:
+            changed = _diff_run_config(override)
+        merged = clone_run_config(base)
+        patch = self.build_patch(override, changed)
+
+        for field in self.explicit_fields:
+            setattr(merged, field, _cow_copy(getattr(override, field)))
+        if self.explicit_marks:
+            _mark_explicit_override(merged, *self.explicit_marks)
+
+        if patch:
+            merge_run_config_with_kwargs(merged, patch)
         return merged
 
-    patch = build_sparse_struct_patch(override, RunConfig())
-    if "executor" in patch:
-        patch["executor_cfg"] = patch.pop("executor")
-    if override.executor_override_raw is not None:
-        patch["executor_cfg"] = _safe_copy(override.executor_override_raw)
-    if "with_adapter" in patch:
-        patch["with_adapter_cfg"] = patch.pop("with_adapter")
-    if override.with_adapter_override_raw is not None:
-        patch["with_adapter_cfg"] = _safe_copy(override.with_adapter_override_raw)
-    if override.retry_override_raw is not None:
-        patch["retry"] = _safe_copy(override.retry_override_raw)
-    if override.pipeline_adapter_cfg_override_raw is not None:
-        patch["pipeline_adapter_cfg"] = _safe_copy(
-            override.pipeline_adapter_cfg_override_raw
+
+def _diff_run_config(override: RunConfig) -> dict[str, tuple[Any, Any]]:
+    """Return ``{field: (value, default)}`` for fields differing from defaults."""
+    return {
+        field: (current_value, default_value)
+        for field, current_value, default_value in _iter_changed_fields(
+            override, _struct_defaults(RunConfig)
         )
-    if override.project_adapter_cfg_override_raw is not None:
-        patch["project_adapter_cfg"] = _safe_copy(
-            override.project_adapter_cfg_override_raw
+    }
+
+
+@lru_cache(maxsize=256)
+def _compile_merge_plan(
+    changed_fields: tuple[tuple[str, bool], ...],
+    raw_fields: tuple[str, ...],
+    present_fields: tuple[str, ...],
+    explicit_fields: tuple[str, ...],
+) -> RunConfigMergePlan:
+    raw_keys = {key for raw_field, key in _RAW_OVERRIDE_KEYS if raw_field in raw_fields}
+    patch_steps = []
+    for field, nested in changed_fields:
+        key = _PATCH_KEY_RENAMES.get(field, field)
+        if key not in _CONSUMED_KWARGS or key in raw_keys:
+            continue
+        if field == "adapter" or (field in _CALLBACK_FIELDS and field in present_fields):
+            continue
+        patch_steps.append((field, key, nested))
+
+    return RunConfigMergePlan(
+        patch_steps=tuple(patch_steps),
+        raw_steps=tuple(
+            (raw_field, key)
+            for raw_field, key in _RAW_OVERRIDE_KEYS
+            if raw_field in raw_fields
+        ),
+        present_fields=present_fields,
+        explicit_fields=tuple(
+            field for field in _EXPLICIT_COPY_FIELDS if field in explicit_fields
+        ),
+        explicit_marks=tuple(sorted(explicit_fields)),
+    )
+
+
+def compile_merge_plan(
+    override: RunConfig,
+    changed: dict[str, tuple[Any, Any]] | None = None,
+) -> RunConfigMergePlan:
+    """Return the cached merge plan for the shape of ``override``.
+
+    Args:
+        override: The (possibly sparse) override config.
+        changed: Precomputed result of diffing ``override`` against defaults.
+
+    Returns:
+        RunConfigMergePlan: A reusable plan shared by all overrides of the
+        same shape.
+    """
+    if changed is None:
+        changed = _diff_run_config(override)
+    changed_fields = tuple(
+        (
+            field,
+            hasattr(current_value, "merge_dict")
+            and hasattr(default_value, "__struct_fields__"),
         )
-    if override.adapter is not None:
-        patch["adapter"] = dict(override.adapter)
-    if override.on_success is not None:
-        patch["on_success"] = _clone_callback_spec(override.on_success)
-    if override.on_failure is not None:
-        patch["on_failure"] = _clone_callback_spec(override.on_failure)
-
-    explicit_fields = set(override.explicit_overrides or [])
-    for field in (
-        "inputs",
-        "final_vars",
-        "config",
-        "cache",
-        "log_level",
-        "reload",
-        "async_driver",
-        "additional_modules",
-        "adapter",
-        "pipeline_adapter_cfg",
-        "project_adapter_cfg",
-        "on_success",
-        "on_failure",
-    ):
-        if field in explicit_fields:
-            setattr(merged, field, _safe_copy(getattr(override, field)))
+        for field, (current_value, default_value) in changed.items()
+    )
+    raw_fields = tuple(
+        raw_field
+        for raw_field, _ in _RAW_OVERRIDE_KEYS
+        if getattr(override, raw_field) is not None
+    )
+    present_fields = tuple(
+        field
+        for field in ("adapter", "on_success", "on_failure")
+        if getattr(override, field) is not None
+    )
+    explicit_fields = tuple(sorted(set(override.explicit_overrides or ())))
+    return _compile_merge_plan(
+        changed_fields, raw_fields, present_fields, explicit_fields
+    )
 
-    if explicit_fields:
-        _mark_explicit_override(merged, *sorted(explicit_fields))
 
-    if patch:
-        merge_run_config_with_kwargs(merged, patch)
+def merge_run_configs(base: RunConfig, override: RunConfig | None) -> RunConfig:
+    """Merge a user-provided ``RunConfig`` onto pipeline defaults.
 
-    return merged
+    The override config may be only partially populated. This function treats
+    values matching ``RunConfig()`` defaults as unspecified and merges only the
+    differing fields onto a copy-on-write clone of ``base``. The merge recipe
+    is compiled once per override shape (see :func:`compile_merge_plan`).
+    """
+    if override is None:
+        return clone_run_config(base)
+
+    changed = _diff_run_config(override)
+    return compile_merge_plan(override, changed).apply(base, override, changed)
 
 
 _UNSET = object()
@@ -980,9 +1164,104 @@ class RunConfigBuilder:
         """Create builder from existing config."""
         return cls(base_config=config)
 
-    def build(self) -> RunConfig:
-        """Build and return the RunConfig object."""
+    def build(self, base: RunConfig | None = None) -> RunConfig:
+        """Build and return the RunConfig object.
+
+        The merge plan for the built config's shape is compiled eagerly, so the
+        first run using it only pays for applying the plan.
+
+        Args:
+            base: Optional pipeline defaults. When given, the built config is
+                merged onto a copy of ``base`` and the merged result returned.
+
+        Returns:
+            RunConfig: The built (or merged) configuration.
+        """
         built = clone_run_config(self.config)
         built.on_success = _normalize_callback_spec(built.on_success)
         built.on_failure = _normalize_callback_spec(built.on_failure)
+        changed = _diff_run_config(built)
+        plan = compile_merge_plan(built, changed)
+        if base is not None:
+            return plan.apply(base, built, changed)
         return built
+
+
+def run_config_from_options(
+    *,
+    inputs: Any = None,
+    final_vars: Any = None,
+    config: Any = None,
+    cache: Any = None,
+    with_adapter: Any = None,
+    log_level: str | None = None,
+    executor_cfg: dict[str, Any] | None = None,
+    max_retries: int | None = None,
+    retry_delay: float | None = None,
+    jitter_factor: float | None = None,
+) -> RunConfig:
+    """Build a partial RunConfig from parsed ``pipeline run`` options.
+
+    ``None`` means the option was not supplied, so only the given values become
+    overrides and pipeline defaults remain untouched. Options of the wrong
+    shape are ignored with a warning. Shared by ``pipeline run`` and the
+    ``flowerpower serve`` daemon so that remote runs merge exactly like local
+    ones.
+
+    Raises:
+        ValueError: If the executor configuration is invalid.
+    """
+    builder = RunConfigBuilder()
+
+    if inputs is not None:
+        if not isinstance(inputs, dict):
+            logger.warning(f"Expected dict for inputs, got {type(inputs)}")
+        else:
+            builder.with_inputs(inputs)
+
+    if final_vars is not None:
+        if not isinstance(final_vars, list):
+            logger.warning(f"Expected list for final_vars, got {type(final_vars)}")
+        else:
+            builder.with_final_vars(final_vars)
+
+    if config is not None:
+        if not isinstance(config, dict):
+            logger.warning(f"Expected dict for config, got {type(config)}")
+        else:
+            builder.with_config(config)
+
+    if cache is not None:
+        builder.with_cache(cache)
+
+    if with_adapter is not None:
+        if not isinstance(with_adapter, dict):
+            logger.warning(f"Expected dict for with_adapter, got {type(with_adapter)}")
+        else:
+            builder.with_with_adapter_cfg(with_adapter)
+
+    if log_level is not None:
+        builder.with_logging(log_level)
+
+    if executor_cfg:
+        try:
+            if "type" in executor_cfg:
+                validate_executor_type(executor_cfg["type"])
+            builder.with_executor(dict(executor_cfg))
+        except (SecurityError, TypeError, ValueError) as e:
+            raise ValueError(f"Invalid executor configuration: {e}") from e
+
+    # Retry configuration only when at least one retry option is given
+    retry_kwargs = {
+        key: value
+        for key, value in (
+            ("max_retries", max_retries),
+            ("retry_delay", retry_delay),
+            ("jitter_factor", jitter_factor),
+        )
+        if value is not None
+    }
+    if retry_kwargs:
+        builder.with_retry_config(**retry_kwargs)
+
+    return builder.build()
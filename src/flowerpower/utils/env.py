@@ -7,6 +7,7 @@ Features:
   (FP_PROJECT__..., FP_PIPELINE__...).
 - Coerce scalar types (int, float, bool) and JSON objects/arrays for rich values.
 - Merge overrides into msgspec-based config structs with clear precedence.
+- Memoize parsed overrides against the FP_* environment snapshot.
 """
 
 from __future__ import annotations
@@ -64,6 +65,28 @@ def _set_nested(dct: dict, path: list[str], value: Any) -> None:
     cur[path[-1]] = value
 
 
+# prefix -> (env snapshot, parsed overrides). Only the latest snapshot per
+# prefix is kept; entries are never handed out without copying.
+_OVERRIDES_CACHE: dict[str, tuple[frozenset[tuple[str, str]], dict]] = {}
+
+
+def _env_snapshot(env: Mapping[str, str], prefix: str) -> frozenset[tuple[str, str]]:
+    return frozenset((key, value) for key, value in env.items() if key.startswith(prefix))
+
+
+def clear_env_overrides_cache() -> None:
+    """Drop memoized overrides, forcing the next parse to re-read the env."""
+    _OVERRIDES_CACHE.clear()
+
+
+def _copy_overrides(data: Any) -> Any:
+    if isinstance(data, dict):
+        return {key: _copy_overrides(value) for key, value in data.items()}
+    if isinstance(data, list):
+        return [_copy_overrides(value) for value in data]
+    return data
+
+
 def parse_env_overrides(
     env: Mapping[str, str] | None = None, prefix: str = "FP_"
 ) -> dict:
@@ -73,11 +96,27 @@ def parse_env_overrides(
     - FP_PROJECT__ADAPTER__HAMILTON_TRACKER__API_KEY
     - FP_PIPELINE__RUN__EXECUTOR__TYPE
     - FP_LOG_LEVEL (global shim)
+
+    Results are memoized against the set of ``prefix``-matching items, so
+    value coercion and nesting only re-run when an ``FP_*`` variable
+    changes. Callers receive a private copy they may mutate. Use
+    :func:`clear_env_overrides_cache` to invalidate explicitly.
     """
-    env = dict(env or os.environ)
+    env = os.environ if env is None else env
+    snapshot = _env_snapshot(env, prefix)
+    cached = _OVERRIDES_CACHE.get(prefix)
+    if cached is not None and cached[0] == snapshot:
+        return _copy_overrides(cached[1])
+
+    overrides = _parse_env_overrides(env, prefix)
+    _OVERRIDES_CACHE[prefix] = (snapshot, overrides)
+    return _copy_overrides(overrides)
+
+
+def _parse_env_overrides(env: Mapping[str, str], prefix: str) -> dict:
     overrides: dict[str, Any] = {}
 
-    for key, raw in env.items():
+    for key, raw in list(env.items()):
         if not key.startswith(prefix):
             continue
         rest = key[len(prefix) :]
@@ -94,7 +133,6 @@ def parse_env_overrides(
     return overrides
 
 
-
 def build_specific_overlays(overrides: dict) -> tuple[dict, dict]:
     """Return (project_overlay, pipeline_overlay) from parsed overrides.
 
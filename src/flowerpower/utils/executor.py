@@ -6,6 +6,7 @@ with proper error handling and dependency management.
 """
 
 import functools
+import threading
 from typing import Any, Dict, Optional, Union
 
 from loguru import logger
@@ -19,8 +20,20 @@ class ExecutorFactory:
 
     This class centralizes executor type selection and instance creation
     to reduce complexity in the Pipeline class.
+
+    Runs should borrow executors with :meth:`acquire` and hand them back with
+    :meth:`release`. Hamilton executors hold a worker pool between ``init()``
+    and ``finalize()``, so an executor is lent to one run at a time:
+    concurrent runs get separate instances, later runs reuse idle ones.
     """
 
+    #: Idle executors kept per configuration.
+    max_idle: int = 16
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._idle: Dict[Any, list[Any]] = {}
+
     def create_executor(
         self, executor_cfg: Union[str, Dict[str, Any], Any, None]
     ) -> Any:
@@ -31,7 +44,8 @@ class ExecutorFactory:
             executor_cfg: Executor configuration (string, dict, or ExecutorConfig)
 
         Returns:
-            Executor instance
+            Executor instance, shared by all callers with the same
+            configuration. Use :meth:`acquire` for pipeline runs.
         """
         # Normalize configuration
         executor_cfg = self._normalize_config(executor_cfg)
@@ -42,9 +56,50 @@ class ExecutorFactory:
         """Create executor with bounded caching."""
         return self._create_executor_by_type(executor_cfg)
 
+    def acquire(self, executor_cfg: Union[str, Dict[str, Any], Any, None]) -> Any:
+        """
+        Borrow an executor for one run.
+
+        Args:
+            executor_cfg: Executor configuration (string, dict, or ExecutorConfig)
+
+        Returns:
+            An idle executor for this configuration, or a new one if all are
+            in use. Return it with :meth:`release` when the run has finished.
+        """
+        executor_cfg = self._normalize_config(executor_cfg)
+        with self._lock:
+            idle = self._idle.get(executor_cfg)
+            if idle:
+                return idle.pop()
+        return self._create_executor_by_type(executor_cfg)
+
+    def release(
+        self, executor_cfg: Union[str, Dict[str, Any], Any, None], executor: Any
+    ) -> None:
+        """
+        Return an executor obtained from :meth:`acquire`.
+
+        Hamilton finalizes remote executors at the end of a run; an executor
+        that is still initialized is finalized here before it is reused.
+        """
+        if getattr(executor, "initialized", False):
+            try:
+                executor.finalize()
+            except Exception as error:
+                logger.warning(f"Dropping executor that failed to finalize: {error}")
+                return
+        executor_cfg = self._normalize_config(executor_cfg)
+        with self._lock:
+            idle = self._idle.setdefault(executor_cfg, [])
+            if len(idle) < self.max_idle:
+                idle.append(executor)
+
     def clear_cache(self) -> None:
-        """Clear the executor cache (for testing)."""
+        """Clear the executor cache and idle executors (for testing)."""
         self._create_cached_executor.cache_clear()
+        with self._lock:
+            self._idle.clear()
 
     def _normalize_config(
         self, executor_cfg: Union[str, Dict[str, Any], Any, None]
@@ -10,6 +10,8 @@ import sys
 from collections.abc import Iterable
 from typing import Any
 
+from fsspec.asyn import AsyncFileSystem, _run_coros_in_chunks, sync
+from fsspec.implementations.dirfs import DirFileSystem
 from fsspeckit import AbstractFileSystem
 from loguru import logger
 
@@ -45,6 +47,73 @@ def find_first_existing_path(
     return None
 
 
+def _async_backend(fs: AbstractFileSystem) -> AsyncFileSystem | None:
+    """Return the async filesystem backing ``fs``, looking through dirfs layers.
+
+    ``None`` is returned for synchronous backends and for filesystems created in
+    ``asynchronous`` mode, which must be awaited by their owner instead.
+    """
+    target = fs
+    while isinstance(target, DirFileSystem):
+        target = target.fs
+    if (
+        isinstance(target, AsyncFileSystem)
+        and target.async_impl
+        and not target.asynchronous
+    ):
+        return target
+    return None
+
+
+def read_candidate_paths(
+    fs: AbstractFileSystem,
+    candidates: Iterable[str],
+    *,
+    purpose: str = "path",
+) -> dict[str, bytes] | None:
+    """Read all candidate paths concurrently on async filesystems.
+
+    Remote backends such as ``s3fs`` or ``gcsfs`` implement fsspec's async
+    API.  For them every candidate is fetched with ``_cat_file`` in a single
+    concurrent wave (bounded by the backend ``batch_size``), so a missing
+    candidate costs no extra ``exists`` round-trip.  Missing paths and probe
+    failures are treated as misses, like :func:`find_first_existing_path`.
+
+    Args:
+        fs: Filesystem to read from.
+        candidates: Candidate paths; duplicates are read once.
+        purpose: Short label used for debug logging.
+
+    Returns:
+        ``{path: content}`` for every candidate that could be read, or ``None``
+        when ``fs`` has no async backend and callers should probe serially.
+    """
+    backend = _async_backend(fs)
+    if backend is None:
+        return None
+
+    paths = list(dict.fromkeys(candidates))
+    if not paths:
+        return {}
+
+    async def _read_all() -> list[Any]:
+        return await _run_coros_in_chunks(
+            [fs._cat_file(path) for path in paths],
+            batch_size=getattr(backend, "batch_size", None),
+            return_exceptions=True,
+            nofiles=True,
+        )
+
+    contents: dict[str, bytes] = {}
+    for path, result in zip(paths, sync(backend.loop, _read_all), strict=True):
+        if isinstance(result, BaseException):
+            if not isinstance(result, FileNotFoundError):
+                logger.debug(f"Skipping unreadable {purpose} candidate {path}: {result}")
+            continue
+        contents[path] = result
+    return contents
+
+
 def resolve_project_path(
     fs: AbstractFileSystem,
     base_dir: str | None = None,
@@ -6,6 +6,8 @@ from loguru import logger
 from ..settings import LOG_LEVEL
 
 _LOGGING_INITIALIZED = False
+# Loguru's default stderr handler has ID 0.
+_HANDLER_ID: int | None = 0
 
 
 def setup_logging(level: str | None = None) -> None:
@@ -19,9 +21,19 @@ def setup_logging(level: str | None = None) -> None:
 
     If the effective logging level is "CRITICAL", logging for the "flowerpower" module
     is disabled. Otherwise, logging is enabled and configured.
+
+    Only loguru's default handler and the handler added by a previous call are
+    replaced, so sinks added by embedding code such as
+    ``flowerpower serve`` survive per-run log level changes.
     """
-    # Remove all existing handlers to prevent duplicate logs
-    logger.remove()
+    global _HANDLER_ID
+    # Remove the previous handler to prevent duplicate logs
+    if _HANDLER_ID is not None:
+        try:
+            logger.remove(_HANDLER_ID)
+        except ValueError:
+            pass
+        _HANDLER_ID = None
 
     # Determine the effective logging level
     effective_level = level or os.getenv("FP_LOG_LEVEL") or LOG_LEVEL
@@ -30,7 +42,7 @@ def setup_logging(level: str | None = None) -> None:
         logger.disable("flowerpower")
     else:
         logger.enable("flowerpower")
-        logger.add(
+        _HANDLER_ID = logger.add(
             sys.stderr,
             level=effective_level.upper(),
             format="<green>{time:YYYY-MM-DD HH:mm:ss.SSS}</green> | <level>{level: <8}</level> | <cyan>{name}</cyan>:<cyan>{function}</cyan>:<cyan>{line}</cyan> - <level>{message}</level>",
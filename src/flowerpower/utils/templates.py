@@ -10,6 +10,7 @@ from hamilton.htypes import Parallelizable, Collect
 
 from pathlib import Path
 
+from flowerpower import params
 from flowerpower.cfg import Config
 
 def _resolve_base_dir() -> Path:
@@ -26,15 +27,21 @@ def _resolve_base_dir() -> Path:
             raise RuntimeError("Could not locate project root for pipeline configuration.")
         current = current.parent
 
+
+def _load_params():
+    return Config.load(
+        _resolve_base_dir(),
+        pipeline_name="{name}",
+        cfg_dir="{cfg_dir}",
+        pipelines_dir="{pipelines_dir}",
+    ).pipeline.h_params
+
 ####################################################################################################
 # Load pipeline parameters. Do not modify this section.
+# FlowerPower injects the already-loaded parameters; the config is only read
+# from disk when this module is imported standalone.
 
-PARAMS = Config.load(
-    _resolve_base_dir(),
-    pipeline_name="{name}",
-    cfg_dir="{cfg_dir}",
-    pipelines_dir="{pipelines_dir}",
-).pipeline.h_params
+PARAMS = params("{name}", fallback=_load_params)
 
 
 ####################################################################################################
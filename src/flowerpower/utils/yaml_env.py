@@ -14,7 +14,9 @@ After interpolation, if the resulting string is valid JSON (object/array/number/
 it is coerced to the corresponding Python type. Otherwise the string is returned.
 
 This module performs interpolation after YAML is parsed, by recursively walking the
-loaded dict/list structure and transforming string values in-place.
+loaded dict/list structure and transforming only string values containing ``$``.
+Containers without such strings are returned as-is, so large configs without
+placeholders are walked but never rebuilt.
 """
 
 from __future__ import annotations
@@ -24,6 +26,8 @@ import os
 import re
 from typing import Any, Mapping
 
+import msgspec
+
 
 _VAR_PATTERN = re.compile(r"\$\$|\$\{[^}]+\}|\$[A-Za-z_][A-Za-z0-9_]*")
 
@@ -123,19 +127,63 @@ def interpolate_env_in_data(
 ) -> Any:
     """Recursively interpolate environment variables for all string values in data.
 
-    Modifies lists and dicts recursively; returns the transformed structure.
+    Only strings containing ``$`` are expanded. Dicts and lists are copied only
+    when one of their values changed; otherwise the original object is returned.
     """
-    env = env or os.environ
+    return _interpolate(data, env or os.environ, json_coerce)
 
-    if isinstance(data, dict):
-        return {
-            k: interpolate_env_in_data(v, env=env, json_coerce=json_coerce)
-            for k, v in data.items()
-        }
-    if isinstance(data, list):
-        return [
-            interpolate_env_in_data(v, env=env, json_coerce=json_coerce) for v in data
-        ]
+
+def _interpolate(data: Any, env: Mapping[str, str], json_coerce: bool) -> Any:
     if isinstance(data, str):
+        if "$" not in data:
+            return data
         return interpolate_string(data, env=env, json_coerce=json_coerce)
+
+    if isinstance(data, dict):
+        changed: dict[Any, Any] | None = None
+        for key, value in data.items():
+            if not isinstance(value, (str, dict, list)):
+                continue
+            new_value = _interpolate(value, env, json_coerce)
+            if new_value is not value:
+                if changed is None:
+                    changed = {}
+                changed[key] = new_value
+        if changed is None:
+            return data
+        return {key: changed.get(key, value) for key, value in data.items()}
+
+    if isinstance(data, list):
+        result: list[Any] | None = None
+        for index, value in enumerate(data):
+            if not isinstance(value, (str, dict, list)):
+                continue
+            new_value = _interpolate(value, env, json_coerce)
+            if new_value is not value:
+                if result is None:
+                    result = list(data)
+                result[index] = new_value
+        return data if result is None else result
+
     return data
+
+
+def load_yaml_with_env(raw: bytes | str, env: Mapping[str, str] | None = None) -> Any:
+    """Decode YAML text and interpolate environment placeholders.
+
+    Uses ``msgspec.yaml.decode``, which picks PyYAML's C-accelerated
+    ``CSafeLoader`` when libyaml is available and the pure-Python safe loader
+    otherwise. Empty documents decode to an empty dict.
+
+    Args:
+        raw: YAML document as bytes or text.
+        env: Environment mapping used for interpolation. Defaults to ``os.environ``.
+
+    Returns:
+        The decoded and interpolated data.
+
+    Raises:
+        msgspec.DecodeError: If the document is not valid YAML.
+    """
+    data = msgspec.yaml.decode(raw) or {}
+    return interpolate_env_in_data(data, env=env)
@@ -0,0 +1,126 @@
+"""Concurrent config loading against an async, S3-style filesystem stand-in."""
+
+import asyncio
+
+import pytest
+from fsspec.asyn import AsyncFileSystem
+from fsspec.implementations.dirfs import DirFileSystem
+from fsspec.implementations.local import LocalFileSystem
+
+from flowerpower.cfg import Config
+from flowerpower.pipeline.catalog import PipelineCatalog
+from flowerpower.pipeline.config_manager import PipelineConfigManager
+from flowerpower.utils.filesystem import read_candidate_paths
+
+
+class LatencyObjectStore(AsyncFileSystem):
+    """In-memory async object store that records request concurrency."""
+
+    protocol = "latencystore"
+    cachable = False
+
+    def __init__(self, objects, latency=0.02, **kwargs):
+        super().__init__(**kwargs)
+        self.objects = {key.strip("/"): value for key, value in objects.items()}
+        self.latency = latency
+        self.requests = []
+        self.in_flight = 0
+        self.max_in_flight = 0
+
+    async def _request(self, kind, path):
+        self.requests.append((kind, path))
+        self.in_flight += 1
+        self.max_in_flight = max(self.max_in_flight, self.in_flight)
+        try:
+            await asyncio.sleep(self.latency)
+        finally:
+            self.in_flight -= 1
+
+    async def _cat_file(self, path, start=None, end=None, **kwargs):
+        path = self._strip_protocol(path).strip("/")
+        await self._request("cat", path)
+        if path not in self.objects:
+            raise FileNotFoundError(path)
+        return self.objects[path][start:end]
+
+    async def _info(self, path, **kwargs):
+        path = self._strip_protocol(path).strip("/")
+        await self._request("info", path)
+        if path not in self.objects:
+            raise FileNotFoundError(path)
+        return {"name": path, "size": len(self.objects[path]), "type": "file"}
+
+
+@pytest.fixture
+def store():
+    return LatencyObjectStore(
+        {
+            "bucket/project/conf/project.yml": b"name: remote\n",
+            "bucket/project/conf/pipelines/etl.yml": (
+                b"name: etl\nparams:\n  batch: 10\n"
+            ),
+            "bucket/project/conf/pipelines/legacy.yml": b"params: {}\n",
+        }
+    )
+
+
+@pytest.fixture
+def project_fs(store):
+    return DirFileSystem(path="bucket/project", fs=store)
+
+
+def test_read_candidate_paths_issues_one_concurrent_wave(store, project_fs):
+    paths = [
+        "conf/project.yml",
+        "conf/project.yaml",
+        "conf/pipelines/etl.yml",
+        "conf/pipelines/etl.yaml",
+    ]
+
+    contents = read_candidate_paths(project_fs, paths + paths[:1])
+
+    assert contents == {
+        "conf/project.yml": b"name: remote\n",
+        "conf/pipelines/etl.yml": b"name: etl\nparams:\n  batch: 10\n",
+    }
+    assert store.max_in_flight == len(paths)
+    assert all(kind == "cat" for kind, _ in store.requests)
+
+
+def test_read_candidate_paths_returns_none_for_sync_filesystems(tmp_path):
+    fs = DirFileSystem(path=str(tmp_path), fs=LocalFileSystem())
+
+    assert read_candidate_paths(fs, ["conf/project.yml"]) is None
+
+
+def test_config_load_reads_all_candidates_in_a_single_wave(store, project_fs):
+    config = Config.load(base_dir="bucket/project", pipeline_name="etl", fs=project_fs)
+
+    assert config.project.name == "remote"
+    assert config.pipeline.name == "etl"
+    assert config.pipeline.params == {"batch": 10}
+    # 2 project + 4 pipeline candidates, all in flight at once, no exists probes.
+    assert len(store.requests) == 6
+    assert store.max_in_flight == 6
+    assert all(kind == "cat" for kind, _ in store.requests)
+
+
+def test_config_manager_falls_back_to_defaults_for_missing_configs(store, project_fs):
+    manager = PipelineConfigManager(
+        base_dir="bucket/project", fs=project_fs, storage_options={}
+    )
+
+    cfg = manager.load_pipeline_config("missing")
+
+    assert cfg.name == "missing"
+    assert cfg.params == {}
+    assert store.max_in_flight == 4
+
+
+def test_catalog_resolves_stored_names_in_one_wave(store, project_fs):
+    files = ["pipelines/etl.py", "pipelines/legacy.py", "pipelines/other.py"]
+    catalog = PipelineCatalog(fs=project_fs, cfg_dir="conf", pipelines_dir="pipelines")
+    catalog.get_files = lambda: files
+
+    assert catalog.get_names() == ["etl", "legacy", "other"]
+    assert store.max_in_flight == 4 * len(files)
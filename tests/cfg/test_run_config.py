@@ -21,6 +21,8 @@ from flowerpower.cfg.pipeline.adapter import AdapterConfig as PipelineAdapterCon
 from flowerpower.cfg.project.adapter import AdapterConfig as ProjectAdapterConfig
 from flowerpower.utils.config import (
     RunConfigBuilder,
+    clone_run_config,
+    compile_merge_plan,
     merge_run_config_with_kwargs,
     merge_run_configs,
     validate_resolved_run_config,
@@ -1090,3 +1092,103 @@ class TestExplicitNonePolicy:
         # Verify the result - should be all strings
         assert result["retry_exceptions"] == ["ValueError", "TypeError"]
         assert all(isinstance(exc, str) for exc in result["retry_exceptions"])
+
+
+class TestCopyOnWriteClone:
+    """Cloning shares leaf values and copies only the mutated container layer."""
+
+    class _Uncopyable:
+        def __deepcopy__(self, memo):
+            raise AssertionError("leaf input values must not be deep-copied")
+
+    def test_clone_shares_leaf_values_by_reference(self):
+        frame = self._Uncopyable()
+        base = RunConfig(
+            inputs={"df": frame},
+            config={"nested": {"a": 1}},
+            cache={"recompute": ["node"]},
+        )
+
+        cloned = clone_run_config(base)
+
+        assert cloned.inputs is not base.inputs
+        assert cloned.inputs["df"] is frame
+        assert cloned.config["nested"] is base.config["nested"]
+        assert cloned.cache is not base.cache
+
+    def test_clone_isolates_top_level_mutations(self):
+        base = RunConfig(inputs={"a": 1}, final_vars=["x"])
+
+        cloned = clone_run_config(base)
+        cloned.inputs["b"] = 2
+        cloned.final_vars.append("y")
+
+        assert base.inputs == {"a": 1}
+        assert base.final_vars == ["x"]
+
+    def test_merge_does_not_deep_copy_or_mutate_override_inputs(self):
+        frame = self._Uncopyable()
+        override_inputs = {"df": frame}
+        base = RunConfig(inputs={"base": 1})
+
+        merged = merge_run_configs(base, RunConfig(inputs=override_inputs))
+        merged.inputs["extra"] = 3
+
+        assert merged.inputs["df"] is frame
+        assert merged.inputs["base"] == 1
+        assert override_inputs == {"df": frame}
+        assert base.inputs == {"base": 1}
+
+    def test_kwargs_merge_copies_first_inputs_layer(self):
+        run_config = RunConfig(inputs=None)
+        caller_inputs = {"a": 1}
+
+        merge_run_config_with_kwargs(run_config, {"inputs": caller_inputs})
+        merge_run_config_with_kwargs(run_config, {"inputs": {"b": 2}})
+
+        assert run_config.inputs == {"a": 1, "b": 2}
+        assert caller_inputs == {"a": 1}
+
+
+class TestMergePlan:
+    """Merge plans are compiled once per override shape and reused."""
+
+    def test_same_shape_overrides_share_one_plan(self):
+        first = RunConfig(inputs={"a": 1}, final_vars=["x"])
+        second = RunConfig(inputs={"b": 2}, final_vars=["y"])
+
+        assert compile_merge_plan(first) is compile_merge_plan(second)
+        assert compile_merge_plan(first) is not compile_merge_plan(
+            RunConfig(inputs={"a": 1})
+        )
+
+    def test_plan_skips_fields_not_consumed_by_merge(self):
+        override = RunConfig(inputs={"a": 1}, explicit_overrides=["reload"])
+
+        plan = compile_merge_plan(override)
+
+        keys = {key for _, key, _ in plan.patch_steps}
+        assert keys == {"inputs"}
+        assert plan.explicit_fields == ("reload",)
+
+    def test_plan_routes_raw_executor_override_instead_of_diff(self):
+        override = RunConfigBuilder().with_executor({"max_workers": 2}).build()
+        base = RunConfig(executor=ExecutorConfig(type="threadpool", max_workers=8))
+
+        plan = compile_merge_plan(override)
+        merged = plan.apply(base, override)
+
+        assert ("executor_override_raw", "executor_cfg") in plan.raw_steps
+        assert all(key != "executor_cfg" for _, key, _ in plan.patch_steps)
+        assert merged.executor.type == "threadpool"
+        assert merged.executor.max_workers == 2
+
+    def test_builder_build_with_base_merges_via_plan(self):
+        base = RunConfig(inputs={"a": 1}, final_vars=["x"], log_level="DEBUG")
+
+        merged = RunConfigBuilder().with_inputs({"b": 2}).build(base=base)
+
+        assert merged.inputs == {"b": 2}
+        assert merged.final_vars == ["x"]
+        assert merged.log_level == "DEBUG"
+        assert base.inputs == {"a": 1}
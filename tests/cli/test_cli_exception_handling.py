@@ -20,7 +20,7 @@ def _mock_project(mocker, side_effect):
     mock_instance = mocker.MagicMock()
     mock_instance.run.side_effect = side_effect
     mocker.patch(
-        "flowerpower.cli.pipeline.FlowerPowerProject.load",
+        "flowerpower.flowerpower.FlowerPowerProject.load",
         return_value=mock_instance,
     )
     return mock_instance
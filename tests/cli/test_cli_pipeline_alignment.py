@@ -23,7 +23,7 @@ def _stubbed_manager(
     manager_context.__exit__.return_value = False
 
     manager_factory = MagicMock(return_value=manager_context)
-    monkeypatch.setattr("flowerpower.cli.pipeline.PipelineManager", manager_factory)
+    monkeypatch.setattr("flowerpower.pipeline.manager.PipelineManager", manager_factory)
     return manager_instance
 
 
@@ -71,3 +71,30 @@ def test_cli_show_pipelines_format(monkeypatch: pytest.MonkeyPatch, requested_fo
 
     assert result.exit_code == 0
     manager_instance.registry.list_pipeline_info.assert_called_once_with()
+
+
+def test_cli_show_summary_forwards_limit_and_offset(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    def configure(manager: MagicMock) -> None:
+        manager.registry.show_summary.return_value = None
+
+    manager_instance = _stubbed_manager(monkeypatch, configure)
+
+    result = runner.invoke(
+        app,
+        ["pipeline", "show-summary", "--limit", "5", "--offset", "10", "--no-code"],
+        catch_exceptions=False,
+    )
+
+    assert result.exit_code == 0
+    manager_instance.registry.show_summary.assert_called_once_with(
+        name=None,
+        cfg=True,
+        code=False,
+        project=True,
+        to_html=False,
+        to_svg=False,
+        limit=5,
+        offset=10,
+    )
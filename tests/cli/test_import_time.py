@@ -0,0 +1,70 @@
+"""Import-time budget for the CLI entry point.
+
+``flowerpower --help`` and shell completion must not import the execution
+stack. The check runs in a fresh interpreter with ``-X importtime`` so that
+modules already imported by the test session do not hide regressions.
+"""
+
+import subprocess
+import sys
+
+# Generous enough for slow CI machines; importing the execution stack costs
+# well over a second on a warm cache.
+IMPORT_BUDGET_SECONDS = 0.6
+
+HEAVY_MODULES = (
+    "hamilton",
+    "fsspeckit",
+    "pandas",
+    "polars",
+    "pyarrow",
+    "flowerpower.cfg",
+    "flowerpower.flowerpower",
+    "flowerpower.pipeline.manager",
+)
+
+HELP_SCRIPT = """
+from flowerpower.cli import app
+
+try:
+    app(["--help"])
+except SystemExit:
+    pass
+"""
+
+
+def _import_times(code: str) -> dict[str, int]:
+    """Cumulative import time in microseconds per module imported by ``code``."""
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", code],
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    times = {}
+    for line in result.stderr.splitlines():
+        if not line.startswith("import time:") or "|" not in line:
+            continue
+        _, cumulative, name = line.split("|")
+        if cumulative.strip().isdigit():
+            times[name.strip()] = int(cumulative)
+    return times
+
+
+def test_cli_help_does_not_import_execution_stack():
+    times = _import_times(HELP_SCRIPT)
+
+    loaded = sorted(
+        name
+        for name in times
+        if any(name == heavy or name.startswith(f"{heavy}.") for heavy in HEAVY_MODULES)
+    )
+    assert loaded == []
+    assert times["flowerpower.cli"] / 1e6 < IMPORT_BUDGET_SECONDS
+
+
+def test_package_import_is_lazy():
+    times = _import_times("import flowerpower, flowerpower.pipeline, flowerpower.utils")
+
+    assert not any(name.startswith("flowerpower.pipeline.") for name in times)
+    assert "hamilton" not in times
@@ -46,7 +46,7 @@ def test_load_hook_uses_project_configured_hooks_dir(
     hook_module = SimpleNamespace(my_hook=lambda: "ok")
     mock_module_from_spec.return_value = hook_module
 
-    with patch("flowerpower.cli.utils.PipelineManager", return_value=manager_context):
+    with patch("flowerpower.pipeline.manager.PipelineManager", return_value=manager_context):
         hook = load_hook("pipeline_name", "pkg.module.my_hook")
 
     assert hook() == "ok"
@@ -78,7 +78,7 @@ def test_load_hook_parses_storage_options_string(
     mock_spec_from_file_location.return_value = spec
     mock_module_from_spec.return_value = SimpleNamespace(my_hook=lambda: "ok")
 
-    with patch("flowerpower.cli.utils.PipelineManager", return_value=manager_context) as mock_manager:
+    with patch("flowerpower.pipeline.manager.PipelineManager", return_value=manager_context) as mock_manager:
         hook = load_hook(
             "pipeline_name",
             "module.my_hook",
@@ -49,3 +49,67 @@ def memory_fs():
     fs = fsspec.filesystem("memory")
     yield fs
     fs.store.clear()  # Clean up after test
+
+
+@pytest.fixture(autouse=True)
+def isolated_run_history(tmp_path, monkeypatch):
+    """Keep run history out of the user's cache directory.
+
+    Recording is off unless a test enables ``history.HISTORY_ENABLED``; the
+    database then lives in the test's temporary directory.
+    """
+    from flowerpower.pipeline import history
+
+    path = tmp_path / "history.sqlite"
+    monkeypatch.setattr(history, "HISTORY_ENABLED", False)
+    monkeypatch.setattr(history, "HISTORY_PATH", str(path))
+    return path
+
+
+@pytest.fixture
+def make_project(tmp_path, monkeypatch):
+    """Factory that writes a small FlowerPower project into ``tmp_path``.
+
+    The returned callable takes the project name, the pipeline modules and
+    their configs (both keyed by the module path relative to the pipelines
+    directory, e.g. ``"group/beta"``) and optional extra files keyed by their
+    path relative to the project root. ``tmp_path`` is prepended to
+    ``sys.path`` so pipeline and helper modules are importable.
+
+    Returns:
+        Callable[..., Path]: Factory returning the project directory.
+    """
+
+    def _make_project(
+        name: str,
+        modules: dict[str, str | bytes] | None = None,
+        configs: dict[str, str] | None = None,
+        *,
+        pipelines_dir: str = "pipelines",
+        files: dict[str, str] | None = None,
+    ) -> Path:
+        (tmp_path / pipelines_dir).mkdir(parents=True, exist_ok=True)
+        (tmp_path / "conf" / pipelines_dir).mkdir(parents=True, exist_ok=True)
+        (tmp_path / "conf" / "project.yml").write_text(f"name: {name}\n")
+        written = {
+            **{
+                f"{pipelines_dir}/{module}.py": text
+                for module, text in (modules or {}).items()
+            },
+            **{
+                f"conf/{pipelines_dir}/{module}.yml": text
+                for module, text in (configs or {}).items()
+            },
+            **(files or {}),
+        }
+        for path, content in written.items():
+            target = tmp_path / path
+            target.parent.mkdir(parents=True, exist_ok=True)
+            if isinstance(content, bytes):
+                target.write_bytes(content)
+            else:
+                target.write_text(content)
+        monkeypatch.syspath_prepend(str(tmp_path))
+        return tmp_path
+
+    return _make_project
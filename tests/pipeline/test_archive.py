@@ -0,0 +1,197 @@
+"""Tests for single-archive pipeline export and import."""
+
+import io
+import tarfile
+
+import msgspec
+import pytest
+
+from flowerpower.pipeline import PipelineManager
+from flowerpower.pipeline.archive import (
+    MANIFEST_NAME,
+    ArchiveManifest,
+    detect_archive_format,
+)
+
+PIPELINES_DIR = "archived_flows"
+
+
+def _make_project(root, name="archived"):
+    (root / PIPELINES_DIR / "group").mkdir(parents=True)
+    (root / "conf" / PIPELINES_DIR).mkdir(parents=True)
+    (root / "conf" / "project.yml").write_text(f"name: {name}\n")
+    (root / PIPELINES_DIR / "alpha.py").write_text("x = 1\n")
+    (root / PIPELINES_DIR / "group" / "beta.py").write_text("y = 2\n")
+    (root / "conf" / PIPELINES_DIR / "alpha.yml").write_text("params: {}\n")
+    return root
+
+
+@pytest.fixture
+def source(tmp_path):
+    return _make_project(tmp_path / "source")
+
+
+@pytest.fixture
+def target(tmp_path):
+    root = tmp_path / "target"
+    (root / "conf").mkdir(parents=True)
+    (root / "conf" / "project.yml").write_text("name: target\n")
+    return root
+
+
+def _manager(root):
+    return PipelineManager(base_dir=str(root), pipelines_dir=PIPELINES_DIR)
+
+
+def test_detect_archive_format():
+    assert detect_archive_format("s3://b/project.tar.zst") == "tar.zst"
+    assert detect_archive_format("project.tgz") == "tar.gz"
+    assert detect_archive_format("project.bin", "tar.gz") == "tar.gz"
+    with pytest.raises(ValueError):
+        detect_archive_format("project.zip")
+
+
+def test_export_archive_writes_manifest_first_with_hashes(source, tmp_path):
+    archive = tmp_path / "out" / "project.tar.gz"
+    archive.parent.mkdir()
+
+    with _manager(source) as manager:
+        manifest = manager.io.export_archive(str(archive))
+        with pytest.raises(FileExistsError):
+            manager.io.export_archive(str(archive))
+
+    with tarfile.open(archive, "r:gz") as tar:
+        members = tar.getnames()
+        stored = msgspec.json.decode(
+            tar.extractfile(MANIFEST_NAME).read(), type=ArchiveManifest
+        )
+
+    assert members[0] == MANIFEST_NAME
+    assert sorted(members[1:]) == [
+        f"{PIPELINES_DIR}/alpha.py",
+        f"{PIPELINES_DIR}/group/beta.py",
+        "conf/archived_flows/alpha.yml",
+        "conf/project.yml",
+    ]
+    assert stored == manifest
+    assert manifest.project == "archived"
+    assert {p.name: p.files for p in manifest.pipelines} == {
+        "alpha": [f"{PIPELINES_DIR}/alpha.py", f"conf/{PIPELINES_DIR}/alpha.yml"],
+        "group.beta": [f"{PIPELINES_DIR}/group/beta.py"],
+    }
+    assert all(len(entry.sha256) == 64 for entry in manifest.files)
+
+
+def test_import_from_archive_extracts_selected_pipelines(source, target, tmp_path):
+    archive = tmp_path / "project.tgz"
+    with _manager(source) as manager:
+        manager.io.export_archive(str(archive), names=["group.beta"])
+        manager.io.export_archive(str(archive), overwrite=True)
+
+    with _manager(target) as manager:
+        report = manager.io.import_from_archive(str(archive), names=["alpha"])
+        with pytest.raises(ValueError, match="not in archive"):
+            manager.io.import_from_archive(str(archive), names=["missing"])
+
+    assert (target / PIPELINES_DIR / "alpha.py").read_text() == "x = 1\n"
+    assert (target / "conf" / PIPELINES_DIR / "alpha.yml").exists()
+    assert not (target / PIPELINES_DIR / "group").exists()
+    # The existing project config is kept without overwrite.
+    assert (target / "conf" / "project.yml").read_text() == "name: target\n"
+    assert (report.copied, report.skipped) == (2, 1)
+
+    with _manager(target) as manager:
+        again = manager.io.import_from_archive(str(archive), overwrite=True)
+
+    assert (again.copied, again.unchanged) == (2, 2)
+    assert (target / "conf" / "project.yml").read_text() == "name: archived\n"
+
+
+def test_import_from_archive_rejects_tampered_files(source, target, tmp_path):
+    archive = tmp_path / "project.tar.gz"
+    with _manager(source) as manager:
+        manifest = manager.io.export_archive(str(archive))
+
+    tampered = tmp_path / "tampered.tar.gz"
+    with tarfile.open(tampered, "w:gz") as tar:
+        for path, content in [
+            (MANIFEST_NAME, msgspec.json.encode(manifest)),
+            (f"{PIPELINES_DIR}/alpha.py", b"import os\n"),
+        ]:
+            info = tarfile.TarInfo(path)
+            info.size = len(content)
+            tar.addfile(info, io.BytesIO(content))
+
+    with _manager(target) as manager:
+        with pytest.raises(ValueError, match="manifest hash"):
+            manager.io.import_from_archive(str(tampered), names=["alpha"])
+
+    assert not (target / PIPELINES_DIR / "alpha.py").exists()
+
+
+@pytest.mark.parametrize(
+    ("config", "match"),
+    [(b"params: {oops}\n", "manifest hash"), (None, "truncated")],
+)
+def test_import_from_archive_writes_nothing_unless_every_file_verifies(
+    source, target, tmp_path, config, match
+):
+    archive = tmp_path / "project.tar.gz"
+    with _manager(source) as manager:
+        manifest = manager.io.export_archive(str(archive), names=["alpha"])
+
+    members = [
+        (MANIFEST_NAME, msgspec.json.encode(manifest)),
+        (f"{PIPELINES_DIR}/alpha.py", b"x = 1\n"),
+    ]
+    if config is not None:
+        members.append((f"conf/{PIPELINES_DIR}/alpha.yml", config))
+    broken = tmp_path / "broken.tar.gz"
+    with tarfile.open(broken, "w:gz") as tar:
+        for path, content in members:
+            info = tarfile.TarInfo(path)
+            info.size = len(content)
+            tar.addfile(info, io.BytesIO(content))
+
+    with _manager(target) as manager:
+        with pytest.raises(ValueError, match=match):
+            manager.io.import_from_archive(str(broken), names=["alpha"])
+
+    assert not (target / PIPELINES_DIR / "alpha.py").exists()
+    assert not (target / "conf" / PIPELINES_DIR / "alpha.yml").exists()
+
+
+@pytest.mark.parametrize(
+    ("project_files", "alpha_files"),
+    [
+        ([], ["../escaped/dir/alpha.py"]),
+        ([], ["conf/project.yml"]),
+        (["hooks/evil.py"], [f"{PIPELINES_DIR}/alpha.py"]),
+    ],
+)
+def test_import_from_archive_rejects_manifest_paths_outside_pipeline(
+    source, target, tmp_path, project_files, alpha_files
+):
+    archive = tmp_path / "project.tar.gz"
+    with _manager(source) as manager:
+        manifest = manager.io.export_archive(str(archive), names=["alpha"])
+
+    crafted = msgspec.structs.replace(
+        manifest,
+        project_files=project_files,
+        pipelines=[msgspec.structs.replace(manifest.pipelines[0], files=alpha_files)],
+    )
+    forged = tmp_path / "forged.tar.gz"
+    with tarfile.open(forged, "w:gz") as tar:
+        content = msgspec.json.encode(crafted)
+        info = tarfile.TarInfo(MANIFEST_NAME)
+        info.size = len(content)
+        tar.addfile(info, io.BytesIO(content))
+
+    with _manager(target) as manager:
+        with pytest.raises(ValueError, match="path in archive"):
+            manager.io.import_from_archive(str(forged), overwrite=True)
+
+    assert not (tmp_path / "escaped").exists()
+    assert not (target / "hooks").exists()
+    assert (target / "conf" / "project.yml").read_text() == "name: target\n"
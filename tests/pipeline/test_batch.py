@@ -0,0 +1,172 @@
+"""Tests for batch runs over input files (`pipeline run-batch`)."""
+
+import json
+
+import pytest
+from typer.testing import CliRunner
+
+from flowerpower.cli import app
+from flowerpower.pipeline.batch import (
+    JsonlResultWriter,
+    open_result_writer,
+    read_input_rows,
+)
+from flowerpower.pipeline.manager import PipelineManager
+
+MODULE = """
+def scaled(x: int, factor: int) -> int:
+    if x < 0:
+        raise ValueError("negative x")
+    return x * factor
+"""
+
+
+@pytest.fixture
+def project_dir(make_project):
+    return make_project(
+        "batch",
+        {"scaler": MODULE},
+        {
+            "scaler": "run:\n  final_vars: [scaled]\n  inputs: {x: 0, factor: 2}\n"
+            "  retry: {max_retries: 0}\n"
+        },
+    )
+
+
+def _write_jsonl(path, rows):
+    path.write_text("".join(json.dumps(row) + "\n" for row in rows))
+
+
+def _read_jsonl(path):
+    return [json.loads(line) for line in path.read_text().splitlines()]
+
+
+def test_run_batch_jsonl_records_failures_and_resumes(project_dir):
+    inputs_file = project_dir / "inputs.jsonl"
+    output = project_dir / "results.jsonl"
+    _write_jsonl(inputs_file, [{"x": x} for x in (1, 2, -1, 4)])
+
+    with PipelineManager(base_dir=str(project_dir)) as manager:
+        summary = manager.run_batch(
+            "scaler", str(inputs_file), str(output), parallel=3
+        )
+
+    assert (summary.total, summary.succeeded, summary.failed, summary.skipped) == (
+        4,
+        3,
+        1,
+        0,
+    )
+    records = {record["row"]: record for record in _read_jsonl(output)}
+    assert records[0]["outputs"] == {"scaled": 2}
+    assert records[3]["inputs"] == {"x": 4}
+    assert records[2]["status"] == "failure"
+    assert "negative x" in records[2]["error"]
+
+    # Simulate an interrupted run: drop the last record and leave a partial line.
+    lines = output.read_text().splitlines(keepends=True)
+    output.write_text("".join(lines[:2]) + lines[2][:10])
+    kept = [json.loads(line) for line in lines[:2]]
+    kept = {record["row"] for record in kept if record["status"] == "success"}
+    _write_jsonl(inputs_file, [{"x": x} for x in (1, 2, -1, 4, 5)])
+
+    with PipelineManager(base_dir=str(project_dir)) as manager:
+        summary = manager.run_batch("scaler", str(inputs_file), str(output))
+
+    assert summary.skipped == len(kept)
+    assert summary.succeeded + summary.failed == 5 - len(kept)
+    records = _read_jsonl(output)
+    assert sorted(record["row"] for record in records) == [0, 1, 2, 3, 4]
+
+    # Failed rows are run again on resume; successful rows are not.
+    with PipelineManager(base_dir=str(project_dir)) as manager:
+        summary = manager.run_batch("scaler", str(inputs_file), str(output))
+
+    assert (summary.skipped, summary.succeeded, summary.failed) == (4, 0, 1)
+    records = _read_jsonl(output)
+    assert sorted(record["row"] for record in records) == [0, 1, 2, 3, 4]
+    assert records[-1]["row"] == 2
+
+
+def test_run_batch_parquet_round_trip(project_dir):
+    pa = pytest.importorskip("pyarrow")
+    pq = pytest.importorskip("pyarrow.parquet")
+    inputs_file = project_dir / "grid.parquet"
+    output = project_dir / "results.parquet"
+    pq.write_table(pa.table({"x": [1, 2, 3], "factor": [10, 20, 30]}), inputs_file)
+
+    assert list(read_input_rows(inputs_file))[1] == {"x": 2, "factor": 20}
+
+    with PipelineManager(base_dir=str(project_dir)) as manager:
+        summary = manager.run_batch(
+            "scaler", str(inputs_file), str(output), parallel=2
+        )
+        assert summary.succeeded == 3
+        # Resuming a finished Parquet output skips every row.
+        assert manager.run_batch("scaler", str(inputs_file), str(output)).skipped == 3
+
+    records = pq.read_table(output).to_pylist()
+    assert [record["outputs"]["scaled"] for record in records] == [10, 40, 90]
+    assert not (project_dir / "results.parquet.partial.jsonl").exists()
+
+
+def test_input_and_output_validation(tmp_path):
+    bad = tmp_path / "inputs.jsonl"
+    bad.write_text('{"x": 1}\n\n[1, 2]\n')
+    with pytest.raises(ValueError, match="inputs.jsonl:3"):
+        list(read_input_rows(bad))
+
+    with pytest.raises(ValueError, match="Unsupported file type"):
+        open_result_writer(tmp_path / "results.csv")
+
+    writer = JsonlResultWriter(tmp_path / "results.jsonl")
+    writer.write({"row": 0, "status": "success"})
+    writer.close()
+    assert JsonlResultWriter(tmp_path / "results.jsonl", resume=False).completed == set()
+
+
+def test_cli_run_batch(project_dir):
+    inputs_file = project_dir / "inputs.jsonl"
+    output = project_dir / "results.jsonl"
+    _write_jsonl(inputs_file, [{"x": 1}, {"x": 2}])
+
+    result = CliRunner().invoke(
+        app,
+        [
+            "pipeline",
+            "run-batch",
+            "scaler",
+            "--inputs-file",
+            str(inputs_file),
+            "--output",
+            str(output),
+            "--parallel",
+            "2",
+            "--inputs",
+            '{"factor": 5}',
+            "--base-dir",
+            str(project_dir),
+        ],
+    )
+    assert result.exit_code == 0, result.output
+    assert "2 succeeded, 0 failed, 0 skipped of 2 rows" in result.stdout
+    assert sorted(r["outputs"]["scaled"] for r in _read_jsonl(output)) == [5, 10]
+
+    _write_jsonl(inputs_file, [{"x": -1}])
+    failed = CliRunner().invoke(
+        app,
+        [
+            "pipeline",
+            "run-batch",
+            "scaler",
+            "-i",
+            str(inputs_file),
+            "-o",
+            str(output),
+            "--no-resume",
+            "-d",
+            str(project_dir),
+        ],
+    )
+    assert failed.exit_code == 1
+    assert _read_jsonl(output)[0]["status"] == "failure"
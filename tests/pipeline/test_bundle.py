@@ -0,0 +1,120 @@
+"""Tests for compiled project bundles."""
+
+import pytest
+
+from flowerpower.pipeline import PipelineManager
+from flowerpower.pipeline.bundle import read_bundle, write_bundle
+
+PIPELINES_DIR = "bundle_flows"
+
+
+@pytest.fixture
+def project_dir(make_project):
+    return make_project(
+        "bundled",
+        {
+            "bundle_demo": "def a() -> int:\n    return 1\n\n\n"
+            "def b(a: int) -> int:\n    return a + 1\n",
+            "bundle_plain": "x = 1\n",
+        },
+        {
+            "bundle_demo": "name: renamed_demo\n"
+            "params:\n  path: ${BUNDLE_TEST_ROOT:-/data}/in\n"
+            "run:\n  final_vars: [b]\n"
+        },
+        pipelines_dir=PIPELINES_DIR,
+    )
+
+
+def _manager(project_dir):
+    return PipelineManager(base_dir=str(project_dir), pipelines_dir=PIPELINES_DIR)
+
+
+def test_compile_records_configs_names_hashes_and_dag(project_dir):
+    with _manager(project_dir) as manager:
+        bundle = manager.compile()
+
+    assert bundle.names == ["renamed_demo", "bundle_plain"]
+    demo = bundle.get("renamed_demo")
+    assert demo.config_file == f"conf/{PIPELINES_DIR}/bundle_demo.yml"
+    assert len(demo.module_hash) == 64
+    nodes = {node["name"]: node for node in demo.dag_summary()["nodes"]}
+    assert nodes["b"]["dependencies"] == ["a"]
+    assert bundle.get("bundle_plain").config_file is None
+    assert (project_dir / ".flowerpower" / "bundle.msgpack").exists()
+
+
+def test_runtime_serves_names_and_configs_from_bundle(project_dir, monkeypatch):
+    with _manager(project_dir) as manager:
+        manager.compile(include_dag=False)
+
+    monkeypatch.setenv("BUNDLE_TEST_ROOT", "/mnt")
+
+    with _manager(project_dir) as manager:
+        assert manager.registry._active_bundle() is not None
+        assert manager.registry.list_pipelines() == ["renamed_demo", "bundle_plain"]
+        cfg = manager.load_pipeline("renamed_demo")
+        assert cfg.params["path"] == "/mnt/in"
+        assert cfg.run.final_vars == ["b"]
+        assert manager.project_cfg.name == "bundled"
+
+        # An explicit reload goes back to the files on disk.
+        (project_dir / "conf" / PIPELINES_DIR / "bundle_demo.yml").unlink()
+        assert manager.load_pipeline("renamed_demo", reload=True).params == {}
+        assert manager.registry._active_bundle() is None
+
+
+def test_bundle_is_ignored_after_source_edits(project_dir):
+    config = project_dir / "conf" / PIPELINES_DIR / "bundle_demo.yml"
+    with _manager(project_dir) as manager:
+        manager.compile(include_dag=False)
+        fs = manager._fs
+
+    config.write_text(config.read_text().replace("final_vars: [b]", "final_vars: [a]"))
+    assert read_bundle(fs, pipelines_dir=PIPELINES_DIR) is None
+    assert read_bundle(fs, pipelines_dir=PIPELINES_DIR, validate=False) is not None
+
+    with _manager(project_dir) as manager:
+        assert manager.registry._active_bundle() is None
+        assert manager.load_pipeline("bundle_demo").run.final_vars == ["a"]
+        manager.compile(include_dag=False)
+
+    (project_dir / PIPELINES_DIR / "bundle_new.py").write_text("y = 1\n")
+    assert read_bundle(fs, pipelines_dir=PIPELINES_DIR) is None
+
+
+def test_check_bundle_reports_stale_paths(project_dir):
+    with _manager(project_dir) as manager:
+        assert manager.check_bundle() is None
+        manager.compile(include_dag=False)
+        assert manager.check_bundle() == []
+
+        (project_dir / PIPELINES_DIR / "bundle_plain.py").write_text("x = 2\n")
+        (project_dir / PIPELINES_DIR / "bundle_new.py").write_text("y = 1\n")
+
+        assert manager.check_bundle() == [
+            f"{PIPELINES_DIR}/bundle_new.py",
+            f"{PIPELINES_DIR}/bundle_plain.py",
+        ]
+
+
+def test_bundle_for_other_directories_is_ignored(project_dir):
+    with _manager(project_dir) as manager:
+        bundle = manager.compile(include_dag=False)
+        fs = manager._fs
+
+    assert read_bundle(fs, pipelines_dir=PIPELINES_DIR) is not None
+    assert read_bundle(fs, pipelines_dir="pipelines") is None
+
+    bundle.flowerpower_version = "0.0.0"
+    write_bundle(fs, bundle)
+    assert read_bundle(fs, pipelines_dir=PIPELINES_DIR) is None
+
+
+def test_use_bundle_setting_disables_loading(project_dir, monkeypatch):
+    with _manager(project_dir) as manager:
+        manager.compile(include_dag=False)
+
+    monkeypatch.setattr("flowerpower.pipeline.manager.USE_BUNDLE", False)
+    with _manager(project_dir) as manager:
+        assert manager.registry._active_bundle() is None
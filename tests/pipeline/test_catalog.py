@@ -212,6 +212,35 @@ class TestPipelineCatalog:
             item["name"] == "p2" and item["size"] == "2.0 KB" for item in collect_result
         )
 
+    def test_collect_pipeline_info_uses_one_detailed_listing(self, catalog, mock_fs):
+        paths = [
+            posixpath.join(catalog._pipelines_dir, "p1.py"),
+            posixpath.join(catalog._pipelines_dir, "p2.py"),
+        ]
+        mock_fs.glob.side_effect = [paths, []]
+        mock_fs.exists.return_value = False
+        mock_fs.find.return_value = {
+            paths[0]: {"type": "file", "size": 2048, "mtime": 1672567200.0},
+            posixpath.join(catalog._pipelines_dir, "notes.txt"): {
+                "type": "file",
+                "size": 1,
+            },
+        }
+
+        result = catalog.collect_pipeline_info()
+
+        mock_fs.find.assert_called_once_with(catalog._pipelines_dir, detail=True)
+        assert result[0] == {
+            "name": "p1",
+            "path": paths[0],
+            "mod_time": "2023-01-01 10:00:00",
+            "size": "2.0 KB",
+        }
+        # Only the file missing from the listing is probed individually.
+        mock_fs.modified.assert_called_once_with(paths[1])
+        mock_fs.size.assert_called_once_with(paths[1])
+        assert result[1]["size"] == "1.0 KB"
+
     def test_get_summary_single_pipeline(
         self, catalog, mock_fs, mock_project_cfg, mock_pipeline_cfg_instance
     ):
@@ -259,6 +288,63 @@ class TestPipelineCatalog:
             posixpath.join(catalog._pipelines_dir, "group", "my_pipeline.py")
         )
 
+    def test_iter_summary_pages_lazily_with_offset_and_limit(
+        self, catalog, mock_fs
+    ):
+        names = [f"pipe{i}" for i in range(7)]
+        mock_fs.glob.side_effect = [
+            [posixpath.join(catalog._pipelines_dir, f"{n}.py") for n in names],
+            [],
+        ]
+        mock_fs.exists.return_value = False
+        fetched = []
+
+        def cat(path):
+            fetched.append(posixpath.basename(path))
+            return b"code"
+
+        mock_fs.cat.side_effect = cat
+
+        pages = catalog.iter_summary(fields=["code"], page_size=2, offset=1, limit=5)
+        first = next(pages)
+
+        assert first == ("pipe1", {"module": "code"})
+        assert set(fetched) <= {"pipe1.py", "pipe2.py"}
+        assert [name for name, _ in pages] == ["pipe2", "pipe3", "pipe4", "pipe5"]
+        assert len(fetched) == 5
+
+    def test_iter_summary_bounds_concurrency(self, catalog, mock_fs):
+        import threading
+        import time
+
+        mock_fs.glob.side_effect = [
+            [posixpath.join(catalog._pipelines_dir, f"p{i}.py") for i in range(12)],
+            [],
+        ]
+        mock_fs.exists.return_value = False
+        lock = threading.Lock()
+        state = {"active": 0, "peak": 0}
+
+        def cat(path):
+            with lock:
+                state["active"] += 1
+                state["peak"] = max(state["peak"], state["active"])
+            time.sleep(0.01)
+            with lock:
+                state["active"] -= 1
+            return b""
+
+        mock_fs.cat.side_effect = cat
+
+        result = list(catalog.iter_summary(fields=["code"], max_workers=3))
+
+        assert len(result) == 12
+        assert 1 < state["peak"] <= 3
+
+    def test_iter_summary_rejects_unknown_fields(self, catalog):
+        with pytest.raises(ValueError, match="Unknown summary fields"):
+            next(catalog.iter_summary(fields=["cfg", "dag"]))
+
     def test_get_summary_all_pipelines(
         self, catalog, mock_fs, mock_project_cfg, mock_pipeline_cfg_instance
     ):
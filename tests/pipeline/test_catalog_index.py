@@ -0,0 +1,127 @@
+"""Tests for the persistent, incrementally refreshed catalog index."""
+
+import os
+
+import pytest
+from fsspec.implementations.dirfs import DirFileSystem
+from fsspec.implementations.local import LocalFileSystem
+
+from flowerpower.pipeline import PipelineManager
+from flowerpower.pipeline.catalog import PipelineCatalog
+from flowerpower.pipeline.catalog_index import read_catalog_index
+
+PIPELINES_DIR = "indexed_flows"
+INDEX_PATH = ".flowerpower/catalog.msgpack"
+
+
+@pytest.fixture
+def project_dir(make_project):
+    return make_project(
+        "indexed",
+        {"__init__": "", "alpha": "x = 1\n", "group/beta": "y = 2\n"},
+        {"alpha": "name: first\n"},
+        pipelines_dir=PIPELINES_DIR,
+    )
+
+
+class CountingFileSystem(DirFileSystem):
+    """Project filesystem that records file reads."""
+
+    def __init__(self, path):
+        super().__init__(path=str(path), fs=LocalFileSystem())
+        self.reads = []
+
+    def cat(self, path, *args, **kwargs):
+        self.reads.append(path)
+        return super().cat(path, *args, **kwargs)
+
+
+def _catalog(fs):
+    return PipelineCatalog(
+        fs=fs, cfg_dir="conf", pipelines_dir=PIPELINES_DIR, index_path=INDEX_PATH
+    )
+
+
+def test_index_is_persisted_and_reused_without_reading_files(project_dir):
+    fs = CountingFileSystem(project_dir)
+
+    assert _catalog(fs).get_names() == ["first", "group.beta"]
+    index = read_catalog_index(fs, "conf", PIPELINES_DIR, INDEX_PATH)
+    alpha = index.get_by_file(f"{PIPELINES_DIR}/alpha.py")
+    assert alpha.stored_name == "first"
+    assert alpha.config_file == f"conf/{PIPELINES_DIR}/alpha.yml"
+    assert alpha.size == 6
+    assert len(alpha.content_hash) == 64
+
+    fs.reads.clear()
+    assert _catalog(fs).list_pipelines() == ["first", "group.beta"]
+    assert fs.reads == [INDEX_PATH]
+
+
+def test_index_refresh_only_rereads_changed_pipelines(project_dir):
+    fs = CountingFileSystem(project_dir)
+    catalog = _catalog(fs)
+    catalog.get_names()
+    old_hash = catalog._index.get_by_file(f"{PIPELINES_DIR}/alpha.py").content_hash
+
+    config = project_dir / "conf" / PIPELINES_DIR / "alpha.yml"
+    config.write_text("name: renamed\n")
+    os.utime(config, (1, 1))
+    (project_dir / PIPELINES_DIR / "gamma.py").write_text("z = 3\n")
+    (project_dir / PIPELINES_DIR / "group" / "beta.py").unlink()
+    fs.reads.clear()
+
+    assert catalog.get_names() == ["renamed", "gamma"]
+    assert sorted(fs.reads) == [
+        f"conf/{PIPELINES_DIR}/alpha.yml",
+        f"{PIPELINES_DIR}/alpha.py",
+        f"{PIPELINES_DIR}/gamma.py",
+    ]
+    new_hash = catalog._index.get_by_file(f"{PIPELINES_DIR}/alpha.py").content_hash
+    assert new_hash != old_hash
+    assert read_catalog_index(fs, "conf", PIPELINES_DIR, INDEX_PATH).names == [
+        "renamed",
+        "gamma",
+    ]
+
+
+def test_collect_pipeline_info_is_served_from_index(project_dir):
+    fs = CountingFileSystem(project_dir)
+    info = _catalog(fs).collect_pipeline_info()
+
+    assert [(row["name"], row["path"], row["size"]) for row in info] == [
+        ("first", f"{PIPELINES_DIR}/alpha.py", "0.0 KB"),
+        ("group.beta", f"{PIPELINES_DIR}/group/beta.py", "0.0 KB"),
+    ]
+    assert all(len(row["mod_time"]) == 19 for row in info)
+
+
+def test_rebuild_rereads_everything(project_dir):
+    with PipelineManager(
+        base_dir=str(project_dir), pipelines_dir=PIPELINES_DIR
+    ) as manager:
+        assert manager.registry.list_pipelines() == ["first", "group.beta"]
+
+        # Same size and mtime: only a rebuild notices the new stored name.
+        config = project_dir / "conf" / PIPELINES_DIR / "alpha.yml"
+        stat = config.stat()
+        config.write_text("name: other\n")
+        os.utime(config, ns=(stat.st_atime_ns, stat.st_mtime_ns))
+        assert manager.registry.list_pipelines() == ["first", "group.beta"]
+
+        index = manager.rebuild_catalog_index()
+
+    assert index.names == ["other", "group.beta"]
+    assert (project_dir / INDEX_PATH).exists()
+
+
+def test_use_catalog_index_setting_disables_index(project_dir, monkeypatch):
+    monkeypatch.setattr("flowerpower.pipeline.manager.USE_CATALOG_INDEX", False)
+    with PipelineManager(
+        base_dir=str(project_dir), pipelines_dir=PIPELINES_DIR
+    ) as manager:
+        assert manager.registry.list_pipelines() == ["first", "group.beta"]
+        with pytest.raises(RuntimeError):
+            manager.rebuild_catalog_index()
+
+    assert not (project_dir / INDEX_PATH).exists()
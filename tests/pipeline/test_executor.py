@@ -287,7 +287,7 @@ def test_execution_context_builder_uses_resolved_run_config_for_executor_and_ada
     executor or adapter precedence.
     """
     executor_factory = MagicMock()
-    executor_factory.create_executor.return_value = MagicMock(name="executor")
+    executor_factory.acquire.return_value = MagicMock(name="executor")
     resolved_adapters = [MagicMock(name="adapter")]
     run_config = RunConfig(
         executor=ExecutorConfig(type="threadpool", max_workers=4, num_cpus=2),
@@ -308,15 +308,17 @@ def test_execution_context_builder_uses_resolved_run_config_for_executor_and_ada
     )
     executor, cleanup, adapters = builder.build(run_config, adapter_set)
 
-    executor_factory.create_executor.assert_called_once()
-    passed_executor_cfg = executor_factory.create_executor.call_args[0][0]
+    executor_factory.acquire.assert_called_once()
+    passed_executor_cfg = executor_factory.acquire.call_args[0][0]
     assert passed_executor_cfg.type == "threadpool"
     assert passed_executor_cfg.max_workers == 4
     assert passed_executor_cfg.num_cpus == 2
-    assert executor is executor_factory.create_executor.return_value
-    assert cleanup is None
+    assert executor is executor_factory.acquire.return_value
     assert adapters == resolved_adapters
 
+    cleanup()
+    executor_factory.release.assert_called_once_with(passed_executor_cfg, executor)
+
 
 def test_executor_run_resolves_pipeline_adapter_config_into_run_config():
     """PipelineExecutor folds pipeline adapter defaults into the resolved RunConfig."""
@@ -375,7 +377,7 @@ def test_executor_main_path_does_not_extract_adapter_config_from_project_context
 
 def test_execution_context_builder_uses_resolved_project_adapter_for_ray_cleanup():
     executor_factory = MagicMock()
-    executor_factory.create_executor.return_value = MagicMock(name="executor")
+    executor_factory.acquire.return_value = MagicMock(name="executor")
 
     ray_module = MagicMock()
     ray_module.shutdown = MagicMock(name="shutdown")
@@ -399,5 +401,7 @@ def test_execution_context_builder_uses_resolved_project_adapter_for_ray_cleanup
             project_adapter_cfg,
         )
 
-    assert executor is executor_factory.create_executor.return_value
-    assert cleanup_fn is ray_module.shutdown
+    assert executor is executor_factory.acquire.return_value
+    cleanup_fn()
+    ray_module.shutdown.assert_called_once()
+    executor_factory.release.assert_called_once()
@@ -0,0 +1,124 @@
+"""Tests for the SQLite run history."""
+
+import pytest
+from typer.testing import CliRunner
+
+from flowerpower.cli import app
+from flowerpower.pipeline import PipelineManager, history
+from flowerpower.pipeline.history import (
+    NodeRecord,
+    RunHistory,
+    RunRecord,
+    estimate_size,
+    percentile,
+)
+
+MODULE = """
+def doubled(x: int) -> int:
+    return x * 2
+
+
+def items(doubled: int) -> list:
+    return list(range(doubled))
+"""
+
+
+@pytest.fixture
+def recording(monkeypatch, isolated_run_history):
+    monkeypatch.setattr(history, "HISTORY_ENABLED", True)
+    return isolated_run_history
+
+
+@pytest.fixture
+def project_dir(make_project):
+    return make_project("recorded", {"lists": MODULE})
+
+
+def _run(run_id, started, duration, status="success", pipeline="p", nodes=()):
+    return RunRecord(
+        run_id=run_id,
+        project="proj",
+        pipeline=pipeline,
+        config_hash="abc",
+        started_at=started,
+        finished_at=started + duration,
+        status=status,
+        nodes=tuple(nodes),
+    )
+
+
+def test_percentile_and_estimate_size():
+    assert percentile([1.0, 2.0, 3.0, 4.0], 50) == pytest.approx(2.5)
+    assert percentile([1.0, 2.0, 3.0, 4.0], 100) == 4.0
+    assert estimate_size(b"x" * 1000) >= 1000
+
+
+def test_history_store_queries_and_stats(tmp_path):
+    store = RunHistory(str(tmp_path / "h.sqlite"))
+    for index, duration in enumerate([1.0, 1.0, 2.0, 2.0]):
+        store.record(
+            _run(
+                f"r{index}",
+                started=100.0 + index,
+                duration=duration,
+                nodes=[NodeRecord("n", duration / 2, output_size=10)],
+            )
+        )
+    store.record(_run("bad", started=200.0, duration=9.0, status="failure"))
+    store.record(_run("other", started=300.0, duration=5.0, pipeline="q"))
+
+    assert [run.run_id for run in store.runs("p", limit=3)] == ["bad", "r3", "r2"]
+    assert [run.run_id for run in store.runs("p", status="failure")] == ["bad"]
+    assert len(store.runs(limit=None)) == 6
+    (with_nodes,) = store.runs("p", limit=1, status="success", with_nodes=True)
+    assert with_nodes.nodes == (NodeRecord("n", 1.0, 10),)
+
+    stats = store.stats("p", project="proj")
+    assert (stats.runs, stats.failures) == (5, 1)
+    assert stats.durations["p50"] == pytest.approx(1.5)
+    assert stats.durations["max"] == pytest.approx(2.0)
+    assert stats.trend == pytest.approx(1.0)
+    assert [(n.node, n.calls, n.mean_output_size) for n in stats.nodes] == [
+        ("n", 4, 10)
+    ]
+    store.close()
+
+
+def test_runs_are_recorded_with_attempts_and_nodes(recording, project_dir):
+    with PipelineManager(base_dir=str(project_dir)) as manager:
+        manager.run("lists", inputs={"x": 3}, final_vars=["items"])
+        with pytest.raises(ValueError, match="Required input"):
+            manager.run(
+                "lists",
+                inputs={},
+                final_vars=["items"],
+                retry={"max_retries": 1, "retry_delay": 0, "retry_exceptions": [Exception]},
+            )
+        failed, succeeded = manager.history("lists", with_nodes=True)
+
+    assert (succeeded.project, succeeded.status, succeeded.attempts) == (
+        "recorded",
+        "success",
+        1,
+    )
+    assert [node.node for node in succeeded.nodes] == ["doubled", "items"]
+    assert succeeded.nodes[1].output_size > succeeded.nodes[0].output_size > 0
+    assert (failed.status, failed.attempts) == ("failure", 2)
+    assert failed.error
+    assert failed.config_hash == succeeded.config_hash
+
+
+def test_cli_history_shows_percentiles(recording, project_dir):
+    with PipelineManager(base_dir=str(project_dir)) as manager:
+        for _ in range(2):
+            manager.run("lists", inputs={"x": 1}, final_vars=["items"])
+
+    result = CliRunner().invoke(
+        app,
+        ["pipeline", "history", "lists", "--base-dir", str(project_dir)],
+        catch_exceptions=False,
+    )
+
+    assert result.exit_code == 0, result.output
+    assert "Run History: lists (2 runs, 100% successful)" in result.stdout
+    assert "Recent Runs" in result.stdout
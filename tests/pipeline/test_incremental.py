@@ -0,0 +1,179 @@
+"""Tests for incremental re-execution (`pipeline run --watch`)."""
+
+import os
+import sys
+import threading
+
+import pytest
+from typer.testing import CliRunner
+
+from flowerpower.cli import app
+from flowerpower.pipeline.incremental import WatchSession
+from flowerpower.pipeline.manager import PipelineManager
+
+HELPERS = """
+def _bump(value: int) -> int:
+    return value + 1
+"""
+
+MODULE = """
+from watch_helpers import _bump
+
+SCALE = 3
+
+
+def raw(x: int) -> int:
+    return x + 1
+
+
+def scaled(raw: int) -> int:
+    return raw * SCALE
+
+
+def other(raw: int) -> int:
+    return raw - 1
+
+
+def final(scaled: int, other: int, offset: int) -> int:
+    return _bump(scaled + other + offset)
+"""
+
+CONFIG = """
+params: {}
+run:
+  final_vars: [final]
+  inputs: {x: 1}
+  config: {offset: 10}
+  additional_modules: [watch_helpers]
+  retry: {max_retries: 0}
+"""
+
+
+@pytest.fixture
+def project_dir(make_project, monkeypatch):
+    project_dir = make_project(
+        "watching",
+        {"watched": MODULE},
+        {"watched": CONFIG},
+        files={"watch_helpers.py": HELPERS},
+    )
+    for name in ("watch_helpers", "watched", "pipelines.watched"):
+        monkeypatch.delitem(sys.modules, name, raising=False)
+    yield project_dir
+    for name in ("watch_helpers", "watched", "pipelines.watched"):
+        sys.modules.pop(name, None)
+
+
+@pytest.fixture
+def session(project_dir):
+    with PipelineManager(base_dir=str(project_dir)) as manager:
+        yield WatchSession(
+            manager,
+            "watched",
+            fs=manager._fs,
+            cfg_dir=manager._cfg_dir,
+            pipelines_dir=manager._pipelines_dir,
+        )
+
+
+def _edit(path, old, new):
+    path.write_text(path.read_text().replace(old, new))
+    # Make the change visible even within the filesystem's mtime granularity.
+    stat = os.stat(path)
+    os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 2_000_000_000))
+
+
+def _rerun(session):
+    changed = session.poll()
+    session.apply(changed)
+    return session.run(changed)
+
+
+def test_only_changed_nodes_are_recomputed(session, project_dir):
+    first = session.run()
+    assert first.error is None
+    assert first.outputs == {"final": 18}
+    assert sorted(first.computed) == ["final", "other", "raw", "scaled"]
+
+    assert session.poll() == []
+    unchanged = session.run()
+    assert unchanged.computed == []
+    assert unchanged.outputs == {"final": 18}
+
+    module = project_dir / "pipelines" / "watched.py"
+    _edit(module, "return raw - 1", "return raw - 2")
+    result = _rerun(session)
+    assert result.changed == [str(module)]
+    assert sorted(result.computed) == ["final", "other"]
+    assert sorted(result.reused) == ["raw", "scaled"]
+    assert result.outputs == {"final": 17}
+
+    # A referenced module-level constant is part of the node's code.
+    _edit(module, "SCALE = 3", "SCALE = 4")
+    result = _rerun(session)
+    assert sorted(result.computed) == ["final", "scaled"]
+    assert result.outputs == {"final": 19}
+
+
+def test_config_and_additional_module_changes(session, project_dir):
+    session.run()
+    config = project_dir / "conf" / "pipelines" / "watched.yml"
+
+    _edit(config, "offset: 10", "offset: 20")
+    result = _rerun(session)
+    assert result.computed == ["final"]
+    assert result.outputs == {"final": 28}
+
+    _edit(project_dir / "watch_helpers.py", "value + 1", "value + 100")
+    result = _rerun(session)
+    assert result.computed == ["final"]
+    assert result.outputs == {"final": 127}
+
+    _edit(config, "x: 1", "x: 2")
+    result = _rerun(session)
+    assert sorted(result.computed) == ["final", "other", "raw", "scaled"]
+    assert result.outputs == {"final": 131}
+
+
+def test_loop_reports_failures_and_keeps_watching(project_dir):
+    module = project_dir / "pipelines" / "watched.py"
+    results = []
+    stop = threading.Event()
+
+    def on_iteration(result):
+        results.append(result)
+        if len(results) == 1:
+            _edit(module, "def other(raw: int) -> int:", "def other(raw: int) -> int")
+        elif len(results) == 2:
+            _edit(module, "def other(raw: int) -> int\n", "def other(raw: int) -> int:\n")
+        else:
+            stop.set()
+
+    with PipelineManager(base_dir=str(project_dir)) as manager:
+        manager.run_watch("watched", on_iteration=on_iteration, interval=0.01, stop=stop)
+
+    assert [result.iteration for result in results] == [1, 2, 3]
+    assert isinstance(results[1].error, SyntaxError)
+    assert results[2].error is None
+    assert results[2].outputs == {"final": 18}
+
+
+def test_cli_run_watch(project_dir, monkeypatch):
+    run_watch = PipelineManager.run_watch
+
+    def run_once(self, name, run_config=None, **kwargs):
+        return run_watch(self, name, run_config, max_iterations=1, **kwargs)
+
+    monkeypatch.setattr(PipelineManager, "run_watch", run_once)
+    result = CliRunner().invoke(
+        app,
+        ["pipeline", "run", "watched", "--watch", "--base-dir", str(project_dir)],
+    )
+    assert result.exit_code == 0, result.output
+    assert "[1] Pipeline 'watched' finished in" in result.stdout
+    assert "4 node(s) computed, 0 reused. Outputs: final" in result.stdout
+
+    remote = CliRunner().invoke(
+        app, ["pipeline", "run", "watched", "--watch", "--remote", "127.0.0.1:1"]
+    )
+    assert remote.exit_code == 1
@@ -542,3 +542,82 @@ def test_sync_filesystem_creates_missing_parent_dirs_with_makedirs() -> None:
 
     dest_fs.makedirs.assert_called_once_with("nested", exist_ok=True)
     dest_fs.write_bytes.assert_called_once_with("nested/file.txt", b"payload")
+
+
+def test_sync_filesystem_skips_unchanged_files_and_reports_counts() -> None:
+    registry = _make_registry()
+    manager = PipelineIOManager(registry)
+    files = ["conf/project.yml", "pipelines/a.py", "pipelines/group/b.py"]
+
+    with tempfile.TemporaryDirectory() as src_dir, tempfile.TemporaryDirectory() as dest_dir:
+        for file in files:
+            (Path(src_dir) / file).parent.mkdir(parents=True, exist_ok=True)
+            (Path(src_dir) / file).write_text(f"# {file}\n")
+
+        def sync():
+            return manager._sync_filesystem(
+                src_base_dir=src_dir,
+                dest_base_dir=dest_dir,
+                src_fs=None,
+                dest_fs=None,
+                files=files,
+                overwrite=True,
+            )
+
+        first = sync()
+        assert (first.copied, first.skipped) == (3, 0)
+        assert first.bytes_copied == sum(len(f"# {file}\n") for file in files)
+
+        second = sync()
+        assert (second.copied, second.skipped, second.unchanged) == (0, 3, 3)
+        assert second.bytes_copied == 0
+
+        (Path(src_dir) / "pipelines/a.py").write_text("# changed\n")
+        third = sync()
+        assert (third.copied, third.unchanged) == (1, 2)
+        assert (Path(dest_dir) / "pipelines/a.py").read_text() == "# changed\n"
+
+
+def test_sync_filesystem_batches_directories_and_bounds_workers() -> None:
+    import threading
+    import time
+
+    registry = _make_registry()
+    manager = PipelineIOManager(registry, max_workers=2)
+    files = [f"pipelines/{group}/p{i}.py" for group in ("a", "b") for i in range(3)]
+    lock = threading.Lock()
+    state = {"active": 0, "peak": 0}
+
+    def read_bytes(path):
+        with lock:
+            state["active"] += 1
+            state["peak"] = max(state["peak"], state["active"])
+        time.sleep(0.01)
+        with lock:
+            state["active"] -= 1
+        return b"x"
+
+    src_fs = MagicMock()
+    src_fs.read_bytes.side_effect = read_bytes
+    dest_fs = MagicMock()
+    dest_fs.exists.return_value = False
+
+    with patch.object(
+        manager,
+        "_get_dir_filesystem",
+        side_effect=[src_fs, dest_fs],
+    ):
+        report = manager._sync_filesystem(
+            src_base_dir="src",
+            dest_base_dir="dest",
+            src_fs=None,
+            dest_fs=None,
+            files=files,
+        )
+
+    assert [c.args[0] for c in dest_fs.makedirs.call_args_list] == [
+        "pipelines/a",
+        "pipelines/b",
+    ]
+    assert state["peak"] == 2
+    assert (report.copied, report.bytes_copied) == (6, 6)
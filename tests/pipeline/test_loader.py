@@ -265,3 +265,71 @@ def test_sync_project_state_valueerror_keeps_existing_state(loader, mocker):
 
     assert loader.project_cfg is original_cfg
     assert loader._hooks_dir == original_hooks_dir
+
+
+def _stat_project_config(loader, mtime=1.0, size=10):
+    loader._fs.info = MagicMock(
+        return_value={"name": "conf/project.yml", "mtime": mtime, "size": size}
+    )
+
+
+def test_sync_project_state_skips_reload_when_stat_unchanged(loader, mocker):
+    _set_project_config(loader, mocker, mocker.MagicMock(spec=ProjectConfig))
+    _stat_project_config(loader)
+
+    loader.sync_project_state()
+    loader.sync_project_state()
+
+    loader._config_manager.load_project_config.assert_called_once()
+    assert loader._fs.info.call_count == 2
+
+
+def test_sync_project_state_reloads_when_stat_changes(loader, mocker):
+    _set_project_config(loader, mocker, mocker.MagicMock(spec=ProjectConfig))
+    _stat_project_config(loader, mtime=1.0)
+    loader.sync_project_state()
+
+    _stat_project_config(loader, mtime=2.0)
+    loader.sync_project_state()
+
+    assert loader._config_manager.load_project_config.call_count == 2
+
+
+def test_sync_project_state_reloads_when_fp_env_changes(loader, mocker, monkeypatch):
+    monkeypatch.delenv("FP_PROJECT__ADAPTER__HAMILTON_TRACKER__API_KEY", raising=False)
+    _set_project_config(loader, mocker, mocker.MagicMock(spec=ProjectConfig))
+    _stat_project_config(loader)
+    loader.sync_project_state()
+    loader.sync_project_state()
+    loader._config_manager.load_project_config.assert_called_once()
+
+    monkeypatch.setenv("FP_PROJECT__ADAPTER__HAMILTON_TRACKER__API_KEY", "XYZ")
+    loader.sync_project_state()
+    loader.sync_project_state()
+
+    assert loader._config_manager.load_project_config.call_count == 2
+
+
+def test_sync_project_state_ttl_avoids_filesystem(loader, mocker):
+    _set_project_config(loader, mocker, mocker.MagicMock(spec=ProjectConfig))
+    _stat_project_config(loader)
+    loader.project_cfg_ttl = 60.0
+    loader.sync_project_state()
+
+    cached = PipelineConfig(name="my_pipeline")
+    loader._pipeline_data_cache["my_pipeline"] = CachedPipelineData(config=cached)
+    assert loader.load_config("my_pipeline") is cached
+
+    loader._fs.info.assert_called_once()
+    loader._config_manager.load_project_config.assert_called_once()
+
+
+def test_sync_project_state_force_bypasses_ttl_and_stat(loader, mocker):
+    _set_project_config(loader, mocker, mocker.MagicMock(spec=ProjectConfig))
+    _stat_project_config(loader)
+    loader.project_cfg_ttl = 60.0
+    loader.sync_project_state()
+
+    loader.sync_project_state(force=True)
+
+    assert loader._config_manager.load_project_config.call_count == 2
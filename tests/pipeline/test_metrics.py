@@ -0,0 +1,135 @@
+"""Tests for the Prometheus metrics subsystem."""
+
+import urllib.request
+
+import pytest
+
+from flowerpower.pipeline import PipelineManager, metrics
+from flowerpower.pipeline.metrics import Counter, Histogram, PipelineMetrics
+from flowerpower.pipeline.retry import RetryManager
+
+MODULE = """
+def doubled(x: int) -> int:
+    return x * 2
+
+
+def total(doubled: int, x: int) -> int:
+    return doubled + x
+"""
+
+
+@pytest.fixture
+def fresh_metrics(monkeypatch):
+    registry = PipelineMetrics()
+    monkeypatch.setattr(metrics, "_METRICS", registry)
+    monkeypatch.setattr(metrics, "METRICS_ENABLED", True)
+    return registry
+
+
+@pytest.fixture
+def project_dir(make_project):
+    return make_project("measured", {"sums": MODULE})
+
+
+def test_counter_and_histogram_render_exposition_format():
+    counter = Counter("jobs_total", "Jobs.", ("pipeline", "status"))
+    counter.inc(pipeline='a"b', status="success")
+    counter.inc(2, pipeline='a"b', status="success")
+    histogram = Histogram("latency_seconds", "Latency.", ("pipeline",), buckets=(1, 5))
+    histogram.observe(0.5, pipeline="a")
+    histogram.observe(3, pipeline="a")
+    histogram.observe(10, pipeline="a")
+
+    assert counter.render() == (
+        "# HELP jobs_total Jobs.\n"
+        "# TYPE jobs_total counter\n"
+        'jobs_total{pipeline="a\\"b",status="success"} 3\n'
+    )
+    assert histogram.render().splitlines()[2:] == [
+        'latency_seconds_bucket{pipeline="a",le="1"} 1',
+        'latency_seconds_bucket{pipeline="a",le="5"} 2',
+        'latency_seconds_bucket{pipeline="a",le="+Inf"} 3',
+        'latency_seconds_sum{pipeline="a"} 13.5',
+        'latency_seconds_count{pipeline="a"} 3',
+    ]
+
+
+def test_retry_manager_reports_retry_attempts():
+    attempts = []
+    calls = iter([RuntimeError("boom"), RuntimeError("boom"), "ok"])
+
+    def operation():
+        outcome = next(calls)
+        if isinstance(outcome, Exception):
+            raise outcome
+        return outcome
+
+    manager = RetryManager(
+        max_retries=3,
+        retry_delay=0,
+        jitter_factor=0,
+        retry_exceptions=(RuntimeError,),
+        sleep=lambda _: None,
+        on_retry=lambda attempt, error: attempts.append(attempt),
+    )
+
+    assert manager.execute(
+        operation=operation, on_success=None, on_failure=None, context_name="x"
+    ) == "ok"
+    assert attempts == [1, 2]
+
+
+def test_runs_record_metrics_and_write_textfile(
+    fresh_metrics, project_dir, tmp_path, monkeypatch
+):
+    textfile = tmp_path / "collector" / "flowerpower.prom"
+    monkeypatch.setattr(metrics, "METRICS_TEXTFILE", str(textfile))
+
+    with PipelineManager(base_dir=str(project_dir)) as manager:
+        for _ in range(2):
+            manager.run("sums", inputs={"x": 2}, final_vars=["total"])
+        with pytest.raises(ValueError, match="Required input"):
+            manager.run(
+                "sums", inputs={}, final_vars=["total"], max_retries=0
+            )
+
+    labels = {"project": "measured", "pipeline": "sums"}
+    assert fresh_metrics.runs.value(status="success", **labels) == 2
+    assert fresh_metrics.runs.value(status="failure", **labels) == 1
+    assert fresh_metrics.run_duration.count(status="success", **labels) == 2
+    assert fresh_metrics.node_duration.count(node="total", **labels) == 2
+    assert fresh_metrics.queue_depth.value(**labels) == 0
+    assert fresh_metrics.cache.value(cache="pipeline", result="hit") == 2
+    assert fresh_metrics.cache.value(cache="pipeline", result="miss") == 1
+
+    exported = textfile.read_text()
+    assert (
+        'flowerpower_pipeline_runs_total{project="measured",pipeline="sums",'
+        'status="success"} 2' in exported
+    )
+
+
+def test_metrics_disabled_records_nothing(project_dir, monkeypatch):
+    registry = PipelineMetrics()
+    monkeypatch.setattr(metrics, "_METRICS", registry)
+    monkeypatch.setattr(metrics, "METRICS_ENABLED", False)
+
+    with PipelineManager(base_dir=str(project_dir)) as manager:
+        manager.run("sums", inputs={"x": 1}, final_vars=["total"])
+
+    assert "flowerpower_pipeline_runs_total{" not in registry.render()
+
+
+def test_http_endpoint_serves_metrics(fresh_metrics):
+    fresh_metrics.record_run("p", "q", "success", 0.2)
+    server = metrics.start_metrics_server(port=0, addr="127.0.0.1")
+    try:
+        host, port = server.server_address[:2]
+        with urllib.request.urlopen(f"http://{host}:{port}/metrics") as response:
+            body = response.read().decode()
+            content_type = response.headers["Content-Type"]
+    finally:
+        metrics.stop_metrics_server()
+
+    assert content_type.startswith("text/plain; version=0.0.4")
+    assert 'flowerpower_pipeline_runs_total{project="p",pipeline="q",status="success"} 1' in body
@@ -0,0 +1,133 @@
+"""Tests for the static node index and cross-pipeline node search."""
+
+import json
+import sys
+
+import pytest
+from typer.testing import CliRunner
+
+from flowerpower.cli import app
+from flowerpower.pipeline import PipelineManager
+from flowerpower.pipeline.node_index import parse_module_nodes, parse_tag_filters
+
+PIPELINES_DIR = "searched_flows"
+
+INGEST = b'''
+from hamilton.function_modifiers import config, tag
+
+
+@tag(owner="data", stage="raw")
+def raw_orders(source_path: str) -> list:
+    return []
+
+
+@config.when(mode="fast")
+def cleaned__fast(raw_orders: list) -> list:
+    return raw_orders
+
+
+@config.when_not(mode="fast")
+def cleaned__slow(raw_orders: list, *, strict: bool = True) -> list:
+    return raw_orders
+
+
+def _helper() -> None:
+    pass
+'''
+
+REPORT = b'''
+import hamilton.function_modifiers as fm
+
+
+@fm.tag(owner="analytics")
+def report(cleaned: list) -> dict:
+    return {}
+'''
+
+
+@pytest.fixture
+def project_dir(make_project):
+    return make_project(
+        "searched", {"ingest": INGEST, "report": REPORT}, pipelines_dir=PIPELINES_DIR
+    )
+
+
+def test_parse_module_nodes_reads_variants_tags_and_parameters():
+    nodes = {node.function: node for node in parse_module_nodes(INGEST)}
+
+    assert sorted(nodes) == ["cleaned__fast", "cleaned__slow", "raw_orders"]
+    assert nodes["raw_orders"].tags == {"owner": "data", "stage": "raw"}
+    assert nodes["cleaned__fast"].name == "cleaned"
+    assert nodes["cleaned__fast"].when == "config.when(mode='fast')"
+    assert nodes["cleaned__slow"].parameters == ["raw_orders", "strict"]
+    assert parse_module_nodes(b"def broken(:\n") == []
+
+
+def test_parse_tag_filters_requires_key_value():
+    assert parse_tag_filters(["owner=data", "stage = raw"]) == {
+        "owner": "data",
+        "stage": "raw",
+    }
+    with pytest.raises(ValueError):
+        parse_tag_filters(["owner"])
+
+
+def test_search_nodes_without_importing_modules(project_dir):
+    with PipelineManager(
+        base_dir=str(project_dir), pipelines_dir=PIPELINES_DIR
+    ) as manager:
+        matches = manager.registry.search_nodes(node="cleaned")
+        tagged = manager.registry.search_nodes(tags={"owner": "data"})
+
+    assert [(m.pipeline, m.role, m.node.function) for m in matches] == [
+        ("ingest", "produces", "cleaned__fast"),
+        ("ingest", "produces", "cleaned__slow"),
+        ("report", "consumes", "report"),
+    ]
+    assert [m.node.name for m in tagged] == ["raw_orders"]
+    assert f"{PIPELINES_DIR}.ingest" not in sys.modules
+
+
+def test_node_index_refreshes_when_module_changes(project_dir):
+    with PipelineManager(
+        base_dir=str(project_dir), pipelines_dir=PIPELINES_DIR
+    ) as manager:
+        assert manager.registry.search_nodes(node="summary") == []
+        (project_dir / PIPELINES_DIR / "report.py").write_bytes(
+            REPORT + b"\n\ndef summary(report: dict) -> str:\n    return ''\n"
+        )
+
+        matches = manager.registry.search_nodes(node="report")
+
+    assert [(m.pipeline, m.role, m.node.name) for m in matches] == [
+        ("report", "produces", "report"),
+        ("report", "consumes", "summary"),
+    ]
+
+
+def test_cli_search_outputs_json(tmp_path):
+    (tmp_path / "pipelines").mkdir()
+    (tmp_path / "conf").mkdir()
+    (tmp_path / "conf" / "project.yml").write_text("name: searched\n")
+    (tmp_path / "pipelines" / "report.py").write_bytes(REPORT)
+
+    result = CliRunner().invoke(
+        app,
+        [
+            "pipeline",
+            "search",
+            "--tag",
+            "owner=analytics",
+            "--format",
+            "json",
+            "--base-dir",
+            str(tmp_path),
+        ],
+        catch_exceptions=False,
+    )
+
+    assert result.exit_code == 0, result.output
+    payload = json.loads(result.stdout.strip().splitlines()[-1])
+    assert [(hit["pipeline"], hit["node"]["name"]) for hit in payload] == [
+        ("report", "report")
+    ]
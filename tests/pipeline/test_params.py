@@ -0,0 +1,57 @@
+"""Tests for context-bound pipeline parameter injection."""
+
+import pytest
+
+from flowerpower import params
+from flowerpower.pipeline import PipelineManager
+from flowerpower.pipeline.params import provide_params
+from flowerpower.utils.misc import dict_to_namespace
+
+PIPELINES_DIR = "params_flows"
+
+
+def _fail():
+    raise AssertionError("fallback must not be used")
+
+
+def test_params_returns_bound_values_for_matching_pipeline():
+    h_params = dict_to_namespace({"a": {"b": 1}})
+
+    with provide_params("group.my-pipeline", h_params):
+        assert params("group.my_pipeline", fallback=_fail) is h_params
+        assert params(fallback=_fail) is h_params
+
+
+def test_params_falls_back_outside_binding_or_for_other_pipeline():
+    sentinel = dict_to_namespace({"x": 1})
+    with provide_params("one", dict_to_namespace({})):
+        assert params("two", fallback=lambda: sentinel) is sentinel
+    assert params("one", fallback=lambda: sentinel) is sentinel
+
+
+@pytest.fixture
+def project_dir(make_project):
+    return make_project(
+        "params_project",
+        {
+            "injected": "from flowerpower import params\n\n\n"
+            "def _boom():\n    raise RuntimeError('config read from disk')\n\n\n"
+            "PARAMS = params('injected', fallback=_boom)\n"
+        },
+        {"injected": "params:\n  scale:\n    factor: 3\n"},
+        pipelines_dir=PIPELINES_DIR,
+    )
+
+
+def test_loader_injects_cached_params_on_import(project_dir):
+    with PipelineManager(
+        base_dir=str(project_dir), pipelines_dir=PIPELINES_DIR
+    ) as manager:
+        module = manager.registry.load_module("injected")
+        config = manager.registry.load_config("injected")
+
+        assert module.PARAMS is config.h_params
+        assert module.PARAMS.scale.scale.factor.value == 3
+
+        reloaded = manager.registry.load_module("injected", reload=True)
+        assert reloaded.PARAMS.scale.scale.factor.value == 3
@@ -0,0 +1,175 @@
+"""Tests for the per-node profiling adapter and ``pipeline profile``."""
+
+import json
+
+import pytest
+from typer.testing import CliRunner
+
+from flowerpower.cli import app
+from flowerpower.pipeline import PipelineManager
+from flowerpower.pipeline.profiling import NodeProfiler, NodeTiming, RunProfile
+
+PIPELINES_DIR = "pipelines"
+
+MODULE = """
+import time
+
+
+def slow(x: int) -> int:
+    time.sleep(0.02)
+    return x + 1
+
+
+def fast(slow: int) -> int:
+    return slow * 2
+"""
+
+MEMORY_MODULE = """
+def blob(size: int) -> bytes:
+    scratch = [bytes(1024) for _ in range(size)]
+    return b"x" * (len(scratch) * 10)
+
+
+def small(blob: bytes) -> int:
+    return len(blob)
+"""
+
+
+@pytest.fixture
+def project_dir(make_project, monkeypatch):
+    project_dir = make_project(
+        "profiled", {"timed": MODULE}, pipelines_dir=PIPELINES_DIR
+    )
+    monkeypatch.chdir(project_dir)
+    return project_dir
+
+
+def _timing(name, start, end, thread=1):
+    return NodeTiming(
+        name=name,
+        task_id=None,
+        start_ns=start,
+        end_ns=end,
+        cpu_ns=(end - start) // 2,
+        thread_id=thread,
+        process_id=7,
+    )
+
+
+def test_run_profile_stats_and_trace_formats():
+    profile = RunProfile(
+        run_id="r",
+        wall_ns=100,
+        timings=[_timing("a", 0, 10), _timing("b", 10, 70), _timing("a", 70, 90)],
+    )
+
+    stats = profile.stats()
+    assert [(s.name, s.calls, s.wall_ns, s.max_wall_ns) for s in stats] == [
+        ("b", 1, 60, 60),
+        ("a", 2, 30, 20),
+    ]
+    assert stats[0].share == pytest.approx(0.6)
+
+    events = profile.to_chrome_trace()["traceEvents"]
+    assert [(e["name"], e["ph"], e["ts"], e["dur"]) for e in events] == [
+        ("a", "X", 0.0, 0.01),
+        ("b", "X", 0.01, 0.06),
+        ("a", "X", 0.07, 0.02),
+    ]
+
+    speedscope = profile.to_speedscope(name="demo")
+    assert speedscope["shared"]["frames"] == [{"name": "a"}, {"name": "b"}]
+    lane = speedscope["profiles"][0]
+    # Closing events sort before openings at the same instant.
+    assert [(e["type"], e["frame"], e["at"]) for e in lane["events"]] == [
+        ("O", 0, 0),
+        ("C", 0, 10),
+        ("O", 1, 10),
+        ("C", 1, 70),
+        ("O", 0, 70),
+        ("C", 0, 90),
+    ]
+
+
+def test_profiler_records_nodes_of_a_run(project_dir):
+    profiler = NodeProfiler(log_top=0)
+    with PipelineManager(base_dir=str(project_dir)) as manager:
+        result = manager.run(
+            "timed",
+            inputs={"x": 1},
+            final_vars=["fast"],
+            adapter={"profiler": profiler},
+        )
+
+    profile = profiler.profile
+    assert result == {"fast": 4}
+    assert profile.success is True
+    assert [t.name for t in profile.timings] == ["slow", "fast"]
+    slow, fast = profile.timings
+    assert slow.wall_ns >= 20_000_000 > slow.cpu_ns
+    assert 0 <= slow.start_ns < slow.end_ns <= fast.start_ns < fast.end_ns
+    assert profile.wall_ns >= fast.end_ns
+
+
+@pytest.mark.parametrize("executor", ["synchronous", "threadpool"])
+def test_memory_mode_records_peaks_and_output_sizes(project_dir, executor):
+    (project_dir / PIPELINES_DIR / "hungry.py").write_text(MEMORY_MODULE)
+    profiler = NodeProfiler(log_top=0, memory=True)
+    with PipelineManager(base_dir=str(project_dir)) as manager:
+        manager.run(
+            "hungry",
+            inputs={"size": 2000},
+            final_vars=["small"],
+            executor_cfg=executor,
+            adapter={"profiler": profiler},
+        )
+
+    stats = {stat.name: stat for stat in profiler.profile.stats()}
+    assert profiler.profile.has_memory
+    # ~2 MB of scratch buffers are allocated and released inside ``blob``.
+    assert stats["blob"].max_peak_bytes > 2_000_000
+    assert stats["small"].max_peak_bytes < 1_000_000
+    assert stats["blob"].max_output_bytes >= 20_000
+    assert stats["blob"].max_rss_delta is not None
+    trace = profiler.profile.to_chrome_trace()["traceEvents"]
+    assert {"peak_bytes", "rss_delta", "output_bytes"} <= set(trace[0]["args"])
+
+
+def test_with_adapter_profiler_flag_attaches_profiler():
+    from flowerpower.cfg.pipeline.run import WithAdapterConfig
+    from flowerpower.utils.adapter import AdapterManager
+
+    adapters = AdapterManager().create_adapters(
+        WithAdapterConfig(profiler=True), None, None
+    )
+
+    assert [type(adapter) for adapter in adapters] == [NodeProfiler]
+    assert adapters[0].memory is False
+
+    (memory_profiler,) = AdapterManager().create_adapters(
+        WithAdapterConfig(memory_profiler=True), None, None
+    )
+    assert memory_profiler.memory is True
+
+
+def test_cli_profile_prints_table_and_writes_trace(project_dir):
+    result = CliRunner().invoke(
+        app,
+        [
+            "pipeline",
+            "profile",
+            "timed",
+            "--inputs",
+            '{"x": 1}',
+            "--outputs",
+            '["fast"]',
+            "--base-dir",
+            str(project_dir),
+        ],
+        catch_exceptions=False,
+    )
+
+    assert result.exit_code == 0, result.output
+    assert "Node Profile" in result.stdout
+    trace = json.loads((project_dir / "timed.trace.json").read_text())
+    assert [event["name"] for event in trace["traceEvents"]] == ["slow", "fast"]
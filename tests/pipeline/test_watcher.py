@@ -0,0 +1,171 @@
+"""Unit tests for the PipelineWatcher and loader change application."""
+
+import time
+
+import pytest
+from fsspec.implementations.dirfs import DirFileSystem
+from fsspec.implementations.local import LocalFileSystem
+
+from flowerpower.cfg import PipelineConfig
+from flowerpower.pipeline.loader import CachedPipelineData
+from flowerpower.pipeline.watcher import PipelineWatcher, WatchChanges
+
+
+@pytest.fixture
+def project_fs(tmp_path):
+    for directory in ("pipelines", "conf/pipelines", "hooks/my_pipeline"):
+        (tmp_path / directory).mkdir(parents=True)
+    (tmp_path / "conf" / "project.yml").write_text("name: demo\n")
+    (tmp_path / "pipelines" / "my_pipeline.py").write_text("x = 1\n")
+    (tmp_path / "pipelines" / "other.py").write_text("y = 1\n")
+    (tmp_path / "conf" / "pipelines" / "my_pipeline.yml").write_text("params: {}\n")
+    return DirFileSystem(path=str(tmp_path), fs=LocalFileSystem())
+
+
+@pytest.fixture
+def watcher(project_fs):
+    return PipelineWatcher(project_fs, backend="poll", interval=0.05)
+
+
+def _touch(fs, path, content):
+    with fs.open(path, "w") as f:
+        f.write(content)
+
+
+def test_first_poll_records_baseline_without_changes(watcher):
+    assert not watcher.poll()
+    assert "pipelines/my_pipeline.py" in watcher.snapshot()
+
+
+def test_module_edit_reports_only_affected_pipeline(watcher, project_fs):
+    watcher.poll()
+    _touch(project_fs, "pipelines/my_pipeline.py", "x = 2  # edited\n")
+
+    changes = watcher.poll()
+
+    assert changes.pipelines == {"my_pipeline"}
+    assert changes.modules == {"my_pipeline"}
+    assert not changes.project
+
+
+def test_config_edit_is_not_a_module_change(watcher, project_fs):
+    watcher.poll()
+    _touch(project_fs, "conf/pipelines/my_pipeline.yml", "params: {a: 1}\n")
+
+    changes = watcher.poll()
+
+    assert changes.pipelines == {"my_pipeline"}
+    assert changes.modules == frozenset()
+
+
+def test_classify_project_hooks_and_legacy_config(watcher):
+    changes = watcher.classify(
+        [
+            "conf/project.yml",
+            "conf/legacy.yaml",
+            "hooks/my_pipeline/hook.py",
+            "pipelines/group/nested.py",
+            "pipelines/__init__.py",
+        ]
+    )
+
+    assert changes.project
+    assert changes.hooks == {"my_pipeline"}
+    assert changes.pipelines == {"legacy", "group/nested"}
+
+
+def test_deleted_file_is_reported(watcher, project_fs):
+    watcher.poll()
+    project_fs.rm("pipelines/other.py")
+
+    assert watcher.poll().pipelines == {"other"}
+
+
+def test_inotify_backend_requires_support(project_fs, mocker):
+    mocker.patch("flowerpower.pipeline.watcher.inotify_simple", None)
+
+    with pytest.raises(ValueError, match="inotify"):
+        PipelineWatcher(project_fs, backend="inotify")
+    assert PipelineWatcher(project_fs).backend == "poll"
+
+
+def test_unlistable_root_is_reported_for_polling(watcher, project_fs, mocker):
+    find = project_fs.find
+
+    def failing_find(path, *args, **kwargs):
+        if path == "pipelines":
+            raise PermissionError("denied")
+        return find(path, *args, **kwargs)
+
+    mocker.patch.object(project_fs, "find", side_effect=failing_find)
+    directories, complete = watcher._local_directories("/project")
+
+    assert not complete
+    assert "/project/pipelines" not in directories
+    assert "/project/conf" in directories
+
+
+def test_background_thread_dispatches_changes(watcher, project_fs):
+    received: list[WatchChanges] = []
+    watcher._on_change = received.append
+
+    with watcher:
+        assert watcher.running
+        _touch(project_fs, "pipelines/other.py", "y = 2  # edited\n")
+        deadline = time.monotonic() + 5
+        while not received and time.monotonic() < deadline:
+            time.sleep(0.02)
+
+    assert not watcher.running
+    assert received and received[0].pipelines == {"other"}
+
+
+def test_loader_apply_changes_evicts_only_touched_entries(mocker):
+    from flowerpower.pipeline.loader import PipelineLoader
+
+    loader = PipelineLoader(
+        config_manager=mocker.MagicMock(),
+        module_resolver=mocker.MagicMock(),
+        fs=mocker.MagicMock(),
+        project_cfg=mocker.MagicMock(hooks_dir=None),
+    )
+    loader._pipeline_data_cache["my-pipeline"] = CachedPipelineData(
+        config=PipelineConfig(name="my-pipeline")
+    )
+    loader._pipeline_data_cache["other"] = CachedPipelineData(
+        config=PipelineConfig(name="other")
+    )
+
+    dropped = loader.apply_changes(
+        WatchChanges(
+            pipelines=frozenset({"my_pipeline"}),
+            modules=frozenset({"my_pipeline"}),
+            paths=("pipelines/my_pipeline.py",),
+        )
+    )
+
+    assert dropped == ["my-pipeline"]
+    assert list(loader._pipeline_data_cache) == ["other"]
+    loader._config_manager.load_project_config.assert_not_called()
+
+    loader.load_module("my-pipeline")
+    loader._module_resolver.load.assert_called_once_with("my-pipeline", reload=True)
+
+
+def test_loader_apply_changes_syncs_project_config(mocker):
+    from flowerpower.pipeline.loader import PipelineLoader
+
+    loader = PipelineLoader(
+        config_manager=mocker.MagicMock(),
+        module_resolver=mocker.MagicMock(),
+        fs=mocker.MagicMock(),
+        project_cfg=mocker.MagicMock(hooks_dir=None),
+    )
+    loader._pipeline_data_cache["other"] = CachedPipelineData(
+        config=PipelineConfig(name="other")
+    )
+
+    loader.apply_changes(WatchChanges(project=True, paths=("conf/project.yml",)))
+
+    loader._config_manager.load_project_config.assert_called_once_with()
+    assert "other" in loader._pipeline_data_cache
@@ -0,0 +1,118 @@
+"""Tests for the `flowerpower serve` daemon and its client."""
+
+import pytest
+from typer.testing import CliRunner
+
+from flowerpower import FlowerPowerProject
+from flowerpower.cli import app
+from flowerpower.server import RunClient, RunServer, ServerError
+
+MODULE = """
+from loguru import logger
+
+
+def doubled(x: int) -> int:
+    logger.info(f"doubling {x}")
+    return x * 2
+
+
+def failing(x: int) -> int:
+    raise ValueError("boom")
+"""
+
+
+@pytest.fixture
+def project_dir(make_project):
+    return make_project(
+        "served",
+        {"calc": MODULE},
+        {"calc": "run:\n  final_vars: [doubled]\n  inputs: {x: 1}\n"},
+    )
+
+
+@pytest.fixture
+def server(project_dir):
+    server = RunServer(FlowerPowerProject.load(str(project_dir)), port=0)
+    server.start()
+    yield server
+    server.close()
+
+
+def test_run_streams_logs_and_result(server):
+    client = RunClient(server.address, timeout=30)
+    assert client.health()["project"] == "served"
+
+    events = list(client.run("calc", {"inputs": {"x": 21}, "max_retries": 0}))
+    assert events[-1]["event"] == "result"
+    assert events[-1]["outputs"] == {"doubled": 42}
+    assert any(e["event"] == "log" and e["message"] == "doubling 21" for e in events)
+
+    # Pipeline defaults apply when no options are given; the project stays warm.
+    assert list(client.run("calc"))[-1]["outputs"] == {"doubled": 2}
+    assert client.health()["runs"] == 2
+
+    failed = list(client.run("calc", {"final_vars": ["failing"], "max_retries": 0}))
+    assert failed[-1]["event"] == "error"
+    assert "boom" in failed[-1]["error"]
+
+    with pytest.raises(ServerError, match="'options' must be an object"):
+        list(client.run("calc", ["x"]))
+
+
+def test_unix_socket_and_cli_remote(project_dir, tmp_path):
+    socket_path = str(tmp_path / "fp.sock")
+    with RunServer(
+        FlowerPowerProject.load(str(project_dir)), socket_path=socket_path
+    ) as server:
+        server.start()
+        result = CliRunner().invoke(
+            app,
+            [
+                "pipeline",
+                "run",
+                "calc",
+                "--inputs",
+                '{"x": 5}',
+                "--remote",
+                f"unix://{socket_path}",
+            ],
+        )
+        assert result.exit_code == 0, result.output
+        assert "Outputs: doubled" in result.stdout
+
+        failed = CliRunner().invoke(
+            app,
+            [
+                "pipeline",
+                "run",
+                "calc",
+                "--final-vars",
+                '["failing"]',
+                "--max-retries",
+                "0",
+                "--remote",
+                socket_path,
+            ],
+        )
+        assert failed.exit_code == 1
+
+
+def test_socket_path_must_not_be_a_regular_file(project_dir, tmp_path):
+    regular = tmp_path / "notes.txt"
+    regular.write_text("keep me\n")
+
+    with pytest.raises(FileExistsError, match="not a Unix socket"):
+        RunServer(FlowerPowerProject.load(str(project_dir)), socket_path=str(regular))
+    assert regular.read_text() == "keep me\n"
+
+
+def test_request_log_level_is_per_request(server, mocker):
+    setup_logging = mocker.patch("flowerpower.pipeline.runner.setup_logging")
+    client = RunClient(server.address, timeout=30)
+
+    debug = list(client.run("calc", {"log_level": "DEBUG", "max_retries": 0}))
+    quiet = list(client.run("calc", {"max_retries": 0}, log_level="WARNING"))
+
+    setup_logging.assert_not_called()
+    assert any(e["event"] == "log" and e["level"] == "DEBUG" for e in debug)
+    assert [e["event"] for e in quiet] == ["result"]
@@ -0,0 +1,90 @@
+"""Tests for benchmark report comparison."""
+
+import json
+
+import pytest
+from typer.testing import CliRunner
+
+from flowerpower.cli import app
+from flowerpower.utils.benchmark import compare_reports, load_report, mann_whitney_u
+
+
+def _report(path, **benchmarks):
+    results = [
+        {"id": key, "group": group, "unit": unit, "samples": samples}
+        for key, (group, unit, samples) in benchmarks.items()
+    ]
+    path.write_text(json.dumps({"benchmark": "framework", "results": results}))
+    return path
+
+
+def test_mann_whitney_exact_and_tied_samples():
+    # Completely separated samples of 5: p = 2 / C(10, 5).
+    u, p = mann_whitney_u([1, 2, 3, 4, 5], [6, 7, 8, 9, 10])
+    assert u == 0
+    assert p == pytest.approx(2 / 252)
+
+    _, p_same = mann_whitney_u([1, 2, 3], [1, 2, 3])
+    assert p_same == pytest.approx(1.0)
+
+    # Ties fall back to the normal approximation.
+    u, p = mann_whitney_u([1, 1, 2, 2, 3, 3] * 3, [3, 3, 4, 4, 5, 5] * 3)
+    assert u == 18  # only the 6 x 6 ties at 3 count, one half each
+    assert p < 0.001
+
+    with pytest.raises(ValueError):
+        mann_whitney_u([], [1.0])
+
+
+def test_compare_reports_flags_significant_changes(tmp_path):
+    base = _report(
+        tmp_path / "base.json",
+        load=("cold_start", "s", [1.0, 1.1, 1.0, 0.9, 1.05]),
+        run=("overhead", "s", [5.0, 5.1, 4.9, 5.0, 5.2]),
+        noisy=("overhead", "s", [1.0, 3.0, 1.0, 3.0, 2.0]),
+        memory=("memory", "bytes", [100, 100, 101, 100, 99]),
+        gone=("overhead", "s", [1.0]),
+    )
+    head = _report(
+        tmp_path / "head.json",
+        load=("cold_start", "s", [1.5, 1.6, 1.4, 1.5, 1.55]),
+        run=("overhead", "s", [2.0, 2.1, 1.9, 2.0, 2.2]),
+        noisy=("overhead", "s", [1.2, 3.2, 1.1, 3.1, 2.5]),
+        memory=("memory", "bytes", [102, 101, 102, 103, 101]),
+        new=("overhead", "s", [1.0]),
+    )
+
+    verdicts = {
+        c.id: c.verdict
+        for c in compare_reports(load_report(base), load_report(head), threshold=0.05)
+    }
+    assert verdicts == {
+        "load": "regression",
+        "run": "improvement",
+        "noisy": "unchanged",
+        "memory": "unchanged",  # significant, but within the threshold
+        "gone": "removed",
+        "new": "added",
+    }
+
+    only_memory = compare_reports(
+        load_report(base), load_report(head), threshold=0.01, groups=["memory"]
+    )
+    assert [(c.id, c.verdict) for c in only_memory] == [("memory", "regression")]
+
+
+def test_cli_bench_compare_exit_code(tmp_path):
+    base = _report(tmp_path / "base.json", load=("cold_start", "s", [1.0] * 4 + [1.1]))
+    head = _report(tmp_path / "head.json", load=("cold_start", "s", [2.0] * 4 + [2.1]))
+    runner = CliRunner(env={"COLUMNS": "200"})
+
+    failed = runner.invoke(app, ["bench", "compare", str(base), str(head)])
+    assert failed.exit_code == 1
+    assert "regression" in failed.stdout
+
+    allowed = runner.invoke(
+        app,
+        ["bench", "compare", str(base), str(head), "--no-fail-on-regression"],
+    )
+    assert allowed.exit_code == 0
+    assert runner.invoke(app, ["bench", "compare", str(head), str(base)]).exit_code == 0
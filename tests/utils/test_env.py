@@ -0,0 +1,80 @@
+"""Tests for memoized environment overlay parsing."""
+
+from unittest.mock import patch
+
+import pytest
+
+from flowerpower.utils import env as env_utils
+from flowerpower.utils.env import (
+    clear_env_overrides_cache,
+    get_env_overlays,
+    parse_env_overrides,
+)
+
+
+@pytest.fixture(autouse=True)
+def _fresh_cache():
+    clear_env_overrides_cache()
+    yield
+    clear_env_overrides_cache()
+
+
+def test_snapshot_ignores_non_prefixed_keys_and_order():
+    first = {"FP_A": "1", "FP_B": "2", "HOME": "/root"}
+    second = {"PATH": "/bin", "FP_B": "2", "FP_A": "1"}
+
+    assert env_utils._env_snapshot(first, "FP_") == env_utils._env_snapshot(second, "FP_")
+
+
+def test_parse_is_memoized_until_fp_env_changes():
+    env = {"FP_PIPELINE__RUN__LOG_LEVEL": "DEBUG", "OTHER": "x"}
+
+    with patch.object(
+        env_utils, "_parse_env_overrides", wraps=env_utils._parse_env_overrides
+    ) as parse:
+        parse_env_overrides(env)
+        env["OTHER"] = "changed"
+        parse_env_overrides(env)
+        assert parse.call_count == 1
+
+        env["FP_PIPELINE__RUN__LOG_LEVEL"] = "WARNING"
+        assert parse_env_overrides(env) == {"pipeline": {"run": {"log_level": "WARNING"}}}
+        assert parse.call_count == 2
+
+
+def test_different_snapshots_are_parsed_separately():
+    with patch.object(
+        env_utils, "_parse_env_overrides", wraps=env_utils._parse_env_overrides
+    ) as parse:
+        info = parse_env_overrides({"FP_LOG_LEVEL": "INFO"})
+        debug = parse_env_overrides({"FP_LOG_LEVEL": "DEBUG"})
+        assert parse.call_count == 2
+
+    assert info == {"_global": {"LOG_LEVEL": "INFO"}}
+    assert debug == {"_global": {"LOG_LEVEL": "DEBUG"}}
+
+
+def test_explicit_invalidation_forces_reparse():
+    env = {"FP_LOG_LEVEL": "INFO"}
+
+    with patch.object(
+        env_utils, "_parse_env_overrides", wraps=env_utils._parse_env_overrides
+    ) as parse:
+        parse_env_overrides(env)
+        clear_env_overrides_cache()
+        parse_env_overrides(env)
+
+    assert parse.call_count == 2
+
+
+def test_memoized_results_are_private_copies():
+    env = {"FP_PIPELINE__RUN__FINAL_VARS": "a,b", "FP_LOG_LEVEL": "DEBUG"}
+
+    first = parse_env_overrides(env)
+    first["pipeline"]["run"]["final_vars"].append("c")
+    get_env_overlays(first)
+
+    assert parse_env_overrides(env) == {
+        "pipeline": {"run": {"final_vars": ["a", "b"]}},
+        "_global": {"LOG_LEVEL": "DEBUG"},
+    }
@@ -48,6 +48,32 @@ class TestExecutorFactoryCache:
 
         assert executor1 is not executor2
 
+    def test_acquire_lends_one_executor_per_run(self) -> None:
+        """Concurrent runs get separate executors; released ones are reused."""
+        from concurrent.futures import ThreadPoolExecutor
+
+        factory = ExecutorFactory()
+        cfg = ExecutorConfig(type="threadpool", max_workers=2)
+
+        executor1 = factory.acquire(cfg)
+        executor2 = factory.acquire(cfg)
+        assert executor1 is not executor2
+
+        factory.release(cfg, executor1)
+        with ThreadPoolExecutor(max_workers=1) as pool:
+            assert pool.submit(factory.acquire, cfg).result() is executor1
+
+    def test_release_finalizes_initialized_executor(self) -> None:
+        factory = ExecutorFactory()
+        cfg = ExecutorConfig(type="threadpool", max_workers=2)
+
+        executor = factory.acquire(cfg)
+        executor.init()
+        factory.release(cfg, executor)
+
+        assert not executor.initialized
+        assert factory.acquire(cfg) is executor
+
 
 class TestDictToNamespace:
     """Tests for dict_to_namespace and DictNamespace."""
@@ -0,0 +1,47 @@
+"""Tests for YAML environment interpolation helpers."""
+
+import msgspec
+import pytest
+
+from flowerpower.utils.yaml_env import interpolate_env_in_data, load_yaml_with_env
+
+
+def test_interpolation_returns_untouched_containers_as_is():
+    data = {"params": {"a": 1, "b": [1, 2, {"c": "plain"}]}, "run": {"x": "y"}}
+
+    assert interpolate_env_in_data(data, env={}) is data
+
+
+def test_interpolation_copies_only_changed_branches():
+    untouched = {"a": 1}
+    data = {"params": {"path": "${ROOT}/in", "n": "${COUNT}"}, "other": untouched}
+
+    result = interpolate_env_in_data(data, env={"ROOT": "/data", "COUNT": "3"})
+
+    assert result == {"params": {"path": "/data/in", "n": 3}, "other": untouched}
+    assert result["other"] is untouched
+    assert data["params"]["path"] == "${ROOT}/in"
+
+
+def test_interpolation_handles_lists():
+    data = ["$A", "literal", ["${B:-fallback}"]]
+
+    assert interpolate_env_in_data(data, env={"A": "x"}) == ["x", "literal", ["fallback"]]
+
+
+def test_load_yaml_with_env_decodes_and_interpolates():
+    raw = b"name: demo\nparams:\n  url: ${HOST}/api\n  size: 10\n"
+
+    assert load_yaml_with_env(raw, env={"HOST": "http://h"}) == {
+        "name": "demo",
+        "params": {"url": "http://h/api", "size": 10},
+    }
+
+
+def test_load_yaml_with_env_empty_document_is_empty_dict():
+    assert load_yaml_with_env(b"") == {}
+
+
+def test_load_yaml_with_env_rejects_invalid_yaml():
+    with pytest.raises(msgspec.DecodeError):
+        load_yaml_with_env(b"a: [1, 2\n")